@@ -9,6 +9,10 @@ from openmdao.core.implicitcomponent import ImplicitComponent
 from openmdao.core.indepvarcomp import IndepVarComp
 from openmdao.core.analysis_error import AnalysisError
 
+# Proc Allocators
+from openmdao.proc_allocators.cost_allocator import CostAllocator, TimingDatabase, \
+    report_idle_times
+
 # Components
 from openmdao.components.add_subtract_comp import AddSubtractComp
 from openmdao.components.balance_comp import BalanceComp
@@ -38,6 +42,7 @@ from openmdao.solvers.linear.direct import DirectSolver
 from openmdao.solvers.linear.petsc_ksp import PETScKrylov
 from openmdao.solvers.linear.linear_runonce import LinearRunOnce
 from openmdao.solvers.linear.scipy_iter_solver import ScipyKrylov
+from openmdao.solvers.linear.sparse_precon import SparsePrecon
 from openmdao.solvers.linear.user_defined import LinearUserDefined
 from openmdao.solvers.linesearch.backtracking import ArmijoGoldsteinLS
 from openmdao.solvers.linesearch.backtracking import BoundsEnforceLS
@@ -62,6 +67,7 @@ from openmdao.utils.spline_distributions import node_centered
 
 # Vectors
 from openmdao.vectors.default_vector import DefaultVector
+from openmdao.vectors.lazy_vector import LazyVector
 try:
     from openmdao.vectors.petsc_vector import PETScVector
 except ImportError:
@@ -85,6 +91,7 @@ from openmdao.utils.options_dictionary import OptionsDictionary
 
 # Recorders
 from openmdao.recorders.sqlite_recorder import SqliteRecorder
+from openmdao.recorders.binary_recorder import BinaryRecorder
 from openmdao.recorders.case_reader import CaseReader
 
 # Visualizations
@@ -130,6 +130,18 @@ class ApproximationScheme(object):
         """
         raise NotImplementedError()
 
+    def _unalias_wrt_inputs(self, system):
+        """
+        Give the aliased inputs that are perturbed by this approximation their own storage.
+
+        Parameters
+        ----------
+        system : System
+            System on which the execution is run.
+        """
+        if system._inputs._aliases:
+            system._unalias_inputs([key[0] for key in self._exec_dict])
+
     def _init_colored_approximations(self, system):
         from openmdao.core.group import Group
         from openmdao.core.implicitcomponent import ImplicitComponent
@@ -119,6 +119,8 @@ class ComplexStep(ApproximationScheme):
             self._fd.compute_approximations(system, jac, total=total)
             return
 
+        self._unalias_wrt_inputs(system)
+
         # Turn on complex step.
         system._set_complex_step_mode(True)
 
@@ -187,6 +187,8 @@ class FiniteDifference(ApproximationScheme):
         if jac is None:
             jac = system._jacobian
 
+        self._unalias_wrt_inputs(system)
+
         self._starting_outs = system._outputs.asarray(True)
         self._starting_resids = system._residuals.asarray(True)
         self._starting_ins = system._inputs.asarray(True)
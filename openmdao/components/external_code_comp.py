@@ -2,6 +2,7 @@
 import os
 import sys
 import re
+from concurrent.futures import as_completed
 
 import numpy.distutils
 from numpy.distutils.exec_command import find_executable
@@ -9,6 +10,8 @@ from numpy.distutils.exec_command import find_executable
 from openmdao.core.analysis_error import AnalysisError
 from openmdao.core.explicitcomponent import ExplicitComponent
 from openmdao.core.implicitcomponent import ImplicitComponent
+from openmdao.utils.class_util import overrides_method
+from openmdao.utils.job_scheduler import JobScheduler
 from openmdao.utils.shell_proc import STDOUT, DEV_NULL, ShellProc
 
 
@@ -44,8 +47,11 @@ class ExternalCodeDelegate(object):
                                   "otherwise shell=False")
         comp.options.declare('env_vars', {}, desc='Environment variables required by the command.')
         comp.options.declare('poll_delay', 0.0, lower=0.0,
-                             desc='Delay between polling for command completion. '
-                                  'A value of zero will use an internally computed default.')
+                             desc='Not used. Command completion is detected as soon as the '
+                                  'command exits.',
+                             deprecation="The 'poll_delay' option of ExternalCodeComp and "
+                                         "ExternalCodeImplicitComp is not used and will be "
+                                         "removed in a future release.")
         comp.options.declare('timeout', 0.0, lower=0.0,
                              desc='Maximum time to wait for command completion. '
                                   'A value of zero implies an infinite wait.')
@@ -190,9 +196,35 @@ class ExternalCodeDelegate(object):
         str
             Error Message
         """
-        # Check to make sure command exists
         comp = self._comp
 
+        comp._process = \
+            ShellProc(self._get_shell_command(command), comp.stdin,
+                      comp.stdout, comp.stderr, comp.options['env_vars'])
+
+        try:
+            return_code, error_msg = \
+                comp._process.wait(timeout=comp.options['timeout'])
+        finally:
+            comp._process.close_files()
+            comp._process = None
+
+        return (return_code, error_msg)
+
+    def _get_shell_command(self, command):
+        """
+        Check that the program of the command exists and return the command to give ShellProc.
+
+        Parameters
+        ----------
+        command : List
+            List containing OS command string.
+
+        Returns
+        -------
+        list or str
+            The command, run through cmd.exe on Windows.
+        """
         if isinstance(command, str):
             program_to_execute = re.findall(r"^([\w\-]+)", command)[0]
         else:
@@ -218,18 +250,7 @@ class ExternalCodeDelegate(object):
                                  "cannot be found" % program_to_execute)
             command_for_shell_proc = command
 
-        comp._process = \
-            ShellProc(command_for_shell_proc, comp.stdin,
-                      comp.stdout, comp.stderr, comp.options['env_vars'])
-
-        try:
-            return_code, error_msg = \
-                comp._process.wait(comp.options['poll_delay'], comp.options['timeout'])
-        finally:
-            comp._process.close_files()
-            comp._process = None
-
-        return (return_code, error_msg)
+        return command_for_shell_proc
 
 
 class ExternalCodeComp(ExplicitComponent):
@@ -239,6 +260,11 @@ class ExternalCodeComp(ExplicitComponent):
     Default stdin is the 'null' device, default stdout is the console, and
     default stderr is ``external_code_comp_error.out``.
 
+    If prepare_job or parse_job is overridden, each execution runs as a job in its own
+    scratch directory, where prepare_job writes the input files of the code and parse_job
+    reads its output files.  Many cases can then be run at the same time with submit or
+    run_batch.
+
     Attributes
     ----------
     stdin : str or file object
@@ -249,6 +275,8 @@ class ExternalCodeComp(ExplicitComponent):
         Error stream external code writes to.
     _external_code_runner: ExternalCodeDelegate object
         The delegate object that handles all the running of the external code for this object.
+    _job_scheduler : JobScheduler or None
+        Scheduler running the jobs, created by the first submitted job.
     return_code : int
         Exit status of the child process.
     """
@@ -263,6 +291,7 @@ class ExternalCodeComp(ExplicitComponent):
             Keyword arguments that will be mapped into the Component options.
         """
         self._external_code_runner = ExternalCodeDelegate(self)
+        self._job_scheduler = None
         super().__init__(**kwargs)
 
         self.stdin = DEV_NULL
@@ -281,6 +310,16 @@ class ExternalCodeComp(ExplicitComponent):
         super()._declare_options()
         self._external_code_runner.declare_options()
 
+        self.options.declare('max_jobs', 0, types=int, lower=0,
+                             desc='Maximum number of jobs that run at the same time. '
+                                  'A value of zero uses the number of CPUs.')
+        self.options.declare('job_dir', None, types=str, allow_none=True,
+                             desc='Directory in which the scratch directory of each job is '
+                                  'created. Defaults to the system temporary directory.')
+        self.options.declare('keep_job_dirs', False, types=bool,
+                             desc='If True, the scratch directories of the jobs are kept '
+                                  'after the jobs are done.')
+
     def check_config(self, logger):
         """
         Perform optional error checks.
@@ -306,7 +345,129 @@ class ExternalCodeComp(ExplicitComponent):
         outputs : Vector
             Unscaled, dimensional output variables read via outputs[key].
         """
-        self._external_code_runner.run_component()
+        if overrides_method('prepare_job', self, ExternalCodeComp) or \
+           overrides_method('parse_job', self, ExternalCodeComp):
+            for name, val in self.submit().result().items():
+                outputs[name] = val
+        else:
+            self._external_code_runner.run_component()
+
+    def prepare_job(self, inputs, job_dir):
+        """
+        Write the input files of the external code for a job, e.g. with an InputFileGenerator.
+
+        This runs in a thread of the job scheduler, so it should only use its arguments.
+
+        Parameters
+        ----------
+        inputs : dict or Vector
+            Input values of the job read via inputs[key].
+        job_dir : str
+            The scratch directory of the job, in which the command runs.
+        """
+        pass
+
+    def parse_job(self, job_dir, outputs):
+        """
+        Read the output files of the external code after a job, e.g. with a FileParser.
+
+        This runs in a thread of the job scheduler, so it should only use its arguments.
+
+        Parameters
+        ----------
+        job_dir : str
+            The scratch directory of the job, in which the command ran.
+        outputs : dict
+            Output values of the job written via outputs[key].  They start from the current
+            outputs of the component.
+        """
+        pass
+
+    def submit(self, inputs=None):
+        """
+        Queue a job that runs the command for the given inputs without waiting for it.
+
+        The command runs in a new scratch directory, with its stdout and stderr written to
+        stdout.out and stderr.out in that directory.  Input and output files are relative to
+        that directory.  The final setup of the problem must have been done.
+
+        Parameters
+        ----------
+        inputs : dict or None
+            Values of the inputs of the job keyed by their relative name.  Inputs that aren't
+            given keep their current value.
+
+        Returns
+        -------
+        Future
+            Future whose result is the dict of output values set by parse_job.
+        """
+        command = self.options['command']
+        if not command:
+            raise ValueError('Empty command list')
+        command = self._external_code_runner._get_shell_command(command)
+
+        if self._job_scheduler is None:
+            self._job_scheduler = JobScheduler(self.options['max_jobs'] or None,
+                                               self.options['job_dir'],
+                                               self.options['keep_job_dirs'])
+
+        # copies are made here, so the job doesn't see later changes to the vectors
+        job_inputs = {name: self._inputs[name].copy() for name in self._var_rel_names['input']}
+        if inputs is not None:
+            job_inputs.update(inputs)
+        job_outputs = {name: self._outputs[name].copy()
+                       for name in self._var_rel_names['output']}
+
+        def parse(job_dir):
+            self.parse_job(job_dir, job_outputs)
+            return job_outputs
+
+        opts = self.options
+        return self._job_scheduler.submit(command,
+                                          lambda job_dir: self.prepare_job(job_inputs, job_dir),
+                                          parse, opts['env_vars'], opts['timeout'],
+                                          opts['allowed_return_codes'],
+                                          opts['external_input_files'],
+                                          opts['external_output_files'],
+                                          RuntimeError if opts['fail_hard'] else AnalysisError)
+
+    def run_batch(self, cases):
+        """
+        Run a job for each case and yield the results as the jobs finish.
+
+        At most max_jobs jobs run at the same time.  The outputs of the component are not
+        changed.
+
+        Parameters
+        ----------
+        cases : iter of dict
+            Values of the inputs of each case keyed by their relative name.
+
+        Yields
+        ------
+        int
+            Index of the case.
+        dict or None
+            Output values of the case, or None if its job failed.
+        Exception or None
+            The error raised by the job, or None if it succeeded.
+        """
+        futures = {self.submit(case): i for i, case in enumerate(cases)}
+        for future in as_completed(futures):
+            try:
+                yield futures[future], future.result(), None
+            except Exception as err:
+                yield futures[future], None, err
+
+    def cleanup(self):
+        """
+        Clean up resources prior to exit.
+        """
+        super().cleanup()
+        if self._job_scheduler is not None:
+            self._job_scheduler.shutdown()
+            self._job_scheduler = None
 
 
 class ExternalCodeImplicitComp(ImplicitComponent):
@@ -11,6 +11,8 @@ import openmdao.api as om
 from openmdao.components.external_code_comp import STDOUT
 
 from openmdao.utils.assert_utils import assert_near_equal, assert_warning
+from openmdao.utils.file_wrap import InputFileGenerator, FileParser
+from openmdao.utils.testing_utils import use_tempdirs
 
 DIRECTORY = os.path.dirname((os.path.abspath(__file__)))
 
@@ -628,5 +630,103 @@ class TestExternalCodeImplicitCompFeature(unittest.TestCase):
         prob.run_model()
         assert_near_equal(prob.get_val('mach'), mach_solve(area_ratio, super_sonic=super_sonic), 1e-8)
 
+class ParaboloidJobComp(om.ExternalCodeComp):
+    def setup(self):
+        self.add_input('x', val=0.0)
+        self.add_input('y', val=0.0)
+
+        self.add_output('f_xy', val=0.0)
+
+        self.options['external_input_files'] = ['input.dat']
+        self.options['external_output_files'] = ['output.dat']
+        self.options['command'] = [sys.executable, os.path.join(DIRECTORY, 'extcode_paraboloid.py'),
+                                   'input.dat', 'output.dat']
+
+        with open('template.dat', 'w') as f:
+            f.write('0.0\n0.0\n')
+        self.template = os.path.abspath('template.dat')
+
+    def prepare_job(self, inputs, job_dir):
+        gen = InputFileGenerator()
+        gen.set_template_file(self.template)
+        gen.set_generated_file(os.path.join(job_dir, 'input.dat'))
+        gen.transfer_var(float(inputs['x']), 0, 1)
+        gen.transfer_var(float(inputs['y']), 1, 1)
+        gen.generate()
+
+    def parse_job(self, job_dir, outputs):
+        parser = FileParser()
+        parser.set_file(os.path.join(job_dir, 'output.dat'))
+        outputs['f_xy'] = parser.transfer_var(0, 1)
+
+
+def paraboloid(x, y):
+    return (x - 3.0) ** 2 + x * y + (y + 4.0) ** 2 - 3.0
+
+
+@use_tempdirs
+class TestExternalCodeCompJobs(unittest.TestCase):
+
+    def test_run_model(self):
+        prob = om.Problem()
+        prob.model.add_subsystem('p', ParaboloidJobComp(), promotes=['*'])
+        prob.setup()
+        prob.set_val('x', 5.0)
+        prob.set_val('y', 2.0)
+        prob.run_model()
+
+        assert_near_equal(prob.get_val('f_xy'), paraboloid(5.0, 2.0), 1e-12)
+
+        # the scratch directory of the job is removed
+        self.assertEqual(sorted(os.listdir('.')), ['template.dat'])
+
+    def test_run_batch(self):
+        prob = om.Problem()
+        prob.model.add_subsystem('p', ParaboloidJobComp(max_jobs=3, job_dir='.',
+                                                        keep_job_dirs=True), promotes=['*'])
+        prob.setup()
+        prob.final_setup()
+        comp = prob.model.p
+
+        cases = [{'x': float(x), 'y': -float(x)} for x in range(6)]
+        results = list(comp.run_batch(cases))
+
+        self.assertEqual(sorted(r[0] for r in results), list(range(6)))
+        for i, outputs, err in results:
+            self.assertIsNone(err)
+            assert_near_equal(outputs['f_xy'], paraboloid(cases[i]['x'], cases[i]['y']), 1e-12)
+
+        self.assertEqual(comp._job_scheduler.max_jobs, 3)
+        self.assertEqual(len([d for d in os.listdir('.') if d.startswith('job_')]), 6)
+
+        # the outputs of the component are unchanged
+        self.assertEqual(prob.get_val('f_xy'), 0.0)
+
+        prob.cleanup()
+        self.assertIsNone(comp._job_scheduler)
+
+    def test_failed_job(self):
+        prob = om.Problem()
+        prob.model.add_subsystem('p', ParaboloidJobComp(fail_hard=False), promotes=['*'])
+        prob.setup()
+        prob.final_setup()
+        comp = prob.model.p
+
+        # the input file of the second case can't be generated
+        results = list(comp.run_batch([{'x': 1.0}, {'x': 'bad'}]))
+        results.sort(key=lambda r: r[0])
+
+        assert_near_equal(results[0][1]['f_xy'], paraboloid(1.0, 0.0), 1e-12)
+        self.assertIsNone(results[1][1])
+        self.assertIsInstance(results[1][2], ValueError)
+
+        comp.options['command'] = [sys.executable, '-c', 'import sys; sys.exit("bad input")']
+        with self.assertRaises(om.AnalysisError) as cm:
+            comp.submit({'x': 1.0}).result()
+
+        self.assertIn('return_code = 1', str(cm.exception))
+        self.assertIn('bad input', str(cm.exception))
+
+
 if __name__ == "__main__":
     unittest.main()
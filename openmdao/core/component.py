@@ -924,7 +924,7 @@ class Component(System):
                 info[abs_key] = meta
 
     def declare_partials(self, of, wrt, dependent=True, rows=None, cols=None, val=None,
-                         method='exact', step=None, form=None, step_calc=None):
+                         method='exact', step=None, form=None, step_calc=None, constant=False):
         """
         Declare information about this component's subjacobians.
 
@@ -967,6 +967,10 @@ class Component(System):
             Step type for finite difference, can be 'abs' for absolute', or 'rel' for
             relative. Defaults to None, in which case the approximation method provides
             its default value.
+        constant : bool
+            If True, the subjacobian keeps the value given by val, so an assembled jacobian
+            only writes it once.  Values set for it in compute_partials or linearize after the
+            first linearization are not seen by an assembled jacobian.
 
         Returns
         -------
@@ -979,6 +983,10 @@ class Component(System):
             msg = '{}: d({})/d({}): method "{}" is not supported, method must be one of {}'
             raise ValueError(msg.format(self.msginfo, of, wrt, method, sorted(_supported_methods)))
 
+        if constant and method_func is not None:
+            raise ValueError('{}: d({})/d({}): a constant partial can\'t be approximated with '
+                             'method "{}".'.format(self.msginfo, of, wrt, method))
+
         if isinstance(of, list):
             of = tuple(of)
         if isinstance(wrt, list):
@@ -986,6 +994,8 @@ class Component(System):
 
         meta = self._declared_partials[of, wrt]
         meta['dependent'] = dependent
+        if constant:
+            meta['constant'] = True
 
         # If only one of rows/cols is specified
         if (rows is None) ^ (cols is None):
@@ -1228,6 +1238,23 @@ class Component(System):
 
         return opts
 
+    def _subjac_is_constant(self, key):
+        """
+        Return True if the given sub-Jacobian never changes after setup.
+
+        Parameters
+        ----------
+        key : (str, str)
+            Absolute (of, wrt) names of the sub-Jacobian.
+
+        Returns
+        -------
+        bool
+            True if the sub-Jacobian is constant.
+        """
+        meta = self._subjacs_info.get(key)
+        return meta is not None and meta.get('constant', False) and 'method' not in meta
+
     def _declare_partials(self, of, wrt, dct, quick_declare=False):
         """
         Store subjacobian metadata for later use.
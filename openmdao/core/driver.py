@@ -41,6 +41,44 @@ def _check_debug_print_opts_valid(name, opts):
                              (name, opt, _valid_opts))
 
 
+class _FlatVOILayout(object):
+    """
+    Positions of a set of design vars or responses in a flat driver vector.
+
+    VOIs that are local, continuous and not distributed are copied between the flat vector
+    and the model outputs with one fancy index operation, the others one at a time.
+
+    Attributes
+    ----------
+    size : int
+        Size of the flat vector.
+    slices : dict
+        Slice of the flat vector of each VOI, keyed by name.
+    loc_flat : ndarray
+        Positions of the local VOI entries in the flat vector.
+    loc_data : ndarray
+        Positions of the local VOI entries in the data array of the model outputs.
+    scaler : ndarray
+        Driver scaler of each local VOI entry.
+    adder : ndarray
+        Driver adder of each local VOI entry.
+    others : list
+        (name, meta, remote_vois) of the VOIs that are set or retrieved one at a time.
+    """
+
+    def __init__(self):
+        """
+        Initialize attributes.
+        """
+        self.size = 0
+        self.slices = {}
+        self.loc_flat = None
+        self.loc_data = None
+        self.scaler = None
+        self.adder = None
+        self.others = []
+
+
 class Driver(object):
     """
     Top-level container for the systems and drivers.
@@ -84,6 +122,11 @@ class Driver(object):
     _remote_objs : dict
         Dict of objectives that are remote on at least one proc. Values are
         (owning rank, size).
+    _flat_layouts : dict
+        Layouts of the flat design var and response vectors, built on first use.
+    _remote_voi_layouts : dict
+        Packed layouts of the remote, non-distributed design vars, constraints and objectives,
+        keyed by 'dvs', 'cons' and 'objs', used to gather each kind in one collective.
     _rec_mgr : <RecordingManager>
         Object that manages all recorders added to this driver.
     _coloring_info : dict
@@ -113,6 +156,8 @@ class Driver(object):
         self._cons = None
         self._objs = None
         self._responses = None
+        self._remote_voi_layouts = {}
+        self._flat_layouts = {}
 
         # Driver options
         self.options = OptionsDictionary(parent_name=type(self).__name__)
@@ -383,6 +428,16 @@ class Driver(object):
         self._remote_responses = self._remote_cons.copy()
         self._remote_responses.update(self._remote_objs)
 
+        self._flat_layouts = {}
+        self._remote_voi_layouts = layouts = {}
+        if MPI and model.comm.size > 1:
+            for key, vois, remote_vois in (('dvs', self._designvars, remote_dv_dict),
+                                           ('cons', self._cons, remote_con_dict),
+                                           ('objs', self._objs, remote_obj_dict)):
+                layout = self._get_remote_voi_layout(vois, remote_vois)
+                if layout is not None:
+                    layouts[key] = layout
+
         # set up simultaneous deriv coloring
         if coloring_mod._use_total_sparsity:
             # reset the coloring
@@ -484,8 +539,299 @@ class Driver(object):
 
         self._rec_mgr.startup(self)
 
+    def _get_remote_voi_layout(self, vois, remote_vois):
+        """
+        Compute the layout used to gather the given remote VOIs in a single Allgatherv.
+
+        The values are packed by owning rank, so each rank sends one contiguous segment.
+
+        Parameters
+        ----------
+        vois : dict
+            Metadata of the design vars, constraints or objectives keyed by name.
+        remote_vois : dict
+            Dict containing (owning_rank, size) for the remote vois of the same type.
+
+        Returns
+        -------
+        tuple or None
+            (slices, sizes, offsets, local, sendbuf), where slices maps each VOI name to its
+            slice of the gathered array and local lists (source name, indices, slice of sendbuf)
+            of the VOIs owned by this proc.  None if there are no remote VOIs to gather.
+        """
+        comm = self._problem().model.comm
+        remotes = []
+        for name, meta in vois.items():
+            src_name = meta['ivc_source'] if meta.get('ivc_source') is not None else name
+            if src_name in remote_vois:
+                owner, size = remote_vois[src_name]
+                if owner is None:
+                    continue
+                if meta['indices'] is not None:
+                    size = len(meta['indices'])
+                remotes.append((owner, name, src_name, meta['indices'], size))
+
+        if not remotes:
+            return None
+
+        # stable sort keeps the dict order of the VOIs within each rank
+        remotes.sort(key=lambda r: r[0])
+
+        sizes = np.zeros(comm.size, dtype=INT_DTYPE)
+        for owner, _, _, _, size in remotes:
+            sizes[owner] += size
+        offsets = sizes2offsets(sizes)
+
+        slices = {}
+        local = []
+        start = 0
+        for owner, name, src_name, indices, size in remotes:
+            slices[name] = slice(start, start + size)
+            if owner == comm.rank:
+                loc_start = start - offsets[owner]
+                local.append((src_name, indices, slice(loc_start, loc_start + size)))
+            start += size
+
+        return slices, sizes, offsets, local, np.empty(sizes[comm.rank])
+
+    def _gather_remote_vois(self, key):
+        """
+        Gather the values of all remote, non-distributed VOIs of one type in one collective.
+
+        This must be called on every process in the Problem's MPI communicator.
+
+        Parameters
+        ----------
+        key : str
+            Type of VOI, either 'dvs', 'cons' or 'objs'.
+
+        Returns
+        -------
+        dict
+            Unscaled flat values keyed by VOI name.  These are views into one array that is
+            allocated for each call, so they stay valid after later calls.
+        """
+        layout = self._remote_voi_layouts.get(key)
+        if layout is None:
+            return {}
+
+        slices, sizes, offsets, local, sendbuf = layout
+        get = self._problem().model._outputs._abs_get_val
+
+        for src_name, indices, slc in local:
+            if indices is None:
+                sendbuf[slc] = get(src_name)
+            else:
+                sendbuf[slc] = get(src_name)[indices]
+
+        val = np.empty(np.sum(sizes))
+        self._problem().model.comm.Allgatherv(sendbuf, [val, sizes, offsets, MPI.DOUBLE])
+
+        return {name: val[slc] for name, slc in slices.items()}
+
+    def _get_flat_layout(self, kind):
+        """
+        Return the layout of the flat design var or response vector, computing it if needed.
+
+        Design vars are in the order of the driver's design vars.  Responses are the objectives
+        followed by the constraints.  Discrete VOIs aren't part of the flat vectors.
+
+        Parameters
+        ----------
+        kind : str
+            Either 'dvs' or 'responses'.
+
+        Returns
+        -------
+        _FlatVOILayout
+            The layout.
+        """
+        if kind in self._flat_layouts:
+            return self._flat_layouts[kind]
+
+        model = self._problem().model
+        outputs = model._outputs
+        data_slices = outputs.get_slice_dict()
+        abs2meta = model._var_allprocs_abs2meta['output']
+        discrete = model._var_allprocs_discrete['output']
+
+        if kind == 'dvs':
+            vois = [(self._designvars, self._remote_dvs)]
+        else:
+            vois = [(self._objs, self._remote_objs), (self._cons, self._remote_cons)]
+
+        layout = _FlatVOILayout()
+        loc_flat = []
+        loc_data = []
+        scalers = []
+        adders = []
+
+        start = 0
+        for voi_dict, remote_vois in vois:
+            for name, meta in voi_dict.items():
+                src_name = meta['ivc_source'] if meta.get('ivc_source') is not None else name
+                if src_name in discrete:
+                    continue
+
+                indices = meta['indices']
+                if src_name in self._dist_driver_vars:
+                    size = np.sum(self._dist_driver_vars[src_name][1])
+                elif indices is not None:
+                    size = len(indices)
+                else:
+                    size = abs2meta[src_name]['global_size']
+
+                layout.slices[name] = slc = slice(start, start + size)
+                start += size
+
+                if (src_name in self._dist_driver_vars or src_name in remote_vois or
+                        not outputs._contains_abs(src_name)):
+                    layout.others.append((name, meta, remote_vois))
+                    continue
+
+                data_slice = data_slices[src_name]
+                inds = np.arange(data_slice.start, data_slice.stop, dtype=INT_DTYPE)
+                loc_data.append(inds if indices is None else inds[indices])
+                loc_flat.append(np.arange(slc.start, slc.stop, dtype=INT_DTYPE))
+
+                scaler = meta['total_scaler']
+                adder = meta['total_adder']
+                scalers.append(np.broadcast_to(1.0 if scaler is None else np.ravel(scaler), size))
+                adders.append(np.broadcast_to(0.0 if adder is None else np.ravel(adder), size))
+
+        layout.size = start
+        if loc_flat:
+            layout.loc_flat = np.concatenate(loc_flat)
+            layout.loc_data = np.concatenate(loc_data)
+            layout.scaler = np.concatenate(scalers)
+            layout.adder = np.concatenate(adders)
+        else:
+            layout.loc_flat = layout.loc_data = np.zeros(0, dtype=INT_DTYPE)
+            layout.scaler = layout.adder = np.zeros(0)
+
+        self._flat_layouts[kind] = layout
+        return layout
+
+    def _get_flat_vals(self, kind, out, driver_scaling):
+        """
+        Fill a flat array with the values of the design vars or responses.
+
+        Parameters
+        ----------
+        kind : str
+            Either 'dvs' or 'responses'.
+        out : ndarray or None
+            Array to fill.  If None, a new array is allocated.
+        driver_scaling : bool
+            When True, return values that are scaled according to the driver scaling.
+
+        Returns
+        -------
+        ndarray
+            The flat values.
+        """
+        layout = self._get_flat_layout(kind)
+        if out is None:
+            out = np.empty(layout.size)
+
+        data = self._problem().model._outputs._data
+        if self._has_scaling and driver_scaling:
+            out[layout.loc_flat] = (data[layout.loc_data] + layout.adder) * layout.scaler
+        else:
+            out[layout.loc_flat] = data[layout.loc_data]
+
+        # the gathers are collective, so they happen whether or not this proc has remote VOIs
+        remote_vals = {}
+        for key in (('dvs',) if kind == 'dvs' else ('objs', 'cons')):
+            remote_vals.update(self._gather_remote_vois(key))
+
+        for name, meta, remote_vois in layout.others:
+            out[layout.slices[name]] = self._get_voi_val(name, meta, remote_vois,
+                                                         driver_scaling=driver_scaling,
+                                                         remote_vals=remote_vals)
+
+        return out
+
+    def get_design_vars_flat(self, out=None):
+        """
+        Return the scaled values of all continuous design variables in one flat array.
+
+        If any design variable is remote or distributed, this must be called on every process
+        in the Problem's MPI communicator.
+
+        Parameters
+        ----------
+        out : ndarray or None
+            Preallocated array to fill.  If None, a new array is allocated.
+
+        Returns
+        -------
+        ndarray
+            Design variable values, in the order of the driver's design variables.
+        """
+        return self._get_flat_vals('dvs', out, True)
+
+    def set_design_vars_flat(self, x):
+        """
+        Set the values of all continuous design variables from one flat array.
+
+        Parameters
+        ----------
+        x : ndarray
+            Scaled design variable values, laid out like the result of get_design_vars_flat.
+        """
+        layout = self._get_flat_layout('dvs')
+
+        vals = x[layout.loc_flat]
+        if self._has_scaling:
+            vals = vals / layout.scaler - layout.adder
+        self._problem().model._outputs._data[layout.loc_data] = vals
+
+        for name, _, _ in layout.others:
+            self.set_design_var(name, x[layout.slices[name]])
+
+    def get_responses_flat(self, out=None, driver_scaling=True):
+        """
+        Return the values of all continuous objectives and constraints in one flat array.
+
+        Objectives come first, followed by the constraints, each in the driver's order.  If any
+        response is remote or distributed, this must be called on every process in the
+        Problem's MPI communicator.
+
+        Parameters
+        ----------
+        out : ndarray or None
+            Preallocated array to fill.  If None, a new array is allocated.
+        driver_scaling : bool
+            When True, return values that are scaled according to either the adder and scaler or
+            the ref and ref0 values that were specified when add_design_var, add_objective, and
+            add_constraint were called on the model. Default is True.
+
+        Returns
+        -------
+        ndarray
+            Response values.
+        """
+        return self._get_flat_vals('responses', out, driver_scaling)
+
+    def get_flat_slices(self, kind):
+        """
+        Return the slice of each design var or response in its flat array.
+
+        Parameters
+        ----------
+        kind : str
+            Either 'dvs' or 'responses'.
+
+        Returns
+        -------
+        dict
+            Slices keyed by VOI name.
+        """
+        return self._get_flat_layout(kind).slices
+
     def _get_voi_val(self, name, meta, remote_vois, driver_scaling=True,
-                     get_remote=True, rank=None):
+                     get_remote=True, rank=None, remote_vals=None):
         """
         Get the value of a variable of interest (objective, constraint, or design var).
 
@@ -512,6 +858,8 @@ class Driver(object):
             of the value that's on the current process for a distributed variable.
         rank : int or None
             If not None, gather value to this rank only.
+        remote_vals : dict or None
+            Values of remote VOIs that were already gathered by _gather_remote_vois.
 
         Returns
         -------
@@ -534,7 +882,10 @@ class Driver(object):
         else:
             distributed = False
 
-        if src_name in remote_vois:
+        if remote_vals is not None and name in remote_vals:
+            val = remote_vals[name]
+
+        elif src_name in remote_vois:
             owner, size = remote_vois[src_name]
             # if var is distributed or only gathering to one rank
             # TODO - support distributed var under a parallel group.
@@ -620,7 +971,9 @@ class Driver(object):
         dict
            Dictionary containing values of each design variable.
         """
-        return {n: self._get_voi_val(n, dv, self._remote_dvs, get_remote=get_remote)
+        remote_vals = self._gather_remote_vois('dvs') if get_remote else None
+        return {n: self._get_voi_val(n, dv, self._remote_dvs, get_remote=get_remote,
+                                     remote_vals=remote_vals)
                 for n, dv in self._designvars.items()}
 
     def set_design_var(self, name, value, set_remote=True):
@@ -708,8 +1061,9 @@ class Driver(object):
         dict
            Dictionary containing values of each objective.
         """
+        remote_vals = self._gather_remote_vois('objs')
         return {n: self._get_voi_val(n, obj, self._remote_objs,
-                                     driver_scaling=driver_scaling)
+                                     driver_scaling=driver_scaling, remote_vals=remote_vals)
                 for n, obj in self._objs.items()}
 
     def get_constraint_values(self, ctype='all', lintype='all', driver_scaling=True):
@@ -735,6 +1089,7 @@ class Driver(object):
            Dictionary containing values of each constraint.
         """
         con_dict = {}
+        remote_vals = self._gather_remote_vois('cons')
         for name, meta in self._cons.items():
             if lintype == 'linear' and not meta['linear']:
                 continue
@@ -749,7 +1104,8 @@ class Driver(object):
                 continue
 
             con_dict[name] = self._get_voi_val(name, meta, self._remote_cons,
-                                               driver_scaling=driver_scaling)
+                                               driver_scaling=driver_scaling,
+                                               remote_vals=remote_vals)
 
         return con_dict
 
@@ -239,10 +239,10 @@ class ExplicitComponent(Component):
 
             with self._call_user_function('compute'):
                 if self._discrete_inputs or self._discrete_outputs:
-                    self.compute(self._inputs, self._outputs, self._discrete_inputs,
-                                 self._discrete_outputs)
+                    self._alias_safe_call(self.compute, self._inputs, self._outputs,
+                                          self._discrete_inputs, self._discrete_outputs)
                 else:
-                    self.compute(self._inputs, self._outputs)
+                    self._alias_safe_call(self.compute, self._inputs, self._outputs)
 
             residuals += outputs
             outputs -= residuals
@@ -258,10 +258,10 @@ class ExplicitComponent(Component):
                 self._residuals.set_val(0.0)
                 with self._call_user_function('compute'):
                     if self._discrete_inputs or self._discrete_outputs:
-                        self.compute(self._inputs, self._outputs, self._discrete_inputs,
-                                     self._discrete_outputs)
+                        self._alias_safe_call(self.compute, self._inputs, self._outputs,
+                                              self._discrete_inputs, self._discrete_outputs)
                     else:
-                        self.compute(self._inputs, self._outputs)
+                        self._alias_safe_call(self.compute, self._inputs, self._outputs)
 
             # Iteration counter is incremented in the Recording context manager at exit.
 
@@ -380,6 +380,23 @@ class ExplicitComponent(Component):
                     # ExplicitComponent jacobian defined with -1 on diagonal.
                     d_residuals *= -1.0
 
+    def _subjac_is_constant(self, key):
+        """
+        Return True if the given sub-Jacobian never changes after setup.
+
+        Parameters
+        ----------
+        key : (str, str)
+            Absolute (of, wrt) names of the sub-Jacobian.
+
+        Returns
+        -------
+        bool
+            True if the sub-Jacobian is constant.
+        """
+        # the -1 diagonal of each output with respect to itself is set during setup
+        return key[0] == key[1] or super()._subjac_is_constant(key)
+
     def _linearize(self, jac=None, sub_do_ln=False):
         """
         Compute jacobian / factorization. The model is assumed to be in a scaled state.
@@ -411,9 +428,10 @@ class ExplicitComponent(Component):
                 # We used to negate the jacobian here, and then re-negate after the hook.
                 with self._call_user_function('compute_partials'):
                     if self._discrete_inputs:
-                        self.compute_partials(self._inputs, self._jacobian, self._discrete_inputs)
+                        self._alias_safe_call(self.compute_partials, self._inputs, self._jacobian,
+                                              self._discrete_inputs)
                     else:
-                        self.compute_partials(self._inputs, self._jacobian)
+                        self._alias_safe_call(self.compute_partials, self._inputs, self._jacobian)
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
         """
@@ -61,6 +61,10 @@ class Group(System):
         Object used to allocate MPI processes to subsystems.
     _proc_info : dict of subsys_name: (min_procs, max_procs, weight)
         Information used to determine MPI process allocation to subsystems.
+    _thread_safe_subs : set of str
+        Names of the subsystems that were added with thread_safe=True.
+    _unaliased_subs : set of str
+        Names of the subsystems that were added with alias_inputs=False.
     _subgroups_myproc : list
         List of local subgroups.
     _manual_connections : dict
@@ -85,6 +89,10 @@ class Group(System):
         or subname can be None for the full, simultaneous transfer.
     _discrete_transfers : dict of discrete transfer metadata
         Key is system pathname or None for the full, simultaneous transfer.
+    _alias_transfers : dict of Transfers or None
+        Nonlinear fwd transfers that skip inputs aliased to their sources and index into the
+        compact nonlinear input vector, keyed like the subname of _transfers. None if this
+        group has no aliased inputs.
     _approx_subjac_keys : list
         List of subjacobian keys used for approximated derivatives.
     _setup_procs_finished : bool
@@ -119,6 +127,8 @@ class Group(System):
         """
         self._mpi_proc_allocator = DefaultAllocator()
         self._proc_info = {}
+        self._thread_safe_subs = set()
+        self._unaliased_subs = set()
 
         super().__init__(**kwargs)
 
@@ -132,6 +142,7 @@ class Group(System):
         self._conn_discrete_in2out = {}
         self._transfers = {}
         self._discrete_transfers = {}
+        self._alias_transfers = None
         self._approx_subjac_keys = None
         self._setup_procs_finished = False
         self._has_distrib_vars = False
@@ -445,7 +456,8 @@ class Group(System):
             # Call the load balancing algorithm
             try:
                 sub_inds, sub_comm, sub_proc_range = self._mpi_proc_allocator(
-                    proc_info, len(allsubs), comm)
+                    proc_info, len(allsubs), comm,
+                    [pathname + '.' + s.name if pathname else s.name for s, _ in allsubs])
             except ProcAllocationError as err:
                 if err.sub_inds is None:
                     raise RuntimeError("%s: %s" % (self.msginfo, err.msg))
@@ -1876,6 +1888,10 @@ class Group(System):
         vec_inputs = self._vectors['input'][vec_name]
 
         if mode == 'fwd':
+            if self._alias_transfers is not None and vec_name == 'nonlinear':
+                # aliased inputs are views of their sources and have no storage here
+                xfer = self._alias_transfers[sub]
+
             if xfer is not None:
                 if self._has_input_scaling:
                     vec_inputs.scale('norm')
@@ -1895,6 +1911,49 @@ class Group(System):
                 else:
                     xfer._transfer(vec_inputs, self._vectors['output'][vec_name], mode)
 
+    def _use_workers(self):
+        """
+        Return True if the subsystems should be run in worker processes or threads.
+
+        Returns
+        -------
+        bool
+            True if the subsystems should be run in worker processes or threads.
+        """
+        return False
+
+    def _begin_sub_transfers(self, vec_name):
+        """
+        Start the fwd transfers to all subsystems before running the local ones.
+
+        Parameters
+        ----------
+        vec_name : str
+            Name of the vector RHS on which to perform the transfers.
+
+        Returns
+        -------
+        dict
+            Start times of the transfers that are still in progress, keyed by subsystem name.
+        """
+        self._transfer(vec_name, 'fwd')
+        return {}
+
+    def _end_sub_transfers(self, vec_name, pending, names):
+        """
+        Wait for the in-progress transfers to the given subsystems to complete.
+
+        Parameters
+        ----------
+        vec_name : str
+            Name of the vector RHS on which the transfers were started.
+        pending : dict
+            Start times of the transfers that are still in progress, keyed by subsystem name.
+        names : iter of str
+            Names of the subsystems.
+        """
+        pass
+
     def _discrete_transfer(self, sub):
         """
         Transfer discrete variables between components.  This only occurs in fwd mode.
@@ -1958,6 +2017,7 @@ class Group(System):
         """
         Compute all transfers that are owned by this system.
         """
+        self._alias_transfers = None
         self._vector_class.TRANSFER._setup_transfers(self)
         if self._conn_discrete_in2out:
             self._vector_class.TRANSFER._setup_discrete_transfers(self)
@@ -2055,7 +2115,8 @@ class Group(System):
 
     def add_subsystem(self, name, subsys, promotes=None,
                       promotes_inputs=None, promotes_outputs=None,
-                      min_procs=1, max_procs=None, proc_weight=1.0):
+                      min_procs=1, max_procs=None, proc_weight=1.0, thread_safe=False,
+                      alias_inputs=True):
         """
         Add a subsystem.
 
@@ -2088,6 +2149,14 @@ class Group(System):
         proc_weight : float
             Weight given to the subsystem when allocating available MPI processes
             to all subsystems.  Default is 1.0.
+        thread_safe : bool
+            If True, the nonlinear solve of the subsystem only modifies its own variables and
+            state, so a ParallelGroup using threads can run it concurrently with its other
+            subsystems.  Default is False.
+        alias_inputs : bool
+            If False, the inputs of the subsystem keep their own storage when the problem's
+            alias_inputs option is set.  Use this for subsystems that modify their inputs in
+            place.  Default is True.
 
         Returns
         -------
@@ -2148,6 +2217,14 @@ class Group(System):
                             (self.msginfo, proc_weight))
 
         self._proc_info[name] = (min_procs, max_procs, proc_weight)
+        if thread_safe:
+            self._thread_safe_subs.add(name)
+        else:
+            self._thread_safe_subs.discard(name)
+        if alias_inputs:
+            self._unaliased_subs.discard(name)
+        else:
+            self._unaliased_subs.add(name)
 
         setattr(self, name, subsys)
 
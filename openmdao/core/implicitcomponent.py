@@ -68,10 +68,12 @@ class ImplicitComponent(Component):
         with self._unscaled_context(outputs=[self._outputs], residuals=[self._residuals]):
             with self._call_user_function('apply_nonlinear', protect_outputs=True):
                 if self._discrete_inputs or self._discrete_outputs:
-                    self.apply_nonlinear(self._inputs, self._outputs, self._residuals,
-                                         self._discrete_inputs, self._discrete_outputs)
+                    self._alias_safe_call(self.apply_nonlinear, self._inputs, self._outputs,
+                                          self._residuals, self._discrete_inputs,
+                                          self._discrete_outputs)
                 else:
-                    self.apply_nonlinear(self._inputs, self._outputs, self._residuals)
+                    self._alias_safe_call(self.apply_nonlinear, self._inputs, self._outputs,
+                                          self._residuals)
 
         self.iter_count_apply += 1
 
@@ -87,10 +89,12 @@ class ImplicitComponent(Component):
                 with Recording(self.pathname + '._solve_nonlinear', self.iter_count, self):
                     with self._call_user_function('solve_nonlinear'):
                         if self._discrete_inputs or self._discrete_outputs:
-                            self.solve_nonlinear(self._inputs, self._outputs,
-                                                 self._discrete_inputs, self._discrete_outputs)
+                            self._alias_safe_call(self.solve_nonlinear, self._inputs,
+                                                  self._outputs, self._discrete_inputs,
+                                                  self._discrete_outputs)
                         else:
-                            self.solve_nonlinear(self._inputs, self._outputs)
+                            self._alias_safe_call(self.solve_nonlinear, self._inputs,
+                                                  self._outputs)
 
         # Iteration counter is incremented in the Recording context manager at exit.
 
@@ -111,10 +115,12 @@ class ImplicitComponent(Component):
 
                     with self._call_user_function('guess_nonlinear', protect_residuals=True):
                         if self._discrete_inputs or self._discrete_outputs:
-                            self.guess_nonlinear(self._inputs, self._outputs, self._residuals,
-                                                 self._discrete_inputs, self._discrete_outputs)
+                            self._alias_safe_call(self.guess_nonlinear, self._inputs,
+                                                  self._outputs, self._residuals,
+                                                  self._discrete_inputs, self._discrete_outputs)
                         else:
-                            self.guess_nonlinear(self._inputs, self._outputs, self._residuals)
+                            self._alias_safe_call(self.guess_nonlinear, self._inputs,
+                                                  self._outputs, self._residuals)
             finally:
                 if complex_step:
                     # Note: passing in False swaps back to the complex vector, which is valid since
@@ -283,10 +289,12 @@ class ImplicitComponent(Component):
 
             with self._call_user_function('linearize', protect_outputs=True):
                 if self._discrete_inputs or self._discrete_outputs:
-                    self.linearize(self._inputs, self._outputs, self._jacobian,
-                                   self._discrete_inputs, self._discrete_outputs)
+                    self._alias_safe_call(self.linearize, self._inputs, self._outputs,
+                                          self._jacobian, self._discrete_inputs,
+                                          self._discrete_outputs)
                 else:
-                    self.linearize(self._inputs, self._outputs, self._jacobian)
+                    self._alias_safe_call(self.linearize, self._inputs, self._outputs,
+                                          self._jacobian)
 
         if (jac is None or jac is self._assembled_jac) and self._assembled_jac is not None:
             self._assembled_jac._update(self)
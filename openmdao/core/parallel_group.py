@@ -1,11 +1,47 @@
 """Define the ParallelGroup class."""
+import sys
+import atexit
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, wait
+from time import perf_counter
 
+from openmdao.core.constants import _DEFAULT_OUT_STREAM
+from openmdao.core.explicitcomponent import ExplicitComponent
 from openmdao.core.group import Group
+from openmdao.core.implicitcomponent import ImplicitComponent
+from openmdao.proc_allocators.proc_allocator import ProcAllocator
+from openmdao.utils.class_util import overrides_method
+from openmdao.utils.general_utils import simple_warning
+
+# group whose subsystems are run by this process, if it is a worker process
+_worker_group = None
 
 
 class ParallelGroup(Group):
     """
     Class used to group systems together to be executed in parallel.
+
+    Parameters
+    ----------
+    **kwargs : dict
+        dict of arguments available here and in all descendants of this Group.
+
+    Attributes
+    ----------
+    _transfer_timings : dict
+        [number of transfers, begin time, wait time, time in flight] of the overlapped
+        transfers to each subsystem, keyed by subsystem name.
+    _worker_pool : multiprocessing.Pool or None
+        Pool of worker processes that run the subsystems when not under MPI.
+    _worker_run : int or None
+        Run counter of the problem when the worker processes were forked.
+    _thread_pool : ThreadPoolExecutor or None
+        Pool of threads that run the thread safe subsystems when not under MPI.
+    _threaded_subs : set of str
+        Names of the local subsystems that run in the thread pool.
+    _stateless_subs : bool
+        True if nothing below this group needs the state that a worker process would leave
+        behind, i.e. there are no recorders and no derivatives computed by user code.
     """
 
     def __init__(self, **kwargs):
@@ -20,3 +56,449 @@ class ParallelGroup(Group):
         """
         super().__init__(**kwargs)
         self._mpi_proc_allocator.parallel = True
+        self._transfer_timings = {}
+        self._worker_pool = None
+        self._worker_run = None
+        self._thread_pool = None
+        self._threaded_subs = set()
+        self._stateless_subs = True
+
+    def _declare_options(self):
+        """
+        Declare options before kwargs are processed in the init method.
+        """
+        super()._declare_options()
+        self.options.declare('proc_allocator', types=ProcAllocator, default=None,
+                             allow_none=True,
+                             desc='Algorithm used to divide procs among the subsystems, e.g. a '
+                                  'CostAllocator. If None, the default allocator is used.')
+        self.options.declare('overlap_transfers', types=bool, default=False,
+                             desc='If True, under MPI the transfers to all subsystems are started '
+                                  'at once and each local subsystem runs as soon as its own '
+                                  'inputs have arrived, while the other transfers are in flight.')
+        self.options.declare('num_workers', types=int, default=0, lower=0,
+                             desc='Number of worker processes that run the subsystems '
+                                  'concurrently when not running under MPI. The workers are '
+                                  'forked when the group first runs in each run_model or '
+                                  'run_driver and share the nonlinear vectors with this process, '
+                                  'so only continuous variables and iteration counts are passed '
+                                  'back. Changes made to the subsystems in this process during '
+                                  'a run, like options set by a driver callback, don\'t reach the '
+                                  'workers until the next run. Anything else a subsystem changes '
+                                  'while it runs, like attributes set on itself, stays in the '
+                                  'worker, so the subsystems run one after the other instead if '
+                                  'there are '
+                                  'recorders below this group, if inputs are aliased, or if '
+                                  'derivatives are used and a component below this group '
+                                  'computes its own partials or Jacobian-vector products. If 0, '
+                                  'the subsystems run one after the other. Ignored under MPI.')
+        self.options.declare('num_threads', types=int, default=0, lower=0,
+                             desc='Number of threads that run the subsystems added with '
+                                  'thread_safe=True concurrently when not running under MPI. The '
+                                  'other subsystems run one after the other in the calling '
+                                  'thread meanwhile. This only pays off for subsystems that '
+                                  'release the GIL, e.g. in numpy calls or while waiting for an '
+                                  'external code. If 0, no threads are used. Ignored under MPI.')
+
+    def _setup_procs(self, pathname, comm, mode, prob_meta):
+        """
+        Execute first phase of the setup process.
+
+        Distribute processors, assign pathnames, and call setup on the group. This method recurses
+        downward through the model.
+
+        Parameters
+        ----------
+        pathname : str
+            Global name of the system, including the path.
+        comm : MPI.Comm or <FakeComm>
+            MPI communicator object.
+        mode : string
+            Derivatives calculation mode, 'fwd' for forward, and 'rev' for
+            reverse (adjoint). Default is 'rev'.
+        prob_meta : dict
+            Problem level metadata.
+        """
+        allocator = self.options['proc_allocator']
+        if allocator is not None:
+            allocator.parallel = True
+            self._mpi_proc_allocator = allocator
+
+        self._transfer_timings = {}
+        self._close_workers()
+
+        if self.options['num_workers'] > 0 and self.options['num_threads'] > 0:
+            raise RuntimeError(f"{self.msginfo}: Options 'num_workers' and 'num_threads' can't "
+                               "both be set.")
+
+        super()._setup_procs(pathname, comm, mode, prob_meta)
+
+        if self.options['num_workers'] > 0 and comm.size == 1:
+            if 'fork' in multiprocessing.get_all_start_methods():
+                prob_meta['shared_memory'] = True
+            else:
+                simple_warning(f"{self.msginfo}: Worker processes can't be forked on this "
+                               "platform, so the subsystems will run one after the other.")
+
+    def _setup_recording(self):
+        """
+        Set up case recording.
+        """
+        super()._setup_recording()
+
+        # the workers hold copies of the subsystems made before this final setup
+        self._close_workers()
+
+        # recorders write from the thread that runs the recorded system, so systems with
+        # recorders anywhere below them stay in the calling thread
+        self._threaded_subs = set()
+        if self.options['num_threads'] > 0:
+            for subsys in self._subsystems_myproc:
+                if subsys.name in self._thread_safe_subs and not any(
+                        _has_recorders(s) for s in subsys.system_iter(include_self=True,
+                                                                      recurse=True)):
+                    self._threaded_subs.add(subsys.name)
+
+        # worker processes don't pass back recorded cases or state needed for derivatives
+        self._stateless_subs = True
+        if self.options['num_workers'] > 0:
+            use_derivs = self._use_derivatives
+            for subsys in self._subsystems_myproc:
+                for s in subsys.system_iter(include_self=True, recurse=True):
+                    if _has_recorders(s) or (use_derivs and _computes_derivatives(s)):
+                        self._stateless_subs = False
+                        return
+
+    def _use_workers(self):
+        """
+        Return True if the subsystems should be run in worker processes or threads.
+
+        Returns
+        -------
+        bool
+            True if the subsystems should be run in worker processes or threads.
+        """
+        if self.comm.size > 1:
+            return False
+
+        if self.options['num_threads'] > 0:
+            return bool(self._threaded_subs)
+
+        # under complex step the vectors point to complex storage that isn't shared, and
+        # discrete values set by the workers would never make it back here
+        return (self.options['num_workers'] > 0 and
+                self._problem_meta['shared_memory'] and _worker_group is None and
+                self._stateless_subs and not self._problem_meta['aliased_inputs'] and
+                not self._outputs._under_complex_step and
+                not self._var_allprocs_discrete['input'] and
+                not self._var_allprocs_discrete['output'])
+
+    def _solve_subsystems_in_workers(self):
+        """
+        Run the nonlinear solve of each subsystem in a worker process or thread.
+
+        The inputs of the subsystems must have been transferred already.
+        """
+        if self.options['num_threads'] > 0:
+            self._solve_subsystems_in_threads()
+            return
+
+        # the workers hold copies of the subsystems made when they were forked, so fork them
+        # again in each run to pick up any changes made to the subsystems since then
+        run = self._problem_meta['run_counter']
+        if self._worker_run != run:
+            self._close_workers()
+
+        if self._worker_pool is None:
+            self._worker_run = run
+            nworkers = min(self.options['num_workers'], len(self._subsystems_myproc))
+            # the workers are forked, so they get a copy of this group without pickling it
+            self._worker_pool = multiprocessing.get_context('fork').Pool(
+                nworkers, initializer=_init_worker, initargs=(self,))
+            # stop the workers before multiprocessing shuts down if cleanup is never called
+            atexit.register(self._worker_pool.terminate)
+
+        counts = self._worker_pool.map(_solve_subsystem,
+                                       [s.name for s in self._subsystems_myproc], chunksize=1)
+
+        # the iteration counts of the copies in the workers advanced instead of these
+        for subsys, sub_counts in zip(self._subsystems_myproc, counts):
+            for s, (niter, napply, nnoapprox) in zip(subsys.system_iter(include_self=True,
+                                                                        recurse=True),
+                                                     sub_counts):
+                s.iter_count += niter
+                s.iter_count_apply += napply
+                s.iter_count_without_approx += nnoapprox
+
+    def _solve_subsystems_in_threads(self):
+        """
+        Run the thread safe subsystems in the thread pool and the others in this thread.
+        """
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(self.options['num_threads'])
+
+        # each thread starts from the iteration coordinate of this thread
+        rec_iter = self._recording_iter
+        stack = list(rec_iter.stack)
+        norec_refcount = rec_iter._norec_refcount
+
+        threaded = self._threaded_subs
+        futures = [self._thread_pool.submit(_solve_in_thread, subsys, rec_iter, stack,
+                                            norec_refcount)
+                   for subsys in self._subsystems_myproc if subsys.name in threaded]
+
+        try:
+            for subsys in self._subsystems_myproc:
+                if subsys.name not in threaded:
+                    subsys._solve_nonlinear()
+        finally:
+            # the threads are still writing to the vectors until they're done
+            wait(futures)
+
+        for future in futures:
+            future.result()
+
+    def _close_workers(self):
+        """
+        Stop the worker processes or threads, if any.
+        """
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown()
+            self._thread_pool = None
+
+        if self._worker_pool is not None:
+            atexit.unregister(self._worker_pool.terminate)
+            self._worker_pool.terminate()
+            self._worker_pool.join()
+            self._worker_pool = None
+
+    def cleanup(self):
+        """
+        Clean up resources prior to exit.
+        """
+        super().cleanup()
+        self._close_workers()
+
+    def _begin_sub_transfers(self, vec_name):
+        """
+        Start the fwd transfers to all subsystems before running the local ones.
+
+        If the overlap_transfers option is set, a non-blocking transfer is started for each
+        subsystem.  Otherwise, or if the transfers can't be split, e.g. because inputs are scaled
+        or under complex step, a full blocking transfer is done.
+
+        Parameters
+        ----------
+        vec_name : str
+            Name of the vector RHS on which to perform the transfers.
+
+        Returns
+        -------
+        dict
+            Start times of the transfers that are still in progress, keyed by subsystem name.
+        """
+        xfers = self._transfers[vec_name]['fwd']
+        vec_inputs = self._vectors['input'][vec_name]
+        vec_outputs = self._vectors['output'][vec_name]
+
+        # all of these are the same on every proc, so either all procs split or none do
+        if not (self.options['overlap_transfers'] and self.comm.size > 1 and
+                vec_name == 'nonlinear' and not self._has_input_scaling and
+                self._alias_transfers is None and not vec_inputs._under_complex_step and
+                xfers[None]._can_split(vec_inputs, vec_outputs)):
+            return super()._begin_sub_transfers(vec_name)
+
+        timings = self._transfer_timings
+        pending = {}
+
+        # the transfers are collective, so they're started in the same order on all procs
+        for name in self._subsystems_allprocs:
+            if name in xfers:
+                start = perf_counter()
+                xfers[name]._transfer_begin(vec_inputs, vec_outputs)
+                if name not in timings:
+                    timings[name] = [0, 0.0, 0.0, 0.0]
+                timings[name][1] += perf_counter() - start
+                pending[name] = start
+
+        if self._conn_discrete_in2out:
+            self._discrete_transfer(None)
+
+        return pending
+
+    def _end_sub_transfers(self, vec_name, pending, names):
+        """
+        Wait for the in-progress transfers to the given subsystems to complete.
+
+        Parameters
+        ----------
+        vec_name : str
+            Name of the vector RHS on which the transfers were started.
+        pending : dict
+            Start times of the transfers that are still in progress, keyed by subsystem name.
+        names : iter of str
+            Names of the subsystems.
+        """
+        if not pending:
+            return
+
+        xfers = self._transfers[vec_name]['fwd']
+        vec_inputs = self._vectors['input'][vec_name]
+        vec_outputs = self._vectors['output'][vec_name]
+
+        for name in names:
+            if name in pending:
+                begun = pending.pop(name)
+                start = perf_counter()
+                xfers[name]._transfer_end(vec_inputs, vec_outputs)
+                end = perf_counter()
+
+                timing = self._transfer_timings[name]
+                timing[0] += 1
+                timing[2] += end - start
+                timing[3] += end - begun
+
+    def report_transfer_timings(self, out_stream=_DEFAULT_OUT_STREAM):
+        """
+        Print the timings of the overlapped transfers to each subsystem on this proc.
+
+        The exposed time of a transfer is the time spent starting it plus the time spent waiting
+        for it to complete.  The rest of the time it was in flight, this proc was starting other
+        transfers or running subsystems, so that time is an upper bound on the communication that
+        was hidden behind computation.
+
+        Parameters
+        ----------
+        out_stream : file-like object
+            Where to send the report.  Defaults to sys.stdout.  If None, nothing is printed.
+
+        Returns
+        -------
+        dict
+            (number of transfers, exposed time, hidden time) keyed by subsystem name.
+        """
+        report = {}
+        for name, (ncalls, begin, wait, in_flight) in self._transfer_timings.items():
+            report[name] = (ncalls, begin + wait, in_flight - begin - wait)
+
+        if out_stream is _DEFAULT_OUT_STREAM:
+            out_stream = sys.stdout
+
+        if out_stream is not None:
+            out_stream.write("Transfers of parallel group '%s' on rank %d\n" %
+                             (self.pathname, self.comm.rank))
+            out_stream.write("%-20s %8s %16s %16s\n" %
+                             ('subsystem', 'calls', 'exposed (s)', 'hidden (s)'))
+            for name, (ncalls, exposed, hidden) in report.items():
+                out_stream.write("%-20s %8d %16.6g %16.6g\n" % (name, ncalls, exposed, hidden))
+
+        return report
+
+
+def _has_recorders(system):
+    """
+    Return True if the given system or any of its solvers has recorders.
+
+    Parameters
+    ----------
+    system : <System>
+        The system.
+
+    Returns
+    -------
+    bool
+        True if the system or any of its solvers has recorders.
+    """
+    for owner in (system, system._nonlinear_solver, system._linear_solver):
+        if owner is not None and owner._rec_mgr._recorders:
+            return True
+    return False
+
+
+def _computes_derivatives(system):
+    """
+    Return True if the given system is a component that computes derivatives in its own code.
+
+    Parameters
+    ----------
+    system : <System>
+        The system.
+
+    Returns
+    -------
+    bool
+        True if the system computes partials or Jacobian-vector products in user code.
+    """
+    if isinstance(system, ExplicitComponent):
+        return system._has_compute_partials or system.matrix_free
+    if isinstance(system, ImplicitComponent):
+        return (system.matrix_free or
+                overrides_method('linearize', system, ImplicitComponent) or
+                overrides_method('solve_linear', system, ImplicitComponent))
+    return False
+
+
+def _solve_in_thread(subsys, rec_iter, stack, norec_refcount):
+    """
+    Run the nonlinear solve of a subsystem in a thread of the thread pool.
+
+    Parameters
+    ----------
+    subsys : <System>
+        The subsystem.
+    rec_iter : <_RecIteration>
+        Manager of the recording iteration stacks.
+    stack : list
+        Iteration stack of the thread that started the solve.
+    norec_refcount : int
+        Number of functions on that stack that must not be recorded.
+    """
+    with rec_iter.thread_stack(stack, norec_refcount):
+        subsys._solve_nonlinear()
+
+
+def _init_worker(group):
+    """
+    Set the group whose subsystems are run by this worker process.
+
+    Parameters
+    ----------
+    group : <ParallelGroup>
+        This process's copy of the group.
+    """
+    global _worker_group
+    _worker_group = group
+
+    # the recorders belong to the parent process, so don't write to them from here
+    for system in group.system_iter(include_self=True, recurse=True):
+        system._rec_mgr._recorders = []
+        for solver in (system._nonlinear_solver, system._linear_solver):
+            if solver is not None:
+                solver._rec_mgr._recorders = []
+
+
+def _solve_subsystem(name):
+    """
+    Run the nonlinear solve of a subsystem of the group of this worker process.
+
+    Parameters
+    ----------
+    name : str
+        Name of the subsystem.
+
+    Returns
+    -------
+    list of (int, int, int)
+        Increase of iter_count, iter_count_apply and iter_count_without_approx of each system
+        in the subsystem's tree during the solve.
+    """
+    subsys = _worker_group._subsystems_allprocs[name].system
+    systems = list(subsys.system_iter(include_self=True, recurse=True))
+    start = [(s.iter_count, s.iter_count_apply, s.iter_count_without_approx) for s in systems]
+
+    subsys._solve_nonlinear()
+
+    # a subsystem may run in a different worker each time, so pass back increases
+    return [(s.iter_count - niter, s.iter_count_apply - napply,
+             s.iter_count_without_approx - nnoapprox)
+            for s, (niter, napply, nnoapprox) in zip(systems, start)]
@@ -5,8 +5,10 @@ import pprint
 import os
 import logging
 import weakref
+import multiprocessing
 
 from collections import defaultdict, namedtuple, OrderedDict
+from contextlib import contextmanager, redirect_stdout
 from fnmatch import fnmatchcase
 from itertools import product
 
@@ -23,7 +25,8 @@ from openmdao.core.indepvarcomp import IndepVarComp
 from openmdao.core.total_jac import _TotalJacInfo
 from openmdao.core.constants import _DEFAULT_OUT_STREAM, _UNDEFINED, INT_DTYPE
 from openmdao.approximation_schemes.complex_step import ComplexStep
-from openmdao.approximation_schemes.finite_difference import FiniteDifference
+from openmdao.approximation_schemes.finite_difference import FiniteDifference, FDForm, \
+    DEFAULT_ORDER, _generate_fd_coeff
 from openmdao.solvers.solver import SolverInfo
 from openmdao.error_checking.check_config import _default_checks, _all_checks
 from openmdao.recorders.recording_iteration_stack import _RecIteration
@@ -43,6 +46,7 @@ from openmdao.utils.name_maps import abs_key2rel_key
 from openmdao.vectors.vector import _full_slice
 from openmdao.vectors.default_vector import DefaultVector
 from openmdao.utils.logger_utils import get_logger, TestLogger
+from openmdao.utils.setup_cache import SetupCache
 import openmdao.utils.coloring as coloring_mod
 from openmdao.utils.hooks import _setup_hooks
 
@@ -181,6 +185,23 @@ class Problem(object):
         self.options.declare('coloring_dir', types=str,
                              default=os.path.join(os.getcwd(), 'coloring_files'),
                              desc='Directory containing coloring files (if any) for this Problem.')
+        self.options.declare('setup_cache_dir', types=str, default=None, allow_none=True,
+                             desc='Directory containing cached setup results for this Problem. '
+                                  'If set, setup results that only depend on the structure of '
+                                  'the model are saved there and reused by later setups of a '
+                                  'model with the same structure. Ignored under MPI.')
+        self.options.declare('alias_inputs', types=bool, default=False,
+                             desc='If True, connected inputs that need no src_indices, unit '
+                                  'conversion or scaling are read-only views of their source '
+                                  'outputs in the nonlinear vectors, so they take no memory and '
+                                  'are never transferred. Inputs connected by a ParallelGroup or '
+                                  'a group using NonlinearBlockJac, and inputs of subsystems '
+                                  'added with alias_inputs=False, are not aliased. An input gets '
+                                  'its own storage when it is set or perturbed for a derivative '
+                                  'approximation. If a component modifies an aliased input in '
+                                  'place, the call is run again on temporary copies of its '
+                                  'aliased inputs, and so are all of its later calls. Ignored '
+                                  'under MPI.')
         self.options.update(options)
 
         # Case recording options
@@ -552,7 +573,9 @@ class Problem(object):
                 # TODO: maybe remove this if inputs are removed from case recording
                 if n_proms < 2:
                     if model._inputs._contains_abs(abs_name):
-                        model._inputs.set_var(abs_name, ivalue, indices)
+                        # an aliased input already sees the value set in its source
+                        if abs_name not in model._inputs._aliases:
+                            model._inputs.set_var(abs_name, ivalue, indices)
                     elif abs_name in model._discrete_inputs:
                         model._discrete_inputs[abs_name] = value
                     else:
@@ -606,6 +629,7 @@ class Problem(object):
             self.model._reset_iter_counts()
 
         self._run_counter += 1
+        self._metadata['run_counter'] = self._run_counter
 
         self.final_setup()
         self.model._clear_iprint()
@@ -644,6 +668,7 @@ class Problem(object):
             self.model._reset_iter_counts()
 
         self._run_counter += 1
+        self._metadata['run_counter'] = self._run_counter
 
         self.final_setup()
         self.model._clear_iprint()
@@ -862,15 +887,28 @@ class Problem(object):
 
         model_comm = self.driver._setup_comm(comm)
 
+        if self.options['setup_cache_dir'] is not None and comm.size == 1:
+            setup_cache = SetupCache(self.options['setup_cache_dir'])
+        else:
+            setup_cache = None
+
         # this metadata will be shared by all Systems/Solvers in the system tree
         self._metadata = {
             'coloring_dir': self.options['coloring_dir'],  # directory for coloring files
+            'setup_cache': setup_cache,  # cache of setup results keyed by model structure
             'recording_iter': _RecIteration(),  # manager of recorder iterations
             'local_vector_class': local_vector_class,
             'distributed_vector_class': distributed_vector_class,
             'solver_info': SolverInfo(),
             'use_derivatives': derivatives,
             'force_alloc_complex': force_alloc_complex,
+            'lazy_complex': False,  # if True, complex vector storage is allocated on demand
+            'alias_inputs': self.options['alias_inputs'] and comm.size == 1,
+            'aliased_inputs': {},  # inputs that are views of their source outputs, mapped to
+                                   # the source
+            'shared_memory': False,  # if True, nonlinear root vectors are shared with the worker
+                                     # processes of ParallelGroups
+            'run_counter': self._run_counter,  # counts run_model and run_driver calls
             'vars_to_gather': {},  # vars that are remote somewhere. does not include distrib vars
             'prom2abs': {'input': {}, 'output': {}},  # includes ALL promotes including buried ones
             'static_mode': False,  # used to determine where various 'static'
@@ -924,6 +962,9 @@ class Problem(object):
         if self._metadata['setup_status'] < _SetupStatus.POST_FINAL_SETUP:
             self.model._final_setup(self.comm)
 
+            if self._metadata['setup_cache'] is not None:
+                self._metadata['setup_cache'].save()
+
         driver._setup_driver(self)
 
         info = driver._coloring_info
@@ -978,7 +1019,8 @@ class Problem(object):
     def check_partials(self, out_stream=_DEFAULT_OUT_STREAM, includes=None, excludes=None,
                        compact_print=False, abs_err_tol=1e-6, rel_err_tol=1e-6,
                        method='fd', step=None, form='forward', step_calc='abs',
-                       force_dense=True, show_only_incorrect=False):
+                       force_dense=True, show_only_incorrect=False, use_coloring=False,
+                       n_procs=1):
         """
         Check partial derivatives comprehensively for all components in your model.
 
@@ -1017,6 +1059,12 @@ class Problem(object):
             If True, analytic derivatives will be coerced into arrays. Default is True.
         show_only_incorrect : bool, optional
             Set to True if output should print only the subjacs found to be incorrect.
+        use_coloring : bool
+            If True, components that declared a partial coloring are approximated using that
+            coloring, which only checks the nonzero entries of their sparsity. Default is False.
+        n_procs : int
+            Number of local processes to spread the components over. The processes are forked,
+            so this isn't available under MPI or on platforms that can't fork. Default is 1.
 
         Returns
         -------
@@ -1042,6 +1090,14 @@ class Problem(object):
             raise RuntimeError(self.msginfo +
                                ": Can't check partials.  Derivative support has been turned off.")
 
+        if n_procs > 1:
+            if self.comm.size > 1:
+                raise RuntimeError(self.msginfo + ": Can't check partials using n_procs > 1 when "
+                                   "running under MPI.")
+            if 'fork' not in multiprocessing.get_all_start_methods():
+                raise RuntimeError(self.msginfo + ": Can't check partials using n_procs > 1 "
+                                   "because processes can't be forked on this platform.")
+
         # TODO: Once we're tracking iteration counts, run the model if it has not been run before.
 
         includes = [includes] if isinstance(includes, str) else includes
@@ -1076,9 +1132,78 @@ class Problem(object):
 
         self.set_solver_print(level=0)
 
+        args = (method, step, form, step_calc, force_dense, use_coloring)
+        if n_procs > 1 and len(comps) > 1:
+            partials_data, indep_key, all_fd_options, comps_could_not_cs = \
+                self._get_partials_data_parallel(comps, n_procs, args)
+        else:
+            partials_data, indep_key, all_fd_options, comps_could_not_cs = \
+                self._get_partials_data(comps, *args)
+
+        # Matrix-free components have a reverse jacobian too.
+        print_reverse = any(comp.matrix_free for comp in comps)
+
+        if out_stream == _DEFAULT_OUT_STREAM:
+            out_stream = sys.stdout
+
+        if len(comps_could_not_cs) > 0:
+            msg = "The following components requested complex step, but force_alloc_complex " + \
+                  "has not been set to True, so finite difference was used: "
+            msg += str(list(comps_could_not_cs))
+            msg += "\nTo enable complex step, specify 'force_alloc_complex=True' when calling " + \
+                   "setup on the problem, e.g. 'problem.setup(force_alloc_complex=True)'"
+            simple_warning(msg)
+
+        _assemble_derivative_data(partials_data, rel_err_tol, abs_err_tol, out_stream,
+                                  compact_print, comps, all_fd_options, indep_key=indep_key,
+                                  print_reverse=print_reverse,
+                                  show_only_incorrect=show_only_incorrect)
+
+        return partials_data
+
+    def _get_partials_data(self, comps, method, step, form, step_calc, force_dense,
+                           use_coloring):
+        """
+        Compute the analytic and approximated partial derivatives of the given components.
+
+        Parameters
+        ----------
+        comps : list of Component
+            Components to check.
+        method : str
+            Method, 'fd' for finite difference or 'cs' for complex step.
+        step : float or None
+            Step size for approximation.
+        form : string
+            Form for finite difference.
+        step_calc : string
+            Step type for finite difference.
+        force_dense : bool
+            If True, analytic derivatives will be coerced into arrays.
+        use_coloring : bool
+            If True, approximate the partials of components with a partial coloring using that
+            coloring.
+
+        Returns
+        -------
+        dict
+            Partial derivative data keyed by component name, then (of, wrt) tuple.
+        dict
+            Set of (of, wrt) tuples that are not declared dependent, keyed by component name.
+        dict
+            Approximation options keyed by component name, then wrt.
+        set
+            Names of the components that requested complex step but got finite difference.
+        """
+        model = self.model
+
         # This is a defaultdict of (defaultdict of dicts).
         partials_data = defaultdict(lambda: defaultdict(dict))
 
+        # The inputs of every component are perturbed, so they can't be views of their sources.
+        # This changes the layout of the input vector, so it must be done before caching it.
+        model._unalias_inputs()
+
         # Caching current point to restore after setups.
         input_cache = model._inputs.asarray(copy=True)
         output_cache = model._outputs.asarray(copy=True)
@@ -1091,7 +1216,6 @@ class Problem(object):
         mfree_directions = {}
 
         # Analytic Jacobians
-        print_reverse = False
         for mode in ('fwd', 'rev'):
             model._inputs.set_val(input_cache)
             model._outputs.set_val(output_cache)
@@ -1120,21 +1244,22 @@ class Problem(object):
                     # Matrix-free components need to calculate their Jacobian by matrix-vector
                     # product.
                     if matrix_free:
-                        print_reverse = True
                         local_opts = comp._get_check_partial_options(include_wrt_outputs=imp)
 
-                        dstate = comp._vectors['output']['linear']
                         if mode == 'fwd':
-                            dinputs = comp._vectors['input']['linear']
-                            doutputs = comp._vectors['residual']['linear']
                             in_list = wrt_list
                             out_list = of_list
                         else:
-                            dinputs = comp._vectors['residual']['linear']
-                            doutputs = comp._vectors['input']['linear']
                             in_list = of_list
                             out_list = wrt_list
 
+                        # Components that handle multi-vectors get all of the seeds of a variable
+                        # in a single product.
+                        multi = comp.supports_multivecs if explicit else comp.has_apply_multi_linear
+                        multi = multi and not (comp._has_input_scaling or
+                                               comp._has_output_scaling or
+                                               comp._has_resid_scaling)
+
                         for inp in in_list:
                             inp_abs = rel_name2abs_name(comp, inp)
                             if mode == 'fwd':
@@ -1143,11 +1268,10 @@ class Problem(object):
                             else:
                                 directional = c_name in mfree_directions
 
-                            try:
-                                flat_view = dinputs._abs_get_val(inp_abs)
-                            except KeyError:
-                                # Implicit state
-                                flat_view = dstate._abs_get_val(inp_abs)
+                            if inp_abs in comp._var_abs2meta['input']:
+                                size = comp._var_abs2meta['input'][inp_abs]['size']
+                            else:
+                                size = comp._var_abs2meta['output'][inp_abs]['size']
 
                             if directional:
                                 n_in = 1
@@ -1157,67 +1281,82 @@ class Problem(object):
                                 if inp in mfree_directions[c_name]:
                                     perturb = mfree_directions[c_name][inp]
                                 else:
-                                    perturb = 2.0 * np.random.random(len(flat_view)) - 1.0
+                                    perturb = 2.0 * np.random.random(size) - 1.0
                                     mfree_directions[c_name][inp] = perturb
 
                             else:
-                                n_in = len(flat_view)
+                                n_in = size
                                 perturb = 1.0
 
-                            for idx in range(n_in):
+                            if multi and not directional and n_in > 1:
+                                ncol = n_in
+                                seeds = [_full_slice]
+                            else:
+                                ncol = 1
+                                seeds = range(n_in)
+
+                            with _multivec_context(comp, ncol, mode) as (dinputs, dstate,
+                                                                         doutputs):
+                                try:
+                                    flat_view = dinputs._abs_get_val(inp_abs)
+                                except KeyError:
+                                    # Implicit state
+                                    flat_view = dstate._abs_get_val(inp_abs)
+
+                                for idx in seeds:
+
+                                    dinputs.set_val(0.0)
+                                    dstate.set_val(0.0)
+
+                                    # Dictionary access returns a scalar for 1d input, and we
+                                    # need a vector for clean code, so use _views_flat.
+                                    if directional:
+                                        flat_view[:] = perturb
+                                    elif ncol > 1:
+                                        # one column per seed
+                                        flat_view[:] = np.eye(n_in)
+                                    else:
+                                        flat_view[idx] = perturb
 
-                                dinputs.set_val(0.0)
-                                dstate.set_val(0.0)
+                                    # Matrix Vector Product
+                                    comp._apply_linear(None, ['linear'], _contains_all, mode)
 
-                                # Dictionary access returns a scalar for 1d input, and we
-                                # need a vector for clean code, so use _views_flat.
-                                if directional:
-                                    flat_view[:] = perturb
-                                else:
-                                    flat_view[idx] = perturb
+                                    for out in out_list:
+                                        out_abs = rel_name2abs_name(comp, out)
 
-                                # Matrix Vector Product
-                                comp._apply_linear(None, ['linear'], _contains_all, mode)
+                                        try:
+                                            derivs = doutputs._abs_get_val(out_abs)
+                                        except KeyError:
+                                            # Implicit state
+                                            derivs = dstate._abs_get_val(out_abs)
 
-                                for out in out_list:
-                                    out_abs = rel_name2abs_name(comp, out)
+                                        if mode == 'fwd':
+                                            deriv = partials_data[c_name][out, inp]
 
-                                    try:
-                                        derivs = doutputs._abs_get_val(out_abs)
-                                    except KeyError:
-                                        # Implicit state
-                                        derivs = dstate._abs_get_val(out_abs)
+                                            # Allocate first time
+                                            if jac_key not in deriv:
+                                                deriv[jac_key] = np.zeros((len(derivs), n_in))
 
-                                    if mode == 'fwd':
-                                        key = out, inp
-                                        deriv = partials_data[c_name][key]
+                                            deriv[jac_key][:, idx] = derivs
 
-                                        # Allocate first time
-                                        if jac_key not in deriv:
-                                            shape = (len(derivs), n_in)
-                                            deriv[jac_key] = np.zeros(shape)
+                                        else:
+                                            deriv = partials_data[c_name][inp, out]
 
-                                        deriv[jac_key][:, idx] = derivs
+                                            if directional:
+                                                # Dot product test for adjoint validity.
+                                                m = mfree_directions[c_name][out]
+                                                d = mfree_directions[c_name][inp]
+                                                mhat = derivs
+                                                dhat = deriv['J_fwd'][:, idx]
 
-                                    else:
-                                        key = inp, out
-                                        deriv = partials_data[c_name][key]
+                                                deriv['directional_fwd_rev'] = \
+                                                    mhat.dot(m) - dhat.dot(d)
 
-                                        if directional:
-                                            # Dot product test for adjoint validity.
-                                            m = mfree_directions[c_name][out]
-                                            d = mfree_directions[c_name][inp]
-                                            mhat = derivs
-                                            dhat = partials_data[c_name][inp, out]['J_fwd'][:, idx]
+                                            # Allocate first time
+                                            if jac_key not in deriv:
+                                                deriv[jac_key] = np.zeros((n_in, len(derivs)))
 
-                                            deriv['directional_fwd_rev'] = mhat.dot(m) - dhat.dot(d)
-
-                                        # Allocate first time
-                                        if jac_key not in deriv:
-                                            shape = (n_in, len(derivs))
-                                            deriv[jac_key] = np.zeros(shape)
-
-                                        deriv[jac_key][idx, :] = derivs
+                                            deriv[jac_key][idx, :] = derivs.T
 
                     # These components already have a Jacobian with calculated derivatives.
                     else:
@@ -1304,6 +1443,15 @@ class Problem(object):
 
             # Load up approximation objects with the requested settings.
             local_opts = comp._get_check_partial_options()
+
+            # A declared partial coloring can be reused as long as all of its wrts are
+            # approximated with the same options.
+            colored_wrts = ()
+            if use_coloring and comp._get_static_coloring() is not None:
+                comp._update_wrt_matches(comp._coloring_info)
+                if not comp._coloring_info['wrt_matches_prom'].intersection(local_opts):
+                    colored_wrts = comp._coloring_info['wrt_matches_prom']
+
             for rel_key in product(of, wrt):
                 abs_key = rel_key2abs_key(comp, rel_key)
                 local_wrt = rel_key[1]
@@ -1353,8 +1501,14 @@ class Problem(object):
                 else:
                     vector = None
 
+                if local_wrt in colored_wrts:
+                    approx_options = dict(fd_options, coloring=True)
+                else:
+                    approx_options = fd_options
+
                 approximations[fd_options['method']].add_approximation(abs_key, self.model,
-                                                                       fd_options, vector=vector)
+                                                                       approx_options,
+                                                                       vector=vector)
 
             approx_jac = {}
             for approximation in approximations.values():
@@ -1384,27 +1538,50 @@ class Problem(object):
         # Conversion of defaultdict to dicts
         partials_data = {comp_name: dict(outer) for comp_name, outer in partials_data.items()}
 
-        if out_stream == _DEFAULT_OUT_STREAM:
-            out_stream = sys.stdout
+        return partials_data, indep_key, all_fd_options, comps_could_not_cs
 
-        if len(comps_could_not_cs) > 0:
-            msg = "The following components requested complex step, but force_alloc_complex " + \
-                  "has not been set to True, so finite difference was used: "
-            msg += str(list(comps_could_not_cs))
-            msg += "\nTo enable complex step, specify 'force_alloc_complex=True' when calling " + \
-                   "setup on the problem, e.g. 'problem.setup(force_alloc_complex=True)'"
-            simple_warning(msg)
+    def _get_partials_data_parallel(self, comps, n_procs, args):
+        """
+        Compute the partial derivative data of the given components in forked processes.
 
-        _assemble_derivative_data(partials_data, rel_err_tol, abs_err_tol, out_stream,
-                                  compact_print, comps, all_fd_options, indep_key=indep_key,
-                                  print_reverse=print_reverse,
-                                  show_only_incorrect=show_only_incorrect)
+        Parameters
+        ----------
+        comps : list of Component
+            Components to check.
+        n_procs : int
+            Number of processes.
+        args : tuple
+            Remaining arguments of _get_partials_data.
 
-        return partials_data
+        Returns
+        -------
+        tuple
+            The partial derivative data of all of the components, as returned by
+            _get_partials_data.
+        """
+        results = _run_forked(self, self._get_partials_data, comps, min(n_procs, len(comps)),
+                              args)
+
+        partials_data = {}
+        indep_key = {}
+        all_fd_options = {}
+        comps_could_not_cs = set()
+        for data, indep, fd_options, could_not_cs in results:
+            partials_data.update(data)
+            indep_key.update(indep)
+            all_fd_options.update(fd_options)
+            comps_could_not_cs.update(could_not_cs)
+
+        # keep the component order of a serial check
+        partials_data = {comp.pathname: partials_data[comp.pathname] for comp in comps
+                         if comp.pathname in partials_data}
+
+        return partials_data, indep_key, all_fd_options, comps_could_not_cs
 
     def check_totals(self, of=None, wrt=None, out_stream=_DEFAULT_OUT_STREAM, compact_print=False,
                      driver_scaling=False, abs_err_tol=1e-6, rel_err_tol=1e-6,
-                     method='fd', step=None, form=None, step_calc='abs'):
+                     method='fd', step=None, form=None, step_calc='abs', use_coloring=False,
+                     directional=False, n_procs=1, seed=None):
         """
         Check total derivatives for the model vs. finite difference.
 
@@ -1443,6 +1620,19 @@ class Problem(object):
         step_calc : string
             Step type for finite difference, can be 'abs' for absolute', or 'rel' for relative.
             Default is 'abs'.
+        use_coloring : bool
+            If True, perturb structurally independent design variable entries together, using the
+            driver's total coloring if it covers the same variables, else a sparsity computed
+            from the analytic totals. Default is False.
+        directional : bool
+            If True, check each column block of the total jacobian along a random direction, so
+            only one perturbation per design variable is needed. Default is False.
+        n_procs : int
+            Number of processes used to evaluate the perturbed points. Processes are forked, so
+            this is not available under MPI or on platforms without fork. Default is 1.
+        seed : int or None
+            Seed of the random directions used when directional is True. Default is None, which
+            gives different directions in each call.
 
         Returns
         -------
@@ -1468,6 +1658,15 @@ class Problem(object):
                   "setup on the problem, e.g. 'problem.setup(force_alloc_complex=True)'"
             raise RuntimeError(msg)
 
+        direct = use_coloring or directional or n_procs > 1
+        if direct:
+            if self.comm.size > 1:
+                raise RuntimeError(self.msginfo + ": Can't check totals using use_coloring, "
+                                   "directional or n_procs > 1 when running under MPI.")
+            if n_procs > 1 and 'fork' not in multiprocessing.get_all_start_methods():
+                raise RuntimeError(self.msginfo + ": Can't check totals using n_procs > 1 "
+                                   "because processes can't be forked on this platform.")
+
         # TODO: Once we're tracking iteration counts, run the model if it has not been run before.
 
         # Calculate Total Derivatives
@@ -1487,25 +1686,35 @@ class Problem(object):
             'form': form,
             'step_calc': step_calc,
         }
-        approx = model._owns_approx_jac
-        approx_of = model._owns_approx_of
-        approx_wrt = model._owns_approx_wrt
-        old_jac = model._jacobian
-        old_subjacs = model._subjacs_info.copy()
-
-        model.approx_totals(method=method, step=step, form=form,
-                            step_calc=step_calc if method == 'fd' else None)
-        total_info = _TotalJacInfo(self, of, wrt, False, return_format='flat_dict', approx=True,
-                                   driver_scaling=driver_scaling)
-        Jfd = total_info.compute_totals_approx(initialize=True)
 
-        # reset the _owns_approx_jac flag after approximation is complete.
-        if not approx:
-            model._jacobian = old_jac
-            model._owns_approx_jac = False
-            model._owns_approx_of = approx_of
-            model._owns_approx_wrt = approx_wrt
-            model._subjacs_info = old_subjacs
+        if direct:
+            Jfd, directions = self._approx_totals_for_check(total_info, method, step, form,
+                                                            step_calc, use_coloring, directional,
+                                                            n_procs, seed)
+            if directional:
+                fd_args['directional'] = True
+                for key, val in Jcalc.items():
+                    Jcalc[key] = val.dot(directions[key[1]]).reshape((val.shape[0], 1))
+        else:
+            approx = model._owns_approx_jac
+            approx_of = model._owns_approx_of
+            approx_wrt = model._owns_approx_wrt
+            old_jac = model._jacobian
+            old_subjacs = model._subjacs_info.copy()
+
+            model.approx_totals(method=method, step=step, form=form,
+                                step_calc=step_calc if method == 'fd' else None)
+            total_info = _TotalJacInfo(self, of, wrt, False, return_format='flat_dict',
+                                       approx=True, driver_scaling=driver_scaling)
+            Jfd = total_info.compute_totals_approx(initialize=True)
+
+            # reset the _owns_approx_jac flag after approximation is complete.
+            if not approx:
+                model._jacobian = old_jac
+                model._owns_approx_jac = False
+                model._owns_approx_of = approx_of
+                model._owns_approx_wrt = approx_wrt
+                model._subjacs_info = old_subjacs
 
         # Assemble and Return all metrics.
         data = {}
@@ -1531,6 +1740,184 @@ class Problem(object):
                                   [model], {'': fd_args}, totals=True)
         return data['']
 
+    def _approx_totals_for_check(self, total_info, method, step, form, step_calc, use_coloring,
+                                 directional, n_procs, seed):
+        """
+        Approximate the total jacobian for check_totals by perturbing the model outputs directly.
+
+        Parameters
+        ----------
+        total_info : _TotalJacInfo
+            Object that computed the analytic totals being checked.
+        method : str
+            Method, 'fd' for finite difference or 'cs' for complex step.
+        step : float
+            Step size for approximation.
+        form : str or None
+            Form for finite difference.
+        step_calc : str
+            Step type for finite difference, 'abs' or 'rel'.
+        use_coloring : bool
+            If True, perturb the columns of each color of a total coloring together.
+        directional : bool
+            If True, perturb each design variable along a random direction.
+        n_procs : int
+            Number of processes used to evaluate the perturbed points.
+        seed : int or None
+            Seed of the random directions.
+
+        Returns
+        -------
+        dict
+            Approximated totals keyed by (of, wrt) promoted name tuples.
+        dict or None
+            Random direction of each promoted design variable, or None if not directional.
+        """
+        model = self.model
+        outputs = model._outputs
+        slices = outputs.get_slice_dict()
+        abs2meta = model._var_allprocs_abs2meta['output']
+        has_scaling = total_info.has_scaling
+
+        wrt_pos = np.hstack([_voi_vec_positions(slices[name], total_info.wrt_meta[name][1],
+                                                abs2meta[name]['shape'])
+                             for name in total_info.wrt])
+        of_pos = np.hstack([_voi_vec_positions(slices[name], total_info.of_meta[name][1],
+                                               abs2meta[name]['shape'])
+                            for name in total_info.of])
+
+        steps = np.full(total_info.wrt_size, step)
+        if method == 'fd' and step_calc == 'rel':
+            for name in total_info.wrt:
+                norm = np.linalg.norm(outputs._abs_get_val(name))
+                if norm != 0.:
+                    steps[total_info.wrt_meta[name][0]] *= norm
+
+        if method == 'cs':
+            fd_form = FDForm(deltas=np.array([1j]), coeffs=np.array([1.]), current_coeff=0.)
+        else:
+            if form is None:
+                form = FiniteDifference.DEFAULT_OPTIONS['form']
+            fd_form = _generate_fd_coeff(form, DEFAULT_ORDER.get(form), model)
+
+        # each point perturbs some entries of the design variables by some amount
+        directions = None
+        if directional:
+            # a generator of our own leaves the global random state of the user alone
+            rng = np.random.default_rng(seed)
+            directions = {}
+            points = []
+            for prom_wrt, name in zip(total_info.prom_wrt, total_info.wrt):
+                cols = total_info.wrt_meta[name][0]
+                directions[prom_wrt] = direction = \
+                    2.0 * rng.random(cols.stop - cols.start) - 1.0
+                if total_info.col_scaler is not None:
+                    # take the step along the direction in scaled space
+                    direction = direction * total_info.col_scaler[cols]
+                points.append((wrt_pos[cols], steps[cols] * direction))
+        else:
+            if use_coloring:
+                coloring = total_info.simul_coloring
+                if coloring is not None:
+                    sparsity = coloring.get_dense_sparsity()
+                else:
+                    # _get_bool_total_jac prints a report of its sweep that doesn't belong here
+                    with redirect_stdout(StringIO()):
+                        sparsity, _ = coloring_mod._get_bool_total_jac(self, of=total_info.of,
+                                                                       wrt=total_info.wrt,
+                                                                       use_abs_names=True)
+                coloring = coloring_mod._compute_coloring(sparsity, 'fwd')
+                col_groups = list(coloring.color_nonzero_iter('fwd'))
+            else:
+                col_groups = [([col], [_full_slice]) for col in range(total_info.wrt_size)]
+            points = [(wrt_pos[cols], steps[cols]) for cols, _ in col_groups]
+
+        f0 = outputs._data[of_pos]
+
+        if n_procs > 1 and len(points) > 1:
+            n_procs = min(n_procs, len(points))
+            diffs = [None] * len(points)
+            for iproc, proc_diffs in enumerate(_run_forked(self, self._run_total_check_points,
+                                                           points, n_procs,
+                                                           (fd_form, of_pos, f0))):
+                diffs[iproc::n_procs] = proc_diffs
+        else:
+            diffs = self._run_total_check_points(points, fd_form, of_pos, f0)
+
+        J = np.zeros((total_info.of_size, 1 if directional else total_info.wrt_size))
+
+        if directional:
+            Jfd = {}
+            for diff, prom_wrt, name in zip(diffs, total_info.prom_wrt, total_info.wrt):
+                J[:, 0] = diff / steps[total_info.wrt_meta[name][0].start]
+                for prom_of, of_name in zip(total_info.prom_of, total_info.of):
+                    Jfd[prom_of, prom_wrt] = sub = J[total_info.of_meta[of_name][0]].copy()
+                    if total_info.row_scaler is not None:
+                        sub *= total_info.row_scaler[total_info.of_meta[of_name][0], np.newaxis]
+        else:
+            for diff, (cols, nzrows) in zip(diffs, col_groups):
+                for col, rows in zip(cols, nzrows):
+                    J[rows, col] = diff[rows] / steps[col]
+
+            Jfd = total_info._get_dict_J(J, total_info.wrt, total_info.prom_wrt, total_info.of,
+                                         total_info.prom_of, total_info.wrt_meta,
+                                         total_info.of_meta, 'flat_dict')
+            if has_scaling:
+                total_info._do_driver_scaling(J)
+
+        return Jfd, directions
+
+    def _run_total_check_points(self, points, fd_form, of_pos, f0):
+        """
+        Solve the model at each of the given perturbed points and difference the results.
+
+        Parameters
+        ----------
+        points : list of (ndarray, ndarray)
+            Output vector positions and the amounts they are perturbed by at each point.
+        fd_form : FDForm
+            Deltas and coefficients of the difference formula, not scaled by the step. Complex
+            deltas indicate complex step.
+        of_pos : ndarray
+            Output vector positions of the responses.
+        f0 : ndarray
+            Values of the responses at the unperturbed point.
+
+        Returns
+        -------
+        list of ndarray
+            Difference of the responses for each point, still to be divided by the step.
+        """
+        model = self.model
+        vecs = (model._inputs, model._outputs, model._residuals)
+        saved = [vec.asarray(copy=True) for vec in vecs]
+        under_cs = np.iscomplexobj(fd_form.deltas)
+
+        if under_cs:
+            model._set_complex_step_mode(True)
+
+        diffs = []
+        try:
+            for pos, perturbation in points:
+                diff = fd_form.current_coeff * f0
+                for delta, coeff in zip(fd_form.deltas, fd_form.coeffs):
+                    model._outputs._data[pos] += delta * perturbation
+                    model.run_solve_nonlinear()
+                    diff = diff + coeff * model._outputs._data[of_pos]
+
+                    # start every point from the same state
+                    for vec, arr in zip(vecs, saved):
+                        vec.set_val(arr)
+
+                diffs.append(diff.imag if under_cs else diff)
+        finally:
+            if under_cs:
+                model._set_complex_step_mode(False)
+            for vec, arr in zip(vecs, saved):
+                vec.set_val(arr)
+
+        return diffs
+
     def compute_totals(self, of=None, wrt=None, return_format='flat_dict', debug_print=False,
                        driver_scaling=False, use_abs_names=False):
         """
@@ -1822,6 +2209,128 @@ class Problem(object):
             _all_checks[c](self, logger)
 
 
+def _voi_vec_positions(slc, indices, shape):
+    """
+    Return the positions of a design variable or response within the output vector.
+
+    Parameters
+    ----------
+    slc : slice
+        Slice of the whole variable in the output vector.
+    indices : ndarray, slice, tuple or None
+        Indices of the design variable or response, if any.
+    shape : tuple
+        Shape of the variable.
+
+    Returns
+    -------
+    ndarray
+        Flat output vector positions.
+    """
+    pos = np.arange(slc.start, slc.stop, dtype=INT_DTYPE)
+    if indices is None:
+        return pos
+    if _is_slicer_op(indices):
+        return pos.reshape(shape)[indices].ravel()
+    return pos[indices]
+
+
+# Problem, function and arguments of a derivative check spread over forked processes.
+_par_check_info = None
+
+
+def _run_forked(prob, func, items, n_procs, args):
+    """
+    Call func on interleaved shares of the given items in forked processes.
+
+    Parameters
+    ----------
+    prob : Problem
+        The Problem being checked.
+    func : function
+        Called as func(items[iproc::n_procs], *args) in process iproc.
+    items : list
+        Items to be split up among the processes.
+    n_procs : int
+        Number of processes.
+    args : tuple
+        Remaining arguments of func.
+
+    Returns
+    -------
+    list
+        The return value of func in each process, in process order.
+    """
+    global _par_check_info
+
+    _par_check_info = (prob, func, items, n_procs, args)
+    try:
+        with multiprocessing.get_context('fork').Pool(n_procs) as pool:
+            return pool.map(_par_check_worker, range(n_procs))
+    finally:
+        _par_check_info = None
+
+
+def _par_check_worker(iproc):
+    """
+    Run this process's share of the work set up by _run_forked.
+
+    Parameters
+    ----------
+    iproc : int
+        Index of this process.
+
+    Returns
+    -------
+    object
+        The return value of the function passed to _run_forked.
+    """
+    prob, func, items, n_procs, args = _par_check_info
+
+    # the recorders belong to the parent process, so don't write to them from here
+    for system in prob.model.system_iter(include_self=True, recurse=True):
+        system._rec_mgr._recorders = []
+        for solver in (system._nonlinear_solver, system._linear_solver):
+            if solver is not None:
+                solver._rec_mgr._recorders = []
+
+    return func(items[iproc::n_procs], *args)
+
+
+@contextmanager
+def _multivec_context(comp, ncol, mode):
+    """
+    Temporarily replace the linear vectors of a component with multi-vectors if ncol > 1.
+
+    Parameters
+    ----------
+    comp : Component
+        Component computing the jacobian-vector products.
+    ncol : int
+        Number of columns of the linear vectors.
+    mode : str
+        'fwd' or 'rev'.
+
+    Yields
+    ------
+    (Vector, Vector, Vector)
+        The vector holding the seeds, the output vector and the vector holding the products.
+    """
+    vectors = comp._vectors
+    old = {kind: vectors[kind]['linear'] for kind in ('input', 'output', 'residual')}
+
+    try:
+        if ncol > 1:
+            for kind in old:
+                vectors[kind]['linear'] = DefaultVector('linear', kind, comp, ncol=ncol)
+
+        seed, prod = ('input', 'residual') if mode == 'fwd' else ('residual', 'input')
+        yield vectors[seed]['linear'], vectors['output']['linear'], vectors[prod]['linear']
+    finally:
+        for kind, vec in old.items():
+            vectors[kind]['linear'] = vec
+
+
 def _assemble_derivative_data(derivative_data, rel_error_tol, abs_error_tol, out_stream,
                               compact_print, system_list, global_options, totals=False,
                               indep_key=None, print_reverse=False,
@@ -348,6 +348,8 @@ class System(object):
                                        "on System is deprecated. Recording of model metadata will "
                                        "always be done",
                                        default=True)
+        self.recording_options.declare('record_every', types=int, default=1, lower=1,
+                                       desc='Only record every N-th execution of the system')
         self.recording_options.declare('includes', types=list, default=['*'],
                                        desc='Patterns for variables to include in recording. \
                                        Uses fnmatch wildcards')
@@ -580,6 +582,26 @@ class System(object):
         if self._vector_class is None:
             self._vector_class = self._local_vector_class
 
+        # Complex storage is only allocated when a subtree enters complex step mode, unless
+        # one of the vector classes in the tree needs it up front.
+        self._problem_meta['lazy_complex'] = all(
+            getattr(sub._vector_class or self._local_vector_class, 'LAZY_COMPLEX', False)
+            for sub in self.system_iter(include_self=True, recurse=True))
+
+        # Inputs are only aliased if every vector class in the tree supports it.
+        if self._problem_meta['alias_inputs'] and all(
+                getattr(sub._vector_class or self._local_vector_class, 'ALIAS_INPUTS', False)
+                for sub in self.system_iter(include_self=True, recurse=True)):
+            self._problem_meta['aliased_inputs'] = self._get_aliased_inputs()
+        else:
+            self._problem_meta['aliased_inputs'] = {}
+
+        # Worker processes are only used if every vector class in the tree can share its data.
+        if self._problem_meta['shared_memory']:
+            self._problem_meta['shared_memory'] = all(
+                getattr(sub._vector_class or self._local_vector_class, 'SHARED_MEMORY', False)
+                for sub in self.system_iter(include_self=True, recurse=True))
+
         for vec_name in vec_names:
             sizes = self._var_sizes[vec_name]['output']
             ncol = 1
@@ -720,6 +742,9 @@ class System(object):
         self._problem_meta['vec_names'] = new_names
         self._problem_meta['lin_vec_names'] = new_names[1:]
 
+        if prob_meta['setup_cache'] is not None:
+            prob_meta['setup_cache'].set_structure(self, mode)
+
         self._setup_relevance(mode)
         self._setup_var_sizes()
 
@@ -762,6 +787,9 @@ class System(object):
 
         self._setup_vectors(self._get_root_vectors())
 
+        if self._problem_meta['aliased_inputs']:
+            self._setup_input_aliases()
+
         # Transfers do not require recursion, but they have to be set up after the vector setup.
         self._setup_transfers()
 
@@ -983,6 +1011,10 @@ class System(object):
         from openmdao.core.group import Group
         is_total = isinstance(self, Group)
 
+        if not is_total:
+            # the inputs are perturbed directly, so they can't be views of their sources
+            self._unalias_inputs()
+
         # compute perturbations
         starting_inputs = self._inputs.asarray(copy=True)
         in_offsets = starting_inputs.copy()
@@ -1625,9 +1657,13 @@ class System(object):
             derivatives between the VOI and all other VOIs.
         """
         if relevant is None:  # should only occur at top level on full setup
-            self._relevant = relevant = self._init_relevance(mode)
-        else:
-            self._relevant = relevant
+            cache = self._problem_meta['setup_cache']
+            if cache is None:
+                relevant = self._init_relevance(mode)
+            else:
+                relevant = cache.get('relevant', self._init_relevance, mode)
+
+        self._relevant = relevant
 
         self._rel_vec_name_list = ['nonlinear', 'linear']
         for vec_name in self._vec_names[2:]:
@@ -1653,6 +1689,170 @@ class System(object):
         """
         pass
 
+    def _get_aliased_inputs(self):
+        """
+        Return the connected inputs that can be views of their source outputs.
+
+        An input can be a view of its source if it's a local, non-distributed input without
+        src_indices, its value doesn't need unit conversion and its source isn't scaled.
+
+        Inputs connected by a group that updates its subsystems in a Jacobi fashion, i.e. a
+        ParallelGroup or a group using NonlinearBlockJac, are not aliased because they must not
+        see the outputs of their siblings from the current iteration.  Inputs of subsystems
+        added with alias_inputs=False are not aliased either.
+
+        Returns
+        -------
+        dict
+            Mapping of aliasable input names to the names of their source outputs.
+        """
+        from openmdao.core.group import Group
+        from openmdao.core.parallel_group import ParallelGroup
+        from openmdao.solvers.nonlinear.nonlinear_block_jac import NonlinearBlockJac
+
+        abs2meta_in = self._var_abs2meta['input']
+        abs2meta_out = self._var_abs2meta['output']
+        aliases = {}
+
+        jacobi_inputs = set()
+        unaliased_prefixes = []
+        for group in self.system_iter(include_self=True, recurse=True, typ=Group):
+            if isinstance(group, ParallelGroup) or \
+               isinstance(group.nonlinear_solver, NonlinearBlockJac):
+                jacobi_inputs.update(group._conn_abs_in2out)
+            prefix = group.pathname + '.' if group.pathname else ''
+            unaliased_prefixes.extend(prefix + name + '.' for name in group._unaliased_subs)
+        unaliased_prefixes = tuple(unaliased_prefixes)
+
+        for abs_in, abs_out in self._conn_global_abs_in2out.items():
+            if abs_in not in abs2meta_in or abs_out not in abs2meta_out:
+                continue  # discrete or remote
+
+            if abs_in in jacobi_inputs or abs_in.startswith(unaliased_prefixes):
+                continue
+
+            meta_in = abs2meta_in[abs_in]
+            meta_out = abs2meta_out[abs_out]
+
+            if (meta_in['src_indices'] is not None or meta_in['distributed'] or
+                    meta_out['distributed'] or meta_in['size'] != meta_out['size']):
+                continue
+
+            units_in = meta_in['units']
+            units_out = meta_out['units']
+            if units_in is not None and units_out is not None and units_in != units_out:
+                continue
+
+            if np.any(meta_out['ref'] != 1.0) or np.any(meta_out['ref0'] != 0.0):
+                continue
+
+            aliases[abs_in] = abs_out
+
+        return aliases
+
+    def _setup_input_aliases(self, cplx=False):
+        """
+        Make the aliased inputs of the nonlinear input vectors in this subtree views of sources.
+
+        Parameters
+        ----------
+        cplx : bool
+            If True, set up the complex views instead. Sources in this subtree have complex
+            storage, while the sources outside of it keep their real values under complex step.
+        """
+        aliases = self._problem_meta['aliased_inputs']
+
+        model_outputs = self._problem_meta['model_ref']()._outputs
+        if model_outputs._under_complex_step:
+            out_views_flat = model_outputs._cplx_views_flat
+        else:
+            out_views_flat = model_outputs._views_flat
+
+        if cplx:
+            outputs = self._outputs
+            if outputs._under_complex_step:
+                cplx_views_flat = outputs._views_flat
+            else:
+                cplx_views_flat = outputs._cplx_views_flat
+        else:
+            cplx_views_flat = None
+
+        for system in self.system_iter(include_self=True, recurse=True):
+            system._inputs._alias_inputs(aliases, out_views_flat, cplx_views_flat)
+
+    def _unalias_inputs(self, names=None):
+        """
+        Give aliased inputs their own storage, so their values can differ from the source.
+
+        Aliased inputs take no space in the nonlinear input vectors, so the vectors of the whole
+        model are laid out again to make room for them. They start out with the current values
+        of their sources.
+
+        Parameters
+        ----------
+        names : iter of str or None
+            Absolute names of the inputs. Names of inputs that aren't aliased are ignored. If
+            None, all aliased inputs of this system are used.
+        """
+        from openmdao.core.group import Group
+
+        aliases = self._problem_meta['aliased_inputs']
+        if names is None:
+            names = self._inputs._aliases
+        names = [n for n in names if n in aliases]
+        if not names:
+            return
+
+        model = self._problem_meta['model_ref']()
+        systems = list(model.system_iter(include_self=True, recurse=True))
+
+        # a subtree under complex step leaves it while its inputs are laid out again
+        cs_system = None
+        for system in systems:
+            if system._inputs._cplx_owner:
+                cs_system = system
+                cs_vecs = [s._inputs for s in system.system_iter(include_self=True, recurse=True)]
+                cplx_vals = {n: v.copy() for n, v in system._inputs._views_flat.items()}
+                for vec in cs_vecs:
+                    vec.set_complex_step_mode(False)
+                system._inputs._free_complex_data(cs_vecs[1:])
+                break
+
+        vals = {n: v.copy() for n, v in model._inputs._views_flat.items()}
+
+        for n in names:
+            del aliases[n]
+
+        model._root_vecs['input']['nonlinear']._reset_layout()
+        for system in systems:
+            system._inputs._reset_layout()
+
+            # the approximations index into the input vectors
+            for scheme in system._approx_schemes.values():
+                scheme._reset()
+
+        model._setup_input_aliases()
+
+        views_flat = model._inputs._views_flat
+        for n, val in vals.items():
+            if n not in aliases:
+                views_flat[n][:] = val
+
+        if cs_system is not None:
+            cs_system._inputs._alloc_complex_data(cs_vecs[1:])
+            cs_system._setup_input_aliases(cplx=True)
+            for vec in cs_vecs:
+                vec.set_complex_step_mode(True)
+
+            views_flat = cs_system._inputs._views_flat
+            for n, val in cplx_vals.items():
+                if n not in aliases:
+                    views_flat[n][:] = val
+
+        for group in systems:
+            if isinstance(group, Group):
+                group._vector_class.TRANSFER._setup_alias_transfers(group)
+
     def _setup_vectors(self, root_vectors, alloc_complex=False):
         """
         Compute all vectors for all vec names and assign excluded variables lists.
@@ -1806,8 +2006,10 @@ class System(object):
         """
         Set all input and output variables to their declared initial values.
         """
+        aliases = self._inputs._aliases
         for abs_name, meta in self._var_abs2meta['input'].items():
-            self._inputs.set_var(abs_name, meta['value'])
+            if abs_name not in aliases:  # aliased inputs get their value from the source
+                self._inputs.set_var(abs_name, meta['value'])
 
         for abs_name, meta in self._var_abs2meta['output'].items():
             self._outputs.set_var(abs_name, meta['value'])
@@ -2163,6 +2365,42 @@ class System(object):
             d_inputs._names = old_ins
             d_outputs._names = old_outs
 
+    def _alias_safe_call(self, func, *args):
+        """
+        Call a user function, running it again on copies of aliased inputs if it writes to one.
+
+        Aliased inputs are read-only views of their sources. If the function fails because it
+        modifies one of them in place, it is called a second time, so it must not depend on
+        being called only once. The second call and all later calls of the user functions of
+        this system get writable copies of the aliased inputs, which are discarded afterwards.
+
+        Parameters
+        ----------
+        func : function
+            The user function.
+        *args : list
+            Arguments of func.
+
+        Returns
+        -------
+        object
+            The return value of func.
+        """
+        inputs = self._inputs
+        if not inputs._aliases:
+            return func(*args)
+
+        if not inputs._copy_aliases:
+            try:
+                return func(*args)
+            except ValueError as err:
+                if 'read-only' not in str(err):
+                    raise
+            inputs._copy_aliases = True
+
+        with inputs._writable_aliases():
+            return func(*args)
+
     @contextmanager
     def _call_user_function(self, fname, protect_inputs=True,
                             protect_outputs=False, protect_residuals=False):
@@ -3919,9 +4157,9 @@ class System(object):
         """
         global _recordable_funcs
 
-        if self._rec_mgr._recorders:
+        options = self.recording_options
+        if self._rec_mgr._recorders and self.iter_count % options['record_every'] == 0:
             parallel = self._rec_mgr._check_parallel() if self.comm.size > 1 else False
-            options = self.recording_options
             metadata = create_local_meta(self.pathname)
 
             # Get the data to record
@@ -4007,6 +4245,9 @@ class System(object):
         active : bool
             Complex mode flag; set to True prior to commencing complex step.
         """
+        if active:
+            self._setup_complex_storage(True)
+
         for sub in self.system_iter(include_self=True, recurse=True):
             sub.under_complex_step = active
             sub._inputs.set_complex_step_mode(active)
@@ -4030,6 +4271,38 @@ class System(object):
                 if sub._assembled_jac:
                     sub._assembled_jac.set_complex_step_mode(active)
 
+        if not active:
+            self._setup_complex_storage(False)
+
+    def _setup_complex_storage(self, active):
+        """
+        Allocate or release the complex storage of the vectors in this subtree.
+
+        This only does anything if complex storage is allocated on demand.
+
+        Parameters
+        ----------
+        active : bool
+            If True, allocate the storage. Otherwise, release it.
+        """
+        subs = list(self.system_iter(recurse=True))
+        for kind, vecs in self._vectors.items():
+            for vec_name in ('nonlinear', 'linear'):
+                vec = vecs.get(vec_name)
+                if vec is None or not vec._alloc_complex:
+                    continue
+
+                subvecs = [sub._vectors[kind][vec_name] for sub in subs
+                           if vec_name in sub._vectors[kind]]
+                if active:
+                    vec._alloc_complex_data(subvecs)
+                else:
+                    vec._free_complex_data(subvecs)
+
+        if active and self._inputs._aliases:
+            # aliased inputs have no complex storage, so they view that of their sources
+            self._setup_input_aliases(cplx=True)
+
     def _set_approx_mode(self, active):
         """
         Turn on or off approx mode flag.
@@ -0,0 +1,290 @@
+""" Unit tests for inputs that are aliased to their source outputs. """
+import unittest
+
+import numpy as np
+
+import openmdao.api as om
+from openmdao.test_suite.components.sellar import SellarDerivatives, SellarNoDerivatives, \
+    SellarProblem
+from openmdao.utils.assert_utils import assert_near_equal
+
+
+class WritesInputs(om.ExplicitComponent):
+
+    def setup(self):
+        self.add_input('x', np.ones(3))
+        self.add_output('y', np.ones(3))
+        self.declare_partials('y', 'x', rows=np.arange(3), cols=np.arange(3), val=1.0)
+
+    def initialize(self):
+        self.ncalls = 0
+
+    def compute(self, inputs, outputs):
+        self.ncalls += 1
+        x = inputs['x']
+        x += 1.0
+        outputs['y'] = x
+
+
+class TestAliasInputs(unittest.TestCase):
+
+    def test_sellar(self):
+        probs = []
+        for alias_inputs in (False, True):
+            prob = SellarProblem(nl_atol=1e-12, linear_solver=om.DirectSolver)
+            prob.options['alias_inputs'] = alias_inputs
+            prob.setup(force_alloc_complex=True)
+            prob.run_model()
+            probs.append(prob)
+
+        expected, prob = probs
+
+        aliases = prob._metadata['aliased_inputs']
+        self.assertEqual(len(aliases), len(prob.model._conn_global_abs_in2out))
+        self.assertEqual(expected._metadata['aliased_inputs'], {})
+
+        d1 = prob.model.d1
+        self.assertTrue(np.shares_memory(d1._inputs['y2'], prob.model.d2._outputs['y2']))
+        with self.assertRaises(ValueError):
+            d1._inputs['y2'][0] = 1.0
+
+        # all connections are aliased, so the transfers have nothing left to do
+        self.assertIsNone(prob.model._alias_transfers[None])
+
+        # and the aliased inputs take no space in the nonlinear input vector
+        self.assertEqual(len(expected.model._inputs), 14)
+        self.assertEqual(len(prob.model._inputs), 0)
+        self.assertEqual(len(prob.model._vectors['input']['linear']), 14)
+
+        for name in ('obj', 'con1', 'con2', 'y1', 'y2', 'd1.y2'):
+            assert_near_equal(prob[name], expected[name], 1e-10)
+
+        J_expected = expected.compute_totals()
+        J = prob.compute_totals()
+        for key, val in J_expected.items():
+            assert_near_equal(J[key], val, 1e-8)
+
+    def test_approx_partials(self):
+        probs = []
+        for alias_inputs in (False, True):
+            prob = SellarProblem(SellarNoDerivatives, nl_atol=1e-12, linear_solver=om.DirectSolver)
+            prob.options['alias_inputs'] = alias_inputs
+            prob.setup(force_alloc_complex=True)
+            prob.run_model()
+            probs.append(prob)
+
+        expected, prob = probs
+
+        J_expected = expected.compute_totals()
+        J = prob.compute_totals()
+        for key, val in J_expected.items():
+            assert_near_equal(J[key], val, 1e-5)
+
+        # inputs perturbed by finite differencing get their own storage
+        d1 = prob.model.cycle.d1
+        self.assertEqual(d1._inputs._aliases, {})
+        self.assertNotIn('cycle.d1.y2', prob._metadata['aliased_inputs'])
+        self.assertIn('obj_cmp.y1', prob._metadata['aliased_inputs'])
+
+        prob['x'] = 2.0
+        expected['x'] = 2.0
+        prob.run_model()
+        expected.run_model()
+        assert_near_equal(prob['obj'], expected['obj'], 1e-10)
+
+    def test_complex_step(self):
+        probs = []
+        for alias_inputs in (False, True):
+            prob = SellarProblem(nl_atol=1e-12, linear_solver=om.DirectSolver)
+            prob.options['alias_inputs'] = alias_inputs
+            prob.setup(force_alloc_complex=True)
+            prob.run_model()
+            probs.append(prob)
+
+        expected, prob = probs
+
+        data = prob.check_partials(method='cs', out_stream=None)
+        for comp_data in data.values():
+            for val in comp_data.values():
+                assert_near_equal(val['abs error'].forward, 0.0, 1e-10)
+
+        data_expected = expected.check_totals(method='cs', out_stream=None)
+        data = prob.check_totals(method='cs', out_stream=None)
+        for key, val in data_expected.items():
+            assert_near_equal(data[key]['J_fd'], val['J_fd'], 1e-10)
+
+    def test_not_aliased(self):
+        prob = om.Problem(alias_inputs=True)
+        model = prob.model
+
+        ivc = model.add_subsystem('ivc', om.IndepVarComp())
+        ivc.add_output('a', np.arange(3.), units='m')
+        model.add_subsystem('src', om.ExecComp('b = 1.0 * a', a=np.arange(3.),
+                                               b={'value': np.ones(3), 'ref': 2.0}))
+
+        model.add_subsystem('same', om.ExecComp('y = 2.0 * x', x={'value': np.ones(3),
+                                                                   'units': 'm'},
+                                                y=np.ones(3)))
+        model.add_subsystem('conv', om.ExecComp('y = 2.0 * x', x={'value': np.ones(3),
+                                                                   'units': 'cm'},
+                                                y=np.ones(3)))
+        model.add_subsystem('idx', om.ExecComp('y = 2.0 * x', x=np.ones(2), y=np.ones(2)))
+        model.add_subsystem('scaled', om.ExecComp('y = 2.0 * x', x=np.ones(3), y=np.ones(3)))
+
+        model.connect('ivc.a', ['same.x', 'conv.x'])
+        model.connect('ivc.a', 'idx.x', src_indices=[2, 0])
+        model.connect('src.b', 'scaled.x')
+
+        prob.setup()
+        prob.run_model()
+
+        self.assertEqual(prob._metadata['aliased_inputs'], {'same.x': 'ivc.a',
+                                                            'src.a': '_auto_ivc.v0'})
+        assert_near_equal(prob['same.y'], [0., 2., 4.], 1e-15)
+        assert_near_equal(prob['conv.y'], [0., 200., 400.], 1e-15)
+        assert_near_equal(prob['idx.y'], [4., 0.], 1e-15)
+        assert_near_equal(prob['scaled.y'], [0., 2., 4.], 1e-15)
+
+        # only the inputs that aren't aliased are transferred
+        self.assertEqual(model._alias_transfers[None]._in_inds.size, 8)
+
+    def test_set_val(self):
+        prob = SellarProblem(nl_atol=1e-12, linear_solver=om.DirectSolver)
+        prob.options['alias_inputs'] = True
+        prob.setup()
+        prob.run_model()
+
+        prob['d1.z'] = np.array([3.0, 1.0])
+        assert_near_equal(prob['d2.z'], [3.0, 1.0], 1e-15)
+        self.assertIn('d1.z', prob._metadata['aliased_inputs'])
+
+        # setting an aliased input directly gives it its own storage
+        d1 = prob.model.d1
+        size = len(prob.model._inputs)
+        d1._inputs['y2'] = 5.0
+        assert_near_equal(d1._inputs['y2'], 5.0, 1e-15)
+        assert_near_equal(d1._inputs['z'], [3.0, 1.0], 1e-15)
+        self.assertEqual(len(prob.model._inputs), size + 1)
+        self.assertNotIn('d1.y2', d1._inputs._aliases)
+        self.assertNotIn('d1.y2', prob.model._inputs._aliases)
+        self.assertNotEqual(prob['d2.y2'], 5.0)
+
+        prob.run_model()
+        expected = SellarProblem(nl_atol=1e-12, linear_solver=om.DirectSolver)
+        expected.setup()
+        expected['d1.z'] = np.array([3.0, 1.0])
+        expected.run_model()
+        assert_near_equal(prob['obj'], expected['obj'], 1e-10)
+
+    def test_unalias_under_complex_step(self):
+        prob = om.Problem(alias_inputs=True)
+        model = prob.model
+        model.add_subsystem('ivc', om.IndepVarComp('a', np.arange(1., 4.)))
+        sub = model.add_subsystem('sub', om.Group())
+        sub.add_subsystem('pre', om.ExecComp('z = 3.0 * a', a=np.ones(3), z=np.ones(3)))
+        sub.add_subsystem('post', om.ExecComp('s = sum(z)', z=np.ones(3)))
+        sub.connect('pre.z', 'post.z')
+        model.connect('ivc.a', 'sub.pre.a')
+
+        prob.setup(force_alloc_complex=True)
+        prob.run_model()
+        self.assertEqual(len(model._inputs), 0)
+
+        # the input gets its own storage while the group is under complex step
+        sub._set_complex_step_mode(True)
+        sub._inputs['pre.a'] = np.arange(1., 4.) + 1e-40j * np.array([1., 0., 0.])
+        self.assertEqual(prob._metadata['aliased_inputs'], {'sub.post.z': 'sub.pre.z'})
+        self.assertEqual(len(model._inputs), 3)
+
+        sub.run_solve_nonlinear()
+        assert_near_equal(sub._outputs['post.s'].imag, 3e-40, 1e-15)
+        assert_near_equal(sub._inputs['post.z'].imag, [3e-40, 0., 0.], 1e-15)
+        sub._set_complex_step_mode(False)
+
+        prob['ivc.a'] = 2.0
+        prob.run_model()
+        assert_near_equal(prob['sub.pre.a'], [2., 2., 2.], 1e-15)
+        assert_near_equal(prob['sub.post.s'], 18., 1e-15)
+
+    def test_component_writes_inputs(self):
+        prob = om.Problem(alias_inputs=True)
+        model = prob.model
+        model.add_subsystem('ivc', om.IndepVarComp('a', np.arange(3.)))
+        model.add_subsystem('comp', WritesInputs())
+        model.connect('ivc.a', 'comp.x')
+
+        prob.setup()
+        prob.final_setup()
+        self.assertIn('comp.x', prob.model.comp._inputs._aliases)
+
+        for i in range(2):
+            prob.run_model()
+
+            # the component gets its own copy of x, so the source is left alone
+            assert_near_equal(prob['ivc.a'], [0., 1., 2.], 1e-15)
+            assert_near_equal(prob['comp.y'], [1., 2., 3.], 1e-15)
+
+        # compute was run again on a copy after it failed to write to the aliased input
+        self.assertEqual(prob.model.comp.ncalls, 3)
+        self.assertIn('comp.x', prob.model.comp._inputs._aliases)
+        self.assertTrue(prob.model.comp._inputs._copy_aliases)
+
+        # a subsystem added with alias_inputs=False never shares its inputs
+        prob = om.Problem(alias_inputs=True)
+        model = prob.model
+        model.add_subsystem('ivc', om.IndepVarComp('a', np.arange(3.)))
+        model.add_subsystem('comp', WritesInputs(), alias_inputs=False)
+        model.connect('ivc.a', 'comp.x')
+
+        prob.setup()
+        prob.run_model()
+        self.assertEqual(prob.model.comp._inputs._aliases, {})
+        self.assertEqual(prob.model.comp.ncalls, 1)
+        assert_near_equal(prob['comp.y'], [1., 2., 3.], 1e-15)
+
+    def test_jacobi(self):
+        # inputs connected by a block Jacobi solver aren't aliased, so it stays Jacobi
+        for solver_class in (om.NonlinearBlockGS, om.NonlinearBlockJac):
+            probs = []
+            for alias_inputs in (False, True):
+                prob = om.Problem(SellarDerivatives(nonlinear_solver=solver_class, nl_atol=1e-12),
+                                  alias_inputs=alias_inputs)
+                prob.setup()
+                prob.set_solver_print(0)
+                prob.run_model()
+                probs.append(prob)
+
+            expected, prob = probs
+            self.assertEqual(prob.model.nonlinear_solver._iter_count,
+                             expected.model.nonlinear_solver._iter_count)
+            assert_near_equal(prob['obj'], expected['obj'], 1e-10)
+
+            aliases = prob._metadata['aliased_inputs']
+            if solver_class is om.NonlinearBlockJac:
+                self.assertEqual(aliases, {})
+            else:
+                self.assertIn('d1.y2', aliases)
+
+    def test_parallel_group(self):
+        # connections inside a ParallelGroup aren't aliased
+        results = []
+        for alias_inputs in (False, True):
+            prob = om.Problem(alias_inputs=alias_inputs)
+            model = prob.model
+            model.add_subsystem('ivc', om.IndepVarComp('a', 1.0))
+            par = model.add_subsystem('par', om.ParallelGroup())
+            par.add_subsystem('c1', om.ExecComp('y = 2.0 * x'))
+            par.add_subsystem('c2', om.ExecComp('y = 3.0 * x'))
+            model.connect('ivc.a', 'par.c1.x')
+            par.connect('c1.y', 'c2.x')
+
+            prob.setup()
+            prob.run_model()
+            results.append(prob.get_val('par.c2.y').copy())
+
+        self.assertEqual(prob._metadata['aliased_inputs'], {'par.c1.x': 'ivc.a'})
+        assert_near_equal(results[1], results[0], 1e-15)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 """ Testing for Problem.check_partials and check_totals."""
 
+from contextlib import redirect_stdout
 from io import StringIO
 
 
@@ -1864,6 +1865,115 @@ class TestProblemCheckPartials(unittest.TestCase):
 
         assert_check_partials(partials)
 
+    def test_multi_jacvec_seeds(self):
+
+        class DenseMultiJacVec(om.ExplicitComponent):
+
+            def setup(self):
+                self.add_input('x', np.ones(4))
+                self.add_input('z', 2.0)
+                self.add_output('y', np.ones(3))
+                self.A = np.arange(12, dtype=float).reshape((3, 4))
+                self.ncalls = {'single': 0, 'multi': 0}
+
+            def compute(self, inputs, outputs):
+                outputs['y'] = self.A.dot(inputs['x']) + 3.0 * inputs['z']
+
+            def compute_jacvec_product(self, inputs, d_inputs, d_outputs, mode):
+                self.ncalls['single'] += 1
+                if mode == 'fwd':
+                    d_outputs['y'] += self.A.dot(d_inputs['x']) + 3.0 * d_inputs['z']
+                else:
+                    d_inputs['x'] += self.A.T.dot(d_outputs['y'])
+                    d_inputs['z'] += 3.0 * np.sum(d_outputs['y'], axis=0)
+
+            def compute_multi_jacvec_product(self, inputs, d_inputs, d_outputs, mode):
+                self.compute_jacvec_product(inputs, d_inputs, d_outputs, mode)
+                self.ncalls['single'] -= 1
+                self.ncalls['multi'] += 1
+
+        prob = om.Problem()
+        comp = prob.model.add_subsystem('comp', DenseMultiJacVec())
+        prob.setup()
+        prob.run_model()
+
+        data = prob.check_partials(out_stream=None)
+        assert_check_partials(data)
+
+        # all the seeds of x (fwd) and y (rev) go into a single product
+        self.assertEqual(comp.ncalls, {'single': 1, 'multi': 2})
+        assert_near_equal(data['comp']['y', 'x']['J_fwd'], comp.A, 1e-15)
+        assert_near_equal(data['comp']['y', 'x']['J_rev'], comp.A, 1e-15)
+        assert_near_equal(data['comp']['y', 'z']['J_rev'], 3.0 * np.ones((3, 1)), 1e-15)
+
+    def test_use_coloring(self):
+
+        class DiagComp(om.ExplicitComponent):
+
+            def setup(self):
+                self.add_input('x', np.arange(10, dtype=float))
+                self.add_output('y', np.zeros(10))
+                self.declare_partials('y', 'x', method='cs')
+                self.declare_coloring(wrt='x', method='cs')
+                self.ncalls = 0
+
+            def compute(self, inputs, outputs):
+                self.ncalls += 1
+                outputs['y'] = 2.0 * inputs['x'] ** 2
+
+        prob = om.Problem()
+        comp = prob.model.add_subsystem('comp', DiagComp())
+        prob.setup(force_alloc_complex=True)
+        prob.run_model()
+
+        # the first linearization computes the dynamic coloring
+        prob.model.run_linearize()
+
+        comp.ncalls = 0
+        data = prob.check_partials(method='cs', out_stream=None)
+        assert_check_partials(data)
+        uncolored_calls = comp.ncalls
+
+        comp.ncalls = 0
+        colored_data = prob.check_partials(method='cs', out_stream=None, use_coloring=True)
+        assert_check_partials(colored_data)
+
+        # the diagonal jacobian is approximated with a single color instead of 10 columns
+        self.assertLessEqual(comp.ncalls, uncolored_calls - 9)
+        assert_near_equal(colored_data['comp']['y', 'x']['J_fd'],
+                          data['comp']['y', 'x']['J_fd'], 1e-15)
+
+    def test_n_procs(self):
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('p0', om.IndepVarComp('x1', 3.0))
+        model.add_subsystem('p1', om.IndepVarComp('x2', 5.0))
+        model.add_subsystem('c0', MyComp())
+        model.add_subsystem('c1', MyCompBadPartials())
+        model.add_subsystem('comp', ParaboloidMatVec())
+        model.add_subsystem('sub', SellarDerivatives())
+        model.connect('p0.x1', ['c0.x1', 'c1.y1'])
+        model.connect('p1.x2', ['c0.x2', 'c1.y2'])
+        model.connect('c0.y', 'comp.x')
+        prob.setup()
+        prob.run_model()
+
+        stream = StringIO()
+        expected = prob.check_partials(out_stream=stream, compact_print=True)
+
+        par_stream = StringIO()
+        data = prob.check_partials(out_stream=par_stream, compact_print=True, n_procs=3)
+
+        self.assertEqual(list(data), list(expected))
+        for c_name, comp_data in expected.items():
+            self.assertEqual(list(data[c_name]), list(comp_data))
+            for key, deriv in comp_data.items():
+                for name in ('J_fwd', 'J_rev', 'J_fd'):
+                    if name in deriv:
+                        assert_near_equal(data[c_name][key][name], deriv[name], 1e-15)
+
+        self.assertEqual(par_stream.getvalue(), stream.getvalue())
+
 
 class TestCheckPartialsFeature(unittest.TestCase):
 
@@ -2848,6 +2958,117 @@ class TestProblemCheckTotals(unittest.TestCase):
         lines = stream.getvalue().splitlines()
         self.assertTrue('index size: 1' in lines[3])
 
+    def _setup_diag_model(self, bad=False):
+
+        class DiagComp(om.ExplicitComponent):
+
+            def setup(self):
+                self.add_input('x', np.ones(10))
+                self.add_output('y', np.ones(10))
+
+                self.declare_partials('y', 'x', rows=np.arange(10), cols=np.arange(10))
+                self.ncalls = 0
+
+            def compute(self, inputs, outputs):
+                self.ncalls += 1
+                outputs['y'] = inputs['x'] ** 2 + 3.0
+
+            def compute_partials(self, inputs, partials):
+                partials['y', 'x'] = 2.0 * inputs['x'] + (0.1 if bad else 0.0)
+
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('p', om.IndepVarComp('x', np.arange(10.0) + 1.0))
+        model.add_subsystem('comp', DiagComp())
+        model.add_subsystem('obj_cmp', om.ExecComp('obj = 2.0 * a'))
+        model.connect('p.x', 'comp.x')
+        model.connect('comp.y', 'obj_cmp.a', src_indices=[0])
+
+        model.add_design_var('p.x', ref=3.0)
+        model.add_objective('obj_cmp.obj')
+        model.add_constraint('comp.y', lower=0.0, scaler=2.0)
+
+        prob.setup(force_alloc_complex=True)
+        prob.run_model()
+
+        return prob
+
+    def test_use_coloring(self):
+        prob = self._setup_diag_model()
+        comp = prob.model.comp
+
+        for method in ('fd', 'cs'):
+            for driver_scaling in (False, True):
+                start = comp.ncalls
+                expected = prob.check_totals(out_stream=None, method=method,
+                                             driver_scaling=driver_scaling)
+                uncolored_calls = comp.ncalls - start
+
+                start = comp.ncalls
+                stdout = StringIO()
+                with redirect_stdout(stdout):
+                    data = prob.check_totals(out_stream=None, method=method,
+                                             driver_scaling=driver_scaling, use_coloring=True)
+                self.assertEqual(comp.ncalls - start, 1)
+                self.assertEqual(stdout.getvalue(), '')
+                self.assertEqual(uncolored_calls, 10)
+
+                for key, val in expected.items():
+                    assert_near_equal(data[key]['J_fwd'], val['J_fwd'], 1e-15)
+                    assert_near_equal(data[key]['J_fd'], val['J_fd'], 1e-9)
+                    self.assertLess(data[key]['abs error'][0], 1e-4)
+
+        assert_near_equal(prob['comp.y'], np.arange(1.0, 11.0) ** 2 + 3.0, 1e-15)
+
+    def test_directional(self):
+        prob = self._setup_diag_model()
+        comp = prob.model.comp
+
+        start = comp.ncalls
+        stream = StringIO()
+        data = prob.check_totals(out_stream=stream, directional=True, driver_scaling=True)
+        self.assertEqual(comp.ncalls - start, 1)
+
+        self.assertEqual(data['comp.y', 'p.x']['J_fwd'].shape, (10, 1))
+        self.assertEqual(data['comp.y', 'p.x']['J_fd'].shape, (10, 1))
+        for val in data.values():
+            self.assertLess(val['abs error'][0], 1e-4)
+        self.assertIn("wrt (d)'p.x'", stream.getvalue())
+        self.assertIn('Directional FD Derivative (Jfd)', stream.getvalue())
+
+        prob = self._setup_diag_model(bad=True)
+        data = prob.check_totals(out_stream=None, directional=True, method='cs')
+        self.assertGreater(data['comp.y', 'p.x']['abs error'][0], 1e-2)
+
+    def test_directional_seed(self):
+        prob = self._setup_diag_model()
+
+        np.random.seed(7)
+        state = np.random.get_state()[1].copy()
+        data1 = prob.check_totals(out_stream=None, directional=True, seed=11)
+        data2 = prob.check_totals(out_stream=None, directional=True, seed=11)
+
+        # the directions don't come from the global random state
+        np.testing.assert_array_equal(np.random.get_state()[1], state)
+        for key, val in data1.items():
+            assert_near_equal(data2[key]['J_fwd'], val['J_fwd'], 1e-15)
+
+    def test_n_procs(self):
+        prob = self._setup_diag_model()
+        comp = prob.model.comp
+
+        expected = prob.check_totals(out_stream=None, form='central')
+
+        start = comp.ncalls
+        data = prob.check_totals(out_stream=None, form='central', n_procs=3)
+        # all perturbed points were run in the forked processes
+        self.assertEqual(comp.ncalls, start)
+
+        for key, val in expected.items():
+            assert_near_equal(data[key]['J_fwd'], val['J_fwd'], 1e-15)
+            assert_near_equal(data[key]['J_fd'], val['J_fd'], 1e-9)
+
 
 @unittest.skipUnless(MPI and PETScVector, "MPI and PETSc are required.")
 class TestProblemCheckTotalsMPI(unittest.TestCase):
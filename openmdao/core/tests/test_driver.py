@@ -178,6 +178,45 @@ class TestDriver(unittest.TestCase):
         con_base = np.array([ (prob['comp.y2'][0]-1.2)/(2.0-1.2), (prob['comp.y2'][1]-2.3)/(4.0-2.3) ])
         assert_near_equal(con['comp.y2'], con_base, 1.0e-3)
 
+    def test_vector_scaled_derivs_formats(self):
+        oscale = np.array([1.0/(7.0-5.2), 1.0/(11.0-6.3)])
+        iscale = np.array([2.0-0.5, 3.0-1.5])
+
+        for approx in (False, True):
+            prob = om.Problem()
+            model = prob.model
+
+            model.add_subsystem('px', om.IndepVarComp(name="x", val=np.ones((2, ))))
+            comp = model.add_subsystem('comp', DoubleArrayComp())
+            model.connect('px.x', 'comp.x1')
+
+            model.add_design_var('px.x', ref=np.array([2.0, 3.0]), ref0=np.array([0.5, 1.5]))
+            model.add_objective('comp.y1', ref=np.array([[7.0, 11.0]]), ref0=np.array([5.2, 6.3]))
+            model.add_constraint('comp.y2', lower=0.0, upper=1.0, ref=3.0)
+            if approx:
+                model.approx_totals(method='cs')
+
+            prob.setup(force_alloc_complex=True)
+            prob.run_model()
+
+            J = comp.JJ[0:4, 0:2] * iscale
+            J[0:2] *= oscale[:, np.newaxis]
+            J[2:4] /= 3.0
+
+            for fmt in ('array', 'dict', 'flat_dict'):
+                # the driver caches its total jacobian, including the return format
+                prob.driver._total_jac = None
+                derivs = prob.driver._compute_totals(of=['comp.y1', 'comp.y2'], wrt=['px.x'],
+                                                     return_format=fmt)
+                if fmt == 'array':
+                    assert_near_equal(derivs, J, 1e-12)
+                elif fmt == 'dict':
+                    assert_near_equal(derivs['comp.y1']['px.x'], J[0:2], 1e-12)
+                    assert_near_equal(derivs['comp.y2']['px.x'], J[2:4], 1e-12)
+                else:
+                    assert_near_equal(derivs['comp.y1', 'px.x'], J[0:2], 1e-12)
+                    assert_near_equal(derivs['comp.y2', 'px.x'], J[2:4], 1e-12)
+
     def test_vector_bounds_inf(self):
 
         # make sure no overflow when there is no specified upper/lower bound and significatn scaling
@@ -787,6 +826,44 @@ class TestDriver(unittest.TestCase):
         assert_near_equal(totals['sub.comp.f_xy', 'sub.x']['J_fd'], [[1.44e2]], 1e-5)
         assert_near_equal(totals['sub.comp.f_xy', 'sub.y']['J_fd'], [[1.58e2]], 1e-5)
 
+    def test_flat_vois(self):
+        prob = om.Problem()
+        prob.model = model = SellarDerivatives()
+
+        model.add_design_var('x', ref=2.0)
+        model.add_design_var('z', indices=[1], ref=5.0, ref0=3.0)
+        model.add_objective('obj', ref=10.0)
+        model.add_constraint('con1', upper=0.0)
+        model.add_constraint('con2', upper=0.0, ref=np.array([4.0]))
+        model.add_constraint('y1', lower=0.0, adder=1.0, indices=[0])
+        prob.set_solver_print(level=0)
+
+        prob.setup()
+        prob.run_model()
+        driver = prob.driver
+
+        self.assertEqual(driver.get_flat_slices('dvs'), {'x': slice(0, 1), 'z': slice(1, 2)})
+        slices = driver.get_flat_slices('responses')
+        self.assertEqual(list(slices), ['obj_cmp.obj', 'con_cmp1.con1', 'con_cmp2.con2', 'd1.y1'])
+
+        dvs = driver.get_design_var_values()
+        assert_near_equal(driver.get_design_vars_flat(),
+                          np.concatenate([dvs['x'], dvs['z']]), 1e-15)
+
+        for scaling in (True, False):
+            vals = driver.get_objective_values(driver_scaling=scaling)
+            vals.update(driver.get_constraint_values(driver_scaling=scaling))
+            out = np.zeros(5)
+            driver.get_responses_flat(out=out, driver_scaling=scaling)
+            for name, slc in slices.items():
+                assert_near_equal(out[slc], vals[name], 1e-15)
+
+        # setting the flat design vector undoes the scaling like set_design_var does
+        driver.set_design_vars_flat(np.array([1.5, 0.5]))
+        assert_near_equal(prob['x'], 3.0, 1e-15)
+        assert_near_equal(prob['z'], [5.0, 4.0], 1e-15)
+        assert_near_equal(driver.get_design_vars_flat(), [1.5, 0.5], 1e-15)
+
 
 class TestDriverFeature(unittest.TestCase):
 
@@ -959,6 +1036,42 @@ class TestDriverMPI(unittest.TestCase):
         assert_near_equal(p.get_val('dc.y', get_remote=True), [81, 96])
         assert_near_equal(p.get_val('dc.z', get_remote=True), [25, 25, 25, 81, 81])
 
+    def test_packed_remote_vois(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('ivc', om.IndepVarComp('x', np.arange(3.)))
+        par = model.add_subsystem('par', om.ParallelGroup())
+        par.add_subsystem('c1', om.ExecComp(['y = 2.0 * x', 'z = sum(x)'],
+                                            x=np.ones(3), y=np.ones(3)))
+        par.add_subsystem('c2', om.ExecComp('y = 3.0 * x', x=np.ones(3), y=np.ones(3)))
+        model.connect('ivc.x', ['par.c1.x', 'par.c2.x'])
+
+        model.add_design_var('ivc.x')
+        model.add_objective('par.c1.z')
+        model.add_constraint('par.c1.y', indices=[0, 2], upper=0.0)
+        model.add_constraint('par.c2.y', upper=0.0, ref=2.0)
+
+        prob.setup()
+        prob.run_model()
+
+        # the design var is local everywhere, the responses are each gathered in one call
+        layouts = prob.driver._remote_voi_layouts
+        self.assertEqual(sorted(layouts), ['cons', 'objs'])
+        self.assertEqual(np.sum(layouts['cons'][1]), 5)
+
+        cons = prob.driver.get_constraint_values()
+        assert_near_equal(cons['par.c1.y'], [0., 4.], 1e-15)
+        assert_near_equal(cons['par.c2.y'], [0., 1.5, 3.], 1e-15)
+        assert_near_equal(prob.driver.get_objective_values()['par.c1.z'], 3., 1e-15)
+
+        # values from earlier calls aren't overwritten by later ones
+        prob['ivc.x'] = np.ones(3)
+        prob.run_model()
+        new_cons = prob.driver.get_constraint_values(driver_scaling=False)
+        assert_near_equal(new_cons['par.c2.y'], [3., 3., 3.], 1e-15)
+        assert_near_equal(cons['par.c2.y'], [0., 1.5, 3.], 1e-15)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -10,6 +10,7 @@ import scipy
 from scipy.sparse.linalg import gmres
 
 import openmdao.api as om
+from openmdao.test_suite.components.sellar import SellarProblem
 from openmdao.utils.assert_utils import assert_near_equal
 
 
@@ -110,6 +111,66 @@ class CacheLinearTestCase(unittest.TestCase):
         assert_near_equal(p['obj.y'], 0.25029766, 1e-3)
 
 
+class WarmStartTestCase(unittest.TestCase):
+
+    def test_iterative_solvers_warm_start(self):
+        for solver_class in (om.ScipyKrylov, om.LinearBlockGS):
+            for mode in ('fwd', 'rev'):
+                with self.subTest(solver=solver_class.__name__, mode=mode):
+                    prob = SellarProblem(linear_solver=solver_class)
+                    prob.setup(mode=mode)
+                    solver = prob.model.linear_solver
+                    prob.run_model()
+
+                    J1 = prob.driver._compute_totals(return_format='array').copy()
+                    self.assertGreater(solver._iter_count, 0)
+                    self.assertIsNotNone(prob.driver._total_jac.lin_sol_cache)
+
+                    # same point, so the stored solutions are already converged
+                    J2 = prob.driver._compute_totals(return_format='array')
+                    self.assertEqual(solver._iter_count, 0)
+                    assert_near_equal(J2, J1, 1e-12)
+
+    def test_warm_start_new_point(self):
+        for mode in ('fwd', 'rev'):
+            with self.subTest(mode=mode):
+                prob = SellarProblem()
+                prob.setup(mode=mode)
+                prob.run_model()
+                prob.driver._compute_totals(return_format='array')
+
+                prob['x'] = 2.5
+                prob['z'] = np.array([3.0, 1.5])
+                prob.run_model()
+                J = prob.driver._compute_totals(return_format='array')
+
+                expected = prob.compute_totals(of=['obj', 'con1', 'con2'], wrt=['z', 'x'],
+                                               return_format='array')
+                assert_near_equal(J, expected, 1e-8)
+
+    def test_warm_start_off(self):
+        prob = SellarProblem(linear_solver=om.ScipyKrylov(warm_start=False))
+        prob.setup(mode='rev')
+        prob.run_model()
+        prob.driver._compute_totals(return_format='array')
+
+        self.assertIsNone(prob.driver._total_jac.lin_sol_cache)
+
+    def test_no_cache_for_direct_solvers(self):
+        for solver in (om.DirectSolver(), om.LinearRunOnce()):
+            with self.subTest(solver=type(solver).__name__):
+                # these solvers don't use an initial guess, so they have no warm_start option
+                with self.assertRaises(KeyError):
+                    solver.options['warm_start'] = True
+
+                prob = SellarProblem(linear_solver=solver)
+                prob.setup(mode='rev')
+                prob.run_model()
+                prob.driver._compute_totals(return_format='array')
+
+                self.assertIsNone(prob.driver._total_jac.lin_sol_cache)
+
+
 if __name__ == "__main__":
     unittest.main()
 
@@ -1,7 +1,10 @@
 """Test the parallel groups."""
 
+import os
 import unittest
 import itertools
+import threading
+import multiprocessing
 
 # note: this is a Python 3.3 change, clean this up for OpenMDAO 3.x
 try:
@@ -28,6 +31,7 @@ from openmdao.test_suite.groups.parallel_groups import \
     FanOutGrouped, FanInGrouped2, Diamond, ConvergeDiverge
 
 from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
 from openmdao.utils.logger_utils import TestLogger
 from openmdao.error_checking.check_config import _default_checks
 
@@ -466,6 +470,341 @@ class TestParallelJacBug(unittest.TestCase):
         self.assertLess(np.max(np.abs(J2 - Jsave)), 1e-20)
 
 
+class TestOverlapTransfers(unittest.TestCase):
+
+    def test_serial(self):
+        p = om.Problem()
+        par = p.model.add_subsystem('par', om.ParallelGroup(overlap_transfers=True))
+        par.add_subsystem('iv', om.IndepVarComp('x', np.arange(4.)))
+        par.add_subsystem('c1', om.ExecComp('y = 2.0 * x', x=np.ones(4), y=np.ones(4)))
+        par.add_subsystem('c2', om.ExecComp('y = 3.0 * x', x=np.ones(4), y=np.ones(4)))
+        par.connect('iv.x', ['c1.x', 'c2.x'])
+        p.setup()
+        p.run_model()
+
+        # on one proc the transfers aren't overlapped
+        assert_near_equal(p['par.c2.y'], 3.0 * np.arange(4.), 1e-15)
+        self.assertEqual(p.model.par.report_transfer_timings(out_stream=None), {})
+
+
+@unittest.skipUnless(MPI and PETScVector, "MPI and PETSc are required.")
+class TestOverlapTransfersMPI(unittest.TestCase):
+
+    N_PROCS = 2
+
+    def test_overlap(self):
+        probs = []
+        for overlap in (False, True):
+            p = om.Problem()
+            par = p.model.add_subsystem('par', om.ParallelGroup(overlap_transfers=overlap))
+            par.add_subsystem('iv', om.IndepVarComp('x', np.arange(4.)))
+            par.add_subsystem('c1', om.ExecComp('y = 2.0 * x', x=np.ones(4), y=np.ones(4)))
+            par.add_subsystem('c2', om.ExecComp('y = 3.0 * x', x=np.ones(4), y=np.ones(4)))
+            par.connect('iv.x', ['c1.x', 'c2.x'])
+            p.setup()
+            p.run_model()
+            probs.append(p)
+
+        expected, p = probs
+        p.run_model()
+
+        for name in ('par.c1.y', 'par.c2.y'):
+            assert_near_equal(p.get_val(name, get_remote=True),
+                              expected.get_val(name, get_remote=True), 1e-15)
+
+        self.assertEqual(expected.model.par._transfer_timings, {})
+
+        report = p.model.par.report_transfer_timings(out_stream=None)
+        self.assertEqual(sorted(report), ['c1', 'c2'])
+        for ncalls, exposed, hidden in report.values():
+            self.assertEqual(ncalls, 2)
+            self.assertGreaterEqual(hidden, 0.0)
+
+
+class PidComp(om.ExplicitComponent):
+
+    def initialize(self):
+        self.options.declare('factor', default=2.0)
+
+    def setup(self):
+        self.add_input('x', np.ones(3))
+        self.add_output('y', np.ones(3))
+        self.add_output('pid', 0.0)
+        self.declare_partials('y', 'x', rows=np.arange(3), cols=np.arange(3), val=2.0)
+
+    def compute(self, inputs, outputs):
+        if inputs['x'][0] < 0.:
+            raise om.AnalysisError('negative x')
+        outputs['y'] = self.options['factor'] * inputs['x']
+        outputs['pid'] = os.getpid()
+
+
+class StatefulPidComp(PidComp):
+
+    def setup(self):
+        super().setup()
+        self.declare_partials('y', 'x', rows=np.arange(3), cols=np.arange(3))
+        self.ncalls = 0
+
+    def compute(self, inputs, outputs):
+        super().compute(inputs, outputs)
+        self.ncalls += 1
+        self.factor = 2.0
+
+    def compute_partials(self, inputs, partials):
+        partials['y', 'x'] = self.factor
+
+
+class WorkersGroup(om.Group):
+    """
+    ParallelGroup of three components run by worker processes, with two of them summed.
+    """
+
+    def initialize(self):
+        self.options.declare('num_workers', types=int)
+        self.options.declare('comp_class', default=PidComp)
+
+    def setup(self):
+        self.add_subsystem('ivc', om.IndepVarComp('x', np.arange(3.)))
+        par = self.add_subsystem('par', om.ParallelGroup(num_workers=self.options['num_workers']))
+        for name in ('a', 'b', 'c'):
+            par.add_subsystem(name, self.options['comp_class']())
+            self.connect('ivc.x', 'par.%s.x' % name)
+        self.add_subsystem('sum', om.ExecComp('s = sum(a) + 2.0 * sum(b)', a=np.ones(3),
+                                              b=np.ones(3)))
+        self.connect('par.a.y', 'sum.a')
+        self.connect('par.b.y', 'sum.b')
+
+        self.add_design_var('ivc.x')
+        self.add_objective('sum.s')
+
+
+@unittest.skipUnless('fork' in multiprocessing.get_all_start_methods(),
+                     "Worker processes must be forked.")
+@use_tempdirs
+class TestParallelGroupWorkers(unittest.TestCase):
+
+    def test_workers(self):
+        p = om.Problem(WorkersGroup(num_workers=2))
+        p.setup()
+        p.run_model()
+        self.assertTrue(p._metadata['shared_memory'])
+
+        for name in ('a', 'b', 'c'):
+            self.assertNotIn(p['par.%s.pid' % name], (0.0, os.getpid()))
+        assert_near_equal(p['sum.s'], 18.0, 1e-15)
+
+        p['ivc.x'] = 2.0
+        p.run_model()
+        assert_near_equal(p['sum.s'], 36.0, 1e-15)
+        assert_near_equal(p.compute_totals()['sum.s', 'ivc.x'], np.full((1, 3), 6.0), 1e-15)
+
+        p.cleanup()
+        self.assertIsNone(p.model.par._worker_pool)
+
+    def test_no_workers(self):
+        p = om.Problem(WorkersGroup(num_workers=0))
+        p.setup()
+        p.run_model()
+        self.assertFalse(p._metadata['shared_memory'])
+        self.assertEqual(p['par.a.pid'], os.getpid())
+
+    def test_analysis_error(self):
+        p = om.Problem(WorkersGroup(num_workers=2))
+        p.setup()
+        p.run_model()
+        p['ivc.x'] = -1.0
+        with self.assertRaises(om.AnalysisError) as cm:
+            p.run_model()
+        self.assertIn('negative x', str(cm.exception))
+        p.cleanup()
+
+    def test_complex_step(self):
+        p = om.Problem(WorkersGroup(num_workers=2))
+        p.setup(force_alloc_complex=True)
+        p.run_model()
+
+        # under complex step the subsystems run in this process
+        data = p.check_totals(method='cs', out_stream=None)
+        assert_near_equal(data['sum.s', 'ivc.x']['J_fd'], np.full((1, 3), 6.0), 1e-15)
+        p.cleanup()
+
+    def test_stateful_partials(self):
+        # compute_partials needs the state set by compute, so the subsystems run in this process
+        p = om.Problem(WorkersGroup(num_workers=2, comp_class=StatefulPidComp))
+        p.setup()
+        p.run_model()
+        self.assertEqual(p['par.a.pid'], os.getpid())
+        self.assertEqual(p.model.par.a.ncalls, 1)
+        assert_near_equal(p.compute_totals()['sum.s', 'ivc.x'], np.full((1, 3), 6.0), 1e-15)
+        self.assertIsNone(p.model.par._worker_pool)
+
+        # without derivatives the state doesn't matter
+        p = om.Problem(WorkersGroup(num_workers=2, comp_class=StatefulPidComp))
+        p.setup(derivatives=False)
+        p.run_model()
+        self.assertNotIn(p['par.a.pid'], (0.0, os.getpid()))
+        assert_near_equal(p['sum.s'], 18.0, 1e-15)
+        p.cleanup()
+
+    def test_recorder(self):
+        p = om.Problem(WorkersGroup(num_workers=2))
+        p.setup()
+        p.model.par.a.add_recorder(om.SqliteRecorder('cases.sql'))
+        p.run_model()
+        self.assertEqual(p['par.a.pid'], os.getpid())
+        p.cleanup()
+
+        cr = om.CaseReader('cases.sql')
+        self.assertEqual(len(cr.list_cases(out_stream=None)), 1)
+
+    def test_aliased_inputs(self):
+        p = om.Problem(WorkersGroup(num_workers=2), alias_inputs=True)
+        p.setup()
+        p.run_model()
+        self.assertEqual(p['par.a.pid'], os.getpid())
+
+        for val in (1.0, 5.0, 7.0):
+            p['ivc.x'] = val
+            p.run_model()
+            assert_near_equal(p['par.a.y'], np.full(3, 2.0 * val), 1e-15)
+            assert_near_equal(p['sum.s'], 18.0 * val, 1e-15)
+        p.cleanup()
+
+    def test_changes_between_runs(self):
+        p = om.Problem(WorkersGroup(num_workers=2))
+        p.setup()
+        p.run_model()
+        par = p.model.par
+        self.assertNotIn(p['par.a.pid'], (0.0, os.getpid()))
+        self.assertEqual(par.a.iter_count, 1)
+
+        # the workers are forked again in each run, so they see changes made in between
+        par.a.options['factor'] = 3.0
+        p.run_model(reset_iter_counts=False)
+        assert_near_equal(p['par.a.y'], 3.0 * np.arange(3.), 1e-15)
+        assert_near_equal(p['sum.s'], 21.0, 1e-15)
+
+        # the iteration counts advanced in the workers are passed back
+        for s in (par, par.a, par.b, par.c):
+            self.assertEqual(s.iter_count, 2)
+        p.cleanup()
+
+
+class ThreadComp(om.ExplicitComponent):
+
+    def initialize(self):
+        self.options.declare('barrier', default=None, allow_none=True)
+        self.thread = None
+
+    def setup(self):
+        self.add_input('x', np.ones(3))
+        self.add_output('y', np.ones(3))
+        self.declare_partials('y', 'x', rows=np.arange(3), cols=np.arange(3), val=2.0)
+
+    def compute(self, inputs, outputs):
+        if inputs['x'][0] < 0.:
+            raise om.AnalysisError('negative x')
+        self.thread = threading.current_thread()
+        if self.options['barrier'] is not None:
+            # only passes if all the components waiting on the barrier run at the same time
+            self.options['barrier'].wait()
+        outputs['y'] = 2.0 * inputs['x']
+
+
+class ThreadsGroup(om.Group):
+    """
+    ParallelGroup of three components where 'a' and 'b' are thread safe and 'c' isn't.
+    """
+
+    def initialize(self):
+        self.options.declare('num_threads', types=int)
+        self.options.declare('barrier', default=None, allow_none=True,
+                             desc='Barrier the thread safe components wait on.')
+
+    def setup(self):
+        self.add_subsystem('ivc', om.IndepVarComp('x', np.arange(3.)))
+        par = self.add_subsystem('par', om.ParallelGroup(num_threads=self.options['num_threads']))
+        par.add_subsystem('a', ThreadComp(barrier=self.options['barrier']), thread_safe=True)
+        par.add_subsystem('b', ThreadComp(barrier=self.options['barrier']), thread_safe=True)
+        par.add_subsystem('c', ThreadComp())
+        for name in ('a', 'b', 'c'):
+            self.connect('ivc.x', 'par.%s.x' % name)
+        self.add_subsystem('sum', om.ExecComp('s = sum(a) + 2.0 * sum(c)', a=np.ones(3),
+                                              c=np.ones(3)))
+        self.connect('par.a.y', 'sum.a')
+        self.connect('par.c.y', 'sum.c')
+
+        self.add_design_var('ivc.x')
+        self.add_objective('sum.s')
+
+
+@use_tempdirs
+class TestParallelGroupThreads(unittest.TestCase):
+
+    def test_threads(self):
+        p = om.Problem(ThreadsGroup(num_threads=2, barrier=threading.Barrier(2, timeout=10)))
+        p.setup()
+        p.run_model()
+        par = p.model.par
+        main = threading.current_thread()
+
+        self.assertEqual(par._threaded_subs, {'a', 'b'})
+        self.assertNotEqual(par.a.thread, main)
+        self.assertNotEqual(par.b.thread, main)
+        self.assertEqual(par.c.thread, main)
+        self.assertEqual(p._recording_iter.stack, [])
+
+        p['ivc.x'] = 2.0
+        p.run_model()
+        assert_near_equal(p['sum.s'], 36.0, 1e-15)
+        assert_near_equal(p.compute_totals()['sum.s', 'ivc.x'], np.full((1, 3), 6.0), 1e-15)
+
+        p.cleanup()
+        self.assertIsNone(par._thread_pool)
+
+    def test_no_threads(self):
+        p = om.Problem(ThreadsGroup(num_threads=0))
+        p.setup()
+        p.run_model()
+        self.assertEqual(p.model.par._threaded_subs, set())
+        self.assertEqual(p.model.par.a.thread, threading.current_thread())
+
+    def test_recorded(self):
+        p = om.Problem(ThreadsGroup(num_threads=2))
+        p.setup()
+        p.model.par.a.add_recorder(om.SqliteRecorder('cases.sql'))
+        p.run_model()
+
+        # the recorder writes from the thread running the system, so it stays in this one
+        self.assertEqual(p.model.par._threaded_subs, {'b'})
+        self.assertEqual(p.model.par.a.thread, threading.current_thread())
+        p.cleanup()
+
+        cr = om.CaseReader('cases.sql')
+        cases = cr.list_cases(out_stream=None)
+        self.assertEqual(cases, ['rank0:root._solve_nonlinear|0|NLRunOnce|0|'
+                                 'par._solve_nonlinear|0|NLRunOnce|0|par.a._solve_nonlinear|0'])
+
+    def test_analysis_error(self):
+        p = om.Problem(ThreadsGroup(num_threads=2))
+        p.setup()
+        p.run_model()
+        p['ivc.x'] = -1.0
+        with self.assertRaises(om.AnalysisError) as cm:
+            p.run_model()
+        self.assertIn('negative x', str(cm.exception))
+        self.assertEqual(p._recording_iter.stack, [])
+        p.cleanup()
+
+    def test_threads_and_workers(self):
+        p = om.Problem()
+        p.model.add_subsystem('par', om.ParallelGroup(num_threads=2, num_workers=2))
+        with self.assertRaises(RuntimeError) as cm:
+            p.setup()
+        self.assertEqual(str(cm.exception), "'par' <class ParallelGroup>: Options "
+                         "'num_workers' and 'num_threads' can't both be set.")
+
 if __name__ == "__main__":
     from openmdao.utils.mpi import mpirun_tests
     mpirun_tests()
@@ -2,7 +2,6 @@
 Helper class for total jacobian computation.
 """
 from collections import OrderedDict, defaultdict
-from copy import deepcopy
 import os
 import pprint
 import sys
@@ -55,12 +54,17 @@ class _TotalJacInfo(object):
         The dense array form of the total jacobian.
     J_dict : dict
         Nested or flat dict with views of the jacobian.
+    row_scaler : ndarray or None
+        Driver scaler of each row of the jacobian, or None if the responses aren't scaled.
+    col_scaler : ndarray or None
+        Inverse driver scaler of each column of the jacobian, or None if the design vars
+        aren't scaled.
     J_final : ndarray or dict
         If return_format is 'array', Jfinal is J.  Otherwise it's either a nested dict (if
         return_format is 'dict') or a flat dict (return_format 'flat_dict') with views into
         the array jacobian.
-    lin_sol_cache : dict
-        Dict of indices keyed to solution vectors.
+    lin_sol_cache : _LinearSolutionCache or None
+        Storage of previous linear solutions used to warm start each derivative solve.
     mode : str
         If 'fwd' compute deriv in forward mode, else if 'rev', reverse (adjoint) mode.
     model : <System>
@@ -132,7 +136,7 @@ class _TotalJacInfo(object):
         self.owning_ranks = problem.model._owning_rank
         self.has_scaling = driver._has_scaling and driver_scaling
         self.return_format = return_format
-        self.lin_sol_cache = {}
+        self.lin_sol_cache = None
         self.debug_print = debug_print
         self.par_deriv = {}
         self.par_deriv_printnames = {}
@@ -277,6 +281,9 @@ class _TotalJacInfo(object):
                 self.in_idx_map[mode], self.in_loc_idxs[mode], self.idx_iter_dict[mode], \
                     self.seeds[mode] = self._create_in_idx_map(mode)
 
+            if not has_lin_cons:
+                self.lin_sol_cache = self._setup_lin_sol_cache()
+
         self.of_meta, self.of_size = self._get_tuple_map(of, responses, abs2meta_out)
         self.wrt_meta, self.wrt_size = self._get_tuple_map(wrt, design_vars, abs2meta_out)
 
@@ -330,8 +337,43 @@ class _TotalJacInfo(object):
                                                           return_format)
 
         if self.has_scaling:
-            self.prom_design_vars = {prom_wrt[i]: design_vars[dv] for i, dv in enumerate(wrt)}
-            self.prom_responses = {prom_of[i]: responses[r] for i, r in enumerate(of)}
+            self.row_scaler = self._get_scaler_vector(of, responses, self.of_meta, self.of_size)
+            self.col_scaler = self._get_scaler_vector(wrt, design_vars, self.wrt_meta,
+                                                      self.wrt_size, invert=True)
+        else:
+            self.row_scaler = self.col_scaler = None
+
+    def _get_scaler_vector(self, names, vois, idx_map, size, invert=False):
+        """
+        Return the driver scaler of each row or column of the jacobian.
+
+        Parameters
+        ----------
+        names : iter of str
+            Names of the variables making up the rows or columns of the jacobian.
+        vois : dict
+            Mapping of variable of interest (desvar or response) name to its metadata.
+        idx_map : dict
+            Dict of metadata tuples keyed by output name, as returned by _get_tuple_map.
+        size : int
+            Total number of rows or columns.
+        invert : bool
+            If True, return the inverse of the scalers.
+
+        Returns
+        -------
+        ndarray or None
+            Scaler of each row or column, or None if none of the variables are scaled.
+        """
+        scalers = None
+        for name in names:
+            scaler = vois[name]['total_scaler']
+            if scaler is not None:
+                if scalers is None:
+                    scalers = np.ones(size)
+                scalers[idx_map[name][0]] = 1.0 / scaler if invert else scaler
+
+        return scalers
 
     def _compute_jac_scatters(self, mode, rowcol_size):
         self.jac_scatters[mode] = jac_scatters = {}
@@ -680,6 +722,40 @@ class _TotalJacInfo(object):
 
         return idx_map, loc_idxs, idx_iter_dict, seed
 
+    def _setup_lin_sol_cache(self):
+        """
+        Create storage for the linear solutions used to warm start derivative solves.
+
+        Every solve in the outer loop of compute_totals is cached if the model's linear solver
+        can make use of an initial guess and its warm_start option is set.  Otherwise only solves
+        involving a variable with cache_linear_solution set are cached.
+
+        Returns
+        -------
+        _LinearSolutionCache or None
+            The solution storage, or None if no solves are to be cached.
+        """
+        solver = self.model._linear_solver
+        warm_start = solver is not None and solver.supports['warm_start'] and \
+            solver.options['warm_start']
+
+        solve_vec_names = {}
+        for mode, iter_dict in self.idx_iter_dict.items():
+            in_idx_map = self.in_idx_map[mode]
+            solve_vec_names[mode] = solves = []
+            for imeta, idx_iter in iter_dict.values():
+                for inds, _, _, _ in idx_iter(imeta, mode):
+                    if isinstance(inds, list):
+                        inds = np.hstack(inds)
+                    entries = [in_idx_map[i] for i in np.atleast_1d(inds)]
+                    if warm_start or any(cache for _, _, cache in entries):
+                        solves.append(sorted({vec_name for vec_name, _, _ in entries}))
+                    else:
+                        solves.append(None)
+
+        if any(vnames is not None for solves in solve_vec_names.values() for vnames in solves):
+            return _LinearSolutionCache(solve_vec_names)
+
     def _get_sol2jac_map(self, names, vois, allprocs_abs2meta_out, mode):
         """
         Create a dict mapping vecname and direction to an index array into the solution vector.
@@ -1363,7 +1439,7 @@ class _TotalJacInfo(object):
         par_deriv = self.par_deriv
         par_print = self.par_deriv_printnames
 
-        has_lin_cons = self.has_lin_cons
+        lin_sol_cache = self.lin_sol_cache
 
         model = self.model
         vec_dinput = model._vectors['input']
@@ -1386,10 +1462,19 @@ class _TotalJacInfo(object):
 
         # Main loop over columns (fwd) or rows (rev) of the jacobian
         for mode in self.idx_iter_dict:
+            isolve = 0
+            output_vec = self.output_vec[mode]
             for key, idx_info in self.idx_iter_dict[mode].items():
                 imeta, idx_iter = idx_info
+                if par_deriv and key in par_deriv:
+                    # parallel colored derivatives only need to solve
+                    # the vectors relevant to this color, not all of them
+                    solve_vec_names = par_deriv[key]
+                else:
+                    solve_vec_names = model._lin_vec_names
+
                 for inds, input_setter, jac_setter, itermeta in idx_iter(imeta, mode):
-                    rel_systems, vec_names, cache_key = input_setter(inds, itermeta, mode)
+                    rel_systems, _, _ = input_setter(inds, itermeta, mode)
 
                     if debug_print:
                         if par_deriv and key in par_deriv:
@@ -1410,21 +1495,16 @@ class _TotalJacInfo(object):
                         sys.stdout.flush()
                         t0 = time.time()
 
-                    # restore old linear solution if cache_linear_solution was set by the user for
-                    # any input variables involved in this linear solution.
+                    # start from the solution of this same solve in the previous call, if we
+                    # have one, so that iterative solvers converge in fewer iterations.
                     with model._scaled_context_all():
-                        if cache_key is not None and not has_lin_cons and self.mode == mode:
-                            self._restore_linear_solution(vec_names, cache_key, self.mode)
-                            model._solve_linear(model._lin_vec_names, self.mode, rel_systems)
-                            self._save_linear_solution(vec_names, cache_key, self.mode)
+                        if lin_sol_cache is None:
+                            model._solve_linear(solve_vec_names, mode, rel_systems)
                         else:
-                            if par_deriv and key in par_deriv:
-                                # parallel colored derivatives only need to solve
-                                # the vectors relevant to this color, not all of them
-                                vecnames_par_deriv = par_deriv[key].copy()
-                                model._solve_linear(vecnames_par_deriv, mode, rel_systems)
-                            else:
-                                model._solve_linear(model._lin_vec_names, mode, rel_systems)
+                            lin_sol_cache.restore(mode, isolve, output_vec)
+                            model._solve_linear(solve_vec_names, mode, rel_systems)
+                            lin_sol_cache.save(mode, isolve, output_vec)
+                    isolve += 1
 
                     if debug_print:
                         print('Elapsed Time:', time.time() - t0, '\n', flush=True)
@@ -1433,7 +1513,7 @@ class _TotalJacInfo(object):
 
         # Driver scaling.
         if self.has_scaling:
-            self._do_driver_scaling(self.J_dict)
+            self._do_driver_scaling(self.J)
 
         if debug_print:
             # Debug outputs scaled derivatives.
@@ -1548,101 +1628,29 @@ class _TotalJacInfo(object):
 
         # Driver scaling.
         if self.has_scaling:
-            self._do_driver_scaling(totals)
+            self._do_driver_scaling(self.J)
 
         if return_format == 'array':
             totals = self.J  # change back to array version
 
         return totals
 
-    def _restore_linear_solution(self, vec_names, key, mode):
-        """
-        Restore the previous linear solution.
-
-        Parameters
-        ----------
-        vec_names : list of str
-            Names of output vectors to restore.
-        key : hashable object
-            Key to lookup linear solution.
-        mode : str
-            Direction of derivative solution.
-        """
-        lin_sol_cache = self.lin_sol_cache
-        if key in lin_sol_cache:
-            lin_sol = lin_sol_cache[key]
-            for i, vec_name in enumerate(vec_names):
-                save_vec = lin_sol[i]
-                doutputs = self.output_vec[mode][vec_name]
-                doutputs.set_val(save_vec)
-        else:
-            lin_sol_cache[key] = lin_sol = []
-            for vec_name in vec_names:
-                lin_sol.append(deepcopy(self.output_vec[mode][vec_name]._data))
-
-    def _save_linear_solution(self, vec_names, key, mode):
-        """
-        Save the current linear solution.
-
-        Parameters
-        ----------
-        vec_names : list of str
-            Names of output vectors to restore.
-        key : hashable object
-            Key to lookup linear solution.
-        mode : str
-            Direction of derivative solution.
-        """
-        lin_sol = self.lin_sol_cache[key]
-        for i, vec_name in enumerate(vec_names):
-            save_vec = lin_sol[i]
-            doutputs = self.output_vec[mode][vec_name]
-            save_vec[:] = doutputs._data
-
     def _do_driver_scaling(self, J):
         """
         Apply scalers to the jacobian if the driver defined any.
 
+        The dict forms of the jacobian are views into the array, so they are scaled as well.
+
         Parameters
         ----------
-        J : dict
-            Jacobian to be scaled.
+        J : ndarray
+            Array jacobian to be scaled in place.
         """
-        # use promoted names for design vars and responses
-        desvars = self.prom_design_vars
-        responses = self.prom_responses
-
-        if self.return_format in ('dict', 'array'):
-            for prom_out, odict in J.items():
-                oscaler = responses[prom_out]['total_scaler']
-
-                for prom_in, val in odict.items():
-                    iscaler = desvars[prom_in]['total_scaler']
-
-                    # Scale response side
-                    if oscaler is not None:
-                        val[:] = (oscaler * val.T).T
+        if self.row_scaler is not None:
+            J *= self.row_scaler[:, np.newaxis]
 
-                    # Scale design var side
-                    if iscaler is not None:
-                        val *= 1.0 / iscaler
-
-        elif self.return_format == 'flat_dict':
-            for tup, val in J.items():
-                prom_out, prom_in = tup
-                oscaler = responses[prom_out]['total_scaler']
-                iscaler = desvars[prom_in]['total_scaler']
-
-                # Scale response side
-                if oscaler is not None:
-                    val[:] = (oscaler * val.T).T
-
-                # Scale design var side
-                if iscaler is not None:
-                    val *= 1.0 / iscaler
-        else:
-            raise RuntimeError("Derivative scaling by the driver only supports the 'dict' and "
-                               "'array' formats at present.")
+        if self.col_scaler is not None:
+            J *= self.col_scaler
 
     def _print_derivatives(self):
         """
@@ -1685,6 +1693,111 @@ class _TotalJacInfo(object):
             self.model._recording_iter.pop()
 
 
+class _LinearSolutionCache(object):
+    """
+    Preallocated storage of the linear solutions from each derivative solve.
+
+    Solutions are stored as rows of a 2-D array per mode and vector name, so saving and
+    restoring a solution is a copy into or out of an existing array.
+
+    Attributes
+    ----------
+    _vec_names : dict
+        Map of mode to a list containing, for each solve, the names of the vectors to cache
+        or None if that solve is not cached.
+    _rows : dict
+        Map of (mode, vec_name) to an array of the storage row of each solve, or -1.
+    _sols : dict
+        Map of (mode, vec_name) to the 2-D array of stored solutions.
+    _filled : dict
+        Map of (mode, vec_name) to a bool array indicating which rows contain a solution.
+    """
+
+    def __init__(self, solve_vec_names):
+        """
+        Initialize attributes.
+
+        Parameters
+        ----------
+        solve_vec_names : dict
+            Map of mode to a list containing, for each solve, the names of the vectors to cache
+            or None if that solve is not cached.
+        """
+        self._vec_names = solve_vec_names
+        self._rows = {}
+        self._sols = {}
+        self._filled = {}
+
+        for mode, solves in solve_vec_names.items():
+            counts = defaultdict(int)
+            for isolve, vec_names in enumerate(solves):
+                if vec_names is None:
+                    continue
+                for vec_name in vec_names:
+                    key = (mode, vec_name)
+                    if key not in self._rows:
+                        self._rows[key] = np.full(len(solves), -1, dtype=INT_DTYPE)
+                    self._rows[key][isolve] = counts[vec_name]
+                    counts[vec_name] += 1
+
+            for vec_name, count in counts.items():
+                self._filled[mode, vec_name] = np.zeros(count, dtype=bool)
+
+    def restore(self, mode, isolve, vectors):
+        """
+        Copy the stored solution of the given solve, if there is one, into the vectors.
+
+        Parameters
+        ----------
+        mode : str
+            Direction of derivative solution.
+        isolve : int
+            Index of the solve within the outer loop for this mode.
+        vectors : dict
+            Solution vectors keyed by vec_name.
+        """
+        vec_names = self._vec_names[mode][isolve]
+        if vec_names is None:
+            return
+
+        for vec_name in vec_names:
+            key = (mode, vec_name)
+            row = self._rows[key][isolve]
+            if self._filled[key][row]:
+                data = vectors[vec_name]._data
+                data[:] = self._sols[key][row].reshape(data.shape)
+
+    def save(self, mode, isolve, vectors):
+        """
+        Store the current solution of the given solve.
+
+        Parameters
+        ----------
+        mode : str
+            Direction of derivative solution.
+        isolve : int
+            Index of the solve within the outer loop for this mode.
+        vectors : dict
+            Solution vectors keyed by vec_name.
+        """
+        vec_names = self._vec_names[mode][isolve]
+        if vec_names is None:
+            return
+
+        for vec_name in vec_names:
+            key = (mode, vec_name)
+            data = vectors[vec_name]._data
+            filled = self._filled[key]
+            sols = self._sols.get(key)
+            if sols is None or sols.shape[1] != data.size or sols.dtype != data.dtype:
+                self._sols[key] = sols = np.empty((filled.size, data.size), dtype=data.dtype)
+                filled[:] = False
+
+            row = self._rows[key][isolve]
+            sols[row] = data.ravel()
+            filled[row] = True
+
+
 def _get_subjac(jac_meta, prom_out, prom_in, of_idx, wrt_idx, dist_resp, comm):
     """
     Return proper subjacobian based on input/output names and indices.
@@ -343,9 +343,7 @@ class DifferentialEvolutionDriver(Driver):
             obj_weights = {name: 1. for name in objs.keys()}
         sum_weights = sum(obj_weights.values())
 
-        for name in self._designvars:
-            i, j = self._desvar_idx[name]
-            self.set_design_var(name, x[i:j])
+        self.set_design_vars_flat(x)
 
         # a very large number, but smaller than the result of nan_to_num in Numpy
         almost_inf = openmdao.INF_BOUND
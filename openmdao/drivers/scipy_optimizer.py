@@ -94,6 +94,11 @@ class ScipyOptimizeDriver(Driver):
         Dictionary of solver-specific options. See the scipy.optimize.minimize documentation.
     _con_cache : dict
         Cached result of constraint evaluations because scipy asks for them in a separate function.
+        Values are views into _resp_flat.
+    _resp_flat : ndarray
+        Preallocated flat array of objective and constraint values.
+    _obj_slice : slice
+        Slice of the objective in _resp_flat.
     _con_idx : dict
         Used for constraint bookkeeping in the presence of 2-sided constraints.
     _grad_cache : OrderedDict
@@ -141,6 +146,8 @@ class ScipyOptimizeDriver(Driver):
         self.result = None
         self._grad_cache = None
         self._con_cache = None
+        self._resp_flat = None
+        self._obj_slice = None
         self._con_idx = {}
         self._obj_and_nlcons = None
         self._dvlist = None
@@ -249,8 +256,10 @@ class ScipyOptimizeDriver(Driver):
             model.run_solve_nonlinear()
             self.iter_count += 1
 
-        self._con_cache = self.get_constraint_values()
-        desvar_vals = self.get_design_var_values()
+        self._resp_flat = self.get_responses_flat()
+        slices = self.get_flat_slices('responses')
+        self._obj_slice = slices[next(iter(self._objs))]
+        self._con_cache = {name: self._resp_flat[slices[name]] for name in self._cons}
         self._dvlist = list(self._designvars)
 
         # maxiter and disp get passed into scipy with all the other options.
@@ -258,15 +267,9 @@ class ScipyOptimizeDriver(Driver):
             self.opt_settings['maxiter'] = self.options['maxiter']
         self.opt_settings['disp'] = self.options['disp']
 
-        # Size Problem
-        ndesvar = 0
-        for desvar in self._designvars.values():
-            size = desvar['global_size'] if desvar['distributed'] else desvar['size']
-            ndesvar += size
-        x_init = np.empty(ndesvar)
-
         # Initial Design Vars
-        i = 0
+        x_init = self.get_design_vars_flat()
+
         use_bounds = (opt in _bounds_optimizers)
         if use_bounds:
             bounds = []
@@ -275,8 +278,6 @@ class ScipyOptimizeDriver(Driver):
 
         for name, meta in self._designvars.items():
             size = meta['global_size'] if meta['distributed'] else meta['size']
-            x_init[i:i + size] = desvar_vals[name]
-            i += size
 
             # Bounds if our optimizer supports them
             if use_bounds:
@@ -570,24 +571,17 @@ class ScipyOptimizeDriver(Driver):
         try:
 
             # Pass in new inputs
-            i = 0
             if MPI:
                 model.comm.Bcast(x_new, root=0)
-            for name, meta in self._designvars.items():
-                size = meta['size']
-                self.set_design_var(name, x_new[i:i + size])
-                i += size
+            self.set_design_vars_flat(x_new)
 
             with RecordingDebugging(self._get_name(), self.iter_count, self) as rec:
                 self.iter_count += 1
                 model.run_solve_nonlinear()
 
-            # Get the objective function evaluations
-            for obj in self.get_objective_values().values():
-                f_new = obj
-                break
-
-            self._con_cache = self.get_constraint_values()
+            # Get the objective function and constraint evaluations, which updates _con_cache
+            self.get_responses_flat(out=self._resp_flat)
+            f_new = self._resp_flat[self._obj_slice].copy()
 
         except Exception as msg:
             self._exc_info = msg
@@ -34,6 +34,9 @@ class AssembledJacobian(Jacobian):
     _subjac_iters : dict
         Mapping of system pathname to tuple of lists of absolute key tuples used to index into
         the jacobian.
+    _const_written : set
+        Pathnames of the systems whose constant subjacs have already been written into the
+        matrices.
     _in_ranges : dict
         Column ranges for inputs.
     _out_ranges : dict
@@ -64,6 +67,7 @@ class AssembledJacobian(Jacobian):
         self._out_ranges = self._get_ranges(system, 'output')
         self._in_ranges = self._get_ranges(system, 'input')
         self._subjac_iters = defaultdict(lambda: None)
+        self._const_written = set()
 
     def _get_ranges(self, system, vtype):
         """
@@ -252,6 +256,36 @@ class AssembledJacobian(Jacobian):
 
         self._ext_mtx[system.pathname] = ext_mtx
 
+    def _get_constant_keys(self, system):
+        """
+        Return the keys of the subjacs that never change after setup.
+
+        Parameters
+        ----------
+        system : System
+            System that is updating this jacobian.
+
+        Returns
+        -------
+        set
+            Set of absolute key tuples of constant subjacs.
+        """
+        # any approximation at the group level writes into subjacs of its components
+        approx_groups = [s.pathname + '.' for s in
+                         system.system_iter(recurse=True, include_self=True)
+                         if s._owns_approx_jac and not isinstance(s, Component)]
+        if '.' in approx_groups:  # system itself is an approximated group
+            return set()
+
+        owners = {}
+        for comp in system.system_iter(recurse=True, include_self=True, typ=Component):
+            if not any(comp.pathname.startswith(prefix) for prefix in approx_groups):
+                for name in comp._var_abs2meta['output']:
+                    owners[name] = comp
+
+        return {key for key in system._subjacs_info
+                if key[0] in owners and owners[key[0]]._subjac_is_constant(key)}
+
     def _get_subjac_iters(self, system):
         # this determines the subjacs that get updated during _update()
 
@@ -308,7 +342,16 @@ class AssembledJacobian(Jacobian):
                 elif ext_mtx is not None and wrtname in sys_inputs:
                     iters_in_ext.append(abs_key)
 
-            self._subjac_iters[system.pathname] = subjac_iters = (iters, iters_in_ext)
+            # constant subjacs only need to be written once
+            const_keys = self._get_constant_keys(system)
+            const_iters = [key for key in iters if key in const_keys]
+            const_iters_in_ext = [key for key in iters_in_ext if key in const_keys]
+            if const_keys:
+                iters = [key for key in iters if key not in const_keys]
+                iters_in_ext = [key for key in iters_in_ext if key not in const_keys]
+
+            self._subjac_iters[system.pathname] = subjac_iters = \
+                (iters, iters_in_ext, const_iters, const_iters_in_ext)
 
         return subjac_iters
 
@@ -323,6 +366,7 @@ class AssembledJacobian(Jacobian):
         """
         # _initialize has been delayed until the first _update call
         if self._int_mtx is None:
+            self._const_written = set()
             self._initialize(system)
             self._init_ranges(system)
             if system.pathname:
@@ -332,19 +376,30 @@ class AssembledJacobian(Jacobian):
         ext_mtx = self._ext_mtx[system.pathname]
         subjacs = system._subjacs_info
 
-        iters, iters_in_ext = self._get_subjac_iters(system)
+        iters, iters_in_ext, const_iters, const_iters_in_ext = self._get_subjac_iters(system)
 
         int_mtx._pre_update()
         if ext_mtx is not None:
             ext_mtx._pre_update()
 
         if self._randomize:
-            for key in iters:
+            for key in iters + const_iters:
                 int_mtx._update_submat(key, self._randomize_subjac(subjacs[key]['value'], key))
 
-            for key in iters_in_ext:
+            for key in iters_in_ext + const_iters_in_ext:
                 ext_mtx._update_submat(key, self._randomize_subjac(subjacs[key]['value'], key))
+
+            # constant subjacs now hold random values, so they must be written again
+            self._const_written = set()
         else:
+            if system.pathname not in self._const_written:
+                for key in const_iters:
+                    int_mtx._update_submat(key, subjacs[key]['value'])
+
+                for key in const_iters_in_ext:
+                    ext_mtx._update_submat(key, subjacs[key]['value'])
+
+                self._const_written.add(system.pathname)
 
             for key in iters:
                 int_mtx._update_submat(key, subjacs[key]['value'])
@@ -10,7 +10,7 @@ from scipy.sparse import coo_matrix, csr_matrix
 from openmdao.api import IndepVarComp, Group, Problem, \
                          ExplicitComponent, ImplicitComponent, ExecComp, \
                          NewtonSolver, ScipyKrylov, \
-                         LinearBlockGS, DirectSolver
+                         LinearBlockGS, DirectSolver, NonlinearBlockGS
 from openmdao.utils.assert_utils import assert_near_equal
 from openmdao.test_suite.components.paraboloid import Paraboloid
 from openmdao.api import ScipyOptimizeDriver
@@ -1085,6 +1085,195 @@ class MaskingTestCase(unittest.TestCase):
 
         np.testing.assert_allclose(totals, expected)
 
+    def _build_masked_model(self, jac_type, mode):
+        # sub's inputs are split between sources inside and outside of G, so when G's linear
+        # solver applies the linear operator of sub, part of sub's ext_mtx is masked out.
+        prob = Problem()
+        model = prob.model
+
+        model.add_subsystem('ivc', IndepVarComp('x', np.ones(3)))
+        G = model.add_subsystem('G', Group())
+        sub = G.add_subsystem('sub', Group())
+        sub.add_subsystem('c0', ExecComp('y = 3.0*x**2', x=np.ones(3), y=np.ones(3)))
+        sub.add_subsystem('c1', ExecComp('y = 2.0*x*z + w', x=np.ones(3), z=np.ones(3),
+                                         w=np.ones(3), y=np.ones(3)))
+        sub.connect('c0.y', 'c1.z')
+        G.add_subsystem('c2', ExecComp('y = 0.1*x**2', x=np.ones(3), y=np.ones(3)))
+
+        model.connect('ivc.x', ['G.sub.c0.x', 'G.sub.c1.x'])
+        G.connect('sub.c1.y', 'c2.x')
+        G.connect('c2.y', 'sub.c1.w')
+
+        if jac_type is not None:
+            sub.options['assembled_jac_type'] = jac_type
+            sub.linear_solver = DirectSolver(assemble_jac=True)
+
+        G.nonlinear_solver = NonlinearBlockGS(atol=1e-14, rtol=1e-14, maxiter=200)
+        G.linear_solver = LinearBlockGS(atol=1e-14, rtol=1e-14, maxiter=200)
+
+        prob.set_solver_print(level=0)
+        prob.setup(mode=mode)
+        prob['ivc.x'] = [0.1, 0.2, 0.3]
+        prob.run_model()
+
+        return prob
+
+    @parameterized.expand(itertools.product(['csc', 'dense'], ['fwd', 'rev']),
+                          name_func=lambda f, n, p: '_'.join([f.__name__] + list(p.args)))
+    def test_ext_mtx_masking(self, jac_type, mode):
+        of = ['G.c2.y', 'G.sub.c1.y']
+        wrt = ['ivc.x']
+
+        prob = self._build_masked_model(jac_type, mode)
+        totals = prob.compute_totals(of=of, wrt=wrt, return_format='array')
+
+        expected = self._build_masked_model(None, mode).compute_totals(of=of, wrt=wrt,
+                                                                       return_format='array')
+        assert_near_equal(totals, expected, 1e-10)
+
+        # masked products use the submatrix of the included columns (inputs) of the external
+        # matrix, which is kept up to date when the matrix changes
+        jac = prob.model.G.sub._assembled_jac
+        ext_mtx = jac._ext_mtx['G.sub']
+        masks = [m for m in jac._mask_caches.values() if m is not None]
+        self.assertTrue(masks)
+        for mask in masks:
+            self.assertLess(mask.cols.size, ext_mtx._matrix.shape[1])
+
+        prob['ivc.x'] = [0.4, 0.5, 0.6]
+        prob.run_model()
+        totals = prob.compute_totals(of=of, wrt=wrt, return_format='array')
+
+        expected_prob = self._build_masked_model(None, mode)
+        expected_prob['ivc.x'] = [0.4, 0.5, 0.6]
+        expected_prob.run_model()
+        expected = expected_prob.compute_totals(of=of, wrt=wrt, return_format='array')
+        assert_near_equal(totals, expected, 1e-10)
+
+        for mask in masks:
+            self.assertEqual(mask._version, ext_mtx._version)
+
+
+class ConstPartialsComp(ExplicitComponent):
+    def initialize(self):
+        self.options.declare('constant', True, types=bool)
+
+    def setup(self):
+        self.add_input('x', val=np.ones(3))
+        self.add_output('y', val=np.ones(3))
+        self.declare_partials('y', 'x', rows=np.arange(3), cols=np.arange(3),
+                              val=[2.0, 3.0, 4.0], constant=self.options['constant'])
+
+    def compute(self, inputs, outputs):
+        outputs['y'] = np.array([2.0, 3.0, 4.0]) * inputs['x']
+
+
+class IncrementalUpdateTestCase(unittest.TestCase):
+
+    def _build_model(self, jac_type, constant=True):
+        prob = Problem()
+        model = prob.model
+
+        model.add_subsystem('ivc', IndepVarComp('x', np.array([1.0, 2.0, 3.0])))
+        model.add_subsystem('lin', ConstPartialsComp(constant=constant))
+        model.add_subsystem('sq', ExecComp('z = x**2 + y', x=np.ones(3), y=np.ones(3),
+                                           z=np.ones(3)))
+        model.connect('ivc.x', ['lin.x', 'sq.x'])
+        model.connect('lin.y', 'sq.y')
+
+        model.options['assembled_jac_type'] = jac_type
+        model.linear_solver = DirectSolver(assemble_jac=True)
+
+        prob.set_solver_print(level=0)
+        prob.setup()
+        prob.run_model()
+
+        return prob
+
+    @parameterized.expand(['csc', 'dense'],
+                          name_func=lambda f, n, p: '_'.join([f.__name__] + list(p.args)))
+    def test_constant_subjacs_written_once(self, jac_type):
+        prob = self._build_model(jac_type)
+
+        prob.compute_totals(of=['sq.z'], wrt=['ivc.x'])
+        int_mtx = prob.model._assembled_jac._int_mtx
+
+        written = []
+        update_submat = int_mtx._update_submat
+
+        def counting_update_submat(key, jac):
+            written.append(key)
+            update_submat(key, jac)
+
+        int_mtx._update_submat = counting_update_submat
+
+        prob['ivc.x'] = [3.0, 2.0, 1.0]
+        prob.run_model()
+        J = prob.compute_totals(of=['sq.z'], wrt=['ivc.x'], return_format='array')
+
+        # only the partials computed by the ExecComp change between linearizations
+        self.assertEqual(sorted(set(written)), [('sq.z', 'sq.x'), ('sq.z', 'sq.y')])
+        assert_near_equal(J, np.diag([6.0, 4.0, 2.0]) + np.diag([2.0, 3.0, 4.0]), 1e-10)
+
+    def test_undeclared_constant_rewritten(self):
+        prob = self._build_model('csc', constant=False)
+        model = prob.model
+
+        # a partial that wasn't declared constant may change without compute_partials
+        model.lin._subjacs_info['lin.y', 'lin.x']['value'] *= 2.0
+        J = prob.compute_totals(of=['sq.z'], wrt=['ivc.x'], return_format='array')
+
+        assert_near_equal(J, np.diag([2.0, 4.0, 6.0]) + np.diag([4.0, 6.0, 8.0]), 1e-10)
+
+    def test_constant_approx_error(self):
+        comp = ExplicitComponent()
+        with self.assertRaises(ValueError) as cm:
+            comp.declare_partials('y', 'x', method='fd', constant=True)
+
+        self.assertEqual(str(cm.exception),
+                         "ExplicitComponent: d(y)/d(x): a constant partial can't be "
+                         "approximated with method \"fd\".")
+
+    @parameterized.expand(['csc', 'dense'],
+                          name_func=lambda f, n, p: '_'.join([f.__name__] + list(p.args)))
+    def test_matches_coo_conversion(self, jac_type):
+        prob = self._build_model(jac_type)
+
+        for x in ([1.0, 2.0, 3.0], [-2.0, 0.5, 7.0]):
+            prob['ivc.x'] = x
+            prob.run_model()
+            prob.compute_totals(of=['sq.z'], wrt=['ivc.x'])
+
+            int_mtx = prob.model._assembled_jac._int_mtx
+            expected = int_mtx._coo.toarray()
+            if jac_type == 'csc':
+                self.assertIs(int_mtx._matrix, int_mtx._compressed)
+                assert_near_equal(int_mtx._matrix.toarray(), expected, 1e-15)
+            else:
+                self.assertIs(int_mtx._matrix, int_mtx._dense)
+                assert_near_equal(int_mtx._matrix, expected, 1e-15)
+
+    @parameterized.expand(['csc', 'dense'],
+                          name_func=lambda f, n, p: '_'.join([f.__name__] + list(p.args)))
+    def test_complex_step_mode(self, jac_type):
+        prob = self._build_model(jac_type)
+        model = prob.model
+
+        J = prob.compute_totals(of=['sq.z'], wrt=['ivc.x'], return_format='array')
+        jac = model._assembled_jac
+        int_mtx = jac._int_mtx
+
+        jac.set_complex_step_mode(True)
+        jac._update(model)
+        self.assertTrue(np.iscomplexobj(int_mtx._matrix))
+        assert_near_equal(int_mtx._coo.toarray().real, int_mtx._coo.toarray(), 1e-15)
+
+        jac.set_complex_step_mode(False)
+        jac._update(model)
+        self.assertFalse(np.iscomplexobj(int_mtx._matrix))
+
+        assert_near_equal(prob.compute_totals(of=['sq.z'], wrt=['ivc.x'], return_format='array'),
+                          J, 1e-15)
 
 if __name__ == '__main__':
     unittest.main()
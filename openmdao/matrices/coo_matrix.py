@@ -16,6 +16,9 @@ class COOMatrix(Matrix):
     ----------
     _coo : coo_matrix
         COO matrix. Used as a basis for conversion to CSC, CSR, Dense in inherited classes.
+    _version : int
+        Incremented whenever the matrix data changes, so masked products know when to refresh
+        their submatrices.
     """
 
     def __init__(self, comm, is_internal):
@@ -31,6 +34,7 @@ class COOMatrix(Matrix):
         """
         super().__init__(comm, is_internal)
         self._coo = None
+        self._version = 0
 
     def _build_coo(self, system):
         """
@@ -191,8 +195,8 @@ class COOMatrix(Matrix):
             incoming vector to multiply.
         mode : str
             'fwd' or 'rev'.
-        mask : ndarray of type bool, or None
-            Array used to zero out part of the matrix data.
+        mask : _ColumnSubset or None
+            Columns of the matrix included in the product, or None to include all of them.
 
         Returns
         -------
@@ -205,26 +209,20 @@ class COOMatrix(Matrix):
         # system.
         mat = self._matrix
 
-        # NOTE: mask applies only to ext_mtx.
+        # NOTE: mask applies only to ext_mtx. Every column of ext_mtx belongs to a single
+        # input, so the product only uses the submatrix of the columns of the unmasked inputs.
+        if mask is None:
+            if mode == 'fwd':
+                return mat.dot(in_vec)
+            return mat.T.dot(in_vec)
 
+        submat = mask._get_submat(mat, self._version)
         if mode == 'fwd':
-            if mask is None:
-                return mat.dot(in_vec)
-            else:
-                save = mat.data[mask]
-                mat.data[mask] = 0.0
-                val = mat.dot(in_vec)
-                mat.data[mask] = save
-                return val
+            return submat.dot(mask._gather(in_vec))
         else:  # rev
-            if mask is None:
-                return mat.T.dot(in_vec)
-            else:
-                save = mat.data[mask]
-                mat.data[mask] = 0.0
-                val = mat.T.dot(in_vec)
-                mat.data[mask] = save
-                return val
+            val = np.zeros(mat.shape[1], dtype=np.result_type(submat.dtype, in_vec.dtype))
+            val[mask.cols] = submat.T.dot(in_vec)
+            return val
 
     def _create_mask_cache(self, d_inputs):
         """
@@ -240,23 +238,26 @@ class COOMatrix(Matrix):
 
         Returns
         -------
-        ndarray or None
-            The mask array or None.
+        _ColumnSubset or None
+            The columns of the matrix to be included in products, or None if all are.
         """
         if d_inputs._in_matvec_context():
             input_names = d_inputs._names
-            mask = None
+            cols = self._coo.col
+            keep = np.zeros(self._coo.shape[1], dtype=bool)
             for key, val in self._key_ranges.items():
                 if key[1] in input_names:
-                    if mask is None:
-                        mask = np.ones(self._matrix.data.size, dtype=np.bool)
                     ind1, ind2, _, _ = val
-                    mask[ind1:ind2] = False
+                    keep[cols[ind1:ind2]] = True
 
-            if mask is not None:
-                # convert the mask indices (if necessary) base on sparse matrix type
-                # (CSC, CSR, etc.)
-                return self._convert_mask(mask)
+            if not np.all(keep):
+                return _ColumnSubset(np.nonzero(keep)[0])
+
+    def _post_update(self):
+        """
+        Do anything that needs to be done at the end of AssembledJacobian._update.
+        """
+        self._version += 1
 
     def set_complex_step_mode(self, active):
         """
@@ -277,18 +278,111 @@ class COOMatrix(Matrix):
             self._coo.data = self._coo.data.real
             self._coo.dtype = np.float
 
-    def _convert_mask(self, mask):
+        self._version += 1
+
+
+class _ColumnSubset(object):
+    """
+    Columns of an ext_mtx that are included in masked products.
+
+    The submatrix of those columns is built the first time it's needed and its data is refreshed
+    only after the data of the full matrix changes.
+
+    Attributes
+    ----------
+    cols : ndarray of int
+        Indices of the included columns.
+    _src : ndarray or sparse matrix or None
+        Matrix the submatrix was built from.
+    _version : int or None
+        Data version of the matrix when the submatrix was last refreshed.
+    _idxs : ndarray of int or None
+        Positions in the data array of a sparse matrix of the entries in the included columns.
+    _submat : ndarray or coo_matrix or None
+        Submatrix of the included columns.
+    _in_buf : ndarray or None
+        Buffer holding the included entries of the vector multiplied in fwd mode.
+    """
+
+    def __init__(self, cols):
+        """
+        Initialize all attributes.
+
+        Parameters
+        ----------
+        cols : ndarray of int
+            Indices of the included columns.
+        """
+        self.cols = cols
+        self._src = None
+        self._version = None
+        self._idxs = None
+        self._submat = None
+        self._in_buf = None
+
+    def _get_submat(self, mat, version):
+        """
+        Return the submatrix of the included columns, refreshing it if the matrix changed.
+
+        Parameters
+        ----------
+        mat : ndarray or sparse matrix
+            The full matrix.
+        version : int
+            Data version of the full matrix.
+
+        Returns
+        -------
+        ndarray or coo_matrix
+            The submatrix.
+        """
+        submat = self._submat
+        if mat is not self._src:
+            # matrices are swapped, e.g. by the dense matrix under complex step, so rebuild
+            if isinstance(mat, ndarray):
+                self._idxs = None
+                submat = self._submat = mat[:, self.cols]
+            else:
+                coo = mat.tocoo(copy=False)
+                col_map = np.full(mat.shape[1], -1, dtype=int)
+                col_map[self.cols] = np.arange(self.cols.size)
+                idxs = self._idxs = np.nonzero(col_map[coo.col] >= 0)[0]
+                submat = self._submat = coo_matrix((mat.data[idxs],
+                                                    (coo.row[idxs], col_map[coo.col[idxs]])),
+                                                   shape=(mat.shape[0], self.cols.size))
+            self._src = mat
+        elif version != self._version:
+            data = mat if self._idxs is None else mat.data
+            dest = submat if self._idxs is None else submat.data
+            if dest.dtype != data.dtype:
+                # complex step changed the type of the matrix data
+                if self._idxs is None:
+                    submat = self._submat = mat[:, self.cols]
+                else:
+                    submat.data = mat.data[self._idxs]
+            elif self._idxs is None:
+                np.take(mat, self.cols, axis=1, out=submat)
+            else:
+                np.take(mat.data, self._idxs, out=submat.data)
+
+        self._version = version
+        return submat
+
+    def _gather(self, vec):
         """
-        Convert the mask to the format of this sparse matrix (CSC, etc.) from COO.
+        Return the included entries of the given vector in a reused buffer.
 
         Parameters
         ----------
-        mask : ndarray
-            The mask of indices to zero out.
+        vec : ndarray
+            Vector with an entry for each column of the full matrix.
 
         Returns
         -------
         ndarray
-            The converted mask array.
+            The entries of vec for the included columns.
         """
-        return mask
+        buf = self._in_buf
+        if buf is None or buf.dtype != vec.dtype:
+            buf = self._in_buf = np.empty(self.cols.size, dtype=vec.dtype)
+        return np.take(vec, self.cols, out=buf)
@@ -1,5 +1,4 @@
 """Define the CSCmatrix class."""
-
 import numpy as np
 from scipy.sparse import csc_matrix
 
@@ -9,8 +8,43 @@ from openmdao.matrices.coo_matrix import COOMatrix
 class CSCMatrix(COOMatrix):
     """
     Sparse matrix in Compressed Col Storage format.
+
+    Attributes
+    ----------
+    _compressed : csc_matrix
+        Compressed matrix whose sparsity structure is computed once at build time.
+    _order : ndarray of int
+        Permutation of the COO data that puts it in CSC order.
+    _starts : ndarray of int or None
+        Start positions, in the permuted COO data, of each unique CSC entry. None if there
+        are no repeated entries.
+    _nnz : int
+        Number of unique entries in the compressed matrix.
+    _indices : ndarray of int
+        Minor axis index of each unique entry in the compressed matrix.
+    _indptr : ndarray of int
+        Offsets into _indices of the start of each major axis slice.
     """
 
+    def __init__(self, comm, is_internal):
+        """
+        Initialize all attributes.
+
+        Parameters
+        ----------
+        comm : MPI.Comm or <FakeComm>
+            communicator of the top-level system that owns the <Jacobian>.
+        is_internal : bool
+            If True, this is the int_mtx of an AssembledJacobian.
+        """
+        super().__init__(comm, is_internal)
+        self._compressed = None
+        self._order = None
+        self._starts = None
+        self._nnz = 0
+        self._indices = None
+        self._indptr = None
+
     def _build(self, num_rows, num_cols, system=None):
         """
         Allocate the matrix.
@@ -25,7 +59,46 @@ class CSCMatrix(COOMatrix):
             owning system.
         """
         super()._build(num_rows, num_cols, system)
-        self._coo = self._matrix
+        coo = self._coo = self._matrix
+        self._build_compressed(coo.col, coo.row, num_cols)
+        self._compressed = csc_matrix((np.zeros(self._nnz), self._indices, self._indptr),
+                                      shape=coo.shape)
+
+    def _build_compressed(self, major, minor, num_major):
+        """
+        Compute the permutation and index arrays that map the COO data to compressed storage.
+
+        Parameters
+        ----------
+        major : ndarray of int
+            Major axis index of each COO entry (cols for CSC, rows for CSR).
+        minor : ndarray of int
+            Minor axis index of each COO entry.
+        num_major : int
+            Size of the major axis.
+        """
+        order = self._order = np.lexsort((minor, major))
+        major = major[order]
+        minor = minor[order]
+
+        # repeated (row, col) entries, e.g. from repeated src_indices, are summed
+        if major.size > 0:
+            new_entry = np.empty(major.size, dtype=bool)
+            new_entry[0] = True
+            new_entry[1:] = (major[1:] != major[:-1]) | (minor[1:] != minor[:-1])
+            if np.all(new_entry):
+                self._starts = None
+            else:
+                self._starts = np.nonzero(new_entry)[0]
+                major = major[self._starts]
+                minor = minor[self._starts]
+        else:
+            self._starts = None
+
+        self._nnz = minor.size
+        self._indices = minor
+        self._indptr = np.zeros(num_major + 1, dtype=int)
+        np.cumsum(np.bincount(major, minlength=num_major), out=self._indptr[1:])
 
     def _pre_update(self):
         """
@@ -37,27 +110,36 @@ class CSCMatrix(COOMatrix):
         """
         Do anything that needs to be done at the end of AssembledJacobian._update.
         """
-        coo = self._coo
-        # this will add any repeated entries together
-        # NOTE: The CSC matrix was created in the following way instead of using self._coo.tocsc()
-        # because on older versions of scipy, self._coo.tocsc() reuses the row/col arrays and the
-        # result is that self._coo.row and self._coo.col get scrambled after csc conversion.
-        self._matrix = csc_matrix((coo.data, (coo.row, coo.col)), shape=coo.shape)
+        super()._post_update()
+        self._gather()
+        self._matrix = self._compressed
 
-    def _convert_mask(self, mask):
+    def _gather(self):
+        """
+        Copy the COO data into the data array of the compressed matrix.
         """
-        Convert the mask to the format of this sparse matrix (CSC, etc.) from COO.
+        data = self._coo.data
+        if self._starts is None:
+            np.take(data, self._order, out=self._compressed.data)
+        elif data.size > 0:
+            self._compressed.data[:] = np.add.reduceat(data[self._order], self._starts)
+
+    def set_complex_step_mode(self, active):
+        """
+        Turn on or off complex stepping mode.
+
+        When turned on, the value in each subjac is cast as complex, and when turned
+        off, they are returned to real values.
 
         Parameters
         ----------
-        mask : ndarray
-            The mask of indices to zero out.
-
-        Returns
-        -------
-        ndarray
-            The converted mask array.
+        active : bool
+            Complex mode flag; set to True prior to commencing complex step.
         """
-        coo = self._coo
-        csc = csc_matrix((mask, (coo.row, coo.col)), shape=coo.shape)
-        return csc.data
+        super().set_complex_step_mode(active)
+
+        mtx = self._compressed
+        if active:
+            mtx.data = mtx.data.astype(np.complex)
+        else:
+            mtx.data = mtx.data.real.copy()
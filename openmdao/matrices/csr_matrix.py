@@ -1,15 +1,16 @@
 """Define the CSRmatrix class."""
-from scipy.sparse import coo_matrix
+import numpy as np
+from scipy.sparse import csr_matrix
 
-from openmdao.matrices.coo_matrix import COOMatrix
+from openmdao.matrices.csc_matrix import CSCMatrix
 
 
-class CSRMatrix(COOMatrix):
+class CSRMatrix(CSCMatrix):
     """
     Sparse matrix in Compressed Row Storage format.
     """
 
-    def _build(self, num_rows, num_cols, in_ranges, out_ranges):
+    def _build(self, num_rows, num_cols, system=None):
         """
         Allocate the matrix.
 
@@ -19,24 +20,11 @@ class CSRMatrix(COOMatrix):
             number of rows in the matrix.
         num_cols : int
             number of cols in the matrix.
-        in_ranges : dict
-            Maps input var name to column range.
-        out_ranges : dict
-            Maps output var name to row range.
+        system : <System>
+            owning system.
         """
-        super()._build(num_rows, num_cols, in_ranges, out_ranges)
-
-        self._coo = self._matrix
-
-    def _pre_update(self):
-        """
-        Do anything that needs to be done at the end of AssembledJacobian._update.
-        """
-        self._matrix = self._coo
-
-    def _post_update(self):
-        """
-        Do anything that needs to be done at the end of AssembledJacobian._update.
-        """
-        # this will add any repeated entries together
-        self._matrix = self._coo.tocsc()
+        super(CSCMatrix, self)._build(num_rows, num_cols, system)
+        coo = self._coo = self._matrix
+        self._build_compressed(coo.row, coo.col, num_rows)
+        self._compressed = csr_matrix((np.zeros(self._nnz), self._indices, self._indptr),
+                                      shape=coo.shape)
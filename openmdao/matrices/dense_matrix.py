@@ -12,8 +12,37 @@ from openmdao.matrices.coo_matrix import COOMatrix
 class DenseMatrix(COOMatrix):
     """
     Dense global matrix.
+
+    Attributes
+    ----------
+    _dense : ndarray
+        Dense matrix, allocated once at build time.
+    _order : ndarray of int
+        Permutation of the COO data that sorts it by flat position in the dense matrix.
+    _starts : ndarray of int or None
+        Start positions, in the permuted COO data, of each unique entry. None if there
+        are no repeated entries.
+    _flat_idxs : ndarray of int
+        Flat position in the dense matrix of each unique entry.
     """
 
+    def __init__(self, comm, is_internal):
+        """
+        Initialize all attributes.
+
+        Parameters
+        ----------
+        comm : MPI.Comm or <FakeComm>
+            communicator of the top-level system that owns the <Jacobian>.
+        is_internal : bool
+            If True, this is the int_mtx of an AssembledJacobian.
+        """
+        super().__init__(comm, is_internal)
+        self._dense = None
+        self._order = None
+        self._starts = None
+        self._flat_idxs = None
+
     def _build(self, num_rows, num_cols, system=None):
         """
         Allocate the matrix.
@@ -28,78 +57,24 @@ class DenseMatrix(COOMatrix):
             owning system.
         """
         super()._build(num_rows, num_cols)
-        self._coo = self._matrix
-
-    def _prod(self, in_vec, mode, mask=None):
-        """
-        Perform a matrix vector product.
-
-        Parameters
-        ----------
-        in_vec : ndarray[:]
-            incoming vector to multiply.
-        mode : str
-            'fwd' or 'rev'.
-        mask : ndarray of type bool, or None
-            Array used to mask out part of the input vector.
-
-        Returns
-        -------
-        ndarray[:]
-            vector resulting from the product.
-        """
-        # when we have a derivative based solver at a level below the
-        # group that owns the AssembledJacobian, we need to use only
-        # the part of the matrix that is relevant to the lower level
-        # system.
-        mat = self._matrix
-
-        if mode == 'fwd':
-            if mask is None:
-                return mat.dot(in_vec)
-            else:
-                # Use the special dot product function from masking module so that we
-                # ignore masked parts.
-                return np.ma.dot(mat, np.ma.array(in_vec, mask=mask))
-        else:  # rev
-            if mask is None:
-                return mat.T.dot(in_vec)
-            else:
-                # Mask need to be applied to ext_mtx so that we can ignore multiplication
-                # by certain columns.
-                mat_T = mat.T
-                arrmask = np.zeros(mat_T.shape, dtype=np.bool)
-                arrmask[mask, :] = True
-                masked_mtx = np.ma.array(mat_T, mask=arrmask, fill_value=0.0)
-
-                masked_product = np.ma.dot(masked_mtx, in_vec).flatten()
-                return np.ma.filled(masked_product, fill_value=0.0)
-
-    def _create_mask_cache(self, d_inputs):
-        """
-        Create masking array for this matrix.
+        coo = self._coo = self._matrix
 
-        Note: this only applies when this Matrix is an 'ext_mtx' inside of a
-        Jacobian object.
+        flat = coo.row * num_cols + coo.col
+        order = self._order = np.argsort(flat, kind='stable')
+        flat = flat[order]
 
-        Parameters
-        ----------
-        d_inputs : Vector
-            The inputs linear vector.
-
-        Returns
-        -------
-        ndarray or None
-            The mask array or None.
-        """
-        if d_inputs._in_matvec_context():
-            sub = d_inputs._names
-            mask = np.ones(len(d_inputs), dtype=np.bool)
-            for key, val in self._metadata.items():
-                if key[1] in sub:
-                    mask[val[1]] = False
+        # repeated entries, e.g. from repeated src_indices, are summed
+        self._starts = None
+        if flat.size > 1:
+            new_entry = np.empty(flat.size, dtype=bool)
+            new_entry[0] = True
+            new_entry[1:] = flat[1:] != flat[:-1]
+            if not np.all(new_entry):
+                self._starts = np.nonzero(new_entry)[0]
+                flat = flat[self._starts]
 
-            return mask
+        self._flat_idxs = flat
+        self._dense = np.zeros((num_rows, num_cols))
 
     def _pre_update(self):
         """
@@ -111,5 +86,32 @@ class DenseMatrix(COOMatrix):
         """
         Do anything that needs to be done at the end of AssembledJacobian._update.
         """
-        # this will add any repeated entries together
-        self._matrix = self._coo.toarray()
+        super()._post_update()
+        data = self._coo.data[self._order]
+        if self._starts is not None:
+            data = np.add.reduceat(data, self._starts)
+
+        self._dense.ravel()[self._flat_idxs] = data
+        self._matrix = self._dense
+
+    def set_complex_step_mode(self, active):
+        """
+        Turn on or off complex stepping mode.
+
+        When turned on, the value in each subjac is cast as complex, and when turned
+        off, they are returned to real values.
+
+        Parameters
+        ----------
+        active : bool
+            Complex mode flag; set to True prior to commencing complex step.
+        """
+        super().set_complex_step_mode(active)
+
+        if active:
+            self._dense = self._dense.astype(np.complex)
+        else:
+            self._dense = self._dense.real.copy()
+
+        if self._matrix is not self._coo:
+            self._matrix = self._dense
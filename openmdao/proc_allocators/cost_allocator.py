@@ -0,0 +1,400 @@
+"""Define the CostAllocator class and the database of system timings that it uses."""
+import os
+import sys
+import json
+import time
+from contextlib import contextmanager
+
+import numpy as np
+
+from openmdao.core.constants import _DEFAULT_OUT_STREAM
+from openmdao.proc_allocators.default_allocator import DefaultAllocator
+
+
+class TimingDatabase(object):
+    """
+    Average nonlinear execution time of systems, keyed by pathname.
+
+    Timings are stored in a JSON file, so they can be measured in one run, e.g. a serial
+    profiling run, and used to allocate procs in later ones.
+
+    Attributes
+    ----------
+    filename : str or None
+        Name of the JSON file containing the timings.
+    _timings : dict
+        (number of executions, total time) keyed by system pathname.
+    """
+
+    def __init__(self, filename=None):
+        """
+        Initialize attributes.
+
+        Parameters
+        ----------
+        filename : str or None
+            Name of the JSON file containing the timings.  If it exists, its timings are read.
+        """
+        self.filename = filename
+        self._timings = {}
+
+        if filename is not None and os.path.isfile(filename):
+            with open(filename, 'r') as f:
+                self._timings = {name: tuple(val) for name, val in json.load(f).items()}
+
+    def add_timing(self, pathname, elapsed, count=1):
+        """
+        Add the time taken by one or more executions of a system.
+
+        Parameters
+        ----------
+        pathname : str
+            Pathname of the system.
+        elapsed : float
+            Total time of the executions in seconds.
+        count : int
+            Number of executions.
+        """
+        ncalls, total = self._timings.get(pathname, (0, 0.0))
+        self._timings[pathname] = (ncalls + count, total + elapsed)
+
+    def get_cost(self, pathname):
+        """
+        Return the average execution time of a system.
+
+        Parameters
+        ----------
+        pathname : str
+            Pathname of the system.
+
+        Returns
+        -------
+        float or None
+            Average time in seconds, or None if the system hasn't been timed.
+        """
+        if pathname in self._timings:
+            ncalls, total = self._timings[pathname]
+            if ncalls > 0:
+                return total / ncalls
+
+    def clear(self):
+        """
+        Remove all timings.
+        """
+        self._timings = {}
+
+    @contextmanager
+    def record(self, problem):
+        """
+        Time each nonlinear execution of every local system of the given problem.
+
+        Parameters
+        ----------
+        problem : <Problem>
+            The problem to time.  Its final setup must have been done.
+
+        Yields
+        ------
+        None
+        """
+        systems = list(problem.model.system_iter(include_self=True, recurse=True))
+        for system in systems:
+            system._solve_nonlinear = self._get_timed_func(system.pathname,
+                                                           system._solve_nonlinear)
+        try:
+            yield
+        finally:
+            for system in systems:
+                # removing the instance attribute exposes the class method again
+                del system._solve_nonlinear
+
+    def _get_timed_func(self, pathname, func):
+        """
+        Return a wrapper of func that adds the time of each call to the timings of pathname.
+
+        Parameters
+        ----------
+        pathname : str
+            Pathname of the system.
+        func : function
+            The method to time.
+
+        Returns
+        -------
+        function
+            The wrapper.
+        """
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.add_timing(pathname, time.perf_counter() - start)
+
+        return timed
+
+    def save(self, filename=None, comm=None):
+        """
+        Write the timings to a JSON file.
+
+        Under MPI, the timings of all procs are merged and rank 0 writes the file.  Systems that
+        are duplicated on several procs keep the largest of their timings.
+
+        Parameters
+        ----------
+        filename : str or None
+            Name of the file.  Defaults to the file the database was created with.
+        comm : MPI.Comm or <FakeComm> or None
+            Communicator of the procs that recorded timings.
+        """
+        if filename is None:
+            filename = self.filename
+        if filename is None:
+            raise ValueError("TimingDatabase: no file name given for saving the timings.")
+
+        timings = self._timings
+        if comm is not None and comm.size > 1:
+            timings = {}
+            for proc_timings in comm.allgather(self._timings):
+                for name, (ncalls, total) in proc_timings.items():
+                    if name not in timings or total / ncalls > timings[name][1] / timings[name][0]:
+                        timings[name] = (ncalls, total)
+            if comm.rank != 0:
+                return
+
+        with open(filename, 'w') as f:
+            json.dump(timings, f, indent=1, sort_keys=True)
+
+
+class CostAllocator(DefaultAllocator):
+    """
+    Processor allocator that balances the measured execution times of the subsystems.
+
+    Each subsystem is assumed to run in cost / nprocs when given nprocs procs, so procs beyond
+    the min_procs of each subsystem are handed out one at a time to the subsystem with the
+    largest predicted time that can still use more.  When there are fewer procs than
+    subsystems, subsystems are assigned to procs with their costs as weights.  Subsystems
+    without a timing get the average cost of the timed ones scaled by their proc_weight, and
+    if none of the subsystems have timings the DefaultAllocator algorithm is used.
+
+    Attributes
+    ----------
+    timings : <TimingDatabase>
+        Subsystem timings.
+    predicted : dict
+        Predicted busy time of each proc of the last allocation of each parallel group, keyed
+        by the pathname of the group.
+    _sub_pathnames : list of str or None
+        Pathnames of the subsystems being allocated.
+    """
+
+    def __init__(self, timings, parallel=True):
+        """
+        Initialize all attributes.
+
+        Parameters
+        ----------
+        timings : <TimingDatabase> or str
+            Subsystem timings, or the name of the JSON file containing them.
+        parallel : bool
+            If True, split subsystem comm.
+        """
+        super().__init__(parallel)
+        self.timings = TimingDatabase(timings) if isinstance(timings, str) else timings
+        self.predicted = {}
+        self._sub_pathnames = None
+
+    def __call__(self, proc_info, nsubs, comm, sub_pathnames=None):
+        """
+        Perform the allocation if parallel.
+
+        Parameters
+        ----------
+        proc_info : list of (min_procs, max_procs, weight)
+            Information used to determine MPI process allocation to subsystems.
+        nsubs : int
+            Number of subsystems.
+        comm : MPI.Comm or <FakeComm>
+            communicator of the owning system.
+        sub_pathnames : list of str or None
+            Pathnames of the subsystems, used to look up their timings.
+
+        Returns
+        -------
+        isubs : [int, ...]
+            indices of the owned local subsystems.
+        sub_comm : MPI.Comm or <FakeComm>
+            communicator to pass to the subsystems.
+        sub_proc_range : (int, int)
+            The range of processors that the subcomm owns, among those of comm.
+        """
+        self._sub_pathnames = sub_pathnames
+        try:
+            return super().__call__(proc_info, nsubs, comm, sub_pathnames)
+        finally:
+            self._sub_pathnames = None
+
+    def _get_costs(self, proc_weights):
+        """
+        Return the cost of each subsystem, or None if none of them have been timed.
+
+        Parameters
+        ----------
+        proc_weights : ndarray
+            The proc_weight of each subsystem.
+
+        Returns
+        -------
+        ndarray or None
+            Average execution time of each subsystem.
+        """
+        if self._sub_pathnames is None:
+            return None
+
+        costs = np.array([np.nan if c is None else c for c in
+                          (self.timings.get_cost(name) for name in self._sub_pathnames)])
+        timed = ~np.isnan(costs)
+        if not np.any(timed):
+            return None
+
+        # a timing of 0 would give a subsystem no weight at all
+        costs[timed] = np.maximum(costs[timed], 1e-12)
+        costs[~timed] = np.mean(costs[timed]) * proc_weights[~timed]
+
+        return costs
+
+    def _divide_procs(self, proc_info, comm):
+        """
+        Perform the parallel processor allocation.
+
+        Parameters
+        ----------
+        proc_info : list of (min_procs, max_procs, weight)
+            Information used to determine MPI process allocation to subsystems.
+        comm : MPI.Comm or <FakeComm>
+            communicator of the owning System.
+
+        Returns
+        -------
+        isubs : [int, ...]
+            indices of the owned local subsystems.
+        sub_comm : MPI.Comm or <FakeComm>
+            communicator to pass to the subsystems.
+        sub_proc_range : (int, int)
+            The range of processors that the subcomm owns, among those of comm.
+        """
+        nproc = comm.size
+        min_procs, max_procs, proc_weights = self._split_proc_info(proc_info, comm)
+        costs = self._get_costs(proc_weights)
+
+        if costs is None:
+            return super()._divide_procs(proc_info, comm)
+
+        self._check_procs(min_procs, max_procs, nproc)
+
+        if np.sum(min_procs) > nproc:
+            # more subsystems than procs, so the costs are used as weights to pack them
+            result = super()._divide_procs([(minp, maxp, c) for (minp, maxp, _), c in
+                                            zip(proc_info, costs)], comm)
+            busy = [np.sum(costs[isubs]) for isubs in comm.allgather(result[0])]
+        else:
+            num_procs = get_balanced_procs(costs, min_procs, max_procs, nproc)
+            result = self._split_comm(num_procs, comm)
+            busy = np.repeat(costs / num_procs, num_procs)
+
+        group = self._sub_pathnames[0].rpartition('.')[0]
+        self.predicted[group] = np.array(busy)
+
+        return result
+
+
+def get_balanced_procs(costs, min_procs, max_procs, nproc):
+    """
+    Return the number of procs of each subsystem that minimizes the largest predicted time.
+
+    Each subsystem is assumed to run in cost / nprocs.  Starting from min_procs, each remaining
+    proc goes to the subsystem with the largest predicted time that is below its max_procs.
+
+    Parameters
+    ----------
+    costs : ndarray
+        Execution time of each subsystem on one proc.
+    min_procs : ndarray
+        Minimum number of procs of each subsystem.
+    max_procs : ndarray
+        Maximum number of procs of each subsystem.
+    nproc : int
+        Number of procs to divide.
+
+    Returns
+    -------
+    ndarray
+        Number of procs of each subsystem.
+    """
+    num_procs = np.maximum(min_procs, 1)
+    times = costs / num_procs
+
+    for i in range(nproc - np.sum(num_procs)):
+        times[num_procs >= max_procs] = -1.0
+        isub = np.argmax(times)
+        num_procs[isub] += 1
+        times[isub] = costs[isub] / num_procs[isub]
+
+    return num_procs
+
+
+def report_idle_times(problem, timings, out_stream=_DEFAULT_OUT_STREAM):
+    """
+    Print the predicted and actual idle time of each proc of each parallel group.
+
+    The actual busy time of a proc is the total of the timings of its local subsystems of the
+    group, and its idle time is how long it waits for the busiest proc.  Predicted times are
+    only available for groups whose procs were allocated by a CostAllocator.  This must be
+    called on every proc.
+
+    Parameters
+    ----------
+    problem : <Problem>
+        The problem, after a run whose timings were recorded.
+    timings : <TimingDatabase>
+        Timings recorded on each proc during the run, e.g. with TimingDatabase.record.
+    out_stream : file-like object
+        Where to send the report.  Defaults to sys.stdout.  Only rank 0 writes.
+
+    Returns
+    -------
+    list of (str, ndarray or None, ndarray)
+        Pathname, predicted idle times and actual idle times of each parallel group.
+    """
+    from openmdao.core.group import Group
+
+    model = problem.model
+    rows = []
+    for group in model.system_iter(include_self=True, recurse=True, typ=Group):
+        if not group._mpi_proc_allocator.parallel:
+            continue
+
+        busy = np.sum([timings.get_cost(s.pathname) or 0.0 for s in group._subsystems_myproc])
+        actual = np.array(group.comm.allgather(busy) if group.comm.size > 1 else [busy])
+        predicted = getattr(group._mpi_proc_allocator, 'predicted', {}).get(group.pathname)
+        if predicted is not None:
+            predicted = np.max(predicted) - predicted
+        if group.comm.rank == 0:
+            rows.append((group.pathname, predicted, np.max(actual) - actual))
+
+    if model.comm.size > 1:
+        rows = [row for proc_rows in model.comm.allgather(rows) for row in proc_rows]
+
+    if out_stream is _DEFAULT_OUT_STREAM:
+        out_stream = sys.stdout
+
+    if out_stream is not None and model.comm.rank == 0:
+        for pathname, predicted, actual in rows:
+            out_stream.write("Parallel group '%s'\n" % pathname)
+            out_stream.write("%6s %20s %20s\n" % ('rank', 'predicted idle (s)', 'actual idle (s)'))
+            for rank, idle in enumerate(actual):
+                pred = 'n/a' if predicted is None else '%.6g' % predicted[rank]
+                out_stream.write("%6d %20s %20.6g\n" % (rank, pred, idle))
+            out_stream.write('\n')
+
+    return rows
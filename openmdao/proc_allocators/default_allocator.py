@@ -35,18 +35,10 @@ class DefaultAllocator(ProcAllocator):
         iproc = comm.rank
         nproc = comm.size
 
-        nsubs = len(proc_info)
         min_procs, max_procs, proc_weights = self._split_proc_info(proc_info, comm)
         min_sum = np.sum(min_procs)
 
-        if np.sum(max_procs) < nproc:
-            raise ProcAllocationError("too many MPI procs allocated. Comm is size %d but "
-                                      "can only use %d." % (nproc, np.sum(max_procs)))
-        if min_sum > nproc and np.any(min_procs > 1):
-            raise ProcAllocationError("can't meet min_procs required because the sum of the "
-                                      "min procs required exceeds the procs allocated and the "
-                                      "min procs required is > 1",
-                                      np.array(list(range(nsubs)))[min_procs > 1])
+        self._check_procs(min_procs, max_procs, nproc)
 
         # Define the normalized weights for all subsystems
         proc_weights /= np.sum(proc_weights)
@@ -116,10 +108,57 @@ class DefaultAllocator(ProcAllocator):
                 # the remaining 'active' subsystems.
                 num_procs[np.argmin(norm)] += 1
 
+        return self._split_comm(num_procs, comm)
+
+    def _check_procs(self, min_procs, max_procs, nproc):
+        """
+        Raise a ProcAllocationError if the procs can't be divided among the subsystems.
+
+        Parameters
+        ----------
+        min_procs : ndarray
+            Min procs required for each subsystem.
+        max_procs : ndarray
+            Max procs usable by each subsystem.
+        nproc : int
+            Number of procs to divide.
+        """
+        if np.sum(max_procs) < nproc:
+            raise ProcAllocationError("too many MPI procs allocated. Comm is size %d but "
+                                      "can only use %d." % (nproc, np.sum(max_procs)))
+        if np.sum(min_procs) > nproc and np.any(min_procs > 1):
+            raise ProcAllocationError("can't meet min_procs required because the sum of the "
+                                      "min procs required exceeds the procs allocated and the "
+                                      "min procs required is > 1",
+                                      np.arange(min_procs.size)[min_procs > 1])
+
+    def _split_comm(self, num_procs, comm):
+        """
+        Split the comm so that each subsystem gets a contiguous range of num_procs procs.
+
+        Parameters
+        ----------
+        num_procs : ndarray
+            Number of procs of each subsystem.
+        comm : MPI.Comm or <FakeComm>
+            communicator of the owning System.
+
+        Returns
+        -------
+        isubs : [int, ...]
+            indices of the owned local subsystems.
+        sub_comm : MPI.Comm or <FakeComm>
+            communicator to pass to the subsystems.
+        sub_proc_range : (int, int)
+            The range of processors that the subcomm owns, among those of comm.
+        """
+        iproc = comm.rank
+        nproc = comm.size
+
         # Compute the coloring
         color = np.zeros(nproc, int)
         start, end = 0, 0
-        for isub in range(nsubs):
+        for isub in range(num_procs.size):
             end += num_procs[isub]
             color[start:end] = isub
             start += num_procs[isub]
@@ -52,7 +52,7 @@ class ProcAllocator(object):
         """
         self.parallel = parallel
 
-    def __call__(self, proc_info, nsubs, comm):
+    def __call__(self, proc_info, nsubs, comm, sub_pathnames=None):
         """
         Perform the allocation if parallel.
 
@@ -64,6 +64,8 @@ class ProcAllocator(object):
             Number of subsystems.
         comm : MPI.Comm or <FakeComm>
             communicator of the owning system.
+        sub_pathnames : list of str or None
+            Pathnames of the subsystems, for allocators that need to identify them.
 
         Returns
         -------
@@ -0,0 +1,124 @@
+""" Unit tests for the CostAllocator and the TimingDatabase. """
+import unittest
+from io import StringIO
+
+import numpy as np
+
+import openmdao.api as om
+from openmdao.proc_allocators.cost_allocator import get_balanced_procs
+from openmdao.test_suite.components.sellar import SellarDerivatives
+from openmdao.test_suite.groups.parallel_groups import FanOutGrouped
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.mpi import MPI
+from openmdao.utils.testing_utils import use_tempdirs
+
+try:
+    from openmdao.vectors.petsc_vector import PETScVector
+except ImportError:
+    PETScVector = None
+
+
+class TestBalancedProcs(unittest.TestCase):
+
+    def test_proportional(self):
+        num_procs = get_balanced_procs(np.array([1., 3., 6.]), np.ones(3, dtype=int),
+                                       np.full(3, 10), 10)
+        np.testing.assert_array_equal(num_procs, [1, 3, 6])
+
+    def test_max_procs(self):
+        num_procs = get_balanced_procs(np.array([1., 6.]), np.array([1, 1]),
+                                       np.array([4, 2]), 5)
+        np.testing.assert_array_equal(num_procs, [3, 2])
+
+
+@use_tempdirs
+class TestTimingDatabase(unittest.TestCase):
+
+    def test_record(self):
+        prob = om.Problem(SellarDerivatives())
+        prob.setup()
+        prob.final_setup()
+
+        timings = om.TimingDatabase('timings.json')
+        with timings.record(prob):
+            prob.run_model()
+            prob.run_model()
+
+        # d1 runs once per solver iteration, the model once per run
+        self.assertEqual(timings._timings[''][0], 2)
+        self.assertGreater(timings._timings['d1'][0], 2)
+        self.assertLess(timings.get_cost('d1'), timings.get_cost(''))
+        self.assertIsNone(timings.get_cost('nope'))
+
+        # the timing wrappers are removed afterwards
+        self.assertNotIn('_solve_nonlinear', prob.model.d1.__dict__)
+
+        timings.save()
+        loaded = om.TimingDatabase('timings.json')
+        self.assertEqual(loaded._timings, timings._timings)
+
+        with self.assertRaises(ValueError):
+            om.TimingDatabase().save()
+
+    def test_report_serial(self):
+        timings = om.TimingDatabase()
+        timings.add_timing('sub.c2', 1.0)
+        timings.add_timing('sub.c3', 3.0)
+
+        prob = om.Problem(FanOutGrouped())
+        prob.model.sub.options['proc_allocator'] = om.CostAllocator(timings)
+        prob.setup()
+        prob.run_model()
+
+        stream = StringIO()
+        rows = om.report_idle_times(prob, timings, out_stream=stream)
+
+        # on one proc both subsystems are local and no allocation was needed
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0][0], 'sub')
+        self.assertIsNone(rows[0][1])
+        assert_near_equal(rows[0][2], [0.], 1e-15)
+        self.assertIn("Parallel group 'sub'", stream.getvalue())
+
+
+@unittest.skipUnless(MPI and PETScVector, "MPI and PETSc are required.")
+class TestCostAllocatorMPI(unittest.TestCase):
+
+    N_PROCS = 3
+
+    def test_balanced(self):
+        timings = om.TimingDatabase()
+        timings.add_timing('sub.c2', 1.0)
+        timings.add_timing('sub.c3', 2.0)
+
+        prob = om.Problem(FanOutGrouped())
+        prob.model.sub.options['proc_allocator'] = om.CostAllocator(timings)
+        prob.setup()
+        prob.run_model()
+
+        par = prob.model.sub
+        names = [s.name for s in par._subsystems_myproc]
+        self.assertEqual(len(names), 1)
+        self.assertEqual(par._subsystems_myproc[0].comm.size, 1 if names == ['c2'] else 2)
+
+        allocator = par.options['proc_allocator']
+        assert_near_equal(allocator.predicted['sub'], [1., 1., 1.], 1e-15)
+        assert_near_equal(prob.get_val('sub.c3.y', get_remote=True), 15.0, 1e-15)
+
+        rows = om.report_idle_times(prob, timings, out_stream=None)
+        assert_near_equal(rows[0][1], [0., 0., 0.], 1e-15)
+
+    def test_no_timings(self):
+        default = om.Problem(FanOutGrouped())
+        default.setup()
+
+        prob = om.Problem(FanOutGrouped())
+        prob.model.sub.options['proc_allocator'] = om.CostAllocator(om.TimingDatabase())
+        prob.setup()
+
+        self.assertEqual([s.name for s in prob.model.sub._subsystems_myproc],
+                         [s.name for s in default.model.sub._subsystems_myproc])
+
+
+if __name__ == '__main__':
+    unittest.main()
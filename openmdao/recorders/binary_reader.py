@@ -0,0 +1,490 @@
+"""
+Definition of the BinaryCaseReader.
+"""
+import pickle
+from bisect import bisect_right
+from json import loads as json_loads
+
+import numpy as np
+
+from openmdao.recorders.base_case_reader import BaseCaseReader
+from openmdao.recorders.binary_recorder import BINARY_MAGIC, binary_format_version, \
+    _record_columns
+from openmdao.recorders.sqlite_reader import SqliteCaseReader, DriverCases, SystemCases, \
+    SolverCases, ProblemCases
+
+
+def is_binary_case_file(filename):
+    """
+    Return True if the given file was written by a BinaryRecorder.
+
+    Parameters
+    ----------
+    filename : str
+        The path to the file.
+
+    Returns
+    -------
+    bool
+        True if the file starts with the header of a binary case file.
+    """
+    try:
+        with open(filename, 'rb') as f:
+            return f.read(len(BINARY_MAGIC)) == BINARY_MAGIC
+    except OSError:
+        return False
+
+
+class _BinaryCaseTable(object):
+    """
+    Mixin that reads the cases of a case table from a binary case file.
+
+    Attributes
+    ----------
+    _reader : BinaryCaseReader
+        The reader that owns this table.
+    _entries : list of tuple
+        Index entries of the cases in this table, in the order they were recorded.
+    _key_rows : dict or None
+        Mapping of case key to the position of its first entry.
+    """
+
+    def __init__(self, reader, entries, *args):
+        """
+        Initialize.
+
+        Parameters
+        ----------
+        reader : BinaryCaseReader
+            The reader that owns this table.
+        entries : list of tuple
+            Index entries of the cases in this table, in the order they were recorded.
+        *args : list
+            Arguments for the case table.
+        """
+        super().__init__(*args)
+        self._reader = reader
+        self._entries = entries
+        self._key_rows = None
+
+    def count(self):
+        """
+        Get the number of cases recorded in the table.
+
+        Returns
+        -------
+        int
+            The number of cases recorded in the table.
+        """
+        return len(self._entries)
+
+    def _fetch_keys(self):
+        """
+        Read the keys of all cases in the table, in the order they were recorded.
+
+        Returns
+        -------
+        list
+            List of keys of cases in the table.
+        """
+        return [entry[2][self._index_name] for entry in self._entries]
+
+    def _fetch_row(self, case_id):
+        """
+        Read the row of the table for the given case.
+
+        Parameters
+        ----------
+        case_id : str
+            The string-identifier of the case.
+
+        Returns
+        -------
+        dict or None
+            The row for the case, or None if it was not found.
+        """
+        if self._key_rows is None:
+            self._key_rows = {}
+            for i, entry in enumerate(self._entries):
+                self._key_rows.setdefault(entry[2][self._index_name], i)
+
+        i = self._key_rows.get(case_id)
+        if i is not None:
+            return self._reader._build_row(self._entries[i], i + 1)
+
+    def _iter_rows(self):
+        """
+        Iterate over all rows of the table, in the order they were recorded.
+
+        Yields
+        ------
+        dict
+            A row of the table.
+        """
+        for i, entry in enumerate(self._entries):
+            yield self._reader._build_row(entry, i + 1)
+
+
+class _BinaryDriverCases(_BinaryCaseTable, DriverCases):
+    """
+    Driver cases read from a binary case file.
+    """
+
+    pass
+
+
+class _BinarySystemCases(_BinaryCaseTable, SystemCases):
+    """
+    System cases read from a binary case file.
+    """
+
+    pass
+
+
+class _BinarySolverCases(_BinaryCaseTable, SolverCases):
+    """
+    Solver cases read from a binary case file.
+    """
+
+    pass
+
+
+class _BinaryProblemCases(_BinaryCaseTable, ProblemCases):
+    """
+    Problem cases read from a binary case file.
+    """
+
+    pass
+
+
+class BinaryCaseReader(SqliteCaseReader):
+    """
+    A CaseReader specific to files created with BinaryRecorder.
+
+    The data file is memory mapped, so the values of a variable across all cases from a
+    source can be read as a strided view with get_val_history.
+
+    Attributes
+    ----------
+    _data : memmap or None
+        The memory mapped data file.
+    _layouts : dict
+        Fields and record length of each record layout, keyed on layout id.
+    _chunks : dict
+        Position of the first record and the records of each chunk, keyed on layout id.
+    _derivatives : dict
+        Recorded driver derivatives, keyed on iteration coordinate.
+    _source_cases : dict
+        Index entries of the cases from each source, keyed on source.
+    """
+
+    def __init__(self, filename, pre_load=False):
+        """
+        Initialize.
+
+        Parameters
+        ----------
+        filename : str
+            The path to the data file written by a BinaryRecorder.
+        pre_load : bool
+            If True, load all the data into memory during initialization.
+        """
+        # the metadata and cases come from the index, so none of the sqlite setup applies
+        BaseCaseReader.__init__(self, filename, pre_load)
+
+        if not is_binary_case_file(filename):
+            raise IOError('File does not contain a valid binary case recording: %s' % filename)
+
+        self._filename = filename
+        self._abs2prom = None
+        self._prom2abs = None
+        self._abs2meta = None
+        self._conns = None
+        self._auto_ivc_map = {}
+        self._layouts = {}
+        self._chunks = {}
+        self._derivatives = {}
+        self._source_cases = {}
+
+        header = len(BINARY_MAGIC) + 8
+        data = np.memmap(filename, dtype=np.uint8, mode='r')
+        version = int(data[len(BINARY_MAGIC):header].view(np.uint64)[0])
+        if version != binary_format_version:
+            raise ValueError('BinaryCaseReader encountered an unhandled '
+                             'binary format version: {0}'.format(version))
+        self._data = data if data.size > header else None
+
+        cases = self._read_index(filename + '.idx')
+
+        # drop any cases whose values were never written
+        cases = [entry for entry in cases if self._get_record(entry) is not None]
+
+        tables = {'driver': [], 'system': [], 'solver': [], 'problem': []}
+        self._global_iterations = giter = []
+        for i, entry in enumerate(cases):
+            record_type, source = entry[0], entry[1]
+            table = tables[record_type]
+            table.append(entry)
+            giter.append((i + 1, record_type, len(table), source))
+            self._source_cases.setdefault(self._get_public_source(record_type, source),
+                                          []).append(entry)
+
+        var_info = self.problem_metadata['variables']
+        args = (filename, self._format_version, giter, self._prom2abs, self._abs2prom,
+                self._abs2meta, self._conns, self._auto_ivc_map, var_info)
+        self._driver_cases = _BinaryDriverCases(self, tables['driver'], *args)
+        self._system_cases = _BinarySystemCases(self, tables['system'], *args)
+        self._solver_cases = _BinarySolverCases(self, tables['solver'], *args)
+        self._problem_cases = _BinaryProblemCases(self, tables['problem'], *args)
+
+        # if requested, load all the iteration data into memory
+        if pre_load:
+            self._load_cases()
+
+    def _read_index(self, filename):
+        """
+        Read the index file, collecting metadata, layouts, and chunks.
+
+        Parameters
+        ----------
+        filename : str
+            The path to the index file.
+
+        Returns
+        -------
+        list of tuple
+            The record type, source, row, layout id, position within the layout and
+            non-floating point values of each case, in the order they were recorded.
+        """
+        metadata = None
+        viewer_data = None
+        counts = {}
+        cases = []
+
+        with open(filename, 'rb') as f:
+            while True:
+                try:
+                    entry = pickle.load(f)
+                except (EOFError, pickle.UnpicklingError):
+                    # the end of the file, or an entry that was only partially written
+                    break
+
+                kind = entry[0]
+                if kind == 'case':
+                    _, record_type, source, row, layout_id, extra = entry
+                    cases.append((record_type, source, row, layout_id, counts[layout_id],
+                                  extra))
+                    counts[layout_id] += 1
+                elif kind == 'chunk':
+                    _, layout_id, offset, num_records = entry
+                    chunks = self._chunks[layout_id]
+                    start = chunks[0][-1] + chunks[1][-1].shape[0] if chunks[0] else 0
+                    rec_len = self._layouts[layout_id][1]
+                    records = self._data[offset:offset + num_records * rec_len * 8]
+                    chunks[0].append(start)
+                    chunks[1].append(records.view(np.float64).reshape(num_records, rec_len))
+                elif kind == 'layout':
+                    _, layout_id, fields, rec_len = entry
+                    self._layouts[layout_id] = (fields, rec_len)
+                    self._chunks[layout_id] = ([], [])
+                    counts[layout_id] = 0
+                elif kind == 'metadata':
+                    metadata = entry[1]
+                elif kind == 'derivatives':
+                    self._derivatives.setdefault(entry[1], entry[2])
+                elif kind == 'viewer':
+                    if viewer_data is None:
+                        viewer_data = entry[2]
+                elif kind == 'system_metadata':
+                    _, name, scaling_factors, options = entry
+                    if name not in self._system_options:
+                        self._system_options[name] = {
+                            'scaling_factors': pickle.loads(scaling_factors),
+                            'component_options': pickle.loads(options),
+                        }
+                elif kind == 'solver_metadata':
+                    _, name, options, solver_class = entry
+                    self.solver_metadata[name] = {
+                        'solver_options': pickle.loads(options),
+                        'solver_class': solver_class,
+                    }
+
+        self._load_metadata(metadata)
+
+        if viewer_data is not None:
+            self.problem_metadata.update(json_loads(viewer_data))
+
+        return cases
+
+    def _get_public_source(self, record_type, source):
+        """
+        Return the name of the source of a case as it is listed by the reader.
+
+        Parameters
+        ----------
+        record_type : str
+            The type of the case, 'driver', 'system', 'solver' or 'problem'.
+        source : str
+            The source of the case as it was recorded.
+
+        Returns
+        -------
+        str
+            The name of the source.
+        """
+        if record_type in ('driver', 'problem'):
+            return record_type
+        elif source.startswith('root'):
+            return source
+        return 'root.' + source
+
+    def _get_record(self, entry):
+        """
+        Return the record holding the floating point values of a case.
+
+        Parameters
+        ----------
+        entry : tuple
+            The index entry of the case.
+
+        Returns
+        -------
+        ndarray or None
+            The record, or None if it has not been written.
+        """
+        layout_id, pos = entry[3], entry[4]
+        rec_len = self._layouts[layout_id][1]
+        if rec_len == 0:
+            return np.zeros(0)
+
+        starts, records = self._chunks[layout_id]
+        i = bisect_right(starts, pos) - 1
+        if i < 0 or pos - starts[i] >= records[i].shape[0]:
+            return None
+
+        return records[i][pos - starts[i]]
+
+    def _build_row(self, entry, row_id):
+        """
+        Assemble the row of a case in the form it is stored in a SqliteRecorder file.
+
+        Parameters
+        ----------
+        entry : tuple
+            The index entry of the case.
+        row_id : int
+            The position of the case in its table, starting at one.
+
+        Returns
+        -------
+        dict
+            The row of the case.
+        """
+        record_type, _, row, layout_id, _, extra = entry
+        record = self._get_record(entry)
+
+        row = dict(row)
+        row['id'] = row_id
+
+        columns = {}
+        for col in _record_columns[record_type]:
+            if extra[col] is None:
+                row[col] = 'null'
+            else:
+                row[col] = columns[col] = {}
+
+        for col, name, shape, offset in self._layouts[layout_id][0]:
+            if shape is None:
+                columns[col][name] = extra[col][name]
+            else:
+                size = int(np.prod(shape))
+                columns[col][name] = record[offset:offset + size].reshape(shape).copy()
+
+        if record_type == 'driver':
+            jac = self._derivatives.get(row['iteration_coordinate'])
+            if jac is not None:
+                row['jacobian'] = jac
+
+        return row
+
+    def get_val_history(self, source, name, column='outputs'):
+        """
+        Return the values of a variable in all cases recorded by a source.
+
+        When the values are stored in a single chunk, the result is a strided view into the
+        memory mapped file rather than a copy.
+
+        Parameters
+        ----------
+        source : str
+            The source of the cases, e.g. 'driver', 'root.d1' or 'root.nonlinear_solver'.
+        name : str
+            The absolute or promoted name of the variable.
+        column : str, optional
+            The kind of value to return, 'inputs', 'outputs' or 'residuals'.
+
+        Returns
+        -------
+        ndarray
+            The values of the variable, with one row per case.
+        """
+        if source not in self._source_cases:
+            raise RuntimeError('Source not found: %s' % source)
+
+        entries = self._source_cases[source]
+        if source.endswith('nonlinear_solver') or source.endswith('linesearch'):
+            column = {'inputs': 'solver_inputs', 'outputs': 'solver_output',
+                      'residuals': 'solver_residuals'}[column]
+
+        layout_ids = sorted(set(entry[3] for entry in entries))
+        field = self._find_field(layout_ids, column, name)
+        if field is None:
+            raise KeyError("Variable '%s' was not recorded as a floating point array in the "
+                           "%s of %s." % (name, column, source))
+        shape, offset, abs_name = field
+        size = int(np.prod(shape))
+
+        # a layout belongs to a single source, so if there is only one, its records are
+        # exactly the cases of the source.
+        if len(layout_ids) == 1:
+            records = self._chunks[layout_ids[0]][1]
+            if len(records) == 1:
+                return records[0][:, offset:offset + size].reshape((-1,) + tuple(shape))
+            return np.concatenate([recs[:, offset:offset + size]
+                                   for recs in records]).reshape((-1,) + tuple(shape))
+
+        vals = []
+        for entry in entries:
+            for col, fname, fshape, foffset in self._layouts[entry[3]][0]:
+                if col == column and fname == abs_name and fshape == shape:
+                    vals.append(self._get_record(entry)[foffset:foffset + size])
+                    break
+        return np.array(vals).reshape((-1,) + tuple(shape))
+
+    def _find_field(self, layout_ids, column, name):
+        """
+        Find the shape and offset of a variable in the given record layouts.
+
+        Parameters
+        ----------
+        layout_ids : list of int
+            Ids of the layouts to search.
+        column : str
+            The column the variable is recorded in.
+        name : str
+            The absolute or promoted name of the variable.
+
+        Returns
+        -------
+        tuple or None
+            The shape, offset, and recorded name of the variable, or None if not found.
+        """
+        names = [name]
+        for io in ('output', 'input'):
+            if self._prom2abs and name in self._prom2abs[io]:
+                names.extend(self._prom2abs[io][name])
+
+        for layout_id in layout_ids:
+            for col, fname, shape, offset in self._layouts[layout_id][0]:
+                if col == column and fname in names and shape is not None:
+                    return shape, offset, fname
@@ -0,0 +1,469 @@
+"""
+Class definition for BinaryRecorder, which appends cases to a chunked binary file.
+"""
+import os
+import pickle
+
+import numpy as np
+
+from openmdao.recorders.sqlite_recorder import SqliteRecorder, array_to_blob, format_version
+from openmdao.utils.general_utils import make_serializable
+from openmdao.utils.record_util import dict_to_structured_array
+
+
+"""
+Binary case file layout
+-----------------------
+The data file starts with BINARY_MAGIC followed by the binary format version as a uint64.
+The rest of the file is a sequence of chunks, each holding a fixed number of records of a
+single layout as a C ordered float64 array of shape (num_records, record_length).
+
+The index file, with the same name plus '.idx', is a sequence of pickled tuples:
+
+('metadata', dict)
+    Variable metadata, in the same form as the metadata table of a SqliteRecorder file.
+('viewer', key, json_data)
+    Model viewer data.
+('system_metadata', name, scaling_factors, options)
+    Pickled scaling factors and options of a system.
+('solver_metadata', name, options, solver_class)
+    Pickled options and class name of a solver.
+('layout', layout_id, fields, record_length)
+    The layout of records, where fields is a list of (column, name, shape, offset) giving
+    the position of each floating point array within a record, in recorded order. Values
+    that are not floating point arrays have a shape and offset of None.
+('case', record_type, source, row, layout_id, extra)
+    A case, where row holds the fields of the case in the form they are stored in a
+    SqliteRecorder file and extra holds the values that are not floating point arrays.
+    The values of the case are in the next record of the given layout.
+('chunk', layout_id, offset, num_records)
+    A chunk of records of the given layout, starting at offset in the data file.
+('derivatives', iteration_coordinate, blob)
+    Derivatives recorded by the driver.
+"""
+BINARY_MAGIC = b'OMBINREC'
+binary_format_version = 1
+
+# columns holding variable values for each record type
+_record_columns = {
+    'driver': ('inputs', 'outputs', 'residuals'),
+    'system': ('inputs', 'outputs', 'residuals'),
+    'solver': ('solver_inputs', 'solver_output', 'solver_residuals'),
+    'problem': ('inputs', 'outputs', 'residuals'),
+}
+
+
+class BinaryRecorder(SqliteRecorder):
+    """
+    Recorder that appends cases to a chunked, memory-mappable binary file.
+
+    The floating point values of each case are packed into a fixed layout record per source,
+    and records are buffered and written in chunks, so recording is a sequence of appends.
+    Iteration coordinates, metadata and any non-floating point values are written to a
+    sidecar index file.
+
+    Attributes
+    ----------
+    connection : file or None
+        The open index file, or None if not recording on this processor.
+    _chunk_size : int
+        Number of records of a layout to buffer before they are written.
+    _data_file : file or None
+        The open data file.
+    _data_offset : int
+        Current size of the data file.
+    _layouts : dict
+        Layout id, fields and record length, keyed on record type, source and fields.
+    _buffers : dict
+        Records waiting to be written, keyed on layout id.
+    _metadata : dict
+        The most recently written variable metadata.
+    """
+
+    def __init__(self, filepath, chunk_size=64, pickle_version=2, record_viewer_data=True,
+                 record_on_change_only=False):
+        """
+        Initialize the BinaryRecorder.
+
+        Parameters
+        ----------
+        filepath : str
+            Path to the recorder file. The index is written to the same path plus '.idx'.
+        chunk_size : int, optional
+            Number of records from a source to buffer before they are written.
+        pickle_version : int, optional
+            The pickle protocol version to use when pickling metadata.
+        record_viewer_data : bool, optional
+            If True, record data needed for visualization.
+        record_on_change_only : bool, optional
+            If True, skip cases whose values are identical to the previous case from the
+            same source.
+        """
+        if chunk_size < 1:
+            raise ValueError("BinaryRecorder: chunk_size must be at least 1 but got %d." %
+                             chunk_size)
+
+        self._chunk_size = chunk_size
+        self._data_file = None
+        self._data_offset = 0
+        self._layouts = {}
+        self._buffers = {}
+        self._metadata = {'format_version': format_version, 'abs2prom': None,
+                          'prom2abs': None, 'abs2meta': None, 'var_settings': None,
+                          'conns': None}
+
+        super().__init__(filepath, pickle_version=pickle_version,
+                         record_viewer_data=record_viewer_data,
+                         record_on_change_only=record_on_change_only)
+
+    def _initialize_database(self):
+        """
+        Create the data and index files.
+        """
+        filepath = self._get_filepath()
+
+        if filepath:
+            self._data_file = open(filepath, 'wb')
+            self.connection = open(filepath + '.idx', 'wb')
+            self._start_files()
+
+        self._database_initialized = True
+
+    def _start_files(self):
+        """
+        Write the header of the data file and the current metadata to the index.
+        """
+        self._data_file.write(BINARY_MAGIC)
+        self._data_file.write(np.uint64(binary_format_version).tobytes())
+        self._data_offset = self._data_file.tell()
+        self._data_file.flush()
+
+        self._write_index('metadata', self._metadata)
+
+        self._last_cases = {}
+        self._layouts = {}
+        self._buffers = {}
+
+    def _write_index(self, *entry):
+        """
+        Append an entry to the index file.
+
+        Parameters
+        ----------
+        *entry : list
+            The contents of the entry.
+        """
+        pickle.dump(entry, self.connection, self._pickle_version)
+
+    def _get_layout(self, record_type, source, fields):
+        """
+        Return the id and record length of the layout for the given fields, adding it if needed.
+
+        Parameters
+        ----------
+        record_type : str
+            The type of the case, 'driver', 'system', 'solver' or 'problem'.
+        source : str
+            The source of the case.
+        fields : list of (str, str, tuple or None)
+            The column, name and shape of each value of the case, with a shape of None for
+            values that are not floating point arrays.
+
+        Returns
+        -------
+        int
+            The id of the layout.
+        int
+            The length of a record.
+        """
+        key = (record_type, source, tuple(fields))
+        try:
+            return self._layouts[key]
+        except KeyError:
+            pass
+
+        layout_fields = []
+        offset = 0
+        for col, name, shape in fields:
+            if shape is None:
+                layout_fields.append((col, name, None, None))
+            else:
+                layout_fields.append((col, name, shape, offset))
+                offset += int(np.prod(shape))
+
+        layout_id = len(self._layouts)
+        self._layouts[key] = layout = (layout_id, offset)
+        self._buffers[layout_id] = []
+        self._write_index('layout', layout_id, layout_fields, offset)
+
+        return layout
+
+    def _record_case(self, record_type, source, row, columns):
+        """
+        Append a case to the record buffers and the index.
+
+        Parameters
+        ----------
+        record_type : str
+            The type of the case, 'driver', 'system', 'solver' or 'problem'.
+        source : str
+            The source of the case.
+        row : dict
+            The fields of the case other than the variable values.
+        columns : list of dict or None
+            Mappings of variable name to value, e.g. for inputs, outputs, and residuals.
+        """
+        if self._is_unchanged(record_type, source, columns):
+            return
+
+        fields = []
+        values = []
+        extra = {}
+        for col, vals in zip(_record_columns[record_type], columns):
+            if vals is None:
+                extra[col] = None
+                continue
+
+            extra[col] = col_extra = {}
+            for name, val in vals.items():
+                if isinstance(val, np.ndarray) and np.issubdtype(val.dtype, np.floating):
+                    fields.append((col, name, val.shape))
+                    values.append(val.ravel())
+                else:
+                    fields.append((col, name, None))
+                    col_extra[name] = make_serializable(val)
+
+        layout_id, rec_len = self._get_layout(record_type, source, fields)
+
+        self._write_index('case', record_type, source, row, layout_id, extra)
+
+        if rec_len > 0:
+            buf = self._buffers[layout_id]
+            buf.append(np.concatenate(values).astype(np.float64))
+            if len(buf) >= self._chunk_size:
+                self._flush_chunk(layout_id)
+
+    def _flush_chunk(self, layout_id):
+        """
+        Write the buffered records of a layout to the data file.
+
+        Parameters
+        ----------
+        layout_id : int
+            The id of the layout.
+        """
+        buf = self._buffers[layout_id]
+        if buf:
+            data = np.vstack(buf)
+            self._data_file.write(data.tobytes())
+            self._write_index('chunk', layout_id, self._data_offset, len(buf))
+            self._data_offset += data.nbytes
+            buf.clear()
+
+            # make each completed chunk visible to readers of a recording that is in progress
+            self._data_file.flush()
+            self.connection.flush()
+
+    def flush(self):
+        """
+        Write all buffered records so the files can be read.
+        """
+        if self.connection:
+            for layout_id in self._buffers:
+                self._flush_chunk(layout_id)
+
+    def _write_metadata(self, abs2prom, prom2abs, abs2meta, var_settings, conns):
+        """
+        Write the variable metadata, which has been converted to JSON.
+
+        Parameters
+        ----------
+        abs2prom : str
+            Mapping of absolute names to promoted names.
+        prom2abs : str
+            Mapping of promoted names to absolute names.
+        abs2meta : str
+            Mapping of absolute names to variable metadata.
+        var_settings : str
+            Settings of design variables and responses, and the execution order.
+        conns : str
+            Connections of the model.
+        """
+        self._metadata = {'format_version': format_version,
+                          'abs2prom': abs2prom, 'prom2abs': prom2abs, 'abs2meta': abs2meta,
+                          'var_settings': var_settings, 'conns': conns}
+        self._write_index('metadata', self._metadata)
+
+    def _write_viewer_data(self, key, json_data):
+        """
+        Write model viewer data.
+
+        Parameters
+        ----------
+        key : str
+            The unique ID to use for this data.
+        json_data : str
+            Data required to visualize the model, converted to JSON.
+        """
+        self._write_index('viewer', key, json_data)
+
+    def _write_system_metadata(self, name, scaling_factors, pickled_metadata):
+        """
+        Write system metadata.
+
+        Parameters
+        ----------
+        name : str
+            The unique ID of the system metadata.
+        scaling_factors : bytes
+            The pickled scaling vectors of the system.
+        pickled_metadata : bytes
+            The pickled options of the system.
+        """
+        self._write_index('system_metadata', name, scaling_factors, pickled_metadata)
+
+    def _write_solver_metadata(self, id, solver_options, solver_class):
+        """
+        Write solver metadata.
+
+        Parameters
+        ----------
+        id : str
+            The unique ID of the solver metadata.
+        solver_options : bytes
+            The pickled options of the solver.
+        solver_class : str
+            The class name of the solver.
+        """
+        self._write_index('solver_metadata', id, solver_options, solver_class)
+
+    def record_iteration_driver(self, recording_requester, data, metadata):
+        """
+        Record data and metadata from a Driver.
+
+        Parameters
+        ----------
+        recording_requester : object
+            Driver in need of recording.
+        data : dict
+            Dictionary containing desvars, objectives, constraints, responses, and System vars.
+        metadata : dict
+            Dictionary containing execution metadata.
+        """
+        if self.connection:
+            row = {'counter': self._counter, 'iteration_coordinate': self._iteration_coordinate,
+                   'timestamp': metadata['timestamp'], 'success': metadata['success'],
+                   'msg': metadata['msg']}
+            self._record_case('driver', recording_requester._get_name(), row,
+                              [data['input'], data['output'], data['residual']])
+
+    def record_iteration_problem(self, recording_requester, data, metadata):
+        """
+        Record data and metadata from a Problem.
+
+        Parameters
+        ----------
+        recording_requester : object
+            Problem in need of recording.
+        data : dict
+            Dictionary containing desvars, objectives, and constraints.
+        metadata : dict
+            Dictionary containing execution metadata.
+        """
+        if self.connection:
+            driver = recording_requester.driver
+            if recording_requester.recording_options['record_derivatives'] and \
+                    driver._designvars and driver._responses:
+                totals = data['totals']
+            else:
+                totals = {}
+
+            row = {'counter': self._counter, 'case_name': metadata['name'],
+                   'timestamp': metadata['timestamp'], 'success': metadata['success'],
+                   'msg': metadata['msg'], 'abs_err': data['abs'], 'rel_err': data['rel'],
+                   'jacobian': bytes(array_to_blob(dict_to_structured_array(totals)))}
+            self._record_case('problem', metadata['name'], row,
+                              [data['input'], data['output'], data['residual']])
+
+    def record_iteration_system(self, recording_requester, data, metadata):
+        """
+        Record data and metadata from a System.
+
+        Parameters
+        ----------
+        recording_requester : System
+            System in need of recording.
+        data : dict
+            Dictionary containing inputs, outputs, and residuals.
+        metadata : dict
+            Dictionary containing execution metadata.
+        """
+        if self.connection:
+            source = recording_requester.pathname
+            if source == '':
+                source = 'root'
+
+            row = {'counter': self._counter, 'iteration_coordinate': self._iteration_coordinate,
+                   'timestamp': metadata['timestamp'], 'success': metadata['success'],
+                   'msg': metadata['msg']}
+            self._record_case('system', source, row,
+                              [data['input'], data['output'], data['residual']])
+
+    def record_iteration_solver(self, recording_requester, data, metadata):
+        """
+        Record data and metadata from a Solver.
+
+        Parameters
+        ----------
+        recording_requester : Solver
+            Solver in need of recording.
+        data : dict
+            Dictionary containing outputs, residuals, and errors.
+        metadata : dict
+            Dictionary containing execution metadata.
+        """
+        if self.connection:
+            row = {'counter': self._counter, 'iteration_coordinate': self._iteration_coordinate,
+                   'timestamp': metadata['timestamp'], 'success': metadata['success'],
+                   'msg': metadata['msg'], 'abs_err': data['abs'], 'rel_err': data['rel']}
+            self._record_case('solver', self._get_solver_source(recording_requester), row,
+                              [data['input'], data['output'], data['residual']])
+
+    def record_derivatives_driver(self, recording_requester, data, metadata):
+        """
+        Record derivatives data from a Driver.
+
+        Parameters
+        ----------
+        recording_requester : object
+            Driver in need of recording.
+        data : dict
+            Dictionary containing derivatives keyed by 'of,wrt' to be recorded.
+        metadata : dict
+            Dictionary containing execution metadata.
+        """
+        if self.connection:
+            blob = array_to_blob(dict_to_structured_array(data))
+            self._write_index('derivatives', self._iteration_coordinate, bytes(blob))
+
+    def shutdown(self):
+        """
+        Write any buffered records and close the files.
+        """
+        if self.connection:
+            self.flush()
+            self._data_file.close()
+            self.connection.close()
+            self._data_file = None
+            self.connection = None
+
+    def delete_recordings(self):
+        """
+        Delete all the recordings, keeping the variable metadata.
+        """
+        if self.connection:
+            self._data_file.seek(0)
+            self._data_file.truncate()
+            self.connection.seek(0)
+            self.connection.truncate()
+            self._start_files()
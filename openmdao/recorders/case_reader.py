@@ -2,6 +2,7 @@
 CaseReader factory function.
 """
 from openmdao.recorders.sqlite_reader import SqliteCaseReader
+from openmdao.recorders.binary_reader import BinaryCaseReader, is_binary_case_file
 
 
 def CaseReader(filename, pre_load=True):
@@ -12,7 +13,7 @@ def CaseReader(filename, pre_load=True):
     ----------
     filename : str
         A path to the recorded file.
-        Currently only sqlite database files recorded via SqliteRecorder are supported.
+        Files recorded via SqliteRecorder and BinaryRecorder are supported.
     pre_load : bool
         If True, load all the data into memory during initialization.
 
@@ -21,4 +22,7 @@ def CaseReader(filename, pre_load=True):
     reader : BaseCaseReader
         An instance of a CaseReader.
     """
+    if is_binary_case_file(filename):
+        return BinaryCaseReader(filename, pre_load)
+
     return SqliteCaseReader(filename, pre_load)
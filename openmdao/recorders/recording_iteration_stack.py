@@ -1,33 +1,104 @@
 """Management of iteration stack for recording."""
 import weakref
+import threading
+from contextlib import contextmanager
 
 from openmdao.utils.mpi import MPI
 
 _norec_funcs = frozenset(['_run_apply', '_compute_totals'])
 
 
+class _ThreadStack(threading.local):
+    """
+    The iteration stack of a thread.
+
+    Attributes
+    ----------
+    stack : list
+        A list that holds the stack of iteration coordinates.
+    norec_refcount : int
+        Number of functions on the stack whose iterations aren't recorded.
+    """
+
+    def __init__(self):
+        """
+        Initialize.
+        """
+        self.stack = []
+        self.norec_refcount = 0
+
+
 class _RecIteration(object):
     """
     A class that encapsulates the iteration stack.
 
     Some tests needed to reset the stack and this avoids issues
-    with data left over from other tests.
+    with data left over from other tests.  Each thread has its own stack, so that systems run
+    concurrently in threads by a ParallelGroup don't push onto each other's stacks.
 
     Attributes
     ----------
-    stack : list
-        A list that holds the stack of iteration coordinates.
     prefix : str or None
         Prefix to prepend to iteration coordinates.
+    _thread : _ThreadStack
+        The iteration stack of the current thread.
     """
 
     def __init__(self):
         """
         Initialize.
         """
-        self.stack = []
         self.prefix = None
-        self._norec_refcount = 0
+        self._thread = _ThreadStack()
+
+    @property
+    def stack(self):
+        """
+        Get the stack of iteration coordinates of the current thread.
+
+        Returns
+        -------
+        list
+            A list that holds the stack of iteration coordinates.
+        """
+        return self._thread.stack
+
+    @property
+    def _norec_refcount(self):
+        """
+        Get the number of functions on the stack whose iterations aren't recorded.
+
+        Returns
+        -------
+        int
+            Number of functions on the stack whose iterations aren't recorded.
+        """
+        return self._thread.norec_refcount
+
+    @contextmanager
+    def thread_stack(self, stack, norec_refcount):
+        """
+        Start the stack of the current thread from the stack of the thread that started it.
+
+        Parameters
+        ----------
+        stack : list
+            The iteration stack of the starting thread.
+        norec_refcount : int
+            Number of functions on that stack whose iterations aren't recorded.
+
+        Yields
+        ------
+        None
+        """
+        thread = self._thread
+        thread.stack = list(stack)
+        thread.norec_refcount = norec_refcount
+        try:
+            yield
+        finally:
+            thread.stack = []
+            thread.norec_refcount = 0
 
     def print_recording_iteration_stack(self):
         """
@@ -80,9 +151,10 @@ class _RecIteration(object):
         iter_coord : tuple
             (func_name, iter_count) for the current iteration.
         """
-        self.stack.append(iter_coord)
+        thread = self._thread
+        thread.stack.append(iter_coord)
         if iter_coord[0] in _norec_funcs:
-            self._norec_refcount += 1
+            thread.norec_refcount += 1
 
     def pop(self):
         """
@@ -93,9 +165,10 @@ class _RecIteration(object):
         tuple
             (function_name, iter_count) for current iteration.
         """
-        iter_coord = self.stack.pop()
+        thread = self._thread
+        iter_coord = thread.stack.pop()
         if iter_coord[0] in _norec_funcs:
-            self._norec_refcount -= 1
+            thread.norec_refcount -= 1
         return iter_coord
 
 
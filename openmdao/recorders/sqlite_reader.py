@@ -17,7 +17,7 @@ from openmdao.utils.general_utils import simple_warning
 from openmdao.utils.variable_table import write_source_table
 from openmdao.utils.record_util import check_valid_sqlite3_db, get_source_system
 
-from openmdao.recorders.sqlite_recorder import format_version
+from openmdao.recorders.sqlite_recorder import format_version, decode_blob, is_encoded_blob
 
 import pickle
 from json import loads as json_loads
@@ -157,8 +157,18 @@ class SqliteCaseReader(BaseCaseReader):
         """
         cur.execute('select * from metadata')
 
-        row = cur.fetchone()
+        self._load_metadata(cur.fetchone())
+
+    def _load_metadata(self, row):
+        """
+        Load variable metadata from the contents of the metadata table.
 
+        Parameters
+        ----------
+        row : sqlite3.Row or dict
+            The format version, variable name maps and metadata, settings for VOIs and
+            connections, with the latter stored as JSON.
+        """
         # get format_version
         self._format_version = version = row['format_version']
 
@@ -807,6 +817,9 @@ class CaseTable(object):
         connections or a promoted input name for multiple connections. This is for output display.
     _global_iterations : list
         List of iteration cases and the table and row in which they are found.
+    _decoded : dict
+        The most recently decoded values of each column holding encoded case data, as a
+        tuple of row id and values, keyed on column name.
     """
 
     def __init__(self, fname, ver, table, index, giter, prom2abs, abs2prom, abs2meta, conns,
@@ -857,6 +870,7 @@ class CaseTable(object):
         self._sources = None
         self._keys = None
         self._cases = {}
+        self._decoded = {}
 
     def count(self):
         """
@@ -892,16 +906,8 @@ class CaseTable(object):
             The cases from the table from the specified source or parent case.
         """
         if not self._keys:
-            with sqlite3.connect(self._filename) as con:
-                cur = con.cursor()
-                cur.execute("SELECT %s FROM %s ORDER BY id ASC" %
-                            (self._index_name, self._table_name))
-                rows = cur.fetchall()
-
-            con.close()
-
             # cache case list for future use
-            self._keys = [row[0] for row in rows]
+            self._keys = self._fetch_keys()
 
         if not source:
             # return all cases
@@ -992,14 +998,7 @@ class CaseTable(object):
             return self._cases[case_id]
 
         # we don't have it, so fetch it
-        with sqlite3.connect(self._filename) as con:
-            con.row_factory = sqlite3.Row
-            cur = con.cursor()
-            cur.execute("SELECT * FROM %s WHERE %s='%s'" %
-                        (self._table_name, self._index_name, case_id))
-            row = cur.fetchone()
-
-        con.close()
+        row = self._fetch_row(case_id)
 
         # if found, extract the data and optionally cache the Case
         if row is not None:
@@ -1014,8 +1013,9 @@ class CaseTable(object):
             else:
                 source = self._get_source(row[self._index_name])
 
-            case = Case(source, row, self._prom2abs, self._abs2prom, self._abs2meta,
-                        self._conns, self._auto_ivc_map, self._var_info, self._format_version)
+            case = Case(source, self._decode_row(row), self._prom2abs, self._abs2prom,
+                        self._abs2meta, self._conns, self._auto_ivc_map, self._var_info,
+                        self._format_version)
 
             # cache it if requested
             if cache:
@@ -1025,6 +1025,79 @@ class CaseTable(object):
         else:
             return None
 
+    def _decode_row(self, row):
+        """
+        Replace any encoded case data in a row with the full values of its variables.
+
+        Parameters
+        ----------
+        row : sqlite3.Row or dict
+            A row from the table.
+
+        Returns
+        -------
+        sqlite3.Row or dict
+            The row, or a dict with the decoded values if it contained encoded data.
+        """
+        if self._format_version < 12:
+            return row
+
+        decoded = None
+        for col in row.keys():
+            data = row[col]
+            if is_encoded_blob(data):
+                if decoded is None:
+                    decoded = dict(zip(row.keys(), row))
+                decoded[col] = dict(self._get_decoded_values(col, row['id'], data))
+
+        return row if decoded is None else decoded
+
+    def _get_decoded_values(self, column, row_id, blob=None):
+        """
+        Decode the variable values stored in a column, applying any delta encoding.
+
+        Parameters
+        ----------
+        column : str
+            The name of the column.
+        row_id : int
+            The id of the row.
+        blob : bytes or None
+            The encoded data, if it has already been read from the table.
+
+        Returns
+        -------
+        dict
+            Mapping of variable name to value.
+        """
+        last = self._decoded.get(column)
+        if last is not None and last[0] == row_id:
+            return last[1]
+
+        if blob is None:
+            with sqlite3.connect(self._filename) as con:
+                cur = con.cursor()
+                cur.execute("SELECT %s FROM %s WHERE id=?" % (column, self._table_name),
+                            (row_id,))
+                blob = cur.fetchone()[0]
+            con.close()
+
+        payload = decode_blob(blob)
+        values = payload['vals']
+
+        for name, val in values.items():
+            if isinstance(val, np.ndarray) and val.dtype == np.float32:
+                values[name] = val.astype(np.float64)
+
+        if payload['base'] is not None:
+            base = self._get_decoded_values(column, payload['base'])
+            for name in payload['delta']:
+                values[name] = base[name] + values[name]
+
+        self._decoded[column] = (row_id, values)
+
+        return values
+
     def _get_iteration_coordinate(self, case_idx):
         """
         Return the iteration coordinate for the indexed case (handles negative indices, etc.).
@@ -1054,19 +1127,75 @@ class CaseTable(object):
         cache : bool
             If True, cases will be cached for faster access by key.
         """
+        for row in self._iter_rows():
+            case_id = row[self._index_name]
+            source = self._get_source(case_id)
+            case = Case(source, self._decode_row(row), self._prom2abs, self._abs2prom,
+                        self._abs2meta, self._conns, self._auto_ivc_map, self._var_info,
+                        self._format_version)
+            if cache:
+                self._cases[case_id] = case
+            yield case
+
+    def _fetch_keys(self):
+        """
+        Read the keys of all cases in the table, in the order they were recorded.
+
+        Returns
+        -------
+        list
+            List of keys of cases in the table.
+        """
+        with sqlite3.connect(self._filename) as con:
+            cur = con.cursor()
+            cur.execute("SELECT %s FROM %s ORDER BY id ASC" %
+                        (self._index_name, self._table_name))
+            rows = cur.fetchall()
+
+        con.close()
+
+        return [row[0] for row in rows]
+
+    def _fetch_row(self, case_id):
+        """
+        Read the row of the table for the given case.
+
+        Parameters
+        ----------
+        case_id : str
+            The string-identifier of the case.
+
+        Returns
+        -------
+        sqlite3.Row or dict or None
+            The row for the case, or None if it was not found.
+        """
+        with sqlite3.connect(self._filename) as con:
+            con.row_factory = sqlite3.Row
+            cur = con.cursor()
+            cur.execute("SELECT * FROM %s WHERE %s=?" % (self._table_name, self._index_name),
+                        (case_id,))
+            row = cur.fetchone()
+
+        con.close()
+
+        return row
+
+    def _iter_rows(self):
+        """
+        Iterate over all rows of the table, in the order they were recorded.
+
+        Yields
+        ------
+        sqlite3.Row or dict
+            A row of the table.
+        """
         with sqlite3.connect(self._filename) as con:
             con.row_factory = sqlite3.Row
             cur = con.cursor()
             cur.execute("SELECT * FROM %s ORDER BY id ASC" % self._table_name)
-            # rows = cur.fetchall()
             for row in cur:
-                case_id = row[self._index_name]
-                source = self._get_source(case_id)
-                case = Case(source, row, self._prom2abs, self._abs2prom, self._abs2meta,
-                            self._conns, self._auto_ivc_map, self._var_info, self._format_version)
-                if cache:
-                    self._cases[case_id] = case
-                yield case
+                yield row
 
         con.close()
 
@@ -1202,70 +1331,50 @@ class DriverCases(CaseTable):
                          var_info)
         self._var_info = var_info
 
-    def cases(self, cache=False):
+    def _add_derivatives(self, cur, row):
         """
-        Iterate over all cases, optionally caching them into memory.
-
-        Override base class to add derivatives from the derivatives table.
+        Add the derivatives recorded for a driver iteration to its row.
 
         Parameters
         ----------
-        cache : bool
-            If True, cases will be cached for faster access by key.
-        """
-        with sqlite3.connect(self._filename) as con:
-            con.row_factory = sqlite3.Row
-            cur = con.cursor()
-            cur.execute("SELECT * FROM %s ORDER BY id ASC" % self._table_name)
-            rows = cur.fetchall()
-
-            for row in rows:
-                if self._format_version > 1:
-                    # fetch associated derivative data, if available
-                    cur.execute("SELECT * FROM driver_derivatives WHERE iteration_coordinate='%s'"
-                                % row['iteration_coordinate'])
-                    derivs_row = cur.fetchone()
-
-                    if derivs_row:
-                        # convert row to a regular dict and add jacobian
-                        row = dict(zip(row.keys(), row))
-                        row['jacobian'] = derivs_row['derivatives']
-
-                case = Case('driver', row, self._prom2abs, self._abs2prom, self._abs2meta,
-                            self._conns, self._auto_ivc_map, self._var_info, self._format_version)
+        cur : sqlite3.Cursor
+            Database cursor to use for reading the data.
+        row : sqlite3.Row
+            The row from the driver_iterations table.
 
-                if cache:
-                    self._cases[case.name] = case
+        Returns
+        -------
+        sqlite3.Row or dict
+            The row, or a dict with the derivatives added if any were recorded.
+        """
+        if self._format_version > 1:
+            # fetch associated derivative data, if available
+            cur.execute("SELECT * FROM driver_derivatives WHERE "
+                        "iteration_coordinate=:iteration_coordinate",
+                        {"iteration_coordinate": row['iteration_coordinate']})
+            derivs_row = cur.fetchone()
 
-                yield case
+            if derivs_row:
+                # convert row to a regular dict and add jacobian
+                row = dict(zip(row.keys(), row))
+                row['jacobian'] = derivs_row['derivatives']
 
-        con.close()
+        return row
 
-    def get_case(self, case_id, cache=False):
+    def _fetch_row(self, case_id):
         """
-        Get a case from the database.
+        Read the row of the table for the given case, including any derivatives.
 
         Parameters
         ----------
-        case_id : int or str
-            The integer index or string-identifier of the case to be retrieved.
-        cache : bool
-            If True, cache the case so it does not have to be fetched on next access.
+        case_id : str
+            The string-identifier of the case.
 
         Returns
         -------
-        Case
-            The specified case from the driver_iterations and driver_derivatives tables.
+        sqlite3.Row or dict or None
+            The row for the case, or None if it was not found.
         """
-        # check to see if we've already cached this case
-        if isinstance(case_id, int):
-            case_id = self._get_iteration_coordinate(case_id)
-
-        # return cached case if present, else fetch it
-        if case_id in self._cases:
-            return self._cases[case_id]
-
-        # Get an unscaled case if does not already exist in _cases
         with sqlite3.connect(self._filename) as con:
             con.row_factory = sqlite3.Row
             cur = con.cursor()
@@ -1276,28 +1385,32 @@ class DriverCases(CaseTable):
                         {"iteration_coordinate": case_id})
             row = cur.fetchone()
 
-            # fetch associated derivative data, if available
-            if row and self._format_version > 1:
-                cur.execute("SELECT * FROM driver_derivatives WHERE "
-                            "iteration_coordinate=:iteration_coordinate",
-                            {"iteration_coordinate": case_id})
-                derivs_row = cur.fetchone()
-
-                if derivs_row:
-                    # convert row to a regular dict and add jacobian
-                    row = dict(zip(row.keys(), row))
-                    row['jacobian'] = derivs_row['derivatives']
+            if row:
+                row = self._add_derivatives(cur, row)
+
         con.close()
 
-        # if found, create Case object (and cache it if requested) else return None
-        if row:
-            case = Case('driver', row, self._prom2abs, self._abs2prom, self._abs2meta,
-                        self._conns, self._auto_ivc_map, self._var_info, self._format_version)
-            if cache:
-                self._cases[case_id] = case
-            return case
-        else:
-            return None
+        return row
+
+    def _iter_rows(self):
+        """
+        Iterate over all rows of the table, including any derivatives.
+
+        Yields
+        ------
+        sqlite3.Row or dict
+            A row of the table.
+        """
+        with sqlite3.connect(self._filename) as con:
+            con.row_factory = sqlite3.Row
+            cur = con.cursor()
+            cur.execute("SELECT * FROM %s ORDER BY id ASC" % self._table_name)
+            rows = cur.fetchall()
+
+            for row in rows:
+                yield self._add_derivatives(cur, row)
+
+        con.close()
 
     def list_sources(self):
         """
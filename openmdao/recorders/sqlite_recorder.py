@@ -14,6 +14,7 @@ import json
 import numpy as np
 
 import pickle
+import zlib
 
 from openmdao.recorders.case_recorder import CaseRecorder
 from openmdao.utils.mpi import MPI
@@ -29,6 +30,9 @@ from openmdao.solvers.solver import Solver
 """
 SQL case database version history.
 ----------------------------------
+12-- OpenMDAO 3.2
+     Case inputs, outputs, and residuals may be stored as encoded blobs (optionally compressed,
+     downcast to float32, or delta encoded against the previous case from the same source).
 11-- OpenMDAO 3.2
      IndepVarComps are created automatically, so this changes some bookkeeping.
 10-- OpenMDAO 3.0
@@ -54,7 +58,11 @@ SQL case database version history.
 1 -- Through OpenMDAO 2.3
      Original implementation.
 """
-format_version = 11
+format_version = 12
+
+# header of an encoded case blob, followed by a byte identifying the compression codec
+_BLOB_HEADER = b'OM'
+_BLOB_CODECS = {None: b'n', 'zlib': b'z', 'lz4': b'l'}
 
 
 def array_to_blob(array):
@@ -104,6 +112,128 @@ def blob_to_array(blob):
     return np.load(out, allow_pickle=True)
 
 
+def _get_lz4():
+    """
+    Return the lz4.frame module, which is only needed for lz4 compression.
+
+    Returns
+    -------
+    module
+        The lz4.frame module.
+    """
+    try:
+        import lz4.frame
+    except ImportError:
+        raise RuntimeError("Recording with lz4 compression requires the 'lz4' package.")
+    return lz4.frame
+
+
+def encode_blob(payload, compression=None, pickle_version=2):
+    """
+    Pickle and optionally compress an object so it can be written to a BLOB field in sqlite.
+
+    Parameters
+    ----------
+    payload : object
+        The object to be encoded.
+    compression : str or None
+        The compression codec to use, 'zlib', 'lz4' or None.
+    pickle_version : int
+        The pickle protocol version to use.
+
+    Returns
+    -------
+    blob
+        The encoded blob.
+    """
+    data = pickle.dumps(payload, pickle_version)
+    if compression == 'zlib':
+        data = zlib.compress(data)
+    elif compression == 'lz4':
+        data = _get_lz4().compress(data)
+
+    return sqlite3.Binary(_BLOB_HEADER + _BLOB_CODECS[compression] + data)
+
+
+def decode_blob(blob):
+    """
+    Convert a BLOB created by encode_blob back to the original object.
+
+    Parameters
+    ----------
+    blob : blob
+        The blob created by encode_blob.
+
+    Returns
+    -------
+    object
+        The decoded object.
+    """
+    blob = bytes(blob)
+    codec = blob[2:3]
+    data = blob[3:]
+    if codec == _BLOB_CODECS['zlib']:
+        data = zlib.decompress(data)
+    elif codec == _BLOB_CODECS['lz4']:
+        data = _get_lz4().decompress(data)
+
+    return pickle.loads(data)
+
+
+def is_encoded_blob(data):
+    """
+    Return True if the given data from a case table is a blob created by encode_blob.
+
+    Parameters
+    ----------
+    data : str or bytes
+        Data from a column of a case table.
+
+    Returns
+    -------
+    bool
+        True if data is an encoded blob.
+    """
+    return isinstance(data, bytes) and data[:2] == _BLOB_HEADER
+
+
+def _values_equal(vals1, vals2):
+    """
+    Return True if two dicts of recorded variable values are identical.
+
+    Parameters
+    ----------
+    vals1 : dict or None
+        Mapping of variable name to value.
+    vals2 : dict or None
+        Mapping of variable name to value.
+
+    Returns
+    -------
+    bool
+        True if both dicts have the same names and values.
+    """
+    if vals1 is None or vals2 is None:
+        return vals1 is vals2
+
+    if vals1.keys() != vals2.keys():
+        return False
+
+    for name, val in vals1.items():
+        other = vals2[name]
+        if isinstance(val, np.ndarray) or isinstance(other, np.ndarray):
+            if not np.array_equal(val, other):
+                return False
+        else:
+            try:
+                if val != other:
+                    return False
+            except Exception:
+                return False
+
+    return True
+
+
 class SqliteRecorder(CaseRecorder):
     """
     Recorder that saves cases in a sqlite db.
@@ -129,9 +259,30 @@ class SqliteRecorder(CaseRecorder):
         Flag indicating whether or not the database has been initialized.
     _record_on_proc : bool
         Flag indicating whether to record on this processor when running in parallel.
+    _record_on_change_only : bool
+        If True, a case is not recorded if its values are identical to those of the previous
+        case recorded from the same source.
+    _delta_encode : bool
+        If True, floating point arrays are stored as the difference from the previous case
+        recorded from the same source.
+    _keyframe_every : int
+        When delta encoding, store full values every this many cases from the same source.
+    _float32 : bool
+        If True, floating point arrays are stored in single precision.
+    _compression : str or None
+        Compression codec used for encoded case data, 'zlib', 'lz4' or None.
+    _encode : bool
+        If True, case data is stored as encoded blobs rather than JSON.
+    _last_cases : dict
+        Values of the previous case recorded from each source, keyed on (table, source).
+    _delta_states : dict
+        Row id, number of cases since the last full case and reconstructed values of the
+        previous case recorded from each source, keyed on (table, source).
     """
 
-    def __init__(self, filepath, append=False, pickle_version=2, record_viewer_data=True):
+    def __init__(self, filepath, append=False, pickle_version=2, record_viewer_data=True,
+                 record_on_change_only=False, delta_encode=False, keyframe_every=20,
+                 float32=False, compression=None):
         """
         Initialize the SqliteRecorder.
 
@@ -145,10 +296,40 @@ class SqliteRecorder(CaseRecorder):
             The pickle protocol version to use when pickling metadata.
         record_viewer_data : bool, optional
             If True, record data needed for visualization.
+        record_on_change_only : bool, optional
+            If True, skip cases whose values are identical to the previous case from the
+            same source.
+        delta_encode : bool, optional
+            If True, store floating point arrays as the difference from the previous case from
+            the same source.
+        keyframe_every : int, optional
+            When delta encoding, store full values every this many cases from the same source.
+        float32 : bool, optional
+            If True, store floating point arrays in single precision.
+        compression : str or None, optional
+            Compress case data using 'zlib' or 'lz4'.
         """
         if append:
             raise NotImplementedError("Append feature not implemented for SqliteRecorder")
 
+        if compression not in _BLOB_CODECS:
+            raise ValueError("SqliteRecorder: compression must be one of %s but got '%s'." %
+                             (sorted(c for c in _BLOB_CODECS if c), compression))
+        if compression == 'lz4':
+            _get_lz4()
+        if keyframe_every < 1:
+            raise ValueError("SqliteRecorder: keyframe_every must be at least 1 but got %d." %
+                             keyframe_every)
+
+        self._record_on_change_only = record_on_change_only
+        self._delta_encode = delta_encode
+        self._keyframe_every = keyframe_every
+        self._float32 = float32
+        self._compression = compression
+        self._encode = delta_encode or float32 or compression is not None
+        self._last_cases = {}
+        self._delta_states = {}
+
         self.connection = None
         self._record_viewer_data = record_viewer_data
 
@@ -164,17 +345,22 @@ class SqliteRecorder(CaseRecorder):
 
         super().__init__(record_viewer_data)
 
-    def _initialize_database(self):
+    def _get_filepath(self):
         """
-        Initialize the database.
+        Return the path of the file to record to on this processor.
+
+        Returns
+        -------
+        str or None
+            The path of the file, or None if nothing is recorded on this processor.
         """
         if MPI:
             rank = MPI.COMM_WORLD.rank
             if self._parallel and self._record_on_proc:
                 filepath = '%s_%d' % (self._filepath, rank)
-                print("Note: SqliteRecorder is running on multiple processors. "
+                print("Note: %s is running on multiple processors. "
                       "Cases from rank %d are being written to %s." %
-                      (rank, filepath))
+                      (type(self).__name__, rank, filepath))
             elif rank == 0:
                 filepath = self._filepath
             else:
@@ -182,6 +368,14 @@ class SqliteRecorder(CaseRecorder):
         else:
             filepath = self._filepath
 
+        return filepath
+
+    def _initialize_database(self):
+        """
+        Initialize the database.
+        """
+        filepath = self._get_filepath()
+
         if filepath:
             try:
                 os.remove(filepath)
@@ -232,8 +426,137 @@ class SqliteRecorder(CaseRecorder):
                 c.execute("CREATE TABLE solver_metadata(id TEXT PRIMARY KEY, "
                           "solver_options BLOB, solver_class TEXT)")
 
+        self._last_cases = {}
+        self._delta_states = {}
         self._database_initialized = True
 
+    def _encode_case(self, table, source, columns):
+        """
+        Convert the variable values of a case to the form in which they are stored.
+
+        Parameters
+        ----------
+        table : str
+            The name of the table the case will be written to.
+        source : str
+            The source of the case.
+        columns : list of dict or None
+            Mappings of variable name to value, e.g. for inputs, outputs, and residuals.
+
+        Returns
+        -------
+        list or None
+            The data to be written for each of the columns, or None if the case should not
+            be recorded.
+        tuple or None
+            The reconstructed values of the case if delta encoding, to be passed to
+            _update_delta_state once the case has been written.
+        """
+        key = (table, source)
+
+        if self._is_unchanged(table, source, columns):
+            return None, None
+
+        if not self._encode:
+            # convert to list so this can be dumped as JSON
+            encoded = []
+            for vals in columns:
+                if vals is not None:
+                    for var in vals:
+                        vals[var] = make_serializable(vals[var])
+                encoded.append(json.dumps(vals))
+            return encoded, None
+
+        base_id = None
+        base = None
+        if self._delta_encode:
+            state = self._delta_states.get(key)
+            if state is not None and state[1] < self._keyframe_every:
+                base_id, _, base = state
+
+        encoded = []
+        recon = []
+        for i, vals in enumerate(columns):
+            if vals is None:
+                encoded.append(json.dumps(None))
+                recon.append(None)
+                continue
+
+            stored = {}
+            deltas = []
+            full = {}
+            base_vals = base[i] if base is not None else None
+            for name, val in vals.items():
+                if isinstance(val, np.ndarray) and np.issubdtype(val.dtype, np.floating):
+                    prev = None if base_vals is None else base_vals.get(name)
+                    if prev is not None and prev.shape == val.shape:
+                        val = val - prev
+                        deltas.append(name)
+                    if self._float32:
+                        val = val.astype(np.float32)
+                    stored[name] = val
+                    # keep what the reader will see, so that errors don't accumulate
+                    full[name] = prev + val if name in deltas else val.astype(np.float64)
+                else:
+                    stored[name] = make_serializable(val)
+
+            payload = {'base': base_id, 'delta': deltas, 'vals': stored}
+            encoded.append(encode_blob(payload, self._compression, self._pickle_version))
+            recon.append(full)
+
+        if self._delta_encode:
+            return encoded, (base_id is None, recon)
+        return encoded, None
+
+    def _is_unchanged(self, table, source, columns):
+        """
+        Return True if a case should be skipped because its values have not changed.
+
+        Parameters
+        ----------
+        table : str
+            The name of the table the case will be written to.
+        source : str
+            The source of the case.
+        columns : list of dict or None
+            Mappings of variable name to value, e.g. for inputs, outputs, and residuals.
+
+        Returns
+        -------
+        bool
+            True if recording only on change and the values are identical to those of the
+            previous case recorded from the same source.
+        """
+        if self._record_on_change_only:
+            key = (table, source)
+            last = self._last_cases.get(key)
+            if last is not None and all(_values_equal(v, lv) for v, lv in zip(columns, last)):
+                return True
+            self._last_cases[key] = deepcopy(columns)
+
+        return False
+
+    def _update_delta_state(self, table, source, row_id, delta_info):
+        """
+        Save the reconstructed values of a case just written for delta encoding the next one.
+
+        Parameters
+        ----------
+        table : str
+            The name of the table the case was written to.
+        source : str
+            The source of the case.
+        row_id : int
+            The id of the row the case was written to.
+        delta_info : tuple or None
+            The info returned by _encode_case.
+        """
+        if delta_info is not None:
+            key = (table, source)
+            is_keyframe, recon = delta_info
+            count = 1 if is_keyframe else self._delta_states[key][1] + 1
+            self._delta_states[key] = (row_id, count, recon)
+
     def _cleanup_abs2meta(self):
         """
         Convert all abs2meta variable properties to a form that can be dumped as JSON.
@@ -393,10 +716,29 @@ class SqliteRecorder(CaseRecorder):
             var_settings['execution_order'] = var_order
             var_settings_json = json.dumps(var_settings)
 
-            with self.connection as c:
-                c.execute("UPDATE metadata SET " +
-                          "abs2prom=?, prom2abs=?, abs2meta=?, var_settings=?, conns=?",
-                          (abs2prom, prom2abs, abs2meta, var_settings_json, conns))
+            self._write_metadata(abs2prom, prom2abs, abs2meta, var_settings_json, conns)
+
+    def _write_metadata(self, abs2prom, prom2abs, abs2meta, var_settings, conns):
+        """
+        Write the variable metadata, which has been converted to JSON.
+
+        Parameters
+        ----------
+        abs2prom : str
+            Mapping of absolute names to promoted names.
+        prom2abs : str
+            Mapping of promoted names to absolute names.
+        abs2meta : str
+            Mapping of absolute names to variable metadata.
+        var_settings : str
+            Settings of design variables and responses, and the execution order.
+        conns : str
+            Connections of the model.
+        """
+        with self.connection as c:
+            c.execute("UPDATE metadata SET " +
+                      "abs2prom=?, prom2abs=?, abs2meta=?, var_settings=?, conns=?",
+                      (abs2prom, prom2abs, abs2meta, var_settings, conns))
 
     def record_iteration_driver(self, recording_requester, data, metadata):
         """
@@ -416,16 +758,12 @@ class SqliteRecorder(CaseRecorder):
             inputs = data['input']
             residuals = data['residual']
 
-            # convert to list so this can be dumped as JSON
-            for in_out_resid in (inputs, outputs, residuals):
-                if in_out_resid is None:
-                    continue
-                for var in in_out_resid:
-                    in_out_resid[var] = make_serializable(in_out_resid[var])
-
-            outputs_text = json.dumps(outputs)
-            inputs_text = json.dumps(inputs)
-            residuals_text = json.dumps(residuals)
+            source = recording_requester._get_name()
+            encoded, delta_info = self._encode_case('driver_iterations', source,
+                                                    [inputs, outputs, residuals])
+            if encoded is None:
+                return
+            inputs_text, outputs_text, residuals_text = encoded
 
             with self.connection as c:
                 c = c.cursor()  # need a real cursor for lastrowid
@@ -436,9 +774,10 @@ class SqliteRecorder(CaseRecorder):
                           (self._counter, self._iteration_coordinate,
                            metadata['timestamp'], metadata['success'], metadata['msg'],
                            inputs_text, outputs_text, residuals_text))
+                self._update_delta_state('driver_iterations', source, c.lastrowid, delta_info)
 
                 c.execute("INSERT INTO global_iterations(record_type, rowid, source) VALUES(?,?,?)",
-                          ('driver', c.lastrowid, recording_requester._get_name()))
+                          ('driver', c.lastrowid, source))
 
     def record_iteration_problem(self, recording_requester, data, metadata):
         """
@@ -467,16 +806,12 @@ class SqliteRecorder(CaseRecorder):
             totals_array = dict_to_structured_array(totals)
             totals_blob = array_to_blob(totals_array)
 
-            # convert to list so this can be dumped as JSON
-            for in_out_resid in (inputs, outputs, residuals):
-                if in_out_resid is None:
-                    continue
-                for var in in_out_resid:
-                    in_out_resid[var] = make_serializable(in_out_resid[var])
-
-            outputs_text = json.dumps(outputs)
-            inputs_text = json.dumps(inputs)
-            residuals_text = json.dumps(residuals)
+            source = metadata['name']
+            encoded, delta_info = self._encode_case('problem_cases', source,
+                                                    [inputs, outputs, residuals])
+            if encoded is None:
+                return
+            inputs_text, outputs_text, residuals_text = encoded
 
             abs_err = data['abs']
             rel_err = data['rel']
@@ -492,6 +827,7 @@ class SqliteRecorder(CaseRecorder):
                            metadata['timestamp'], metadata['success'], metadata['msg'],
                            inputs_text, outputs_text, residuals_text, totals_blob,
                            abs_err, rel_err))
+                self._update_delta_state('problem_cases', source, c.lastrowid, delta_info)
 
                 c.execute("INSERT INTO global_iterations(record_type, rowid, source) VALUES(?,?,?)",
                           ('problem', c.lastrowid, metadata['name']))
@@ -514,14 +850,16 @@ class SqliteRecorder(CaseRecorder):
             outputs = data['output']
             residuals = data['residual']
 
-            # convert to list so this can be dumped as JSON
-            for i_o_r in (inputs, outputs, residuals):
-                for var, dat in i_o_r.items():
-                    i_o_r[var] = make_serializable(dat)
+            # get the pathname of the source system
+            source_system = recording_requester.pathname
+            if source_system == '':
+                source_system = 'root'
 
-            outputs_text = json.dumps(outputs)
-            inputs_text = json.dumps(inputs)
-            residuals_text = json.dumps(residuals)
+            encoded, delta_info = self._encode_case('system_iterations', source_system,
+                                                    [inputs, outputs, residuals])
+            if encoded is None:
+                return
+            inputs_text, outputs_text, residuals_text = encoded
 
             with self.connection as c:
                 c = c.cursor()  # need a real cursor for lastrowid
@@ -532,11 +870,8 @@ class SqliteRecorder(CaseRecorder):
                           (self._counter, self._iteration_coordinate,
                            metadata['timestamp'], metadata['success'], metadata['msg'],
                            inputs_text, outputs_text, residuals_text))
-
-                # get the pathname of the source system
-                source_system = recording_requester.pathname
-                if source_system == '':
-                    source_system = 'root'
+                self._update_delta_state('system_iterations', source_system, c.lastrowid,
+                                         delta_info)
 
                 c.execute("INSERT INTO global_iterations(record_type, rowid, source) VALUES(?,?,?)",
                           ('system', c.lastrowid, source_system))
@@ -561,16 +896,13 @@ class SqliteRecorder(CaseRecorder):
             outputs = data['output']
             residuals = data['residual']
 
-            # convert to list so this can be dumped as JSON
-            for i_o_r in (inputs, outputs, residuals):
-                if i_o_r is None:
-                    continue
-                for var in i_o_r:
-                    i_o_r[var] = make_serializable(i_o_r[var])
+            source_solver = self._get_solver_source(recording_requester)
 
-            outputs_text = json.dumps(outputs)
-            inputs_text = json.dumps(inputs)
-            residuals_text = json.dumps(residuals)
+            encoded, delta_info = self._encode_case('solver_iterations', source_solver,
+                                                    [inputs, outputs, residuals])
+            if encoded is None:
+                return
+            inputs_text, outputs_text, residuals_text = encoded
 
             with self.connection as c:
                 c = c.cursor()  # need a real cursor for lastrowid
@@ -582,25 +914,41 @@ class SqliteRecorder(CaseRecorder):
                           (self._counter, self._iteration_coordinate,
                            metadata['timestamp'], metadata['success'], metadata['msg'],
                            abs, rel, inputs_text, outputs_text, residuals_text))
-
-                # get the pathname of the source system
-                source_system = recording_requester._system().pathname
-                if source_system == '':
-                    source_system = 'root'
-
-                # get solver type from SOLVER class attribute to determine the solver pathname
-                solver_type = recording_requester.SOLVER[0:2]
-                if solver_type == 'NL':
-                    source_solver = source_system + '.nonlinear_solver'
-                elif solver_type == 'LS':
-                    source_solver = source_system + '.nonlinear_solver.linesearch'
-                else:
-                    raise RuntimeError("Solver type '%s' not recognized during recording. "
-                                       "Expecting NL or LS" % recording_requester.SOLVER)
+                self._update_delta_state('solver_iterations', source_solver, c.lastrowid,
+                                         delta_info)
 
                 c.execute("INSERT INTO global_iterations(record_type, rowid, source) VALUES(?,?,?)",
                           ('solver', c.lastrowid, source_solver))
 
+    def _get_solver_source(self, recording_requester):
+        """
+        Return the name under which the cases of a solver are recorded.
+
+        Parameters
+        ----------
+        recording_requester : Solver
+            Solver in need of recording.
+
+        Returns
+        -------
+        str
+            The pathname of the solver.
+        """
+        # get the pathname of the source system
+        source_system = recording_requester._system().pathname
+        if source_system == '':
+            source_system = 'root'
+
+        # get solver type from SOLVER class attribute to determine the solver pathname
+        solver_type = recording_requester.SOLVER[0:2]
+        if solver_type == 'NL':
+            return source_system + '.nonlinear_solver'
+        elif solver_type == 'LS':
+            return source_system + '.nonlinear_solver.linesearch'
+        else:
+            raise RuntimeError("Solver type '%s' not recognized during recording. "
+                               "Expecting NL or LS" % recording_requester.SOLVER)
+
     def record_viewer_data(self, model_viewer_data, key='Driver'):
         """
         Record model viewer data.
@@ -614,14 +962,26 @@ class SqliteRecorder(CaseRecorder):
         """
         if self.connection:
             json_data = json.dumps(model_viewer_data, default=default_noraise)
+            self._write_viewer_data(key, json_data)
 
-            # Note: recorded to 'driver_metadata' table for legacy/compatibility reasons.
-            try:
-                with self.connection as c:
-                    c.execute("INSERT INTO driver_metadata(id, model_viewer_data) VALUES(?,?)",
-                              (key, json_data))
-            except sqlite3.IntegrityError:
-                print("Model viewer data has already has already been recorded for %s." % key)
+    def _write_viewer_data(self, key, json_data):
+        """
+        Write model viewer data.
+
+        Parameters
+        ----------
+        key : str
+            The unique ID to use for this data in the table.
+        json_data : str
+            Data required to visualize the model, converted to JSON.
+        """
+        # Note: recorded to 'driver_metadata' table for legacy/compatibility reasons.
+        try:
+            with self.connection as c:
+                c.execute("INSERT INTO driver_metadata(id, model_viewer_data) VALUES(?,?)",
+                          (key, json_data))
+        except sqlite3.IntegrityError:
+            print("Model viewer data has already has already been recorded for %s." % key)
 
     def record_metadata_system(self, recording_requester, run_counter=None):
         """
@@ -660,22 +1020,38 @@ class SqliteRecorder(CaseRecorder):
             if not path:
                 path = 'root'
 
-            scaling_factors = sqlite3.Binary(scaling_factors)
-            pickled_metadata = sqlite3.Binary(pickled_metadata)
-
-            # Need to use OR IGNORE in here because if the user does run_driver more than once
-            #   the current OpenMDAO code will call this function each time and there will be
-            #   SQL errors for "UNIQUE constraint failed: system_metadata.id"
-            # Future versions of OpenMDAO will handle this better.
             if run_counter is None:
                 name = path
             else:
                 name = "{}_{}".format(path, str(run_counter))
-            with self.connection as c:
-                c.execute("INSERT OR IGNORE INTO system_metadata"
-                          "(id, scaling_factors, component_metadata) "
-                          "VALUES(?,?,?)", (name, scaling_factors,
-                                            pickled_metadata))
+
+            self._write_system_metadata(name, scaling_factors, pickled_metadata)
+
+    def _write_system_metadata(self, name, scaling_factors, pickled_metadata):
+        """
+        Write system metadata.
+
+        Parameters
+        ----------
+        name : str
+            The unique ID of the system metadata.
+        scaling_factors : bytes
+            The pickled scaling vectors of the system.
+        pickled_metadata : bytes
+            The pickled options of the system.
+        """
+        scaling_factors = sqlite3.Binary(scaling_factors)
+        pickled_metadata = sqlite3.Binary(pickled_metadata)
+
+        # Need to use OR IGNORE in here because if the user does run_driver more than once
+        #   the current OpenMDAO code will call this function each time and there will be
+        #   SQL errors for "UNIQUE constraint failed: system_metadata.id"
+        # Future versions of OpenMDAO will handle this better.
+        with self.connection as c:
+            c.execute("INSERT OR IGNORE INTO system_metadata"
+                      "(id, scaling_factors, component_metadata) "
+                      "VALUES(?,?,?)", (name, scaling_factors,
+                                        pickled_metadata))
 
     def record_metadata_solver(self, recording_requester):
         """
@@ -695,9 +1071,24 @@ class SqliteRecorder(CaseRecorder):
 
             solver_options = pickle.dumps(recording_requester.options, self._pickle_version)
 
-            with self.connection as c:
-                c.execute("INSERT INTO solver_metadata(id, solver_options, solver_class) "
-                          "VALUES(?,?,?)", (id, sqlite3.Binary(solver_options), solver_class))
+            self._write_solver_metadata(id, solver_options, solver_class)
+
+    def _write_solver_metadata(self, id, solver_options, solver_class):
+        """
+        Write solver metadata.
+
+        Parameters
+        ----------
+        id : str
+            The unique ID of the solver metadata.
+        solver_options : bytes
+            The pickled options of the solver.
+        solver_class : str
+            The class name of the solver.
+        """
+        with self.connection as c:
+            c.execute("INSERT INTO solver_metadata(id, solver_options, solver_class) "
+                      "VALUES(?,?,?)", (id, sqlite3.Binary(solver_options), solver_class))
 
     def record_derivatives_driver(self, recording_requester, data, metadata):
         """
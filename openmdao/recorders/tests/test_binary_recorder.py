@@ -0,0 +1,203 @@
+""" Unit tests for the BinaryRecorder and BinaryCaseReader. """
+import os
+import unittest
+
+import numpy as np
+
+import openmdao.api as om
+from openmdao.recorders.binary_reader import BinaryCaseReader, is_binary_case_file
+from openmdao.recorders.sqlite_reader import SqliteCaseReader
+from openmdao.test_suite.components.sellar import SellarProblem
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+
+@use_tempdirs
+class TestBinaryRecorder(unittest.TestCase):
+
+    def assertCasesEqual(self, expected, actual):
+        self.assertEqual(expected.name, actual.name)
+        self.assertEqual(expected.source, actual.source)
+        self.assertEqual(expected.counter, actual.counter)
+        self.assertEqual(expected.success, actual.success)
+
+        for attr in ('inputs', 'outputs', 'residuals'):
+            exp = getattr(expected, attr)
+            act = getattr(actual, attr)
+            if exp is None:
+                self.assertIsNone(act)
+                continue
+            self.assertEqual(sorted(exp.absolute_names()), sorted(act.absolute_names()))
+            for name in exp.absolute_names():
+                assert_near_equal(act[name], exp[name], 1e-15)
+
+        for attr in ('abs_err', 'rel_err'):
+            if getattr(expected, attr) is None:
+                self.assertIsNone(getattr(actual, attr))
+            else:
+                assert_near_equal(getattr(actual, attr), getattr(expected, attr), 1e-15)
+
+        if expected.derivatives is None:
+            self.assertIsNone(actual.derivatives)
+        else:
+            for key in expected.derivatives.keys():
+                assert_near_equal(actual.derivatives[key], expected.derivatives[key], 1e-15)
+
+    def check_same_as_sqlite(self, chunk_size):
+        for recorder in (om.SqliteRecorder('cases.sql'),
+                         om.BinaryRecorder('cases.bin', chunk_size=chunk_size)):
+            prob = SellarProblem()
+            prob.driver.recording_options['record_derivatives'] = True
+            prob.setup()
+
+            prob.driver.add_recorder(recorder)
+            prob.model.add_recorder(recorder)
+            prob.model.d1.add_recorder(recorder)
+            prob.model.nonlinear_solver.add_recorder(recorder)
+            prob.add_recorder(recorder)
+
+            prob.run_driver()
+            prob.record('final')
+            prob.cleanup()
+
+        sql_cr = om.CaseReader('cases.sql')
+        bin_cr = om.CaseReader('cases.bin')
+
+        self.assertIsInstance(sql_cr, SqliteCaseReader)
+        self.assertIsInstance(bin_cr, BinaryCaseReader)
+
+        self.assertEqual(sql_cr.list_sources(out_stream=None),
+                         bin_cr.list_sources(out_stream=None))
+
+        for source in sql_cr.list_sources(out_stream=None):
+            self.assertEqual(sql_cr.list_source_vars(source, out_stream=None),
+                             bin_cr.list_source_vars(source, out_stream=None))
+
+        sql_cases = sql_cr.list_cases(out_stream=None)
+        self.assertEqual(sql_cases, bin_cr.list_cases(out_stream=None))
+        self.assertEqual(sql_cr.list_cases('root.d1', recurse=False, out_stream=None),
+                         bin_cr.list_cases('root.d1', recurse=False, out_stream=None))
+
+        for expected, actual in zip(sql_cr.get_cases(), bin_cr.get_cases()):
+            self.assertCasesEqual(expected, actual)
+
+        self.assertCasesEqual(sql_cr.get_case('final'), bin_cr.get_case('final'))
+        self.assertCasesEqual(sql_cr.get_case(-1), bin_cr.get_case(-1))
+
+        self.assertEqual(sorted(sql_cr.system_options), sorted(bin_cr.system_options))
+        self.assertEqual(sorted(sql_cr.solver_metadata), sorted(bin_cr.solver_metadata))
+        self.assertEqual(sql_cr.problem_metadata['tree'], bin_cr.problem_metadata['tree'])
+
+    def test_same_as_sqlite(self):
+        self.check_same_as_sqlite(chunk_size=64)
+
+    def test_same_as_sqlite_many_chunks(self):
+        self.check_same_as_sqlite(chunk_size=2)
+
+    def test_val_history(self):
+        prob = SellarProblem()
+        prob.setup()
+        recorder = om.BinaryRecorder('cases.bin')
+        prob.model.d1.add_recorder(recorder)
+        prob.model.nonlinear_solver.add_recorder(recorder)
+        prob.run_driver()
+        prob.cleanup()
+
+        cr = om.CaseReader('cases.bin')
+
+        cases = cr.get_cases('root.nonlinear_solver', recurse=False)
+        hist = cr.get_val_history('root.nonlinear_solver', 'y1')
+        self.assertEqual(hist.shape, (len(cases), 1))
+        for row, case in zip(hist, cases):
+            assert_near_equal(row, case.outputs['y1'], 1e-15)
+
+        # all the cases fit in one chunk, so the history is read straight from the file
+        self.assertTrue(np.shares_memory(hist, cr._data))
+
+        hist = cr.get_val_history('root.d1', 'd1.z', column='inputs')
+        self.assertEqual(hist.shape, (len(cr.list_cases('root.d1', recurse=False,
+                                                        out_stream=None)), 2))
+        assert_near_equal(hist[-1], [5., 2.], 1e-15)
+
+        with self.assertRaises(RuntimeError) as cm:
+            cr.get_val_history('root.d2', 'y2')
+        self.assertEqual(str(cm.exception), 'Source not found: root.d2')
+
+    def test_val_history_many_chunks(self):
+        prob = SellarProblem()
+        prob.setup()
+        prob.model.d1.add_recorder(om.BinaryRecorder('cases.bin', chunk_size=3))
+        prob.run_driver()
+        prob.cleanup()
+
+        cr = om.CaseReader('cases.bin')
+
+        cases = cr.get_cases('root.d1', recurse=False)
+        hist = cr.get_val_history('root.d1', 'd1.y1')
+        self.assertEqual(hist.shape, (len(cases), 1))
+        for row, case in zip(hist, cases):
+            assert_near_equal(row, case.outputs['d1.y1'], 1e-15)
+
+    def test_unflushed_cases_dropped(self):
+        prob = SellarProblem()
+        prob.setup()
+        recorder = om.BinaryRecorder('cases.bin', chunk_size=3)
+        prob.model.d1.add_recorder(recorder)
+        prob.run_driver()
+
+        # cases still in the buffer are not in the data file yet
+        ncases = len(om.CaseReader('cases.bin').list_cases(out_stream=None))
+        self.assertEqual(ncases % 3, 0)
+
+        recorder.flush()
+        cr = om.CaseReader('cases.bin')
+        self.assertGreater(len(cr.list_cases(out_stream=None)), ncases)
+
+        prob.cleanup()
+        self.assertEqual(len(om.CaseReader('cases.bin').list_cases(out_stream=None)),
+                         len(cr.list_cases(out_stream=None)))
+
+    def test_record_on_change_only(self):
+        prob = om.Problem()
+        prob.model.add_subsystem('comp', om.ExecComp('y = 2.0*x', x=np.ones(3), y=np.ones(3)))
+        prob.setup()
+
+        recorder = om.BinaryRecorder('cases.bin', record_on_change_only=True)
+        prob.model.comp.add_recorder(recorder)
+
+        for x in (1., 1., 1., 3., 3.):
+            prob['comp.x'] = x
+            prob.run_model()
+        prob.cleanup()
+
+        cr = om.CaseReader('cases.bin')
+        cases = cr.list_cases('root.comp', recurse=False, out_stream=None)
+        self.assertEqual(len(cases), 2)
+        assert_near_equal(cr.get_val_history('root.comp', 'comp.y'), [[2.] * 3, [6.] * 3])
+
+    def test_not_binary(self):
+        for recorder in (om.SqliteRecorder('cases.sql'), om.BinaryRecorder('cases.bin')):
+            prob = SellarProblem()
+            prob.setup()
+            prob.driver.add_recorder(recorder)
+            prob.run_driver()
+            prob.cleanup()
+
+        self.assertFalse(is_binary_case_file('cases.sql'))
+        self.assertTrue(is_binary_case_file('cases.bin'))
+        self.assertTrue(os.path.isfile('cases.bin.idx'))
+
+        with self.assertRaises(IOError) as cm:
+            BinaryCaseReader('cases.sql')
+        self.assertEqual(str(cm.exception),
+                         'File does not contain a valid binary case recording: cases.sql')
+
+    def test_bad_chunk_size(self):
+        with self.assertRaises(ValueError) as cm:
+            om.BinaryRecorder('cases.bin', chunk_size=0)
+        self.assertEqual(str(cm.exception),
+                         'BinaryRecorder: chunk_size must be at least 1 but got 0.')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3099,6 +3099,116 @@ class TestSqliteCaseReader(unittest.TestCase):
         for i, line in enumerate(expected_cases):
             self.assertEqual(text[i], line)
 
+@use_tempdirs
+class TestSqliteRecordingOptions(unittest.TestCase):
+
+    def _record_solver(self, filename, **kwargs):
+        prob = SellarProblem()
+        prob.setup()
+
+        solver = prob.model.nonlinear_solver
+        solver.add_recorder(om.SqliteRecorder(filename, record_viewer_data=False, **kwargs))
+        solver.recording_options['record_solver_residuals'] = True
+
+        prob.run_driver()
+        prob.cleanup()
+
+        return om.CaseReader(filename)
+
+    def _check_same_cases(self, cr, expected, tol):
+        cases = cr.get_cases('root.nonlinear_solver')
+        expected_cases = expected.get_cases('root.nonlinear_solver')
+        self.assertEqual(len(cases), len(expected_cases))
+
+        for case, expected_case in zip(cases, expected_cases):
+            self.assertEqual(case.name, expected_case.name)
+            for vals, expected_vals in ((case.inputs, expected_case.inputs),
+                                        (case.outputs, expected_case.outputs),
+                                        (case.residuals, expected_case.residuals)):
+                for name in expected_vals.absolute_names():
+                    self.assertEqual(vals[name].dtype, np.float64)
+                    assert_near_equal(vals[name], expected_vals[name], tol)
+
+        # random access walks back through the delta encoded cases
+        last = cr.get_case(-1)
+        assert_near_equal(last.outputs['y1'], expected.get_case(-1).outputs['y1'], tol)
+
+    def test_record_every(self):
+        prob = SellarProblem()
+        prob.setup()
+
+        solver = prob.model.nonlinear_solver
+        solver.add_recorder(om.SqliteRecorder('cases.sql', record_viewer_data=False))
+        solver.recording_options['record_every'] = 2
+
+        prob.run_driver()
+        prob.cleanup()
+
+        cr = om.CaseReader('cases.sql')
+        self.assertEqual(cr.list_cases('root.nonlinear_solver', out_stream=None),
+                         ['rank0:Driver|0|root._solve_nonlinear|0|NonlinearBlockGS|%d' % i
+                          for i in (2, 4, 6)])
+
+    def test_system_record_every(self):
+        prob = SellarProblem()
+        prob.setup()
+
+        d1 = prob.model.d1
+        d1.add_recorder(om.SqliteRecorder('cases.sql', record_viewer_data=False))
+        d1.recording_options['record_every'] = 3
+
+        prob.run_driver()
+        prob.cleanup()
+
+        cr = om.CaseReader('cases.sql')
+        cases = cr.list_cases('root.d1', out_stream=None)
+        self.assertEqual([int(c.rsplit('|', 1)[-1]) for c in cases], [0, 3, 6])
+
+    def test_record_on_change_only(self):
+        prob = om.Problem()
+        comp = prob.model.add_subsystem('comp', om.ExecComp('y = 2.0 * x'), promotes=['*'])
+
+        comp.add_recorder(om.SqliteRecorder('all.sql', record_viewer_data=False))
+        comp.add_recorder(om.SqliteRecorder('changed.sql', record_viewer_data=False,
+                                            record_on_change_only=True))
+        prob.setup()
+
+        for x in (1.0, 1.0, 1.0, 3.0, 3.0):
+            prob['x'] = x
+            prob.run_model()
+        prob.cleanup()
+
+        cr = om.CaseReader('all.sql')
+        self.assertEqual(len(cr.list_cases('root.comp', recurse=False, out_stream=None)), 5)
+
+        cr = om.CaseReader('changed.sql')
+        self.assertEqual(len(cr.list_cases('root.comp', recurse=False, out_stream=None)), 2)
+
+    def test_delta_compression(self):
+        expected = self._record_solver('plain.sql')
+        cr = self._record_solver('delta.sql', delta_encode=True, keyframe_every=3,
+                                 compression='zlib')
+        self._check_same_cases(cr, expected, 1e-15)
+
+    def test_float32(self):
+        expected = self._record_solver('plain.sql')
+        cr = self._record_solver('float32.sql', float32=True, delta_encode=True)
+        self._check_same_cases(cr, expected, 1e-5)
+
+    def test_bad_options(self):
+        with self.assertRaises(ValueError) as cm:
+            om.SqliteRecorder('cases.sql', compression='gzip')
+
+        self.assertEqual(str(cm.exception), "SqliteRecorder: compression must be one of "
+                         "['lz4', 'zlib'] but got 'gzip'.")
+
+        with self.assertRaises(ValueError) as cm:
+            om.SqliteRecorder('cases.sql', delta_encode=True, keyframe_every=0)
+
+        self.assertEqual(str(cm.exception),
+                         "SqliteRecorder: keyframe_every must be at least 1 but got 0.")
+
+
 @use_tempdirs
 class TestFeatureSqliteReader(unittest.TestCase):
 
@@ -403,6 +403,53 @@ class DirectSolver(LinearSolver):
 
         return inv_jac
 
+    def _solve_multi(self, rhs, mode='fwd'):
+        """
+        Solve the linear system for multiple right-hand sides using the current factorization.
+
+        Parameters
+        ----------
+        rhs : ndarray
+            Array of shape (n, nrhs) containing scaled right-hand sides, one per column.
+        mode : str
+            'fwd' or 'rev'.
+
+        Returns
+        -------
+        ndarray
+            Array of shape (n, nrhs) containing the scaled solutions.
+        """
+        system = self._system()
+        trans_lu = 0 if mode == 'fwd' else 1
+
+        # matrix-vector-product generated jacobians are scaled.
+        if self._assembled_jac is None:
+            return scipy.linalg.lu_solve(self._lup, rhs, trans=trans_lu)
+
+        d_residuals = system._vectors['residual']['linear']
+        d_outputs = system._vectors['output']['linear']
+
+        if mode == 'fwd':
+            b_vec, b_scaled = d_residuals, system._has_resid_scaling
+            x_vec, x_scaled = d_outputs, system._has_output_scaling
+        else:
+            b_vec, b_scaled = d_outputs, system._has_output_scaling
+            x_vec, x_scaled = d_residuals, system._has_resid_scaling
+
+        # AssembledJacobians are unscaled.
+        if b_scaled:
+            rhs = rhs * b_vec._scaling['phys'][1][:, np.newaxis]
+
+        if isinstance(self._assembled_jac._int_mtx, DenseMatrix):
+            sol = scipy.linalg.lu_solve(self._lup, rhs, trans=trans_lu)
+        else:
+            sol = self._lu.solve(rhs, 'N' if mode == 'fwd' else 'T')
+
+        if x_scaled:
+            sol *= x_vec._scaling['norm'][1][:, np.newaxis]
+
+        return sol
+
     def solve(self, vec_names, mode, rel_systems=None):
         """
         Run the solver.
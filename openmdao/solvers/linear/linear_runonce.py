@@ -48,3 +48,7 @@ class LinearRunOnce(LinearBlockGS):
         # this solver does not iterate
         self.options.undeclare("maxiter")
         self.options.undeclare("err_on_non_converge")
+
+        # a single GS pass would carry a stale initial guess into the result
+        self.options.undeclare("warm_start")
+        self.supports['warm_start'] = False
@@ -221,6 +221,15 @@ class PETScKrylov(LinearSolver):
         self.options.declare('precon_side', default='right', values=['left', 'right'],
                              desc='Preconditioner side, default is right.')
 
+        # the current solution vector is passed to the solver as the initial guess
+        self.options.declare('warm_start', default=True, types=bool,
+                             desc='If True and this is the linear solver of the model, the '
+                                  'solution of each total derivative solve is stored and used as '
+                                  'the initial guess of the same solve in the next computation '
+                                  'of the total derivatives. This costs one solution vector of '
+                                  'memory per solve.')
+        self.supports['warm_start'] = True
+
         # changing the default maxiter from the base class
         self.options['maxiter'] = 100
 
@@ -0,0 +1,502 @@
+"""Define the SparsePrecon class, an approximate solver built from an assembled jacobian."""
+
+import numpy as np
+import scipy.sparse.linalg
+from scipy.sparse import csc_matrix, csr_matrix, identity, diags
+
+from openmdao.solvers.solver import LinearSolver
+from openmdao.solvers.linear.direct import format_singular_error
+
+
+def _strength_graph(A, theta):
+    """
+    Return the strength of connection graph of a sparse matrix.
+
+    Entry (i, j) is strong if abs(a_ij) >= theta * sqrt(abs(a_ii * a_jj)).
+
+    Parameters
+    ----------
+    A : csr_matrix
+        Square sparse matrix.
+    theta : float
+        Strength threshold.
+
+    Returns
+    -------
+    csr_matrix
+        Boolean matrix containing only the strong off-diagonal connections.
+    """
+    coo = A.tocoo()
+    diag = np.abs(A.diagonal())
+    offdiag = coo.row != coo.col
+    rows = coo.row[offdiag]
+    cols = coo.col[offdiag]
+    vals = np.abs(coo.data[offdiag])
+    strong = vals >= theta * np.sqrt(diag[rows] * diag[cols])
+    n = A.shape[0]
+    S = csr_matrix((np.ones(np.count_nonzero(strong), dtype=bool),
+                    (rows[strong], cols[strong])), shape=(n, n))
+    # aggregation requires a symmetric graph
+    return (S + S.T).tocsr()
+
+
+def _aggregate(S):
+    """
+    Group the nodes of a strength graph into aggregates using greedy aggregation.
+
+    Parameters
+    ----------
+    S : csr_matrix
+        Symmetric strength of connection graph.
+
+    Returns
+    -------
+    ndarray
+        Aggregate index of each node.
+    int
+        Number of aggregates.
+    """
+    n = S.shape[0]
+    indptr = S.indptr
+    indices = S.indices
+    agg = np.full(n, -1, dtype=int)
+    nagg = 0
+
+    # pass 1: root nodes whose neighborhood is entirely unaggregated
+    for i in range(n):
+        if agg[i] >= 0:
+            continue
+        nbrs = indices[indptr[i]:indptr[i + 1]]
+        if np.all(agg[nbrs] < 0):
+            agg[i] = nagg
+            agg[nbrs] = nagg
+            nagg += 1
+
+    # pass 2: attach leftover nodes to a neighboring aggregate
+    for i in np.nonzero(agg < 0)[0]:
+        nbrs = indices[indptr[i]:indptr[i + 1]]
+        nbr_aggs = agg[nbrs]
+        nbr_aggs = nbr_aggs[nbr_aggs >= 0]
+        if nbr_aggs.size > 0:
+            agg[i] = nbr_aggs[0]
+
+    # pass 3: anything still isolated becomes its own aggregate
+    for i in np.nonzero(agg < 0)[0]:
+        agg[i] = nagg
+        nagg += 1
+
+    return agg, nagg
+
+
+def _spectral_radius(A, niter=15):
+    """
+    Estimate the spectral radius of a sparse matrix using power iteration.
+
+    Parameters
+    ----------
+    A : csr_matrix
+        Square sparse matrix.
+    niter : int
+        Number of power iterations.
+
+    Returns
+    -------
+    float
+        Estimated spectral radius.
+    """
+    x = np.random.RandomState(0).rand(A.shape[0])
+    rho = 1.0
+    for i in range(niter):
+        y = A.dot(x)
+        norm = np.linalg.norm(y)
+        if norm == 0.0:
+            return 1.0
+        rho = norm / np.linalg.norm(x)
+        x = y / norm
+    return rho
+
+
+class _SAMultigrid(object):
+    """
+    Smoothed aggregation algebraic multigrid hierarchy applied as a single V-cycle.
+
+    Attributes
+    ----------
+    _levels : list
+        List of (A, inv_diag, P, R) tuples, one for each fine level.
+    _coarse_lu : SuperLU
+        LU factorization of the coarsest operator.
+    _smooth_iters : int
+        Number of damped Jacobi pre and post smoothing iterations.
+    _omega : float
+        Damping factor for the Jacobi smoother.
+    """
+
+    def __init__(self, A, strength=0.25, max_levels=10, coarse_size=50, smooth_iters=1):
+        """
+        Build the multigrid hierarchy.
+
+        Parameters
+        ----------
+        A : sparse matrix
+            Square operator to be approximately inverted.
+        strength : float
+            Strength of connection threshold used during aggregation.
+        max_levels : int
+            Maximum number of levels in the hierarchy.
+        coarse_size : int
+            Operators smaller than this are solved directly.
+        smooth_iters : int
+            Number of damped Jacobi pre and post smoothing iterations.
+        """
+        self._levels = []
+        self._smooth_iters = smooth_iters
+        self._omega = 2.0 / 3.0
+
+        A = csr_matrix(A)
+        while len(self._levels) < max_levels - 1 and A.shape[0] > coarse_size:
+            inv_diag = self._inv_diag(A)
+            agg, nagg = _aggregate(_strength_graph(A, strength))
+            if nagg >= A.shape[0]:
+                # no coarsening possible
+                break
+
+            n = A.shape[0]
+            P0 = csr_matrix((np.ones(n), (np.arange(n), agg)), shape=(n, nagg))
+            DinvA = diags(inv_diag).dot(A).tocsr()
+            omega = (4.0 / 3.0) / _spectral_radius(DinvA)
+            P = (P0 - omega * DinvA.dot(P0)).tocsr()
+            R = P.T.tocsr()
+
+            self._levels.append((A, inv_diag, P, R))
+            A = R.dot(A).dot(P).tocsr()
+
+        self._coarse_lu = scipy.sparse.linalg.splu(csc_matrix(A))
+
+    def _inv_diag(self, A):
+        """
+        Return the inverse of the diagonal of A, guarding against zero diagonal entries.
+
+        Parameters
+        ----------
+        A : csr_matrix
+            Square sparse matrix.
+
+        Returns
+        -------
+        ndarray
+            Inverse diagonal entries.
+        """
+        diag = A.diagonal()
+        diag[diag == 0.0] = 1.0
+        return 1.0 / diag
+
+    def solve(self, b):
+        """
+        Apply a single V-cycle to approximately solve A x = b.
+
+        Parameters
+        ----------
+        b : ndarray
+            Right hand side.
+
+        Returns
+        -------
+        ndarray
+            Approximate solution.
+        """
+        return self._vcycle(0, b)
+
+    def _vcycle(self, lvl, b):
+        """
+        Recursively apply the V-cycle starting at the given level.
+
+        Parameters
+        ----------
+        lvl : int
+            Index of the current level.
+        b : ndarray
+            Right hand side at the current level.
+
+        Returns
+        -------
+        ndarray
+            Approximate solution at the current level.
+        """
+        if lvl == len(self._levels):
+            return self._coarse_lu.solve(b)
+
+        A, inv_diag, P, R = self._levels[lvl]
+        omega = self._omega
+
+        x = omega * inv_diag * b
+        for i in range(self._smooth_iters - 1):
+            x += omega * inv_diag * (b - A.dot(x))
+
+        x += P.dot(self._vcycle(lvl + 1, R.dot(b - A.dot(x))))
+
+        for i in range(self._smooth_iters):
+            x += omega * inv_diag * (b - A.dot(x))
+
+        return x
+
+
+class SparsePrecon(LinearSolver):
+    """
+    Approximate linear solver built from the sparse assembled jacobian.
+
+    This solver constructs either an incomplete LU factorization or a smoothed aggregation
+    algebraic multigrid hierarchy from the assembled jacobian and applies it once per solve.
+    It is intended to be used as a preconditioner for a Krylov solver. The factorization is
+    cached and only rebuilt when the jacobian has changed by more than 'refresh_tol'.
+
+    Attributes
+    ----------
+    _precon : SuperLU or _SAMultigrid or None
+        Approximate inverse of the assembled jacobian.
+    _precon_T : SuperLU or _SAMultigrid or None
+        Approximate inverse of the transposed assembled jacobian (multigrid only).
+    _ref_data : ndarray or None
+        Copy of the jacobian data at the time the preconditioner was last built.
+    _matrix : csc_matrix or None
+        Jacobian used to build the current preconditioner.
+    _num_builds : int
+        Number of times the preconditioner has been built.
+    """
+
+    SOLVER = 'LN: SPRECON'
+
+    def __init__(self, **kwargs):
+        """
+        Initialize all attributes.
+
+        Parameters
+        ----------
+        **kwargs : dict
+            options dictionary.
+        """
+        super().__init__(**kwargs)
+
+        self._precon = None
+        self._precon_T = None
+        self._ref_data = None
+        self._matrix = None
+        self._num_builds = 0
+
+    def _declare_options(self):
+        """
+        Declare options before kwargs are processed in the init method.
+        """
+        super()._declare_options()
+
+        self.options.declare('precon_type', default='ilu', values=('ilu', 'amg'),
+                             desc="Type of approximate inverse. 'ilu' is an incomplete LU "
+                                  "factorization and 'amg' is smoothed aggregation multigrid.")
+        self.options.declare('drop_tol', default=1e-4, lower=0.0,
+                             desc="Drop tolerance for the incomplete LU factorization.")
+        self.options.declare('fill_factor', default=10.0, lower=1.0,
+                             desc="Upper bound on the ratio of fill in the incomplete LU "
+                                  "factors to the nonzeros in the original matrix.")
+        self.options.declare('refresh_tol', default=0.0, lower=0.0,
+                             desc="The preconditioner is rebuilt when the relative change in the "
+                                  "norm of the jacobian since the last build exceeds this value. "
+                                  "The default of 0.0 rebuilds whenever the jacobian changes.")
+        self.options.declare('amg_strength', default=0.25, lower=0.0, upper=1.0,
+                             desc="Strength of connection threshold for multigrid aggregation.")
+        self.options.declare('amg_max_levels', default=10, types=int, lower=2,
+                             desc="Maximum number of multigrid levels.")
+        self.options.declare('amg_coarse_size', default=50, types=int, lower=1,
+                             desc="Multigrid operators smaller than this are solved directly.")
+        self.options.declare('amg_smooth_iters', default=1, types=int, lower=1,
+                             desc="Number of Jacobi pre and post smoothing iterations in each "
+                                  "multigrid V-cycle.")
+
+        # this solver does not iterate
+        self.options.undeclare("maxiter")
+        self.options.undeclare("err_on_non_converge")
+
+        self.options.undeclare("atol")
+        self.options.undeclare("rtol")
+
+        # This solver requires an assembled jacobian.
+        self.options['assemble_jac'] = True
+
+    def _setup_solvers(self, system, depth):
+        """
+        Assign system instance, set depth, and optionally perform setup.
+
+        Parameters
+        ----------
+        system : <System>
+            pointer to the owning system.
+        depth : int
+            depth of the current system (already incremented).
+        """
+        super()._setup_solvers(system, depth)
+        self._disallow_distrib_solve()
+
+        if not self.options['assemble_jac']:
+            raise RuntimeError("{}: SparsePrecon requires an assembled jacobian. Set the "
+                               "'assemble_jac' option to True.".format(self.msginfo))
+
+        self._precon = self._precon_T = self._ref_data = self._matrix = None
+
+    def _linearize_children(self):
+        """
+        Return a flag that is True when we need to call linearize on our subsystems' solvers.
+
+        Returns
+        -------
+        boolean
+            Flag for indicating child linearization.
+        """
+        return False
+
+    def _needs_refresh(self, matrix):
+        """
+        Return True if the preconditioner must be rebuilt for the given jacobian.
+
+        Parameters
+        ----------
+        matrix : csc_matrix
+            The current assembled jacobian.
+
+        Returns
+        -------
+        bool
+            True if the preconditioner is out of date.
+        """
+        ref = self._ref_data
+        if self._precon is None or ref is None or ref.shape != matrix.data.shape or \
+           self._matrix.shape != matrix.shape or ref.dtype != matrix.data.dtype:
+            return True
+
+        ref_norm = np.linalg.norm(ref)
+        diff = np.linalg.norm(matrix.data - ref)
+        if ref_norm == 0.0:
+            return diff > 0.0
+
+        return diff / ref_norm > self.options['refresh_tol']
+
+    def _linearize(self):
+        """
+        Build the preconditioner if the jacobian has changed beyond the refresh tolerance.
+        """
+        system = self._system()
+
+        matrix = self._assembled_jac._int_mtx._matrix
+        if matrix is None:
+            # this happens if we're not rank 0 when using owned_sizes
+            self._precon = self._precon_T = None
+            return
+
+        if not isinstance(matrix, csc_matrix):
+            matrix = csc_matrix(matrix)
+
+        if not self._needs_refresh(matrix):
+            return
+
+        self._ref_data = matrix.data.copy()
+        self._matrix = matrix
+        self._precon_T = None
+
+        if self.options['precon_type'] == 'ilu':
+            try:
+                self._precon = scipy.sparse.linalg.spilu(matrix,
+                                                         drop_tol=self.options['drop_tol'],
+                                                         fill_factor=self.options['fill_factor'])
+            except RuntimeError as err:
+                if 'exactly singular' in str(err):
+                    raise RuntimeError(format_singular_error(system, matrix))
+                else:
+                    raise err
+        else:
+            self._precon = self._build_amg(matrix)
+
+        self._num_builds += 1
+
+    def _build_amg(self, matrix):
+        """
+        Build a smoothed aggregation multigrid hierarchy for the given matrix.
+
+        Parameters
+        ----------
+        matrix : sparse matrix
+            Matrix to approximate the inverse of.
+
+        Returns
+        -------
+        _SAMultigrid
+            The multigrid hierarchy.
+        """
+        opts = self.options
+        return _SAMultigrid(matrix, strength=opts['amg_strength'],
+                            max_levels=opts['amg_max_levels'],
+                            coarse_size=opts['amg_coarse_size'],
+                            smooth_iters=opts['amg_smooth_iters'])
+
+    def _apply_inverse(self, b, mode):
+        """
+        Apply the approximate inverse of the jacobian (or its transpose) to b.
+
+        Parameters
+        ----------
+        b : ndarray
+            Right hand side.
+        mode : str
+            'fwd' or 'rev'.
+
+        Returns
+        -------
+        ndarray
+            Approximate solution.
+        """
+        if self.options['precon_type'] == 'ilu':
+            return self._precon.solve(b, 'N' if mode == 'fwd' else 'T')
+
+        if mode == 'fwd':
+            return self._precon.solve(b)
+
+        # multigrid hierarchies aren't transposable, so build one for the transpose on demand
+        if self._precon_T is None:
+            self._precon_T = self._build_amg(self._matrix.T)
+        return self._precon_T.solve(b)
+
+    def solve(self, vec_names, mode, rel_systems=None):
+        """
+        Run the solver.
+
+        Parameters
+        ----------
+        vec_names : [str, ...]
+            list of names of the right-hand-side vectors.
+        mode : str
+            'fwd' or 'rev'.
+        rel_systems : set of str
+            Names of systems relevant to the current solve.
+        """
+        if len(vec_names) > 1 or vec_names[0] != 'linear':
+            raise RuntimeError("SparsePrecon with multiple right-hand-sides is not supported.")
+
+        self._vec_names = vec_names
+        self._mode = mode
+
+        system = self._system()
+
+        d_residuals = system._vectors['residual']['linear']
+        d_outputs = system._vectors['output']['linear']
+
+        # assign x and b vectors based on mode
+        if mode == 'fwd':
+            x_vec = d_outputs._data
+            b_vec = d_residuals._data
+        else:  # rev
+            x_vec = d_residuals._data
+            b_vec = d_outputs._data
+
+        if self._precon is None:
+            return
+
+        # AssembledJacobians are unscaled.
+        with system._unscaled_context(outputs=[d_outputs], residuals=[d_residuals]):
+            x_vec[:] = self._apply_inverse(b_vec, mode)
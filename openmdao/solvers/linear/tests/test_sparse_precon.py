@@ -0,0 +1,200 @@
+"""Test the SparsePrecon linear solver class."""
+
+import unittest
+
+import numpy as np
+
+import openmdao.api as om
+from openmdao.test_suite.components.double_sellar import DoubleSellar
+from openmdao.utils.assert_utils import assert_near_equal
+
+
+class Poisson1D(om.ImplicitComponent):
+    """
+    Discretized 1D Poisson equation, -u'' = f, with a sparse tridiagonal jacobian.
+    """
+
+    def initialize(self):
+        self.options.declare('n', default=200, types=int)
+
+    def setup(self):
+        n = self.options['n']
+        self.add_input('f', np.ones(n))
+        self.add_output('u', np.zeros(n))
+
+        self.h2 = 1.0 / (n + 1) ** 2
+
+        rows = np.concatenate([np.arange(n), np.arange(1, n), np.arange(n - 1)])
+        cols = np.concatenate([np.arange(n), np.arange(n - 1), np.arange(1, n)])
+        vals = np.concatenate([2.0 * np.ones(n), -np.ones(n - 1), -np.ones(n - 1)]) / self.h2
+        self.declare_partials('u', 'u', rows=rows, cols=cols, val=vals)
+        self.declare_partials('u', 'f', rows=np.arange(n), cols=np.arange(n), val=-np.ones(n))
+
+    def apply_nonlinear(self, inputs, outputs, residuals):
+        u = outputs['u']
+        Au = 2.0 * u
+        Au[1:] -= u[:-1]
+        Au[:-1] -= u[1:]
+        residuals['u'] = Au / self.h2 - inputs['f']
+
+
+class TestSparsePrecon(unittest.TestCase):
+
+    def _check_totals(self, prob, n):
+        prob.run_model()
+        J = prob.compute_totals(of=['u'], wrt=['f'], return_format='array')
+
+        h2 = 1.0 / (n + 1) ** 2
+        A = (2.0 * np.eye(n) - np.eye(n, k=1) - np.eye(n, k=-1)) / h2
+        assert_near_equal(J, np.linalg.inv(A), 1e-7)
+
+    def test_ilu_fwd(self):
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('poisson', Poisson1D(n=50), promotes=['*'])
+        model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, maxiter=3)
+        model.linear_solver = om.ScipyKrylov(assemble_jac=True, atol=1e-10)
+        model.linear_solver.precon = om.SparsePrecon(precon_type='ilu')
+        prob.set_solver_print(level=0)
+        prob.setup(mode='fwd')
+        self._check_totals(prob, 50)
+
+    def test_ilu_rev(self):
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('poisson', Poisson1D(n=50), promotes=['*'])
+        model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, maxiter=3)
+        model.linear_solver = om.ScipyKrylov(assemble_jac=True, atol=1e-10)
+        model.linear_solver.precon = om.SparsePrecon(precon_type='ilu')
+        prob.set_solver_print(level=0)
+        prob.setup(mode='rev')
+        self._check_totals(prob, 50)
+
+    def test_amg_fwd(self):
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('poisson', Poisson1D(n=100), promotes=['*'])
+        model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, maxiter=3)
+        model.linear_solver = om.ScipyKrylov(assemble_jac=True, atol=1e-10)
+        model.linear_solver.precon = om.SparsePrecon(precon_type='amg', amg_coarse_size=10)
+        prob.set_solver_print(level=0)
+        prob.setup(mode='fwd')
+        self._check_totals(prob, 100)
+
+    def test_amg_rev(self):
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('poisson', Poisson1D(n=100), promotes=['*'])
+        model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, maxiter=3)
+        model.linear_solver = om.ScipyKrylov(assemble_jac=True, atol=1e-10)
+        model.linear_solver.precon = om.SparsePrecon(precon_type='amg', amg_coarse_size=10)
+        prob.set_solver_print(level=0)
+        prob.setup(mode='rev')
+        self._check_totals(prob, 100)
+
+    def test_amg_reduces_iterations(self):
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('poisson', Poisson1D(n=100), promotes=['*'])
+        model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, maxiter=3)
+        model.linear_solver = om.ScipyKrylov(assemble_jac=True, atol=1e-10)
+        model.linear_solver.precon = om.SparsePrecon(precon_type='amg', amg_coarse_size=10)
+        prob.set_solver_print(level=0)
+        prob.setup()
+        prob.run_model()
+        prob.compute_totals(of=['u'], wrt=['f'])
+        precon_iters = prob.model.linear_solver._iter_count
+
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('poisson', Poisson1D(n=100), promotes=['*'])
+        model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, maxiter=3)
+        model.linear_solver = om.ScipyKrylov(assemble_jac=True, atol=1e-10)
+        prob.set_solver_print(level=0)
+        prob.setup()
+        prob.run_model()
+        prob.compute_totals(of=['u'], wrt=['f'])
+        plain_iters = prob.model.linear_solver._iter_count
+
+        self.assertLess(precon_iters, plain_iters)
+
+    def test_constant_jac_not_refactored(self):
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('poisson', Poisson1D(n=50), promotes=['*'])
+        model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, maxiter=3)
+        model.linear_solver = om.ScipyKrylov(assemble_jac=True, atol=1e-10)
+        model.linear_solver.precon = om.SparsePrecon(precon_type='ilu')
+        prob.set_solver_print(level=0)
+        prob.setup()
+        precon = prob.model.linear_solver.precon
+
+        prob.run_model()
+        prob.compute_totals(of=['u'], wrt=['f'])
+        prob.run_model()
+        prob.compute_totals(of=['u'], wrt=['f'])
+
+        # The jacobian is constant, so the factorization is built only once.
+        self.assertEqual(precon._num_builds, 1)
+
+    def test_refresh_tol(self):
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('poisson', Poisson1D(n=50), promotes=['*'])
+        model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, maxiter=3)
+        model.linear_solver = om.ScipyKrylov(assemble_jac=True, atol=1e-10)
+        model.linear_solver.precon = om.SparsePrecon(precon_type='ilu')
+        prob.set_solver_print(level=0)
+        prob.setup()
+        precon = prob.model.linear_solver.precon
+        precon.options['refresh_tol'] = 0.1
+
+        prob.run_model()
+        self.assertEqual(precon._num_builds, 1)
+
+        sub = prob.model.poisson._subjacs_info[('poisson.u', 'poisson.u')]
+
+        # small change is below the refresh tolerance
+        sub['value'] *= 1.01
+        prob.model.run_linearize()
+        self.assertEqual(precon._num_builds, 1)
+
+        # large change triggers a rebuild
+        sub['value'] *= 2.0
+        prob.model.run_linearize()
+        self.assertEqual(precon._num_builds, 2)
+
+    def test_double_sellar(self):
+        prob = om.Problem(model=DoubleSellar())
+        model = prob.model
+
+        model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False)
+        model.linear_solver = om.ScipyKrylov(assemble_jac=True)
+        model.linear_solver.precon = om.SparsePrecon(drop_tol=0.0)
+
+        prob.setup()
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        assert_near_equal(prob['g1.y1'], 0.64, .00001)
+        assert_near_equal(prob['g1.y2'], 0.80, .00001)
+        assert_near_equal(prob['g2.y1'], 0.64, .00001)
+        assert_near_equal(prob['g2.y2'], 0.80, .00001)
+
+    def test_requires_assembled_jac(self):
+        prob = om.Problem()
+        prob.model.add_subsystem('p', Poisson1D(n=5))
+        prob.model.linear_solver = om.SparsePrecon(assemble_jac=False)
+
+        prob.setup()
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.final_setup()
+
+        self.assertEqual(str(cm.exception),
+                         "SparsePrecon in <model> <class Group>: SparsePrecon requires an "
+                         "assembled jacobian. Set the 'assemble_jac' option to True.")
+
+
+if __name__ == "__main__":
+    unittest.main()
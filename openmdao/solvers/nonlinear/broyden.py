@@ -37,8 +37,6 @@ class BroydenSolver(NonlinearSolver):
         Most recent change in state vector.
     fxm : ndarray
         Most recent residual.
-    Gm : ndarray
-        Most recent Jacobian matrix.
     linear_solver : LinearSolver
         Linear solver to use for calculating inverse Jacobian.
     linesearch : NonlinearSolver
@@ -49,6 +47,12 @@ class BroydenSolver(NonlinearSolver):
         Most recent state.
     _idx : dict
         Cache of vector indices for each state name.
+    _inv_jac : _LimitedMemoryInverse
+        Inverse Jacobian stored as a base matrix plus a limited number of Broyden updates.
+    _direct_solver : DirectSolver or None
+        Solver used to factor the assembled Jacobian when the linear solver is not direct.
+    _state_rows : ndarray or None
+        Indices of the states in the full linear output vector.
     _computed_jacobians : int
         Number of computed jacobians.
     _converge_failures : int
@@ -83,7 +87,9 @@ class BroydenSolver(NonlinearSolver):
         self.size = 0
         self._idx = {}
         self._recompute_jacobian = True
-        self.Gm = None
+        self._inv_jac = None
+        self._direct_solver = None
+        self._state_rows = None
         self.xm = None
         self.fxm = None
         self.delta_xm = None
@@ -124,6 +130,14 @@ class BroydenSolver(NonlinearSolver):
                                   "Jacobian.")
         self.options.declare('max_jacobians', default=10,
                              desc="Maximum number of jacobians to compute.")
+        self.options.declare('history_size', default=None, types=int, lower=1,
+                             allow_none=True,
+                             desc="Maximum number of Broyden updates stored in the "
+                                  "limited-memory representation of the inverse Jacobian. If "
+                                  "None, all updates are stored. When the limit is reached, the "
+                                  "oldest update is folded into the computed inverse Jacobian, "
+                                  "or dropped if the inverse Jacobian is a scaled identity, "
+                                  "which makes the updates approximate.")
         self.options.declare('state_vars', [], desc="List of the state-variable/residuals that "
                                                     "are to be solved here.")
         self.options.declare('update_broyden', default=True,
@@ -194,7 +208,9 @@ class BroydenSolver(NonlinearSolver):
             n = np.sum(system._owned_sizes)
 
         self.size = n
-        self.Gm = np.empty((n, n))
+        self._inv_jac = _LimitedMemoryInverse(n, self.options['history_size'])
+        self._direct_solver = None
+        self._state_rows = None
         self.xm = np.empty((n, ))
         self.fxm = np.empty((n, ))
         self.delta_xm = None
@@ -297,11 +313,11 @@ class BroydenSolver(NonlinearSolver):
 
         # Convert local storage if we are under complex step.
         if system.under_complex_step:
-            self.Gm = self.Gm.astype(np.complex)
+            self._inv_jac.set_complex_step_mode(True)
             self.xm = self.xm.astype(np.complex)
             self.fxm = self.fxm.astype(np.complex)
         elif np.iscomplexobj(self.xm):
-            self.Gm = self.Gm.real
+            self._inv_jac.set_complex_step_mode(False)
             self.xm = self.xm.real
             self.fxm = self.fxm.real
 
@@ -375,10 +391,10 @@ class BroydenSolver(NonlinearSolver):
         Perform the operations in the iteration loop.
         """
         system = self._system()
-        Gm = self._update_inverse_jacobian()
+        inv_jac = self._update_inverse_jacobian()
         fxm = self.fxm
 
-        delta_xm = -Gm.dot(fxm)
+        delta_xm = -inv_jac.dot(fxm)
 
         if self.linesearch:
             self._solver_info.append_subsolver()
@@ -433,7 +449,6 @@ class BroydenSolver(NonlinearSolver):
         self.delta_fxm = delta_fxm
         self.fxm = fxm
         self.xm = xm
-        self.Gm = Gm
 
     def _update_inverse_jacobian(self):
         """
@@ -441,10 +456,10 @@ class BroydenSolver(NonlinearSolver):
 
         Returns
         -------
-        ndarray
+        _LimitedMemoryInverse
             Updated inverse Jacobian.
         """
-        Gm = self.Gm
+        inv_jac = self._inv_jac
 
         # Apply the Broyden Update approximation to the previous value of the inverse jacobian.
         if self.options['update_broyden'] and not self._recompute_jacobian:
@@ -454,23 +469,35 @@ class BroydenSolver(NonlinearSolver):
             # Sometimes you can get stuck, particularly when enforcing bounds in a linesearch.
             # Make sure we don't update in this case because of divide by zero.
             if fact > self.options['atol']:
-                Gm += np.outer((self.delta_xm - Gm.dot(dfxm)), dfxm * (1.0 / fact**2))
+                inv_jac.update(self.delta_xm, dfxm, dfxm * (1.0 / fact**2))
 
         # Solve for total derivatives of user-requested residuals wrt states.
         elif self.options['compute_jacobian']:
             if self._full_inverse:
-                Gm = self._compute_full_inverse_jacobian()
+                inv_jac.reset(self._compute_full_inverse_jacobian())
             else:
-                Gm = self._compute_inverse_jacobian()
+                inv_jac.reset(self._compute_inverse_jacobian())
 
             self._computed_jacobians += 1
 
         # Set inverse Jacobian to identity scaled by alpha.
         # This is the default starting point used by scipy and the general broyden algorithm.
         else:
-            Gm = np.diag(np.full(self.size, -self.options['alpha'], dtype=Gm.dtype))
+            inv_jac.reset(diag=-self.options['alpha'])
+
+        return inv_jac
+
+    @property
+    def Gm(self):
+        """
+        Return the current inverse Jacobian as a dense matrix.
 
-        return Gm
+        Returns
+        -------
+        ndarray
+            Dense inverse Jacobian.
+        """
+        return self._inv_jac.todense()
 
     def get_vector(self, vec):
         """
@@ -538,25 +565,84 @@ class BroydenSolver(NonlinearSolver):
                 i, j = self._idx[name]
                 linear[name] = dx[i:j]
 
+    def _get_direct_solver(self):
+        """
+        Return a DirectSolver that can factor the Jacobian of our system, or None.
+
+        Returns
+        -------
+        DirectSolver or None
+            The linear solver if it is direct, else a solver that factors the assembled Jacobian
+            of the linear solver, else None.
+        """
+        from openmdao.solvers.linear.direct import DirectSolver
+
+        system = self._system()
+        ln_solver = self.linear_solver
+
+        if system.comm.size > 1:
+            return None
+
+        if isinstance(ln_solver, DirectSolver):
+            return ln_solver
+
+        asm_jac = ln_solver._assembled_jac
+        if asm_jac is None or asm_jac._int_mtx is None:
+            return None
+
+        n = len(system._vectors['output']['linear'])
+        if asm_jac._int_mtx._matrix.shape != (n, n):
+            return None
+
+        if self._direct_solver is None:
+            self._direct_solver = DirectSolver()
+            self._direct_solver._setup_solvers(system, self._depth + 1)
+        self._direct_solver._assembled_jac = asm_jac
+
+        return self._direct_solver
+
+    def _get_state_rows(self):
+        """
+        Return the indices of the states in the full linear output vector.
+
+        Returns
+        -------
+        ndarray
+            Array of indices ordered to match the state vector.
+        """
+        if self._state_rows is None:
+            system = self._system()
+            prom2abs = system._var_allprocs_prom2abs_list['output']
+
+            offsets = {}
+            offset = 0
+            for abs_name, view in system._vectors['output']['linear']._views_flat.items():
+                offsets[abs_name] = offset
+                offset += view.size
+
+            rows = np.empty(self.size, dtype=int)
+            for name in self.options['state_vars']:
+                i, j = self._idx[name]
+                start = offsets[prom2abs[name][0]]
+                rows[i:j] = np.arange(start, start + j - i)
+
+            self._state_rows = rows
+
+        return self._state_rows
+
     def _compute_inverse_jacobian(self):
         """
-        Compute inverse Jacobian for system by doing a linear solve for each state.
+        Compute inverse Jacobian for the states.
+
+        When a direct factorization of the Jacobian is available, all columns are computed with a
+        single multiple right-hand-side solve. Otherwise a linear solve is done for each state.
 
         Returns
         -------
         ndarray
             New inverse Jacobian.
         """
-        # TODO : Consider promoting this capability out into OpenMDAO so other solvers can use the
-        # same code.
-        # TODO : Can do each state in parallel if procs are available.
         system = self._system()
-        states = self.options['state_vars']
-        d_res = system._vectors['residual']['linear']
-        d_out = system._vectors['output']['linear']
-
-        inv_jac = self.Gm
-        d_res.set_val(0.0)
 
         # Disable local fd
         approx_status = system._owns_approx_jac
@@ -571,6 +657,43 @@ class BroydenSolver(NonlinearSolver):
             my_asm_jac._update(system)
         self._linearize()
 
+        direct = self._get_direct_solver()
+        if direct is None:
+            inv_jac = self._compute_inverse_jacobian_columns()
+        else:
+            if direct is not ln_solver:
+                direct._linearize()
+
+            rows = self._get_state_rows()
+            rhs = np.zeros((len(system._vectors['output']['linear']), self.size))
+            rhs[rows, np.arange(self.size)] = 1.0
+
+            inv_jac = direct._solve_multi(rhs)[rows]
+
+        # Enable local fd
+        system._owns_approx_jac = approx_status
+
+        return inv_jac
+
+    def _compute_inverse_jacobian_columns(self):
+        """
+        Compute inverse Jacobian for the states by doing a linear solve for each state.
+
+        Returns
+        -------
+        ndarray
+            New inverse Jacobian.
+        """
+        system = self._system()
+        states = self.options['state_vars']
+        d_res = system._vectors['residual']['linear']
+        d_out = system._vectors['output']['linear']
+        ln_solver = self.linear_solver
+
+        # complex under complex step
+        inv_jac = np.empty((self.size, self.size), dtype=d_out.asarray().dtype)
+        d_res.set_val(0.0)
+
         for wrt_name in states:
             i_wrt, j_wrt = self._idx[wrt_name]
             if wrt_name in d_res:
@@ -593,9 +716,6 @@ class BroydenSolver(NonlinearSolver):
                 if wrt_name in d_res:
                     d_wrt[j] = 0.0
 
-        # Enable local fd
-        system._owns_approx_jac = approx_status
-
         return inv_jac
 
     def _compute_full_inverse_jacobian(self):
@@ -656,3 +776,163 @@ class BroydenSolver(NonlinearSolver):
             self.linear_solver.cleanup()
         if self.linesearch:
             self.linesearch.cleanup()
+
+
+class _LimitedMemoryInverse(object):
+    """
+    Inverse Jacobian stored as a base matrix plus a limited number of rank one updates.
+
+    The represented matrix is G0 + U[:, :k] * V[:, :k]^T, where G0 is either a dense matrix or a
+    scaled identity.  Once the maximum number of updates is stored, the oldest one is folded
+    into G0 to make room for each new one, or dropped if G0 is a scaled identity.  Without a
+    maximum, the storage grows as needed.
+
+    Attributes
+    ----------
+    _base : ndarray or None
+        Dense base matrix, or None if the base is a scaled identity.
+    _diag : float
+        Scale of the identity used when there is no dense base matrix.
+    _U : ndarray
+        Preallocated storage for the update directions.
+    _V : ndarray
+        Preallocated storage for the update weights.
+    _num : int
+        Number of stored updates.
+    _history : int or None
+        Maximum number of stored updates, or None for no limit.
+    """
+
+    def __init__(self, size, history):
+        """
+        Initialize all attributes.
+
+        Parameters
+        ----------
+        size : int
+            Number of states.
+        history : int or None
+            Maximum number of stored updates, or None for no limit.
+        """
+        self._base = None
+        self._diag = 1.0
+        self._history = history
+        ncol = 10 if history is None else history
+        self._U = np.empty((size, ncol))
+        self._V = np.empty((size, ncol))
+        self._num = 0
+
+    def reset(self, base=None, diag=1.0):
+        """
+        Discard all updates and set a new base matrix.
+
+        Parameters
+        ----------
+        base : ndarray or None
+            Dense base matrix, or None for a scaled identity.
+        diag : float
+            Scale of the identity when base is None.
+        """
+        self._base = base
+        self._diag = diag
+        self._num = 0
+
+    def dot(self, vec):
+        """
+        Return the product of the inverse Jacobian with a vector.
+
+        Parameters
+        ----------
+        vec : ndarray
+            Vector to multiply.
+
+        Returns
+        -------
+        ndarray
+            The product.
+        """
+        if self._base is None:
+            prod = self._diag * vec
+        else:
+            prod = self._base.dot(vec)
+
+        k = self._num
+        if k > 0:
+            prod += self._U[:, :k].dot(self._V[:, :k].T.dot(vec))
+
+        return prod
+
+    def update(self, delta_x, delta_f, weight):
+        """
+        Apply the Broyden update G += (delta_x - G * delta_f) * weight^T.
+
+        Parameters
+        ----------
+        delta_x : ndarray
+            Change in the states.
+        delta_f : ndarray
+            Change in the residuals.
+        weight : ndarray
+            Change in the residuals scaled by the inverse of its squared norm.
+        """
+        u = delta_x - self.dot(delta_f)
+
+        if self._num == self._U.shape[1]:
+            if self._history is None:
+                # no limit, so double the storage.
+                self._U = np.hstack((self._U, np.empty_like(self._U)))
+                self._V = np.hstack((self._V, np.empty_like(self._V)))
+            else:
+                # history is full, so fold the oldest update into the dense base if there is
+                # one, or else drop it.
+                if self._base is not None:
+                    self._base += np.outer(self._U[:, 0], self._V[:, 0])
+                self._U[:, :-1] = self._U[:, 1:]
+                self._V[:, :-1] = self._V[:, 1:]
+                self._num -= 1
+
+        k = self._num
+        self._U[:, k] = u
+        self._V[:, k] = weight
+        self._num += 1
+
+    def todense(self):
+        """
+        Return the inverse Jacobian as a dense matrix.
+
+        Returns
+        -------
+        ndarray
+            Dense inverse Jacobian.
+        """
+        size = self._U.shape[0]
+        if self._base is None:
+            dense = np.diag(np.full(size, self._diag, dtype=self._U.dtype))
+        else:
+            dense = self._base.copy()
+
+        k = self._num
+        if k > 0:
+            dense += self._U[:, :k].dot(self._V[:, :k].T)
+
+        return dense
+
+    def set_complex_step_mode(self, active):
+        """
+        Turn on or off complex stepping mode.
+
+        Parameters
+        ----------
+        active : bool
+            Complex mode flag; set to True prior to commencing complex step.
+        """
+        if active:
+            if self._base is not None:
+                self._base = self._base.astype(np.complex)
+            self._U = self._U.astype(np.complex)
+            self._V = self._V.astype(np.complex)
+        else:
+            if self._base is not None:
+                self._base = self._base.real
+            self._U = self._U.real
+            self._V = self._V.real
@@ -1,7 +1,11 @@
 """Define the NewtonSolver class."""
 
 
+from distutils.version import LooseVersion
+
 import numpy as np
+import scipy
+from scipy.sparse.linalg import LinearOperator, gmres
 
 from openmdao.solvers.linesearch.backtracking import BoundsEnforceLS
 from openmdao.solvers.solver import NonlinearSolver
@@ -22,6 +26,15 @@ class NewtonSolver(NonlinearSolver):
         is the parent system's linear solver.
     linesearch : NonlinearSolver
         Line search algorithm. Default is None for no line search.
+    _eta : float
+        Forcing term (relative tolerance of the Krylov solve) for the current Jacobian-free
+        Newton step.
+    _norm_prev : float or None
+        Residual norm at the start of the previous Jacobian-free Newton step.
+    _jfnk_outputs : ndarray or None
+        Output values about which the Jacobian-free directional derivatives are taken.
+    _jfnk_resids : ndarray or None
+        Residual values about which the Jacobian-free directional derivatives are taken.
     """
 
     SOLVER = 'NL: Newton'
@@ -43,6 +56,11 @@ class NewtonSolver(NonlinearSolver):
         # Slot for linesearch
         self.linesearch = BoundsEnforceLS()
 
+        self._eta = 0.0
+        self._norm_prev = None
+        self._jfnk_outputs = None
+        self._jfnk_resids = None
+
     def _declare_options(self):
         """
         Declare options before kwargs are processed in the init method.
@@ -60,6 +78,28 @@ class NewtonSolver(NonlinearSolver):
                              desc='When the option is true, a solver will reraise any '
                              'AnalysisError that arises during subsolve; when false, it will '
                              'continue solving.')
+        self.options.declare('jacobian_free', types=bool, default=False,
+                             desc='When True, compute the Newton step with a Jacobian-free '
+                             'Newton-Krylov method that approximates Jacobian-vector products '
+                             'with directional finite differences of the residuals, so the '
+                             'partial derivatives are never computed.')
+        self.options.declare('jfnk_step', default=1e-7, lower=0.0,
+                             desc='Relative step size for the directional finite differences '
+                             'used when jacobian_free is True.')
+        self.options.declare('jfnk_maxiter', types=int, default=100, lower=1,
+                             desc='Maximum number of Krylov iterations per Newton step when '
+                             'jacobian_free is True.')
+        self.options.declare('jfnk_forcing', default='eisenstat_walker',
+                             values=('eisenstat_walker', 'constant'),
+                             desc='How the relative tolerance of each Krylov solve is chosen '
+                             'when jacobian_free is True. With eisenstat_walker, the tolerance '
+                             'follows the reduction of the residual norm, so early Newton '
+                             'iterations are solved loosely.')
+        self.options.declare('jfnk_eta', default=0.1, lower=0.0, upper=1.0,
+                             desc='Relative tolerance of the first Krylov solve, or of every '
+                             'solve if jfnk_forcing is constant.')
+        self.options.declare('jfnk_eta_max', default=0.9, lower=0.0, upper=1.0,
+                             desc='Upper limit on the Eisenstat-Walker forcing term.')
 
         self.supports['gradients'] = True
         self.supports['implicit_components'] = True
@@ -80,6 +120,10 @@ class NewtonSolver(NonlinearSolver):
 
         self._disallow_discrete_outputs()
 
+        if self.options['jacobian_free'] and system.comm.size > 1:
+            raise RuntimeError("{}: The jacobian_free option is not supported when running "
+                               "under MPI.".format(self.msginfo))
+
         if not isinstance(self.options._dict['solve_subsystems']['value'], bool):
             msg = '{}: solve_subsystems must be set by the user.'
             raise ValueError(msg.format(self.msginfo))
@@ -203,6 +247,9 @@ class NewtonSolver(NonlinearSolver):
         self._run_apply()
         norm = self._iter_get_norm()
 
+        self._eta = self.options['jfnk_eta']
+        self._norm_prev = None
+
         norm0 = norm if norm != 0.0 else 1.0
         return norm0, norm
 
@@ -222,14 +269,19 @@ class NewtonSolver(NonlinearSolver):
 
         system._vectors['residual']['linear'].set_vec(system._residuals)
         system._vectors['residual']['linear'] *= -1.0
-        my_asm_jac = self.linear_solver._assembled_jac
 
-        system._linearize(my_asm_jac, sub_do_ln=do_sub_ln)
-        if (my_asm_jac is not None and system.linear_solver._assembled_jac is not my_asm_jac):
-            my_asm_jac._update(system)
-        self._linearize()
+        if self.options['jacobian_free']:
+            self._jfnk_solve()
+        else:
+            my_asm_jac = self.linear_solver._assembled_jac
+
+            system._linearize(my_asm_jac, sub_do_ln=do_sub_ln)
+            if (my_asm_jac is not None and
+                    system.linear_solver._assembled_jac is not my_asm_jac):
+                my_asm_jac._update(system)
+            self._linearize()
 
-        self.linear_solver.solve(['linear'], 'fwd')
+            self.linear_solver.solve(['linear'], 'fwd')
 
         if self.linesearch:
             self.linesearch._do_subsolve = do_subsolve
@@ -249,6 +301,115 @@ class NewtonSolver(NonlinearSolver):
         # Enable local fd
         system._owns_approx_jac = approx_status
 
+    def _update_forcing_term(self, norm):
+        """
+        Compute the forcing term for the next Jacobian-free Newton step.
+
+        This is choice 2 from Eisenstat and Walker, "Choosing the forcing terms in an inexact
+        Newton method", SIAM J. Sci. Comput., 1996, with their safeguard against the forcing
+        term dropping too quickly.
+
+        Parameters
+        ----------
+        norm : float
+            Norm of the current residual.
+
+        Returns
+        -------
+        float
+            The forcing term.
+        """
+        options = self.options
+        eta_prev = self._eta
+        norm_prev = self._norm_prev
+        self._norm_prev = norm
+
+        if options['jfnk_forcing'] == 'constant' or norm_prev is None or norm_prev == 0.0:
+            return eta_prev
+
+        gamma = 0.9
+        alpha = 2.0
+
+        eta = gamma * (norm / norm_prev) ** alpha
+        safeguard = gamma * eta_prev ** alpha
+        if safeguard > 0.1:
+            eta = max(eta, safeguard)
+
+        # don't solve more tightly than is needed to reach the nonlinear tolerance
+        if norm > 0.0:
+            eta = max(eta, 0.5 * options['atol'] / norm)
+
+        return min(eta, options['jfnk_eta_max'])
+
+    def _jfnk_mat_vec(self, in_arr):
+        """
+        Approximate the product of the Jacobian with a vector by a directional finite difference.
+
+        Parameters
+        ----------
+        in_arr : ndarray
+            The incoming array.
+
+        Returns
+        -------
+        ndarray
+            The approximate Jacobian-vector product.
+        """
+        vnorm = np.linalg.norm(in_arr)
+        if vnorm == 0.0:
+            return np.zeros_like(in_arr)
+
+        system = self._system()
+        outputs = system._outputs
+        u0 = self._jfnk_outputs
+
+        delta = self.options['jfnk_step'] * (1.0 + np.linalg.norm(u0)) / vnorm
+
+        outputs._data[:] = u0 + delta * in_arr
+        system._apply_nonlinear()
+        outputs._data[:] = u0
+
+        return (system._residuals._data - self._jfnk_resids) / delta
+
+    def _jfnk_solve(self):
+        """
+        Solve for the Newton step using Jacobian-free Newton-Krylov.
+
+        The right-hand side is taken from and the step is placed into the linear vectors.
+        """
+        system = self._system()
+        outputs = system._outputs._data
+        resids = system._residuals._data
+
+        if self._jfnk_outputs is None or self._jfnk_outputs.shape != outputs.shape or \
+                self._jfnk_outputs.dtype != outputs.dtype:
+            self._jfnk_outputs = np.empty_like(outputs)
+            self._jfnk_resids = np.empty_like(resids)
+
+        self._jfnk_outputs[:] = outputs
+        self._jfnk_resids[:] = resids
+
+        self._eta = eta = self._update_forcing_term(np.linalg.norm(resids))
+
+        size = outputs.size
+        linop = LinearOperator((size, size), dtype=outputs.dtype, matvec=self._jfnk_mat_vec)
+
+        d_outputs = system._vectors['output']['linear']
+        rhs = system._vectors['residual']['linear'].asarray(copy=True)
+        maxiter = self.options['jfnk_maxiter']
+
+        # a zero initial guess, because the previous step is no guess for this one.
+        x0 = np.zeros(size, dtype=outputs.dtype)
+        if LooseVersion(scipy.__version__) < LooseVersion("1.1"):
+            x, _ = gmres(linop, rhs, x0=x0, restart=maxiter, maxiter=1, tol=eta)
+        else:
+            x, _ = gmres(linop, rhs, x0=x0, restart=maxiter, maxiter=1, tol=eta, atol=0.0)
+
+        # put back the residuals that match the unperturbed outputs
+        resids[:] = self._jfnk_resids
+
+        d_outputs.set_val(x)
+
     def _set_complex_step_mode(self, active):
         """
         Turn on or off complex stepping mode.
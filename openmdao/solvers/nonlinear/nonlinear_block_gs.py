@@ -18,6 +18,11 @@ class NonlinearBlockGS(NonlinearSolver):
     _theta_n_1 : float
         Cached relaxation factor from previous iteration. Only used if the aitken acceleration
         option is turned on.
+    _anderson : dict or None
+        Preallocated ring buffers and counters used by Anderson acceleration.
+    _owned_weights : ndarray or None
+        Array that is zero at output entries duplicated from other procs and one elsewhere. Only
+        used when running under MPI.
     """
 
     SOLVER = 'NL: NLBGS'
@@ -35,6 +40,8 @@ class NonlinearBlockGS(NonlinearSolver):
 
         self._theta_n_1 = 1.0
         self._delta_outputs_n_1 = None
+        self._anderson = None
+        self._owned_weights = None
 
     def _setup_solvers(self, system, depth):
         """
@@ -55,6 +62,9 @@ class NonlinearBlockGS(NonlinearSolver):
             raise RuntimeError('{}: Nonlinear Gauss-Seidel cannot be used on a '
                                'parallel group.'.format(self.msginfo))
 
+        self._anderson = None
+        self._owned_weights = None
+
     def _declare_options(self):
         """
         Declare options before kwargs are processed in the init method.
@@ -69,6 +79,13 @@ class NonlinearBlockGS(NonlinearSolver):
                              desc='upper limit for Aitken relaxation factor')
         self.options.declare('aitken_initial_factor', default=1.0,
                              desc='initial value for Aitken relaxation factor')
+        self.options.declare('use_anderson', types=bool, default=False,
+                             desc='set to True to use Anderson acceleration')
+        self.options.declare('anderson_depth', types=int, default=5, lower=1,
+                             desc='number of previous iterations used by Anderson acceleration')
+        self.options.declare('anderson_beta', default=1.0, lower=0.0, upper=1.0,
+                             desc='mixing factor for Anderson acceleration. A value of 1.0 '
+                                  'applies the full fixed point update.')
         self.options.declare('cs_reconverge', types=bool, default=True,
                              desc='When True, when this driver solves under a complex step, nudge '
                              'the Solution vector by a small amount so that it reconverges.')
@@ -94,9 +111,15 @@ class NonlinearBlockGS(NonlinearSolver):
         system = self._system()
 
         if self.options['use_aitken']:
+            if self.options['use_anderson']:
+                raise RuntimeError("{}: Aitken relaxation and Anderson acceleration cannot be "
+                                   "used at the same time.".format(self.msginfo))
             self._delta_outputs_n_1 = system._outputs.asarray(copy=True)
             self._theta_n_1 = 1.
 
+        if self.options['use_anderson']:
+            self._init_anderson()
+
         # When under a complex step from higher in the hierarchy, sometimes the step is too small
         # to trigger reconvergence, so nudge the outputs slightly so that we always get at least
         # one iteration.
@@ -117,6 +140,10 @@ class NonlinearBlockGS(NonlinearSolver):
         residuals = system._residuals
         use_aitken = self.options['use_aitken']
 
+        if self.options['use_anderson']:
+            # store the outputs going into the iteration
+            self._anderson['x'][:] = outputs._data
+
         if use_aitken:
 
             aitken_min_factor = self.options['aitken_min_factor']
@@ -155,27 +182,12 @@ class NonlinearBlockGS(NonlinearSolver):
                 temp = delta_outputs_n.copy()
                 temp -= delta_outputs_n_1
 
-                # If MPI, piggyback on the residual vector to perform a distributed norm.
-                if system.comm.size > 1:
-                    backup_r = residuals.asarray(copy=True)
-                    residuals.set_val(temp)
-                    temp_norm = residuals.get_norm()
-                else:
-                    temp_norm = np.linalg.norm(temp)
+                temp_norm = self._owned_norm(temp)
 
                 if temp_norm == 0.:
                     temp_norm = 1e-12  # prevent division by 0 below
 
-                # If MPI, piggyback on the output and residual vectors to perform a distributed
-                # dot product.
-                if system.comm.size > 1:
-                    backup_o = outputs.asarray(copy=True)
-                    outputs.set_val(delta_outputs_n)
-                    tddo = residuals.dot(outputs)
-                    residuals.set_val(backup_r)
-                    outputs.set_val(backup_o)
-                else:
-                    tddo = temp.dot(delta_outputs_n)
+                tddo = self._owned_dot(temp, delta_outputs_n)
 
                 theta_n = theta_n_1 * (1 - tddo / temp_norm ** 2)
 
@@ -200,11 +212,151 @@ class NonlinearBlockGS(NonlinearSolver):
             # save update to use in next iteration
             delta_outputs_n_1[:] = delta_outputs_n
 
+        elif self.options['use_anderson']:
+            self._anderson_update(outputs._data)
+
         if not self.options['use_apply_nonlinear']:
             # Residual is the change in the outputs vector.
             with system._unscaled_context(outputs=[outputs], residuals=[residuals]):
                 residuals.set_val(outputs._data - outputs_n)
 
+    def _init_anderson(self):
+        """
+        Allocate (if needed) and reset the Anderson acceleration history.
+        """
+        data = self._system()._outputs._data
+        depth = self.options['anderson_depth']
+        anderson = self._anderson
+
+        if anderson is None or anderson['dF'].shape != (data.size, depth) or \
+           anderson['dF'].dtype != data.dtype:
+            self._anderson = anderson = {
+                'x': np.zeros(data.size, dtype=data.dtype),
+                'f': np.zeros(data.size, dtype=data.dtype),
+                'f_prev': np.zeros(data.size, dtype=data.dtype),
+                'g_prev': np.zeros(data.size, dtype=data.dtype),
+                'dF': np.zeros((data.size, depth), dtype=data.dtype),
+                'dG': np.zeros((data.size, depth), dtype=data.dtype),
+            }
+
+        anderson['head'] = 0
+        anderson['count'] = 0
+        anderson['started'] = False
+
+    def _anderson_update(self, g):
+        """
+        Replace the outputs with the Anderson (type-II) accelerated iterate.
+
+        Parameters
+        ----------
+        g : ndarray
+            Output data after the Gauss-Seidel iteration. Updated in place.
+        """
+        anderson = self._anderson
+        f = anderson['f']
+        dF = anderson['dF']
+        dG = anderson['dG']
+
+        # residual of the fixed point map
+        np.subtract(g, anderson['x'], out=f)
+
+        if anderson['started']:
+            head = anderson['head']
+            np.subtract(f, anderson['f_prev'], out=dF[:, head])
+            np.subtract(g, anderson['g_prev'], out=dG[:, head])
+            anderson['head'] = (head + 1) % dF.shape[1]
+            anderson['count'] = min(anderson['count'] + 1, dF.shape[1])
+
+        anderson['f_prev'][:] = f
+        anderson['g_prev'][:] = g
+        anderson['started'] = True
+
+        k = anderson['count']
+        if k == 0:
+            return
+
+        # Column order doesn't matter for the least squares problem, so the ring buffer can be
+        # used directly.
+        dF_k = dF[:, :k]
+        gram = self._owned_dot(dF_k, dF_k)
+        rhs = self._owned_dot(dF_k, f)
+        gamma = np.linalg.lstsq(np.atleast_2d(gram), np.atleast_1d(rhs), rcond=None)[0]
+
+        g -= dG[:, :k].dot(gamma)
+
+        beta = self.options['anderson_beta']
+        if beta != 1.0:
+            g -= (1.0 - beta) * (f - dF_k.dot(gamma))
+
+    def _get_owned_weights(self):
+        """
+        Return an array that excludes duplicated output entries from distributed sums.
+
+        Returns
+        -------
+        ndarray or None
+            Zero at entries owned by other procs and one elsewhere, or None if not under MPI.
+        """
+        system = self._system()
+        if system.comm.size == 1:
+            return None
+
+        if self._owned_weights is None:
+            outputs = system._outputs
+            weights = np.ones(outputs._data.size)
+            if hasattr(outputs, '_get_dup_inds'):
+                weights[outputs._get_dup_inds()] = 0.0
+            self._owned_weights = weights
+
+        return self._owned_weights
+
+    def _owned_dot(self, a, b):
+        """
+        Compute a dot product of arrays laid out like the outputs, summed across all procs.
+
+        Parameters
+        ----------
+        a : ndarray
+            Array of shape (n,) or (n, k).
+        b : ndarray
+            Array of shape (n,) or (n, k).
+
+        Returns
+        -------
+        float or ndarray
+            The product a^T b.
+        """
+        weights = self._get_owned_weights()
+        if weights is None:
+            return a.T.dot(b)
+
+        if b.ndim == 1:
+            local = a.T.dot(weights * b)
+        else:
+            local = a.T.dot(weights[:, np.newaxis] * b)
+
+        return self._system().comm.allreduce(local)
+
+    def _owned_norm(self, a):
+        """
+        Compute the 2-norm of an array laid out like the outputs across all procs.
+
+        Parameters
+        ----------
+        a : ndarray
+            Array of shape (n,).
+
+        Returns
+        -------
+        float
+            The norm of a.
+        """
+        weights = self._get_owned_weights()
+        if weights is None:
+            return np.linalg.norm(a)
+
+        return np.sqrt(self._system().comm.allreduce(np.sum(weights * np.abs(a) ** 2)))
+
     def _run_apply(self):
         """
         Run the apply_nonlinear method on the system.
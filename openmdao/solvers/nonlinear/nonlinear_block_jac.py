@@ -26,6 +26,8 @@ class NonlinearBlockJac(NonlinearSolver):
                 with multi_proc_fail_check(system.comm):
                     for subsys in system._subsystems_myproc:
                         subsys._solve_nonlinear()
+            elif system._use_workers():
+                system._solve_subsystems_in_workers()
             else:
                 for subsys in system._subsystems_myproc:
                     subsys._solve_nonlinear()
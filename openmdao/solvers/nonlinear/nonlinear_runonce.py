@@ -24,13 +24,24 @@ class NonlinearRunOnce(NonlinearSolver):
         system = self._system()
 
         with Recording('NLRunOnce', 0, self) as rec:
-            # If this is a parallel group, transfer all at once then run each subsystem.
+            # If this is a parallel group, start all transfers at once then run each subsystem
+            # as soon as its own transfer is done.
             if len(system._subsystems_myproc) != len(system._subsystems_allprocs):
-                system._transfer('nonlinear', 'fwd')
+                pending = system._begin_sub_transfers('nonlinear')
+
+                try:
+                    with multi_proc_fail_check(system.comm):
+                        for subsys in system._subsystems_myproc:
+                            system._end_sub_transfers('nonlinear', pending, (subsys.name,))
+                            subsys._solve_nonlinear()
+                finally:
+                    # transfers to subsystems on other procs must be completed here as well
+                    system._end_sub_transfers('nonlinear', pending, list(pending))
 
-                with multi_proc_fail_check(system.comm):
-                    for subsys in system._subsystems_myproc:
-                        subsys._solve_nonlinear()
+            # If the subsystems run in worker processes, transfer all at once then run them.
+            elif system._use_workers():
+                system._transfer('nonlinear', 'fwd')
+                system._solve_subsystems_in_workers()
 
             # If this is not a parallel group, transfer for each subsystem just prior to running it.
             else:
@@ -2,11 +2,13 @@
 
 import os
 import unittest
+import warnings
 
 import numpy as np
 
 import openmdao.api as om
 from openmdao.core.tests.test_distrib_derivs import DistribExecComp
+from openmdao.solvers.nonlinear.broyden import _LimitedMemoryInverse
 from openmdao.test_suite.components.double_sellar import DoubleSellar
 from openmdao.test_suite.components.implicit_newton_linesearch import ImplCompTwoStates
 from openmdao.test_suite.components.sellar import SellarStateConnection, SellarDerivatives, \
@@ -129,6 +131,18 @@ class SpedicatoHuang(om.ImplicitComponent):
             jacobian['y', 'y'][j, j+1] = 1.0 + .5*(y[j+1] - y[j-1])
 
 
+class ScaledSpedicatoHuang(SpedicatoHuang):
+
+    def setup(self):
+
+        self.n = 3
+
+        self.add_input('x', np.array([0, 20]))
+        self.add_output('y', 10.0*np.ones((self.n, )), ref=3.0, res_ref=7.0)
+
+        self.declare_partials(of='y', wrt=['x', 'y'])
+
+
 class TestBryoden(unittest.TestCase):
 
     def test_reraise_error(self):
@@ -621,6 +635,45 @@ class TestBryoden(unittest.TestCase):
         for key, val in totals.items():
             assert_near_equal(val['rel error'][0], 0.0, 1e-6)
 
+    def test_cs_around_broyden_states_iterative(self):
+        # The inverse Jacobian is computed one column at a time, in complex under complex step.
+
+        prob = om.Problem()
+        model = prob.model
+        sub = model.add_subsystem('sub', om.Group(), promotes=['*'])
+
+        model.add_subsystem('px', om.IndepVarComp('x', 1.0), promotes=['x'])
+        model.add_subsystem('pz', om.IndepVarComp('z', np.array([5.0, 2.0])), promotes=['z'])
+
+        sub.add_subsystem('d1', SellarDis1withDerivatives(), promotes=['x', 'z', 'y1', 'y2'])
+        sub.add_subsystem('d2', SellarDis2withDerivatives(), promotes=['z', 'y1', 'y2'])
+
+        model.add_subsystem('obj_cmp', om.ExecComp('obj = x**2 + z[1] + y1 + exp(-y2)',
+                                                z=np.array([0.0, 0.0]), x=0.0),
+                            promotes=['obj', 'x', 'z', 'y1', 'y2'])
+
+        sub.nonlinear_solver = om.BroydenSolver(state_vars=['y1', 'y2'], atol=1e-12, rtol=1e-12)
+        sub.nonlinear_solver.linear_solver = om.LinearBlockGS(atol=1e-14, rtol=1e-14)
+        sub.linear_solver = om.DirectSolver()
+        model.linear_solver = om.DirectSolver()
+
+        prob.model.add_design_var('x', lower=-100, upper=100)
+        prob.model.add_design_var('z', lower=-100, upper=100)
+        prob.model.add_objective('obj')
+
+        prob.setup(check=False, force_alloc_complex=True)
+        prob.set_solver_print(level=0)
+
+        prob.run_model()
+
+        with warnings.catch_warnings():
+            warnings.filterwarnings('error', category=np.ComplexWarning,
+                                    module='openmdao.solvers.nonlinear.broyden')
+            totals = prob.check_totals(method='cs', out_stream=None)
+
+        for key, val in totals.items():
+            assert_near_equal(val['rel error'][0], 0.0, 1e-6)
+
     def test_cs_around_broyden_compute_jac(self):
         # Basic sellar test.
 
@@ -746,6 +799,109 @@ class TestBryoden(unittest.TestCase):
             assert_near_equal(val['rel error'][0], 0.0, 1e-7)
 
 
+    def _check_inverse_jacobian(self, linear_solver, jac_type='csc'):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('p1', om.IndepVarComp('x', np.array([0.5, 20.0])))
+        model.add_subsystem('comp', ScaledSpedicatoHuang())
+        model.add_subsystem('mixed', MixedEquation())
+
+        model.connect('p1.x', 'comp.x')
+
+        model.options['assembled_jac_type'] = jac_type
+        model.nonlinear_solver = om.BroydenSolver()
+        model.nonlinear_solver.options['state_vars'] = ['mixed.x45', 'comp.y', 'mixed.x12']
+        model.nonlinear_solver.linear_solver = linear_solver
+
+        prob.setup()
+        prob.run_model()
+
+        solver = model.nonlinear_solver
+        self.assertTrue(model._has_output_scaling and model._has_resid_scaling)
+        inv_jac = solver._compute_inverse_jacobian()
+        expected = solver._compute_inverse_jacobian_columns()
+
+        assert_near_equal(inv_jac, expected, 1e-12)
+        return solver
+
+    def test_inverse_jacobian_multi_rhs(self):
+        solver = self._check_inverse_jacobian(om.DirectSolver())
+        self.assertIsNone(solver._direct_solver)
+
+    def test_inverse_jacobian_multi_rhs_dense(self):
+        self._check_inverse_jacobian(om.DirectSolver(), jac_type='dense')
+
+    def test_inverse_jacobian_multi_rhs_unassembled(self):
+        self._check_inverse_jacobian(om.DirectSolver(assemble_jac=False))
+
+    def test_inverse_jacobian_assembled_factorization(self):
+        # An iterative linear solver with an assembled jacobian gets a direct factorization.
+        solver = self._check_inverse_jacobian(om.ScipyKrylov(assemble_jac=True))
+        self.assertIsNotNone(solver._direct_solver)
+
+    def test_limited_memory_history(self):
+        # Only history_size updates are kept on top of the scaled identity.
+        for history_size in (2, 3, 10):
+            prob = om.Problem()
+            model = prob.model
+
+            model.add_subsystem('p1', om.IndepVarComp('c', 0.01))
+            model.add_subsystem('vec', VectorEquation())
+            model.connect('p1.c', 'vec.c')
+
+            model.nonlinear_solver = om.BroydenSolver(state_vars=['vec.x'], maxiter=30,
+                                                      compute_jacobian=False,
+                                                      history_size=history_size)
+            prob.setup()
+            prob.run_model()
+
+            assert_near_equal(prob['vec.x'], np.zeros((5, )), 1e-6)
+
+            inv_jac = model.nonlinear_solver._inv_jac
+            self.assertIsNone(inv_jac._base)
+            self.assertLessEqual(inv_jac._num, history_size)
+            self.assertEqual(inv_jac._U.shape, (5, history_size))
+
+    def test_limited_memory_drop_oldest(self):
+        inv_jac = _LimitedMemoryInverse(3, 2)
+        inv_jac.reset(diag=-1.0)
+
+        rng = np.random.default_rng(11)
+        updates = [(rng.random(3), rng.random(3), rng.random(3)) for i in range(3)]
+        pairs = []
+        for dx, df, w in updates:
+            pairs.append((dx - inv_jac.dot(df), w))
+            inv_jac.update(dx, df, w)
+
+        # the first update was dropped
+        expected = -np.eye(3) + sum(np.outer(u, w) for u, w in pairs[1:])
+        assert_near_equal(inv_jac.todense(), expected, 1e-15)
+        assert_near_equal(inv_jac.dot(np.ones(3)), expected.dot(np.ones(3)), 1e-15)
+
+    def test_limited_memory_exact(self):
+        # Without a limit, or with a dense base to fold into, no update is lost.
+        rng = np.random.default_rng(11)
+        base = rng.random((3, 3))
+        updates = [(rng.random(3), rng.random(3), rng.random(3)) for i in range(25)]
+
+        for history, dense in ((None, None), (None, base), (2, base)):
+            inv_jac = _LimitedMemoryInverse(3, history)
+            if dense is None:
+                inv_jac.reset(diag=-1.0)
+                expected = -np.eye(3)
+            else:
+                inv_jac.reset(dense.copy())
+                expected = dense.copy()
+
+            for dx, df, w in updates:
+                expected += np.outer(dx - expected.dot(df), w)
+                inv_jac.update(dx, df, w)
+
+            assert_near_equal(inv_jac.todense(), expected, 1e-10)
+            self.assertLessEqual(inv_jac._num, 25 if history is None else history)
+
+
 # Commented the following test out until we fix the broyden check
 # @unittest.skipUnless(MPI and PETScVector, "only run with MPI and PETSc.")
 # class TestBryodenMPI(unittest.TestCase):
@@ -845,6 +845,112 @@ class TestNewton(unittest.TestCase):
 
 
 
+class Bratu1D(om.ImplicitComponent):
+    """
+    Discretized 1D Bratu problem, -u'' = lam * exp(u), that counts its linearizations.
+    """
+
+    def initialize(self):
+        self.options.declare('n', default=50, types=int)
+        self.num_linearize = 0
+        self.num_apply = 0
+
+    def setup(self):
+        n = self.options['n']
+        self.add_input('lam', 3.0)
+        self.add_output('u', np.zeros(n))
+        self.declare_partials('u', ['u', 'lam'])
+
+        self.h2 = 1.0 / (n + 1) ** 2
+
+    def apply_nonlinear(self, inputs, outputs, residuals):
+        self.num_apply += 1
+        u = outputs['u']
+        Au = 2.0 * u
+        Au[1:] -= u[:-1]
+        Au[:-1] -= u[1:]
+        residuals['u'] = Au / self.h2 - inputs['lam'] * np.exp(u)
+
+    def linearize(self, inputs, outputs, partials):
+        self.num_linearize += 1
+        n = self.options['n']
+        u = outputs['u']
+        A = (2.0 * np.eye(n) - np.eye(n, k=1) - np.eye(n, k=-1)) / self.h2
+        partials['u', 'u'] = A - np.diag(inputs['lam'] * np.exp(u))
+        partials['u', 'lam'] = -np.exp(u)
+
+
+class TestNewtonJacobianFree(unittest.TestCase):
+
+    def _run_bratu(self, **newton_opts):
+        prob = om.Problem()
+        prob.model.add_subsystem('bratu', Bratu1D())
+
+        newton = prob.model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False,
+                                                               atol=1e-10, rtol=1e-12,
+                                                               **newton_opts)
+        prob.model.linear_solver = om.DirectSolver()
+
+        prob.set_solver_print(level=0)
+        prob.setup()
+        prob.run_model()
+
+        return prob, newton
+
+    def test_bratu(self):
+        prob, newton = self._run_bratu()
+        expected = prob.get_val('bratu.u').copy()
+
+        prob, newton = self._run_bratu(jacobian_free=True)
+
+        assert_near_equal(prob.get_val('bratu.u'), expected, 1e-8)
+        self.assertLess(newton._iter_count, 8)
+
+        # the partials are never computed
+        self.assertEqual(prob.model.bratu.num_linearize, 0)
+
+    def test_eisenstat_walker_fewer_residuals(self):
+        prob, newton = self._run_bratu(jacobian_free=True, jfnk_forcing='constant',
+                                       jfnk_eta=1e-6)
+        constant_applies = prob.model.bratu.num_apply
+        expected = prob.get_val('bratu.u').copy()
+
+        prob, newton = self._run_bratu(jacobian_free=True)
+
+        assert_near_equal(prob.get_val('bratu.u'), expected, 1e-8)
+        self.assertLess(prob.model.bratu.num_apply, constant_applies)
+
+    def test_sellar_state_connection(self):
+        newton = om.NewtonSolver(solve_subsystems=False, jacobian_free=True)
+        prob = om.Problem(model=SellarStateConnection(nonlinear_solver=newton))
+
+        prob.set_solver_print(level=0)
+        prob.setup()
+        prob.run_model()
+
+        assert_near_equal(prob.get_val('y1'), 25.58830273, .00001)
+        assert_near_equal(prob['state_eq.y2_command'], 12.05848819, .00001)
+
+        self.assertLess(newton._iter_count, 10)
+
+    def test_sellar_derivatives_after_jfnk(self):
+        # Jacobian-free solves don't change the linear solver used for total derivatives.
+        newton = om.NewtonSolver(solve_subsystems=False, jacobian_free=True)
+        prob = om.Problem(model=SellarDerivatives(nonlinear_solver=newton,
+                                                  linear_solver=om.DirectSolver()))
+
+        prob.set_solver_print(level=0)
+        prob.setup()
+        prob.run_model()
+
+        assert_near_equal(prob.get_val('y1'), 25.58830273, .00001)
+        assert_near_equal(prob.get_val('y2'), 12.05848819, .00001)
+
+        J = prob.compute_totals(of=['obj'], wrt=['x', 'z'])
+        assert_near_equal(J['obj', 'x'][0][0], 2.98061391, .00001)
+        assert_near_equal(J['obj', 'z'][0], [9.61001155, 1.78448534], .00001)
+
+
 class TestNewtonFeatures(unittest.TestCase):
 
     def test_feature_basic(self):
@@ -379,6 +379,107 @@ class TestNLBGaussSeidel(unittest.TestCase):
         #check that the relaxation factor is updated correctly
         assert_near_equal(model.nonlinear_solver._theta_n_1, 1.00, 0.001)
 
+    def test_NLBGS_Anderson(self):
+
+        prob = om.Problem(model=SellarDerivatives())
+        model = prob.model
+        model.nonlinear_solver = om.NonlinearBlockGS()
+
+        prob.setup()
+        model.nonlinear_solver.options['use_anderson'] = True
+        prob.run_model()
+
+        assert_near_equal(prob.get_val('y1'), 25.58830273, .00001)
+        assert_near_equal(prob.get_val('y2'), 12.05848819, .00001)
+
+        # Without acceleration, this takes 8 iterations.
+        self.assertLess(model.nonlinear_solver._iter_count, 7)
+
+    def test_NLBGS_Anderson_apply_nonlinear(self):
+
+        prob = om.Problem(model=SellarDerivatives())
+        model = prob.model
+        model.nonlinear_solver = om.NonlinearBlockGS()
+
+        prob.setup()
+        model.nonlinear_solver.options['use_anderson'] = True
+        model.nonlinear_solver.options['use_apply_nonlinear'] = True
+        prob.run_model()
+
+        assert_near_equal(prob.get_val('y1'), 25.58830273, .00001)
+        assert_near_equal(prob.get_val('y2'), 12.05848819, .00001)
+
+    def test_NLBGS_Anderson_slow_coupling(self):
+
+        def build(**kwargs):
+            n = 10
+            prob = om.Problem()
+            model = prob.model
+
+            coeff = np.linspace(0.85, 0.95, n)
+            model.add_subsystem('c1', om.ExecComp('y1 = a*y2 + 1.0', a=coeff, y1=np.ones(n),
+                                                  y2=np.ones(n)), promotes=['*'])
+            model.add_subsystem('c2', om.ExecComp('y2 = 0.95*y1 - 2.0', y1=np.ones(n),
+                                                  y2=np.ones(n)), promotes=['*'])
+
+            model.nonlinear_solver = om.NonlinearBlockGS(maxiter=500, atol=1e-10, rtol=1e-12,
+                                                         **kwargs)
+            prob.setup()
+            prob.set_solver_print(level=0)
+            prob.run_model()
+
+            y1 = (1.0 - 2.0 * coeff) / (1.0 - 0.95 * coeff)
+            assert_near_equal(prob.get_val('y1'), y1, 1e-8)
+            assert_near_equal(prob.get_val('y2'), 0.95 * y1 - 2.0, 1e-8)
+
+            return model.nonlinear_solver._iter_count
+
+        plain_iters = build()
+        anderson_iters = build(use_anderson=True, anderson_depth=10)
+        damped_iters = build(use_anderson=True, anderson_depth=10, anderson_beta=0.5)
+
+        self.assertGreater(plain_iters, 100)
+        self.assertLess(anderson_iters, 20)
+        self.assertLess(damped_iters, 30)
+
+    def test_NLBGS_Anderson_cs(self):
+
+        prob = om.Problem(model=SellarDerivatives())
+
+        model = prob.model
+        model.approx_totals(method='cs')
+
+        prob.setup()
+        prob.set_solver_print(level=0)
+        model.nonlinear_solver.options['use_anderson'] = True
+        model.nonlinear_solver.options['atol'] = 1e-15
+        model.nonlinear_solver.options['rtol'] = 1e-15
+
+        prob.run_model()
+
+        assert_near_equal(prob.get_val('y1'), 25.58830273, .00001)
+        assert_near_equal(prob.get_val('y2'), 12.05848819, .00001)
+
+        J = prob.compute_totals(of=['y1'], wrt=['x'])
+        assert_near_equal(J['y1', 'x'][0][0], 0.98061448, 1e-6)
+
+    def test_NLBGS_Aitken_Anderson_error(self):
+
+        prob = om.Problem(model=SellarDerivatives())
+        model = prob.model
+        model.nonlinear_solver = om.NonlinearBlockGS()
+
+        prob.setup()
+        model.nonlinear_solver.options['use_aitken'] = True
+        model.nonlinear_solver.options['use_anderson'] = True
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.run_model()
+
+        self.assertEqual(str(cm.exception),
+                         "NonlinearBlockGS in <model> <class SellarDerivatives>: Aitken "
+                         "relaxation and Anderson acceleration cannot be used at the same time.")
+
     def test_NLBGS_Aitken_initial_factor(self):
 
         prob = om.Problem(model=SellarDerivatives())
@@ -591,6 +692,41 @@ class ProcTestCase1(unittest.TestCase):
         # Test that Aitken accelerated the convergence, normally takes 7.
         self.assertTrue(model.nonlinear_solver._iter_count == 6)
 
+    def test_anderson(self):
+
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('px', om.IndepVarComp('x', 1.0), promotes=['x'])
+        model.add_subsystem('pz', om.IndepVarComp('z', np.array([5.0, 2.0])), promotes=['z'])
+
+        p1 = model.add_subsystem('p1', om.ParallelGroup(), promotes=['*'])
+        p1.add_subsystem('d1a', SellarDis1withDerivatives(), promotes=['x', 'z'])
+        p1.add_subsystem('d1b', SellarDis1withDerivatives(), promotes=['x', 'z'])
+
+        p2 = model.add_subsystem('p2', om.ParallelGroup(), promotes=['*'])
+        p2.add_subsystem('d2a', SellarDis2withDerivatives(), promotes=['z'])
+        p2.add_subsystem('d2b', SellarDis2withDerivatives(), promotes=['z'])
+
+        model.connect('d1a.y1', 'd2a.y1')
+        model.connect('d1b.y1', 'd2b.y1')
+        model.connect('d2a.y2', 'd1a.y2')
+        model.connect('d2b.y2', 'd1b.y2')
+
+        model.nonlinear_solver = om.NonlinearBlockGS(use_anderson=True)
+
+        prob.setup()
+        prob.set_solver_print(level=0)
+
+        prob.run_model()
+
+        assert_near_equal(prob.get_val('d1a.y1', get_remote=True), 25.58830273, .00001)
+        assert_near_equal(prob.get_val('d1b.y1', get_remote=True), 25.58830273, .00001)
+        assert_near_equal(prob.get_val('d2a.y2', get_remote=True), 12.05848819, .00001)
+        assert_near_equal(prob.get_val('d2b.y2', get_remote=True), 12.05848819, .00001)
+
+        # Without acceleration, this takes 8 iterations.
+        self.assertLess(model.nonlinear_solver._iter_count, 7)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -192,6 +192,8 @@ class Solver(object):
                                        "Solver is "
                                        "deprecated. Recording of metadata will always be done",
                                        default=True)
+        self.recording_options.declare('record_every', types=int, default=1, lower=1,
+                                       desc='Only record every N-th iteration of the solver')
         self.recording_options.declare('includes', types=list, default=['*'],
                                        desc="Patterns for variables to include in recording. \
                                        Paths are relative to solver's Group. \
@@ -433,6 +435,10 @@ class Solver(object):
         if not self._rec_mgr._recorders:
             return
 
+        # only record every N-th iteration, as numbered in the iteration coordinate
+        if self._recording_iter.stack[-1][1] % self.recording_options['record_every'] != 0:
+            return
+
         metadata = create_local_meta(self.SOLVER)
 
         # Get the data
@@ -783,6 +789,7 @@ class LinearSolver(Solver):
                              desc='Activates use of assembled jacobian by this solver.')
 
         self.supports.declare('assembled_jac', types=bool, default=True)
+        self.supports.declare('warm_start', types=bool, default=False)
 
     def _setup_solvers(self, system, depth):
         """
@@ -913,6 +920,15 @@ class BlockLinearSolver(LinearSolver):
         super()._declare_options()
         self.supports['assembled_jac'] = False
 
+        # iterations start from the current contents of the solution vector
+        self.options.declare('warm_start', default=True, types=bool,
+                             desc='If True and this is the linear solver of the model, the '
+                                  'solution of each total derivative solve is stored and used as '
+                                  'the initial guess of the same solve in the next computation '
+                                  'of the total derivatives. This costs one solution vector of '
+                                  'memory per solve.')
+        self.supports['warm_start'] = True
+
     def _setup_solvers(self, system, depth):
         """
         Assign system instance, set depth, and optionally perform setup.
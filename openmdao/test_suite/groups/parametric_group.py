@@ -27,7 +27,7 @@ class ParametericTestGroup(Group):
         self.total_wrt = None
         self.expected_values = None
         self.default_params = {
-            'local_vector_class': ['default', 'petsc'],
+            'local_vector_class': ['default', 'lazy', 'petsc'],
             'assembled_jac': [True, False],
             'jacobian_type': ['matvec', 'dense', 'sparse-csc'],
         }
@@ -35,7 +35,7 @@ class ParametericTestGroup(Group):
         super().__init__()
 
         self.options.declare('local_vector_class', default='default',
-                             values=['default', 'petsc'],
+                             values=['default', 'lazy', 'petsc'],
                              desc='Which local vector implementation to use.')
         self.options.declare('assembled_jac', default=True,
                              types=bool,
@@ -13,6 +13,7 @@ from openmdao.solvers.linear.scipy_iter_solver import ScipyKrylov
 from openmdao.solvers.nonlinear.newton import NewtonSolver
 from openmdao.test_suite.groups.cycle_group import CycleGroup
 from openmdao.vectors.default_vector import DefaultVector
+from openmdao.vectors.lazy_vector import LazyVector
 
 try:
     from openmdao.vectors.petsc_vector import PETScVector
@@ -186,6 +187,8 @@ class ParameterizedInstance(object):
         local_vec_class = args.get('local_vector_class', 'default')
         if local_vec_class == 'default':
             vec_class = DefaultVector
+        elif local_vec_class == 'lazy':
+            vec_class = LazyVector
         elif local_vec_class == 'petsc':
             vec_class = PETScVector
             if PETScVector is None:
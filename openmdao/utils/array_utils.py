@@ -2,12 +2,38 @@
 Utils for dealing with arrays.
 """
 import sys
+import mmap
 from itertools import product
 from copy import copy
 
 import numpy as np
 
 
+def shared_zeros(size):
+    """
+    Return a float array of zeros in memory that is shared with forked child processes.
+
+    Writes to the array by a child process forked after its creation are seen by the parent,
+    and vice versa.  The memory is released along with the array.
+
+    Parameters
+    ----------
+    size : int
+        Length of the array.
+
+    Returns
+    -------
+    ndarray
+        Array of zeros.
+    """
+    size = int(size)
+    if size == 0:
+        return np.zeros(0)
+
+    # anonymous maps are zero filled, and they're inherited as shared memory when forking
+    return np.frombuffer(mmap.mmap(-1, size * np.dtype(float).itemsize), dtype=float)
+
+
 def shape_to_len(shape):
     """
     Compute length given a shape tuple.
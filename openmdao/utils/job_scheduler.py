@@ -0,0 +1,204 @@
+"""Define the JobScheduler class, used to run external codes asynchronously."""
+import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+from openmdao.core.analysis_error import AnalysisError
+from openmdao.utils.shell_proc import DEV_NULL, ShellProc
+
+
+class JobScheduler(object):
+    """
+    Run commands asynchronously on this machine, each in its own scratch directory.
+
+    At most max_jobs commands run at the same time, and the others wait in a queue.  Each
+    running job has a thread that blocks until its process exits, so waiting for the jobs
+    doesn't use the CPU.
+
+    Attributes
+    ----------
+    max_jobs : int
+        Maximum number of jobs that run at the same time.
+    root_dir : str or None
+        Directory in which the scratch directories are created.
+    keep_dirs : bool
+        If True, the scratch directories are kept after the jobs are done.
+    _executor : ThreadPoolExecutor
+        Threads that run the jobs.
+    """
+
+    def __init__(self, max_jobs=None, root_dir=None, keep_dirs=False):
+        """
+        Initialize attributes.
+
+        Parameters
+        ----------
+        max_jobs : int or None
+            Maximum number of jobs that run at the same time.  Defaults to the number of CPUs.
+        root_dir : str or None
+            Directory in which the scratch directories are created.  Defaults to the system
+            temporary directory.
+        keep_dirs : bool
+            If True, the scratch directories are kept after the jobs are done.
+        """
+        self.max_jobs = max_jobs or os.cpu_count() or 1
+        self.root_dir = root_dir
+        self.keep_dirs = keep_dirs
+        self._executor = ThreadPoolExecutor(self.max_jobs)
+
+    def __enter__(self):
+        """
+        Enter a context in which the scheduler is used.
+
+        Returns
+        -------
+        JobScheduler
+            This scheduler.
+        """
+        return self
+
+    def __exit__(self, *args):
+        """
+        Wait for the submitted jobs and stop the threads when leaving the context.
+
+        Parameters
+        ----------
+        *args : list
+            Exception information, if any.
+        """
+        self.shutdown()
+
+    def submit(self, command, prepare=None, parse=None, env_vars=None, timeout=0.,
+               allowed_return_codes=(0,), input_files=(), output_files=(),
+               err_class=RuntimeError):
+        """
+        Queue a job that runs the given command in a new scratch directory.
+
+        Parameters
+        ----------
+        command : list or str
+            Command to be executed in the scratch directory.  If command is a str, it runs in
+            a shell.
+        prepare : function or None
+            Function called with the scratch directory before the command runs, e.g. to write
+            the input files with an InputFileGenerator.
+        parse : function or None
+            Function called with the scratch directory after the command ran successfully, e.g.
+            to read the output files with a FileParser.  Its return value is the result of the
+            job.
+        env_vars : dict or None
+            Environment variables required by the command.
+        timeout : float
+            Maximum time to wait for the command to complete.  A value of zero implies an
+            infinite wait.
+        allowed_return_codes : iter of int
+            Return codes that are considered successful.
+        input_files : iter of str
+            Files, relative to the scratch directory, that must exist before the command runs.
+        output_files : iter of str
+            Files, relative to the scratch directory, that must exist after the command ran.
+        err_class : type
+            Class of the exception raised if the command fails or files are missing.
+
+        Returns
+        -------
+        Future
+            Future whose result is the return value of parse, or the return code of the command
+            if parse is None.
+        """
+        return self._executor.submit(self._run_job, command, prepare, parse, env_vars, timeout,
+                                     allowed_return_codes, input_files, output_files, err_class)
+
+    def shutdown(self, wait=True):
+        """
+        Stop accepting jobs and stop the threads once the submitted jobs are done.
+
+        Parameters
+        ----------
+        wait : bool
+            If True, wait for the submitted jobs to be done.
+        """
+        self._executor.shutdown(wait=wait)
+
+    def _run_job(self, command, prepare, parse, env_vars, timeout, allowed_return_codes,
+                 input_files, output_files, err_class):
+        """
+        Run a job in a new scratch directory.
+
+        Parameters
+        ----------
+        command : list or str
+            Command to be executed in the scratch directory.
+        prepare : function or None
+            Function called with the scratch directory before the command runs.
+        parse : function or None
+            Function called with the scratch directory after the command ran successfully.
+        env_vars : dict or None
+            Environment variables required by the command.
+        timeout : float
+            Maximum time to wait for the command to complete.
+        allowed_return_codes : iter of int
+            Return codes that are considered successful.
+        input_files : iter of str
+            Files that must exist before the command runs.
+        output_files : iter of str
+            Files that must exist after the command ran.
+        err_class : type
+            Class of the exception raised if the command fails or files are missing.
+
+        Returns
+        -------
+        object
+            The return value of parse, or the return code of the command if parse is None.
+        """
+        job_dir = tempfile.mkdtemp(prefix='job_', dir=self.root_dir)
+        try:
+            if prepare is not None:
+                prepare(job_dir)
+
+            missing = _missing_files(job_dir, input_files)
+            if missing:
+                raise err_class("The following input files are missing: %s" % missing)
+
+            stderr = os.path.join(job_dir, 'stderr.out')
+            process = ShellProc(command, DEV_NULL, os.path.join(job_dir, 'stdout.out'), stderr,
+                                env_vars, cwd=job_dir)
+            return_code, _ = process.wait(timeout=timeout)
+
+            if return_code is None:
+                raise AnalysisError('Timed out after %s sec.' % timeout)
+
+            if return_code not in allowed_return_codes:
+                with open(stderr, 'r') as stderrfile:
+                    error_desc = stderrfile.read()
+                raise err_class('return_code = %d\nError Output:\n%s' % (return_code, error_desc))
+
+            missing = _missing_files(job_dir, output_files)
+            if missing:
+                raise err_class("The following output files are missing: %s" % missing)
+
+            return return_code if parse is None else parse(job_dir)
+
+        finally:
+            if not self.keep_dirs:
+                shutil.rmtree(job_dir, ignore_errors=True)
+
+
+def _missing_files(job_dir, files):
+    """
+    Return the files that don't exist in the given directory.
+
+    Parameters
+    ----------
+    job_dir : str
+        The directory.
+    files : iter of str
+        Names of the files, relative to the directory.
+
+    Returns
+    -------
+    list of str
+        Sorted names of the missing files.
+    """
+    return sorted(f for f in files if not os.path.exists(os.path.join(job_dir, f)))
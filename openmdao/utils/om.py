@@ -70,6 +70,12 @@ def _n2_setup_parser(parser):
     parser.add_argument('--use_declare_partial_info', action='store_true',
                         dest='use_declare_partial_info',
                         help="ignored, now always true.")
+    parser.add_argument('--compact', action='store_true', dest='compact',
+                        help="store the model data in the compact format used for large models.")
+    parser.add_argument('--lazy_depth', default=None, type=int, action='store',
+                        dest='lazy_depth',
+                        help="with --compact, depth of the subtrees whose nodes and details are "
+                        "only loaded when expanded.")
 
 
 def _n2_cmd(options, user_args):
@@ -96,7 +102,8 @@ def _n2_cmd(options, user_args):
 
         def _viewmod(prob):
             n2(prob, outfile=options.outfile, show_browser=not options.no_browser,
-                title=options.title, embeddable=options.embeddable)
+                title=options.title, embeddable=options.embeddable, compact=options.compact,
+                lazy_depth=options.lazy_depth)
             exit()  # could make this command line selectable later
 
         hooks._register_hook('setup', 'Problem', pre=_noraise)
@@ -107,7 +114,8 @@ def _n2_cmd(options, user_args):
     else:
         # assume the file is a recording, run standalone
         n2(filename, outfile=options.outfile, title=options.title,
-            show_browser=not options.no_browser, embeddable=options.embeddable)
+            show_browser=not options.no_browser, embeddable=options.embeddable,
+            compact=options.compact, lazy_depth=options.lazy_depth)
 
 
 def _view_connections_setup_parser(parser):
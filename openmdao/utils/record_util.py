@@ -173,8 +173,8 @@ def deserialize(json_data, abs2meta, prom2abs, conns):
 
     Parameters
     ----------
-    json_data : string
-        JSON encoded data
+    json_data : string or dict
+        JSON encoded data, or a dict of values that has already been decoded.
     abs2meta : dict
         Dictionary mapping absolute variable names to variable metadata
     prom2abs : dict
@@ -188,7 +188,7 @@ def deserialize(json_data, abs2meta, prom2abs, conns):
     array or dict
         Variable names and values parsed from the JSON string
     """
-    values = json.loads(json_data)
+    values = json_data if isinstance(json_data, dict) else json.loads(json_data)
     if values is None:
         return None
 
@@ -202,7 +202,7 @@ def deserialize(json_data, abs2meta, prom2abs, conns):
             src_name = conns[abs_name[0]]
             has_shape = 'shape' in abs2meta[src_name]
 
-        if isinstance(value, list) and has_shape:
+        if isinstance(value, (list, np.ndarray)) and has_shape:
             values[name] = np.asarray(value)  # array will be proper shape based on list structure
         else:
             all_array = False
@@ -0,0 +1,188 @@
+"""Cache of setup results that only depend on the structure of a model."""
+
+import os
+import pickle
+import marshal
+import hashlib
+
+import numpy as np
+
+
+def _structure_key(model, mode):
+    """
+    Return a hash of the structure of the given model.
+
+    Only the things that the cached setup products depend on are hashed, i.e. the systems,
+    the names, promoted names, shapes and src_indices of the variables, the connections, the
+    design variables and responses, and the derivative settings.  Variable values and system
+    options only matter as far as they change one of these.
+
+    Parameters
+    ----------
+    model : <System>
+        The top level system, after its connections and variable shapes are known.
+    mode : str
+        Derivative direction, either 'fwd', 'rev' or 'auto'.
+
+    Returns
+    -------
+    str
+        Hex digest of the structure hash.
+    """
+    # everything but index arrays goes into one big list that is serialized in one go, because
+    # hashing each item separately would cost about as much as the setup work being cached
+    items = [mode, model._use_derivatives, model._problem_meta['vec_names']]
+    arrays = []
+
+    items.extend((s.pathname, type(s).__module__, type(s).__qualname__)
+                 for s in model.system_iter(include_self=True, recurse=True))
+
+    for io in ('input', 'output'):
+        abs2prom = model._var_allprocs_abs2prom[io]
+        items.extend((name, abs2prom[name], meta['shape'], meta['distributed'])
+                     for name, meta in model._var_allprocs_abs2meta[io].items())
+        items.extend(model._var_allprocs_discrete[io])
+
+    for name, meta in model._var_abs2meta['input'].items():
+        if meta['src_indices'] is not None:
+            items.append((name, meta['flat_src_indices']))
+            arrays.append(meta['src_indices'])
+
+    items.extend(model._conn_global_abs_in2out.items())
+
+    for vois in (model.get_design_vars(recurse=True, get_sizes=False, use_prom_ivc=False),
+                 model.get_responses(recurse=True, get_sizes=False, use_prom_ivc=False)):
+        for name, meta in vois.items():
+            items.append((name, meta.get('type'), meta.get('linear'),
+                          meta['parallel_deriv_color'], meta['vectorize_derivs']))
+            arrays.append(meta['indices'])
+
+    try:
+        # version 2 doesn't write references, so equal items always give equal bytes
+        hsh = hashlib.sha1(marshal.dumps(items, 2))
+    except ValueError:  # something that marshal doesn't handle, e.g. a numpy int in a shape
+        hsh = hashlib.sha1(repr(items).encode())
+    for arr in arrays:
+        if isinstance(arr, np.ndarray) and arr.dtype != object:
+            hsh.update(repr((arr.shape, arr.dtype.str)).encode())
+            hsh.update(np.ascontiguousarray(arr).tobytes())
+        else:
+            hsh.update(repr(arr).encode())
+
+    return hsh.hexdigest()
+
+
+class SetupCache(object):
+    """
+    Setup products of a model, persisted to disk and keyed by a hash of the model structure.
+
+    Products are stored pickled, so values returned by the cache never share data with values
+    computed in an earlier setup.
+
+    Attributes
+    ----------
+    _directory : str
+        Directory containing the cache files.
+    _key : str or None
+        Hash of the structure of the current model, or None if it isn't known yet.
+    _products : dict
+        Pickled setup products keyed by product name.
+    _dirty : bool
+        True if products have been added since the cache file was read.
+    """
+
+    def __init__(self, directory):
+        """
+        Initialize attributes.
+
+        Parameters
+        ----------
+        directory : str
+            Directory containing the cache files.
+        """
+        self._directory = directory
+        self._key = None
+        self._products = {}
+        self._dirty = False
+
+    def _get_fname(self):
+        """
+        Return the name of the cache file of the current model structure.
+
+        Returns
+        -------
+        str
+            Cache file name.
+        """
+        return os.path.join(self._directory, 'setup_%s.pkl' % self._key)
+
+    def set_structure(self, model, mode):
+        """
+        Compute the structure hash of the given model and read any products cached for it.
+
+        Parameters
+        ----------
+        model : <System>
+            The top level system, after its connections and variable shapes are known.
+        mode : str
+            Derivative direction, either 'fwd', 'rev' or 'auto'.
+        """
+        key = _structure_key(model, mode)
+        if key == self._key:
+            return
+
+        self._key = key
+        self._products = {}
+        self._dirty = False
+
+        fname = self._get_fname()
+        if os.path.isfile(fname):
+            try:
+                with open(fname, 'rb') as f:
+                    self._products = pickle.load(f)
+            except Exception:
+                # an unreadable cache file is treated like a missing one and rewritten
+                self._dirty = True
+
+    def get(self, name, func, *args):
+        """
+        Return the named setup product, calling func(*args) to compute it if it isn't cached.
+
+        Parameters
+        ----------
+        name : hashable
+            Name of the product.
+        func : function
+            Function computing the product.
+        *args : list
+            Arguments of func.
+
+        Returns
+        -------
+        object
+            The setup product.
+        """
+        if name in self._products:
+            return pickle.loads(self._products[name])
+
+        product = func(*args)
+        if self._key is not None:
+            self._products[name] = pickle.dumps(product, pickle.HIGHEST_PROTOCOL)
+            self._dirty = True
+
+        return product
+
+    def save(self):
+        """
+        Write the products of the current model structure to disk if any were added.
+        """
+        if not self._dirty:
+            return
+
+        if not os.path.exists(self._directory):
+            os.makedirs(self._directory)
+
+        with open(self._get_fname(), 'wb') as f:
+            pickle.dump(self._products, f, pickle.HIGHEST_PROTOCOL)
+
+        self._dirty = False
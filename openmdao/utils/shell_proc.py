@@ -1,9 +1,9 @@
 """Some basic shell utilities, used for ExternalCodeComp mostly."""
 import os
+import select
 import signal
 import subprocess
 import sys
-import time
 
 PIPE = subprocess.PIPE
 STDOUT = subprocess.STDOUT
@@ -77,7 +77,7 @@ class ShellProc(subprocess.Popen):
     """
 
     def __init__(self, args, stdin=None, stdout=None, stderr=None, env=None,
-                 universal_newlines=False):
+                 universal_newlines=False, cwd=None):
         """
         Initialize.
 
@@ -104,6 +104,8 @@ class ShellProc(subprocess.Popen):
             Environment variables for the command.
         universal_newlines : bool
             Set to True to turn on universal newlines.
+        cwd : str or None
+            Directory the command runs in.  Defaults to the current directory.
         """
         environ = os.environ.copy()
         if env:
@@ -135,12 +137,12 @@ class ShellProc(subprocess.Popen):
                 subprocess.Popen.__init__(self, args, stdin=self._inp,
                                           stdout=self._out, stderr=self._err,
                                           shell=shell, env=environ,
-                                          universal_newlines=universal_newlines)
+                                          universal_newlines=universal_newlines, cwd=cwd)
             else:
                 subprocess.Popen.__init__(self, args, stdin=self._inp,
                                           stdout=self._out, stderr=self._err,
                                           shell=shell, env=environ,
-                                          universal_newlines=universal_newlines,
+                                          universal_newlines=universal_newlines, cwd=cwd,
                                           # setsid to put this and any children in
                                           # same process group so we can kill them
                                           # all if necessary
@@ -191,18 +193,17 @@ class ShellProc(subprocess.Popen):
 
     def wait(self, poll_delay=0., timeout=0.):
         """
-        Poll for command completion or timeout.
+        Wait for command completion or timeout.
 
         Closes any files implicitly opened.
 
         Parameters
         ----------
         poll_delay : float (seconds)
-            Time to delay between polling for command completion.
-            A value of zero uses an internal default.
+            Not used.  Completion is detected as soon as the process exits.
         timeout : float (seconds)
             Maximum time to wait for command completion.
-            A value of zero implies an infinite maximum wait.
+            A value of zero or None implies an infinite maximum wait.
 
         Returns
         -------
@@ -213,20 +214,9 @@ class ShellProc(subprocess.Popen):
         """
         return_code = None
         try:
-            if poll_delay <= 0:
-                poll_delay = max(0.1, timeout / 100.)
-                poll_delay = min(10., poll_delay)
-            npolls = int(timeout / poll_delay) + 1
-
-            time.sleep(poll_delay)
-            return_code = self.poll()
-            while return_code is None:
-                npolls -= 1
-                if (timeout > 0) and (npolls < 0):
-                    self.terminate()
-                    break
-                time.sleep(poll_delay)
-                return_code = self.poll()
+            return_code = self._wait_for_exit(timeout)
+            if return_code is None:
+                self.terminate()
         finally:
             self.close_files()
 
@@ -237,6 +227,42 @@ class ShellProc(subprocess.Popen):
             self.errormsg = 'Timed out'
         return (return_code, self.errormsg)
 
+    def _wait_for_exit(self, timeout):
+        """
+        Block until the process exits or the timeout expires.
+
+        Parameters
+        ----------
+        timeout : float (seconds) or None
+            Maximum time to wait.  A value of zero or None implies an infinite wait.
+
+        Returns
+        -------
+        int or None
+            Return code, or None if the timeout expired.
+        """
+        if not timeout:
+            return subprocess.Popen.wait(self)
+
+        # Popen.wait polls when given a timeout, so wait for a process file descriptor to
+        # become readable instead where the platform has them.
+        if hasattr(os, 'pidfd_open'):
+            try:
+                pidfd = os.pidfd_open(self.pid)
+            except OSError:
+                pass
+            else:
+                try:
+                    select.select([pidfd], [], [], timeout)
+                finally:
+                    os.close(pidfd)
+                return self.poll()
+
+        try:
+            return subprocess.Popen.wait(self, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            return None
+
     def error_message(self, return_code):
         """
         Return error message for `return_code`.
@@ -0,0 +1,138 @@
+""" Unit tests for the setup cache. """
+import os
+import unittest
+
+import numpy as np
+
+import openmdao.api as om
+from openmdao.test_suite.components.sellar import SellarProblem
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.general_utils import ContainsAll
+from openmdao.utils.testing_utils import use_tempdirs
+
+
+def _get_xfer_idxs(prob):
+    xfers = {}
+    for group in prob.model.system_iter(include_self=True, recurse=True, typ=om.Group):
+        for vec_name, xfer_dict in group._transfers.items():
+            for direction, xfer in xfer_dict.items():
+                for sub, x in xfer.items():
+                    if x is not None:
+                        xfers[group.pathname, vec_name, direction, sub] = \
+                            (x._in_inds.copy(), x._out_inds.copy())
+    return xfers
+
+
+@use_tempdirs
+class TestSetupCache(unittest.TestCase):
+
+    def test_same_results(self):
+        expected = SellarProblem()
+        expected.setup()
+        expected.run_model()
+        J_expected = expected.compute_totals()
+
+        for i in range(2):
+            prob = SellarProblem()
+            prob.options['setup_cache_dir'] = 'setup_cache'
+            prob.setup()
+            cache = prob._metadata['setup_cache']
+            prob.run_model()
+
+            # the first setup fills the cache file, the second reuses it
+            self.assertEqual(len(os.listdir('setup_cache')), 1)
+            groups = prob.model.system_iter(include_self=True, recurse=True, typ=om.Group)
+            self.assertEqual(sorted(cache._products, key=str),
+                             sorted(['relevant'] + [('transfers', g.pathname) for g in groups],
+                                    key=str))
+
+            relevant = prob.model._relevant
+            self.assertEqual(sorted(relevant), sorted(expected.model._relevant))
+            for voi in relevant:
+                if voi in ('linear', 'nonlinear'):
+                    self.assertIsInstance(relevant[voi]['@all'][1], ContainsAll)
+                else:
+                    self.assertEqual(relevant[voi], expected.model._relevant[voi])
+
+            exp_xfers = _get_xfer_idxs(expected)
+            xfers = _get_xfer_idxs(prob)
+            self.assertEqual(set(xfers), set(exp_xfers))
+            for key, (in_inds, out_inds) in xfers.items():
+                np.testing.assert_array_equal(in_inds, exp_xfers[key][0])
+                np.testing.assert_array_equal(out_inds, exp_xfers[key][1])
+
+            assert_near_equal(prob['obj'], expected['obj'], 1e-12)
+            J = prob.compute_totals()
+            for key, val in J_expected.items():
+                assert_near_equal(J[key], val, 1e-10)
+
+    def test_key(self):
+        keys = set()
+        for x, extra_con, mode in ((1.0, False, 'auto'), (3.0, False, 'auto'),
+                                   (1.0, True, 'auto'), (1.0, False, 'rev')):
+            prob = SellarProblem()
+            prob.options['setup_cache_dir'] = 'setup_cache'
+            if extra_con:
+                prob.model.add_constraint('y1', upper=10.0)
+            prob.setup(mode=mode)
+            prob['x'] = x
+            prob.final_setup()
+            keys.add(prob._metadata['setup_cache']._key)
+
+        # changing a value doesn't change the structure, the other changes do
+        self.assertEqual(len(keys), 3)
+        self.assertEqual(len(os.listdir('setup_cache')), 3)
+
+    def test_new_values(self):
+        prob = SellarProblem()
+        prob.options['setup_cache_dir'] = 'setup_cache'
+        prob.setup()
+        prob.run_model()
+
+        # the second problem reuses the cached setup at a different point
+        prob = SellarProblem()
+        prob.options['setup_cache_dir'] = 'setup_cache'
+        prob.setup()
+        prob['x'] = 3.0
+        prob.run_model()
+
+        expected = SellarProblem()
+        expected.setup()
+        expected['x'] = 3.0
+        expected.run_model()
+
+        assert_near_equal(prob['obj'], expected['obj'], 1e-12)
+        assert_near_equal(prob['y1'], expected['y1'], 1e-12)
+
+    def test_bad_cache_file(self):
+        prob = SellarProblem()
+        prob.options['setup_cache_dir'] = 'setup_cache'
+        prob.setup()
+        prob.final_setup()
+        fname = os.path.join('setup_cache', os.listdir('setup_cache')[0])
+
+        with open(fname, 'wb') as f:
+            f.write(b'not a pickle')
+
+        prob = SellarProblem()
+        prob.options['setup_cache_dir'] = 'setup_cache'
+        prob.setup()
+        prob.run_model()
+        assert_near_equal(prob['obj'], 28.58830817, 1e-6)
+
+        # the bad file was replaced
+        prob = SellarProblem()
+        prob.options['setup_cache_dir'] = 'setup_cache'
+        prob.setup()
+        self.assertIn('relevant', prob._metadata['setup_cache']._products)
+
+    def test_unused(self):
+        prob = SellarProblem()
+        prob.setup()
+        prob.final_setup()
+        self.assertIsNone(prob._metadata['setup_cache'])
+        self.assertFalse(os.path.exists('setup_cache'))
+
+
+if __name__ == '__main__':
+    unittest.main()
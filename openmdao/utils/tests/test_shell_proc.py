@@ -91,6 +91,19 @@ class TestCase(unittest.TestCase):
         else:
             self.assertEqual(msg, ': SIGTERM')
 
+    def test_wait(self):
+        os.mkdir('sub')
+        proc = ShellProc([sys.executable, '-c', 'open("out", "w").close()'], cwd='sub')
+        return_code, error_msg = proc.wait()
+        self.assertEqual(return_code, 0)
+        self.assertTrue(os.path.exists(os.path.join('sub', 'out')))
+
+        proc = ShellProc([sys.executable, '-c', 'import time; time.sleep(60)'])
+        return_code, error_msg = proc.wait(timeout=0.5)
+        self.assertEqual(return_code, None)
+        self.assertEqual(error_msg, 'Timed out')
+        proc.wait()
+
 
 if __name__ == '__main__':
     unittest.main()
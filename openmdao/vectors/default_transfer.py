@@ -14,6 +14,11 @@ from openmdao.utils.mpi import MPI
 _empty_idx_array = np.array([], dtype=INT_DTYPE)
 
 
+# Runs of consecutive indices shorter than this are cheaper to transfer with fancy indexing than
+# with one slice copy each (the per-copy overhead is roughly that of indexing 200 entries).
+_MIN_BLOCK_SIZE = 200
+
+
 def _merge(indices_list):
     if len(indices_list) > 0:
         return np.concatenate(indices_list)
@@ -21,11 +26,105 @@ def _merge(indices_list):
         return _empty_idx_array
 
 
+def _compile_blocks(in_inds, out_inds, min_block_size=_MIN_BLOCK_SIZE):
+    """
+    Split a pair of transfer index arrays into contiguous blocks and scattered indices.
+
+    Parameters
+    ----------
+    in_inds : int ndarray
+        Input indices for the transfer.
+    out_inds : int ndarray
+        Output indices for the transfer.
+    min_block_size : int
+        Minimum length of a run of consecutive indices that becomes a block.
+
+    Returns
+    -------
+    list of (slice, slice)
+        (input slice, output slice) pairs of the contiguous blocks.
+    int ndarray
+        Input indices that aren't part of a block.
+    int ndarray
+        Output indices that aren't part of a block.
+    """
+    size = len(in_inds)
+    if size < min_block_size:
+        return [], in_inds, out_inds
+
+    # a run ends wherever either the input or the output indices stop increasing by one
+    breaks = np.nonzero((np.diff(in_inds) != 1) | (np.diff(out_inds) != 1))[0] + 1
+    starts = np.concatenate(([0], breaks))
+    ends = np.concatenate((breaks, [size]))
+    isblock = ends - starts >= min_block_size
+
+    if not np.any(isblock):
+        return [], in_inds, out_inds
+
+    blocks = []
+    mask = np.ones(size, dtype=bool)
+    for start, end in zip(starts[isblock], ends[isblock]):
+        istart = in_inds[start]
+        ostart = out_inds[start]
+        blocks.append((slice(istart, istart + end - start), slice(ostart, ostart + end - start)))
+        mask[start:end] = False
+
+    return blocks, in_inds[mask], out_inds[mask]
+
+
 class DefaultTransfer(Transfer):
     """
     Default NumPy transfer.
+
+    Contiguous runs of the transfer indices are copied as slices and only the remaining
+    (scattered) indices use fancy indexing.
+
+    Attributes
+    ----------
+    _blocks : list of (slice, slice)
+        (input slice, output slice) pairs of the contiguous parts of the transfer.
+    _scat_in_inds : int ndarray
+        input indices of the scattered part of the transfer.
+    _scat_out_inds : int ndarray
+        output indices of the scattered part of the transfer.
+    _scat_out_uniq : int ndarray or None
+        unique output indices of the scattered part of the transfer, or None if the scattered
+        output indices have no duplicates.
+    _scat_out_inv : int ndarray or None
+        position of each scattered output index in _scat_out_uniq, or None if the scattered
+        output indices have no duplicates.
     """
 
+    def __init__(self, in_vec, out_vec, in_inds, out_inds, comm):
+        """
+        Initialize all attributes.
+
+        Parameters
+        ----------
+        in_vec : <Vector>
+            pointer to the input vector.
+        out_vec : <Vector>
+            pointer to the output vector.
+        in_inds : int ndarray
+            input indices for the transfer.
+        out_inds : int ndarray
+            output indices for the transfer.
+        comm : MPI.Comm or <FakeComm>
+            communicator of the system that owns this transfer.
+        """
+        super().__init__(in_vec, out_vec, in_inds, out_inds, comm)
+        self._blocks, self._scat_in_inds, self._scat_out_inds = \
+            _compile_blocks(in_inds, out_inds)
+
+        # in rev mode, duplicate output indices (an output connected to several inputs) have to
+        # be summed, which is done with a bincount over the unique indices
+        self._scat_out_uniq = self._scat_out_inv = None
+        if self._scat_out_inds.size > 0:
+            uniq, inv = np.unique(self._scat_out_inds, return_inverse=True)
+            if uniq.size < self._scat_out_inds.size:
+                self._scat_out_uniq = uniq
+                self._scat_out_inv = inv
+
     @staticmethod
     def _setup_transfers(group):
         """
@@ -36,23 +135,138 @@ class DefaultTransfer(Transfer):
         group : <Group>
             Parent group.
         """
-        iproc = group.comm.rank
         rev = group._mode == 'rev' or group._mode == 'auto'
 
         for subsys in group._subgroups_myproc:
             subsys._setup_transfers()
 
-        abs2meta = group._var_abs2meta
-        allprocs_abs2meta_out = group._var_allprocs_abs2meta['output']
-
         group._transfers = transfers = {}
         vectors = group._vectors
-        offsets = _global2local_offsets(group._get_var_offsets())
 
         vec_names = group._lin_rel_vec_name_list if group._use_derivatives else group._vec_names
-        allsubs = group._subsystems_allprocs
 
+        cache = group._problem_meta['setup_cache']
+        if cache is None:
+            xfer_idxs = DefaultTransfer._get_transfer_indices(group, vec_names, rev)
+        else:
+            xfer_idxs = cache.get(('transfers', group.pathname),
+                                  DefaultTransfer._get_transfer_indices, group, vec_names, rev)
+
+        for vec_name in vec_names:
+            fwd_xfer_in, fwd_xfer_out, rev_xfer_in, rev_xfer_out = xfer_idxs[vec_name]
+
+            tot_size = 0
+            for arr in fwd_xfer_in.values():
+                tot_size += arr.size
+
+            transfers[vec_name] = {}
+
+            if tot_size > 0:
+                try:
+                    xfer_in = np.concatenate(list(fwd_xfer_in.values()))
+                    xfer_out = np.concatenate(list(fwd_xfer_out.values()))
+                except ValueError:
+                    xfer_in = xfer_out = np.zeros(0, dtype=INT_DTYPE)
+
+                out_vec = vectors['output'][vec_name]
+
+                xfer_all = DefaultTransfer(vectors['input'][vec_name], out_vec,
+                                           xfer_in, xfer_out, group.comm)
+            else:
+                xfer_all = None
+
+            transfers[vec_name]['fwd'] = xfwd = {}
+            xfwd[None] = xfer_all
+            if rev:
+                transfers[vec_name]['rev'] = xrev = {}
+                xrev[None] = xfer_all
+
+            for sname, inds in fwd_xfer_in.items():
+                if inds.size > 0:
+                    xfwd[sname] = DefaultTransfer(vectors['input'][vec_name],
+                                                  vectors['output'][vec_name],
+                                                  inds, fwd_xfer_out[sname], group.comm)
+                else:
+                    xfwd[sname] = None
+
+            if rev:
+                for sname, inds in rev_xfer_out.items():
+                    if inds.size > 0:
+                        xrev[sname] = DefaultTransfer(vectors['input'][vec_name],
+                                                      vectors['output'][vec_name],
+                                                      rev_xfer_in[sname], inds, group.comm)
+                    else:
+                        xrev[sname] = None
+
+        if group._use_derivatives:
+            transfers['nonlinear'] = transfers['linear']
+
+        DefaultTransfer._setup_alias_transfers(group)
+
+    @staticmethod
+    def _setup_alias_transfers(group):
+        """
+        Compute the nonlinear fwd transfers of a group whose input vector has aliased inputs.
+
+        Aliased inputs are views of their source outputs, so they never need a transfer and
+        they take no space in the nonlinear input vectors.  The input indices of the remaining
+        transfers are mapped from the full layout of the inputs to that compact layout.
+
+        Parameters
+        ----------
+        group : <Group>
+            Parent group.
+        """
+        in_vec = group._inputs
+        if not in_vec._aliases:
+            group._alias_transfers = None
+            return
+
+        abs2meta = group._var_abs2meta['input']
+        names = group._var_relevant_names['nonlinear']['input']
+        sizes = np.array([abs2meta[name]['size'] for name in names], dtype=INT_DTYPE)
+        aliased = np.repeat([name in in_vec._aliases for name in names], sizes)
+        compact_inds = np.cumsum(~aliased, dtype=INT_DTYPE) - 1
+
+        group._alias_transfers = alias_xfers = {}
+        for key, xfer in group._transfers['nonlinear']['fwd'].items():
+            if xfer is not None:
+                keep = ~aliased[xfer._in_inds]
+                if not np.any(keep):
+                    xfer = None
+                else:
+                    xfer = DefaultTransfer(in_vec, group._outputs,
+                                           compact_inds[xfer._in_inds[keep]],
+                                           xfer._out_inds[keep], group.comm)
+            alias_xfers[key] = xfer
+
+    @staticmethod
+    def _get_transfer_indices(group, vec_names, rev):
+        """
+        Compute the input and output indices of all transfers that are owned by a group.
+
+        Parameters
+        ----------
+        group : <Group>
+            Parent group.
+        vec_names : list of str
+            Names of the vectors having transfers.
+        rev : bool
+            If True, compute the indices of the reverse transfers too.
+
+        Returns
+        -------
+        dict
+            Tuples of (fwd_in, fwd_out, rev_in, rev_out) keyed by vec_name, where each entry
+            maps the name of a subsystem to its merged transfer indices. The rev entries are
+            None if rev is False.
+        """
+        iproc = group.comm.rank
+        abs2meta = group._var_abs2meta
+        allprocs_abs2meta_out = group._var_allprocs_abs2meta['output']
+        offsets = _global2local_offsets(group._get_var_offsets())
         mypathlen = len(group.pathname + '.' if group.pathname else '')
+        xfer_idxs = {}
 
         for vec_name in vec_names:
             relvars, _ = group._relevant[vec_name]['@all']
@@ -60,9 +274,6 @@ class DefaultTransfer(Transfer):
             relvars_out = relvars['output']
 
             # Initialize empty lists for the transfer indices
-            nsub_allprocs = len(allsubs)
-            xfer_in = []
-            xfer_out = []
             fwd_xfer_in = defaultdict(list)
             fwd_xfer_out = defaultdict(list)
             if rev:
@@ -120,58 +331,22 @@ class DefaultTransfer(Transfer):
                         rev_xfer_in[sub_out].append(input_inds)
                         rev_xfer_out[sub_out].append(output_inds)
 
-            tot_size = 0
             for sname, inds in fwd_xfer_in.items():
-                fwd_xfer_in[sname] = arr = _merge(inds)
+                fwd_xfer_in[sname] = _merge(inds)
                 fwd_xfer_out[sname] = _merge(fwd_xfer_out[sname])
-                tot_size += arr.size
 
             if rev:
                 for sname, inds in rev_xfer_in.items():
                     rev_xfer_in[sname] = _merge(inds)
                     rev_xfer_out[sname] = _merge(rev_xfer_out[sname])
-
-            transfers[vec_name] = {}
-
-            if tot_size > 0:
-                try:
-                    xfer_in = np.concatenate(list(fwd_xfer_in.values()))
-                    xfer_out = np.concatenate(list(fwd_xfer_out.values()))
-                except ValueError:
-                    xfer_in = xfer_out = np.zeros(0, dtype=INT_DTYPE)
-
-                out_vec = vectors['output'][vec_name]
-
-                xfer_all = DefaultTransfer(vectors['input'][vec_name], out_vec,
-                                           xfer_in, xfer_out, group.comm)
             else:
-                xfer_all = None
+                rev_xfer_in = rev_xfer_out = None
 
-            transfers[vec_name]['fwd'] = xfwd = {}
-            xfwd[None] = xfer_all
-            if rev:
-                transfers[vec_name]['rev'] = xrev = {}
-                xrev[None] = xfer_all
+            xfer_idxs[vec_name] = (dict(fwd_xfer_in), dict(fwd_xfer_out),
+                                   None if rev_xfer_in is None else dict(rev_xfer_in),
+                                   None if rev_xfer_out is None else dict(rev_xfer_out))
 
-            for sname, inds in fwd_xfer_in.items():
-                if inds.size > 0:
-                    xfwd[sname] = DefaultTransfer(vectors['input'][vec_name],
-                                                  vectors['output'][vec_name],
-                                                  inds, fwd_xfer_out[sname], group.comm)
-                else:
-                    xfwd[sname] = None
-
-            if rev:
-                for sname, inds in rev_xfer_out.items():
-                    if inds.size > 0:
-                        xrev[sname] = DefaultTransfer(vectors['input'][vec_name],
-                                                      vectors['output'][vec_name],
-                                                      rev_xfer_in[sname], inds, group.comm)
-                    else:
-                        xrev[sname] = None
-
-        if group._use_derivatives:
-            transfers['nonlinear'] = transfers['linear']
+        return xfer_idxs
 
     @staticmethod
     def _setup_discrete_transfers(group):
@@ -266,13 +441,30 @@ class DefaultTransfer(Transfer):
             'fwd' or 'rev'.
 
         """
+        in_data = in_vec._data
+        out_data = out_vec._data
+        scat_in = self._scat_in_inds
+
         if mode == 'fwd':
             # this works whether the vecs have multi columns or not due to broadcasting
-            in_vec.set_val(out_vec.asarray()[self._out_inds], self._in_inds)
+            for in_slc, out_slc in self._blocks:
+                in_data[in_slc] = out_data[out_slc]
+            if scat_in.size > 0:
+                in_data[scat_in] = out_data[self._scat_out_inds]
 
         else:  # rev
-            if out_vec._ncol == 1:
-                out_vec.iadd(np.bincount(self._out_inds, in_vec._data[self._in_inds],
-                                         minlength=out_vec._data.size))
-            else:  # matrix-matrix   (bincount only works with 1d arrays)
-                np.add.at(out_vec._data, self._out_inds, in_vec._data[self._in_inds])
+            for in_slc, out_slc in self._blocks:
+                out_data[out_slc] += in_data[in_slc]
+            if scat_in.size > 0:
+                if self._scat_out_uniq is None:
+                    out_data[self._scat_out_inds] += in_data[scat_in]
+                elif out_vec._ncol == 1:
+                    uniq = self._scat_out_uniq
+                    vals = in_data[scat_in]
+                    sums = np.bincount(self._scat_out_inv, vals.real, minlength=uniq.size)
+                    if np.iscomplexobj(vals):
+                        sums = sums + 1j * np.bincount(self._scat_out_inv, vals.imag,
+                                                       minlength=uniq.size)
+                    out_data[uniq] += sums
+                else:  # matrix-matrix   (bincount only works with 1d arrays)
+                    np.add.at(out_data, self._scat_out_inds, in_data[scat_in])
@@ -1,10 +1,12 @@
 """Define the default Vector class."""
+from contextlib import contextmanager
 from copy import deepcopy
 import numbers
 
 import numpy as np
 
 from openmdao.core.constants import INT_DTYPE
+from openmdao.utils.array_utils import shared_zeros
 from openmdao.vectors.vector import Vector, _full_slice
 from openmdao.vectors.default_transfer import DefaultTransfer
 from openmdao.utils.mpi import MPI, multi_proc_exception_check
@@ -13,10 +15,48 @@ from openmdao.utils.mpi import MPI, multi_proc_exception_check
 class DefaultVector(Vector):
     """
     Default NumPy vector.
+
+    Attributes
+    ----------
+    _cplx_owner : bool
+        True if this vector allocated its complex storage when entering complex step mode, so
+        it must release it again for itself and its subsystem vectors when leaving.
     """
 
     TRANSFER = DefaultTransfer
 
+    # complex storage can be allocated on demand instead of during setup
+    LAZY_COMPLEX = True
+
+    # inputs can be views of their source outputs
+    ALIAS_INPUTS = True
+
+    # nonlinear root data can be shared with forked worker processes
+    SHARED_MEMORY = True
+
+    def __init__(self, name, kind, system, root_vector=None, alloc_complex=False, ncol=1):
+        """
+        Initialize all attributes.
+
+        Parameters
+        ----------
+        name : str
+            The name of the vector: 'nonlinear', 'linear', or right-hand side name.
+        kind : str
+            The kind of vector, 'input', 'output', or 'residual'.
+        system : <System>
+            Pointer to the owning system.
+        root_vector : <Vector>
+            Pointer to the vector owned by the root system.
+        alloc_complex : bool
+            Whether to allocate any imaginary storage to perform complex step. Default is False.
+        ncol : int
+            Number of columns for multi-vectors.
+        """
+        self._cplx_owner = False
+        super().__init__(name, kind, system, root_vector=root_vector,
+                         alloc_complex=alloc_complex, ncol=ncol)
+
     def _create_data(self):
         """
         Allocate data array.
@@ -32,8 +72,36 @@ class DefaultVector(Vector):
         system = self._system()
         ncol = self._ncol
         size = np.sum(system._var_sizes[self._name][self._typ][system.comm.rank, :])
+
+        # aliased inputs are views of their sources, so they take no space here
+        aliases = self._get_stored_aliases()
+        if aliases:
+            abs2meta = system._var_abs2meta['input']
+            size -= sum(abs2meta[name]['size'] for name in aliases if name in abs2meta)
+
+        if ncol == 1 and self._name == 'nonlinear' and system._problem_meta['shared_memory']:
+            # worker processes of a ParallelGroup write their outputs directly into this
+            return shared_zeros(size)
         return np.zeros(size) if ncol == 1 else np.zeros((size, ncol))
 
+    def _get_root_slice(self):
+        """
+        Return the slice of the root data array that holds the data of this vector.
+
+        Returns
+        -------
+        slice
+            Slice of the root data array.
+        """
+        ncol = self._ncol
+        slices = self._root_vector.get_slice_dict()
+
+        mynames = self._system()._var_relevant_names[self._name][self._typ]
+        if mynames:
+            return slice(slices[mynames[0]].start // ncol, slices[mynames[-1]].stop // ncol)
+
+        return slice(0, 0)
+
     def _extract_root_data(self):
         """
         Extract views of arrays from root_vector.
@@ -43,23 +111,16 @@ class DefaultVector(Vector):
         ndarray
             zeros array of correct size.
         """
-        system = self._system()
-        type_ = self._typ
-        ncol = self._ncol
         root_vec = self._root_vector
-
-        slices = root_vec.get_slice_dict()
-
-        mynames = system._var_relevant_names[self._name][type_]
-        if mynames:
-            myslice = slice(slices[mynames[0]].start // ncol, slices[mynames[-1]].stop // ncol)
-        else:
-            myslice = slice(0, 0)
+        myslice = self._get_root_slice()
 
         data = root_vec._data[myslice]
 
-        # Extract view for complex storage too.
-        cplx_data = root_vec._cplx_data[myslice] if self._alloc_complex else None
+        # Extract view for complex storage too, unless it is allocated on demand.
+        if self._alloc_complex and root_vec._cplx_data is not None:
+            cplx_data = root_vec._cplx_data[myslice]
+        else:
+            cplx_data = None
 
         scaling = {}
         if self._do_scaling:
@@ -94,7 +155,8 @@ class DefaultVector(Vector):
                 if self._name == 'nonlinear':
                     self._scaling['phys'] = (np.zeros(data.size), np.ones(data.size))
                     self._scaling['norm'] = (np.zeros(data.size), np.ones(data.size))
-                elif self._name == 'linear':
+                elif (self._name == 'linear' and
+                      self._system()._root_vecs[self._kind]['nonlinear']._data.size == data.size):
                     # reuse the nonlinear scaling vecs since they're the same as ours
                     nlvec = self._system()._root_vecs[self._kind]['nonlinear']
                     self._scaling['phys'] = (None, nlvec._scaling['phys'][1])
@@ -104,7 +166,7 @@ class DefaultVector(Vector):
                     self._scaling['norm'] = (None, np.ones(data.size))
 
             # Allocate imaginary for complex step
-            if self._alloc_complex:
+            if self._alloc_complex and not self._system()._problem_meta['lazy_complex']:
                 self._cplx_data = np.zeros(self._data.shape, dtype=np.complex)
 
         else:
@@ -131,13 +193,15 @@ class DefaultVector(Vector):
         self._views = views = {}
         self._views_flat = views_flat = {}
 
-        alloc_complex = self._alloc_complex
-        self._cplx_views = cplx_views = {}
-        self._cplx_views_flat = cplx_views_flat = {}
-
+        aliases = self._get_stored_aliases()
         abs2meta = system._var_abs2meta[io]
         start = end = 0
         for abs_name in system._var_relevant_names[self._name][io]:
+            if abs_name in aliases:
+                # replaced by a view of the source in _alias_inputs
+                views_flat[abs_name] = views[abs_name] = self._data[start:start]
+                continue
+
             meta = abs2meta[abs_name]
             end = start + meta['size']
             shape = meta['shape']
@@ -152,13 +216,6 @@ class DefaultVector(Vector):
                 v.shape = shape
             views[abs_name] = v
 
-            if alloc_complex:
-                cplx_views_flat[abs_name] = v = self._cplx_data[start:end]
-                if shape != v.shape:
-                    v = v.view()
-                    v.shape = shape
-                cplx_views[abs_name] = v
-
             if do_scaling:
                 for scaleto in ('phys', 'norm'):
                     scale0, scale1 = factors[abs_name][kind, scaleto]
@@ -172,6 +229,170 @@ class DefaultVector(Vector):
         self._names = frozenset(views)
         self._len = end
 
+        if self._cplx_data is not None:
+            self._initialize_cplx_views()
+
+    def _initialize_cplx_views(self):
+        """
+        Internally assemble views onto the complex storage.
+
+        Sets the following attributes:
+        _cplx_views
+        _cplx_views_flat
+        """
+        self._cplx_views = cplx_views = {}
+        self._cplx_views_flat = cplx_views_flat = {}
+
+        views = self._views
+        cplx_data = self._cplx_data
+        aliases = self._get_stored_aliases()
+        start = end = 0
+        for abs_name, v in self._views_flat.items():
+            if abs_name in aliases:
+                # replaced by a view of the source in _alias_inputs
+                cplx_views_flat[abs_name] = cplx_views[abs_name] = cplx_data[start:start]
+                continue
+
+            end += v.shape[0]
+            cplx_views_flat[abs_name] = cv = cplx_data[start:end]
+            shape = views[abs_name].shape
+            if shape != cv.shape:
+                cv = cv.view()
+                cv.shape = shape
+            cplx_views[abs_name] = cv
+            start = end
+
+    def _alloc_complex_data(self, subvecs):
+        """
+        Allocate complex storage for this vector if it is allocated on demand.
+
+        The vectors of all subsystems are given views of the new storage.
+
+        Parameters
+        ----------
+        subvecs : list of <Vector>
+            Vectors of the same name and kind owned by the subsystems of our system.
+        """
+        if self._cplx_data is not None:
+            # storage was allocated during setup or by a parent system.
+            return
+
+        self._cplx_owner = True
+        start = self._get_root_slice().start
+        cplx_data = np.zeros(self._data.shape, dtype=np.complex)
+
+        for vec in [self] + subvecs:
+            myslice = vec._get_root_slice()
+            vec._cplx_data = cplx_data[myslice.start - start:myslice.stop - start]
+            vec._initialize_cplx_views()
+
+    def _free_complex_data(self, subvecs):
+        """
+        Release complex storage that was allocated on demand by this vector.
+
+        Parameters
+        ----------
+        subvecs : list of <Vector>
+            Vectors of the same name and kind owned by the subsystems of our system.
+        """
+        if self._cplx_owner:
+            self._cplx_owner = False
+            for vec in [self] + subvecs:
+                vec._cplx_data = None
+                vec._cplx_views = {}
+                vec._cplx_views_flat = {}
+
+    def _get_stored_aliases(self):
+        """
+        Return the aliased inputs that take no space in the data array of this vector.
+
+        Returns
+        -------
+        dict
+            Mapping of aliased input names to the names of their source outputs.
+        """
+        if self._kind == 'input' and self._name == 'nonlinear':
+            return self._system()._problem_meta['aliased_inputs']
+        return {}
+
+    def _alias_inputs(self, aliases, out_views_flat, cplx_out_views_flat=None):
+        """
+        Make the views of the given inputs read-only views of their source outputs.
+
+        The aliased inputs have no storage of their own in this vector.
+
+        Parameters
+        ----------
+        aliases : dict
+            Mapping of aliased input names to the names of their source outputs.
+        out_views_flat : dict
+            Flat views of the root nonlinear output vector.
+        cplx_out_views_flat : dict or None
+            If not None, the complex views of this vector are set instead, to these flat complex
+            views of outputs if they have them, or else to out_views_flat.
+        """
+        if cplx_out_views_flat is None:
+            views, views_flat = self._views, self._views_flat
+            self._aliases = {}
+        else:
+            views, views_flat = self._cplx_views, self._cplx_views_flat
+
+        abs2meta = self._system()._var_abs2meta['input']
+
+        for abs_in in views_flat:
+            if abs_in in aliases:
+                abs_out = aliases[abs_in]
+                if cplx_out_views_flat is not None and abs_out in cplx_out_views_flat:
+                    src = cplx_out_views_flat[abs_out]
+                else:
+                    src = out_views_flat[abs_out]
+                views_flat[abs_in] = flat = src.view()
+                flat.flags.writeable = False
+                shape = abs2meta[abs_in]['shape']
+                if shape != flat.shape:
+                    v = flat.view()
+                    v.shape = shape
+                    views[abs_in] = v
+                else:
+                    views[abs_in] = flat
+                if cplx_out_views_flat is None:
+                    self._aliases[abs_in] = abs_out
+
+    @contextmanager
+    def _writable_aliases(self):
+        """
+        Replace the views of the aliased inputs with writable copies for the duration.
+
+        Changes made to the copies are discarded afterwards.
+
+        Yields
+        ------
+        None
+        """
+        views, views_flat = self._views, self._views_flat
+        saved = {}
+        for name in self._aliases:
+            saved[name] = views[name], views_flat[name]
+            views_flat[name] = flat = views_flat[name].copy()
+            views[name] = flat.reshape(saved[name][0].shape)
+
+        try:
+            yield
+        finally:
+            for name, (view, flat) in saved.items():
+                views[name] = view
+                views_flat[name] = flat
+
+    def _reset_layout(self):
+        """
+        Rebuild the data array and views of this vector after the set of aliased inputs changed.
+
+        The data array of the root vector is reallocated, so values aren't kept.
+        """
+        self._slices = None
+        self._initialize_data(None if self._root_vector is self else self._root_vector)
+        self._initialize_views()
+
     def _in_matvec_context(self):
         """
         Return True if this vector is inside of a matvec_context.
@@ -410,9 +631,11 @@ class DefaultVector(Vector):
         """
         if self._slices is None:
             slices = {}
+            aliases = self._get_stored_aliases()
             start = end = 0
             for name in self._system()._var_relevant_names[self._name][self._typ]:
-                end += self._views_flat[name].size
+                if name not in aliases:
+                    end += self._views_flat[name].size
                 slices[name] = slice(start, end)
                 start = end
             self._slices = slices
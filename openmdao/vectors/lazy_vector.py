@@ -0,0 +1,403 @@
+"""Define the LazyVector class."""
+from collections import OrderedDict
+from collections.abc import Mapping
+
+import numpy as np
+
+from openmdao.core.constants import INT_DTYPE
+from openmdao.vectors.default_vector import DefaultVector
+
+
+class _VarTable(object):
+    """
+    Offsets of all of the variables in a root vector, shared by every vector in the tree.
+
+    Attributes
+    ----------
+    names : list of str
+        Absolute names of the variables, in root vector order.
+    index : dict
+        Mapping of absolute name to its position in names.
+    offsets : ndarray of int
+        Start of each variable in the root data array, followed by the total length.
+    """
+
+    def __init__(self, names, abs2meta):
+        """
+        Initialize all attributes.
+
+        Parameters
+        ----------
+        names : list of str
+            Absolute names of the variables, in root vector order.
+        abs2meta : dict
+            Mapping of absolute name to variable metadata.
+        """
+        self.names = names
+        self.index = {name: i for i, name in enumerate(names)}
+        self.offsets = offsets = np.zeros(len(names) + 1, dtype=INT_DTYPE)
+        if names:
+            np.cumsum([abs2meta[name]['size'] for name in names], out=offsets[1:])
+
+
+class _LazyViews(Mapping):
+    """
+    Read-only mapping of variable name to a view of the data, created on first access.
+
+    The most recently used views are cached, up to CACHE_SIZE of them.
+
+    Attributes
+    ----------
+    _data : ndarray
+        Data array of the owning vector.
+    _table : _VarTable
+        Table of variable offsets of the root vector.
+    _lo : int
+        Position in the table of the first variable of the owning vector.
+    _hi : int
+        Position in the table after the last variable of the owning vector.
+    _abs2meta : dict
+        Mapping of absolute name to variable metadata.
+    _ncol : int
+        Number of columns for multi-vectors.
+    _flat : bool
+        If True, views are flat.
+    _cache : OrderedDict
+        Most recently used views, keyed by absolute name, from least to most recent.
+    """
+
+    CACHE_SIZE = 16
+
+    def __init__(self, data, table, lo, hi, abs2meta, ncol, flat):
+        """
+        Initialize all attributes.
+
+        Parameters
+        ----------
+        data : ndarray
+            Data array of the owning vector.
+        table : _VarTable
+            Table of variable offsets of the root vector.
+        lo : int
+            Position in the table of the first variable of the owning vector.
+        hi : int
+            Position in the table after the last variable of the owning vector.
+        abs2meta : dict
+            Mapping of absolute name to variable metadata.
+        ncol : int
+            Number of columns for multi-vectors.
+        flat : bool
+            If True, views are flat.
+        """
+        self._data = data
+        self._table = table
+        self._lo = lo
+        self._hi = hi
+        self._abs2meta = abs2meta
+        self._ncol = ncol
+        self._flat = flat
+        self._cache = OrderedDict()
+
+    def __getitem__(self, name):
+        """
+        Return the view of the named variable, creating it if necessary.
+
+        Parameters
+        ----------
+        name : str
+            Absolute name of the variable.
+
+        Returns
+        -------
+        ndarray
+            View of the variable in the data array.
+        """
+        cache = self._cache
+        try:
+            v = cache[name]
+        except KeyError:
+            pass
+        else:
+            cache.move_to_end(name)
+            return v
+
+        idx = self._table.index.get(name)
+        if idx is None or not (self._lo <= idx < self._hi):
+            raise KeyError(name)
+
+        offsets = self._table.offsets
+        base = offsets[self._lo]
+        v = self._data[offsets[idx] - base:offsets[idx + 1] - base]
+
+        if not self._flat:
+            shape = self._abs2meta[name]['shape']
+            if self._ncol > 1:
+                if not isinstance(shape, tuple):
+                    shape = (shape,)
+                shape = tuple(list(shape) + [self._ncol])
+            if shape != v.shape:
+                v = v.view()
+                v.shape = shape
+
+        cache[name] = v
+        if len(cache) > self.CACHE_SIZE:
+            cache.popitem(last=False)
+
+        return v
+
+    def __contains__(self, name):
+        """
+        Return True if the named variable is in the owning vector.
+
+        Parameters
+        ----------
+        name : str
+            Absolute name of the variable.
+
+        Returns
+        -------
+        bool
+            True if the variable is in the owning vector.
+        """
+        idx = self._table.index.get(name)
+        return idx is not None and self._lo <= idx < self._hi
+
+    def __iter__(self):
+        """
+        Iterate over the absolute names of the variables of the owning vector.
+
+        Returns
+        -------
+        iterator
+            Iterator over absolute names.
+        """
+        return iter(self._table.names[self._lo:self._hi])
+
+    def __len__(self):
+        """
+        Return the number of variables in the owning vector.
+
+        Returns
+        -------
+        int
+            Number of variables.
+        """
+        return self._hi - self._lo
+
+
+class LazyVector(DefaultVector):
+    """
+    NumPy vector that creates variable views on demand.
+
+    A DefaultVector builds a view of every variable for every system in the tree, so the
+    number of views grows with the number of variables times the depth of the model. A
+    LazyVector instead shares a single table of variable offsets built by the root vector and
+    only creates the views that are actually requested, caching them per vector.
+
+    Attributes
+    ----------
+    _table : _VarTable
+        Table of variable offsets of the root vector.
+    _lo : int
+        Position in the table of the first variable of this vector.
+    _hi : int
+        Position in the table after the last variable of this vector.
+    """
+
+    # views are always created from the table, so inputs can't be views of their sources
+    ALIAS_INPUTS = False
+
+    def __init__(self, name, kind, system, root_vector=None, alloc_complex=False, ncol=1):
+        """
+        Initialize all attributes.
+
+        Parameters
+        ----------
+        name : str
+            The name of the vector: 'nonlinear', 'linear', or right-hand side name.
+        kind : str
+            The kind of vector, 'input', 'output', or 'residual'.
+        system : <System>
+            Pointer to the owning system.
+        root_vector : <Vector>
+            Pointer to the vector owned by the root system.
+        alloc_complex : bool
+            Whether to allocate any imaginary storage to perform complex step. Default is False.
+        ncol : int
+            Number of columns for multi-vectors.
+        """
+        self._table = None
+        self._lo = self._hi = 0
+        super().__init__(name, kind, system, root_vector=root_vector,
+                         alloc_complex=alloc_complex, ncol=ncol)
+
+    def _get_table(self):
+        """
+        Return the variable table of the root vector, creating it if we are the root.
+
+        Returns
+        -------
+        _VarTable
+            Table of variable offsets of the root vector.
+        """
+        if self._root_vector is not self:
+            return self._root_vector._table
+
+        system = self._system()
+        names = system._var_relevant_names[self._name][self._typ]
+
+        # vectors with the same variables, e.g. outputs and residuals, share a table
+        for vecs in system._root_vecs.values():
+            for vec in vecs.values():
+                table = getattr(vec, '_table', None)
+                if vec._typ == self._typ and table is not None and \
+                   (table.names is names or table.names == names):
+                    return table
+
+        return _VarTable(names, system._var_abs2meta[self._typ])
+
+    def _get_root_slice(self):
+        """
+        Return the slice of the root data array that holds the data of this vector.
+
+        Returns
+        -------
+        slice
+            Slice of the root data array.
+        """
+        offsets = self._table.offsets
+        return slice(offsets[self._lo], offsets[self._hi])
+
+    def _extract_root_data(self):
+        """
+        Extract views of arrays from root_vector.
+
+        Returns
+        -------
+        ndarray
+            zeros array of correct size.
+        """
+        system = self._system()
+        root_vec = self._root_vector
+        table = root_vec._table
+
+        mynames = system._var_relevant_names[self._name][self._typ]
+        if mynames:
+            self._lo = table.index[mynames[0]]
+            self._hi = table.index[mynames[-1]] + 1
+        myslice = self._get_root_slice()
+
+        data = root_vec._data[myslice]
+
+        # Extract view for complex storage too, unless it is allocated on demand.
+        if self._alloc_complex and root_vec._cplx_data is not None:
+            cplx_data = root_vec._cplx_data[myslice]
+        else:
+            cplx_data = None
+
+        scaling = {}
+        if self._do_scaling:
+            for typ in ('phys', 'norm'):
+                rs0, rs1 = root_vec._scaling[typ]
+                scaling[typ] = (None if rs0 is None else rs0[myslice], rs1[myslice])
+
+        return data, cplx_data, scaling
+
+    def _initialize_data(self, root_vector):
+        """
+        Internally allocate data array.
+
+        Parameters
+        ----------
+        root_vector : Vector or None
+            the root's vector instance or None, if we are at the root.
+        """
+        self._table = self._get_table()
+        if root_vector is None:
+            self._hi = len(self._table.names)
+
+        super()._initialize_data(root_vector)
+
+    def _initialize_views(self):
+        """
+        Internally assemble views onto the vectors.
+
+        Sets the following attributes:
+        _views
+        _views_flat
+        """
+        system = self._system()
+        io = self._typ
+        ncol = self._ncol
+        table = self._table
+        lo = self._lo
+        hi = self._hi
+        abs2meta = system._var_abs2meta[io]
+
+        self._views = _LazyViews(self._data, table, lo, hi, abs2meta, ncol, False)
+        self._views_flat = _LazyViews(self._data, table, lo, hi, abs2meta, ncol, True)
+
+        if self._cplx_data is not None:
+            self._initialize_cplx_views()
+
+        # the scaling arrays of subsystem vectors are views of the root arrays, so they only
+        # need to be filled once.
+        if self._do_scaling and self._root_vector is self:
+            factors = system._scale_factors
+            scaling = self._scaling
+            kind = self._kind
+            offsets = table.offsets
+            for i, abs_name in enumerate(table.names):
+                start = offsets[i]
+                end = offsets[i + 1]
+                for scaleto in ('phys', 'norm'):
+                    scale0, scale1 = factors[abs_name][kind, scaleto]
+                    vec = scaling[scaleto]
+                    if vec[0] is not None:
+                        vec[0][start:end] = scale0
+                    vec[1][start:end] = scale1
+
+        self._names = self._views
+        self._len = int(table.offsets[hi] - table.offsets[lo])
+
+    def _initialize_cplx_views(self):
+        """
+        Internally assemble views onto the complex storage.
+
+        Sets the following attributes:
+        _cplx_views
+        _cplx_views_flat
+        """
+        abs2meta = self._system()._var_abs2meta[self._typ]
+        args = (self._cplx_data, self._table, self._lo, self._hi, abs2meta, self._ncol)
+        self._cplx_views = _LazyViews(*args, False)
+        self._cplx_views_flat = _LazyViews(*args, True)
+
+    def _copy_views(self):
+        """
+        Return a dictionary containing just the views.
+
+        Returns
+        -------
+        dict
+            Dictionary containing copies of the _views.
+        """
+        return {name: view.copy() for name, view in self._views.items()}
+
+    def get_slice_dict(self):
+        """
+        Return a dict of var names mapped to their slice in the local data array.
+
+        Returns
+        -------
+        dict
+            Mapping of var name to slice.
+        """
+        if self._slices is None:
+            ncol = self._ncol
+            lo = self._lo
+            offsets = (self._table.offsets[lo:self._hi + 1] - self._table.offsets[lo]) * ncol
+            self._slices = {name: slice(offsets[i], offsets[i + 1])
+                            for i, name in enumerate(self._table.names[lo:self._hi])}
+
+        return self._slices
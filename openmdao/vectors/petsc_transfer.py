@@ -22,6 +22,10 @@ class PETScTransfer(DefaultTransfer):
     ----------
     _scatter : method
         Method that performs a PETSc scatter.
+    _scatter_begin : method
+        Method that starts a non-blocking PETSc scatter.
+    _scatter_end : method
+        Method that waits for a PETSc scatter started by _scatter_begin to complete.
     _transfer : method
         Method that performs either a normal transfer or a multi-transfer.
     """
@@ -47,8 +51,11 @@ class PETScTransfer(DefaultTransfer):
         in_indexset = PETSc.IS().createGeneral(self._in_inds, comm=self._comm)
         out_indexset = PETSc.IS().createGeneral(self._out_inds, comm=self._comm)
 
-        self._scatter = PETSc.Scatter().create(out_vec._petsc, out_indexset, in_vec._petsc,
-                                               in_indexset).scatter
+        scatter = PETSc.Scatter().create(out_vec._petsc, out_indexset, in_vec._petsc,
+                                         in_indexset)
+        self._scatter = scatter.scatter
+        self._scatter_begin = scatter.begin
+        self._scatter_end = scatter.end
 
         if in_vec._ncol > 1:
             self._transfer = self._multi_transfer
@@ -293,6 +300,55 @@ class PETScTransfer(DefaultTransfer):
             if in_vec._alloc_complex:
                 in_vec._data[:] = in_petsc.array
 
+    def _can_split(self, in_vec, out_vec):
+        """
+        Return True if a fwd transfer between the given vectors can be split into begin and end.
+
+        The split is only done when the PETSc vectors reference the vector data directly, so the
+        data arriving in the input vector doesn't have to be copied after the scatter completes.
+
+        Parameters
+        ----------
+        in_vec : <Vector>
+            pointer to the input vector.
+        out_vec : <Vector>
+            pointer to the output vector.
+
+        Returns
+        -------
+        bool
+            True if _transfer_begin and _transfer_end can be used.
+        """
+        return in_vec._ncol == 1 and not (in_vec._alloc_complex or out_vec._alloc_complex)
+
+    def _transfer_begin(self, in_vec, out_vec):
+        """
+        Start a non-blocking fwd transfer.
+
+        Every proc of the communicator must call _transfer_end before the inputs are used.
+
+        Parameters
+        ----------
+        in_vec : <Vector>
+            pointer to the input vector.
+        out_vec : <Vector>
+            pointer to the output vector.
+        """
+        self._scatter_begin(out_vec._petsc, in_vec._petsc, addv=False, mode=False)
+
+    def _transfer_end(self, in_vec, out_vec):
+        """
+        Wait for a fwd transfer started by _transfer_begin to complete.
+
+        Parameters
+        ----------
+        in_vec : <Vector>
+            pointer to the input vector.
+        out_vec : <Vector>
+            pointer to the output vector.
+        """
+        self._scatter_end(out_vec._petsc, in_vec._petsc, addv=False, mode=False)
+
     def _multi_transfer(self, in_vec, out_vec, mode='fwd'):
         """
         Perform transfer.
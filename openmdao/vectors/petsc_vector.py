@@ -38,6 +38,15 @@ class PETScVector(DefaultVector):
     TRANSFER = PETScTransfer
     cite = CITATION
 
+    # the PETSc vectors wrap the complex storage, so it must be allocated during setup
+    LAZY_COMPLEX = False
+
+    # PETSc scatters transfer every input, so inputs can't be views of their sources
+    ALIAS_INPUTS = False
+
+    # the PETSc vectors wrap the data, so it isn't reallocated in shared memory
+    SHARED_MEMORY = False
+
     def __init__(self, name, kind, system, root_vector=None, alloc_complex=False, ncol=1):
         """
         Initialize all attributes.
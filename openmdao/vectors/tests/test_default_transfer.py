@@ -0,0 +1,131 @@
+""" Unit tests for the DefaultTransfer. """
+import unittest
+
+import numpy as np
+
+import openmdao.api as om
+from openmdao.core.constants import INT_DTYPE
+from openmdao.vectors.default_transfer import _compile_blocks
+from openmdao.utils.assert_utils import assert_near_equal
+
+try:
+    from parameterized import parameterized
+except ImportError:
+    from openmdao.utils.assert_utils import SkipParameterized as parameterized
+
+
+N = 500
+
+
+class TransferGroup(om.Group):
+    """
+    Group whose transfers have blocks, scattered indices and duplicate indices.
+
+    'a' goes to a contiguous input, 'b' to a reversed input and to two inputs that both use
+    its first entry.
+    """
+
+    def initialize(self):
+        self.options.declare('vectorize', default=False,
+                             desc='Whether to vectorize the derivatives of the design '
+                                  'variables and constraints.')
+
+    def setup(self):
+        vectorize = self.options['vectorize']
+
+        ivc = self.add_subsystem('ivc', om.IndepVarComp())
+        ivc.add_output('a', np.arange(N, dtype=float) + 1.)
+        ivc.add_output('b', np.arange(N, dtype=float) + 2.)
+
+        self.add_subsystem('cont', om.ExecComp('y = 3.0 * x', x=np.ones(N), y=np.ones(N)))
+        self.add_subsystem('scat', om.ExecComp('y = 2.0 * x**2', x=np.ones(N), y=np.ones(N)))
+        self.add_subsystem('dup', om.ExecComp('y = x1 * x2'))
+        self.connect('ivc.a', 'cont.x')
+        self.connect('ivc.b', 'scat.x', src_indices=np.arange(N)[::-1])
+        self.connect('ivc.b', 'dup.x1', src_indices=[0])
+        self.connect('ivc.b', 'dup.x2', src_indices=[0])
+
+        self.add_design_var('ivc.a', vectorize_derivs=vectorize)
+        self.add_design_var('ivc.b', vectorize_derivs=vectorize)
+        self.add_objective('dup.y')
+        self.add_constraint('cont.y', upper=0.0, vectorize_derivs=vectorize)
+        self.add_constraint('scat.y', upper=0.0, vectorize_derivs=vectorize)
+
+
+class TestCompileBlocks(unittest.TestCase):
+
+    def test_blocks(self):
+        in_inds = np.arange(1000, dtype=INT_DTYPE)
+        out_inds = np.concatenate((np.arange(300), np.arange(300)[::-1],
+                                   np.arange(50, 250), [7] * 200)).astype(INT_DTYPE)
+
+        blocks, scat_in, scat_out = _compile_blocks(in_inds, out_inds, 200)
+
+        self.assertEqual(blocks, [(slice(0, 300), slice(0, 300)),
+                                  (slice(600, 800), slice(50, 250))])
+        np.testing.assert_array_equal(scat_in, np.concatenate((np.arange(300, 600),
+                                                               np.arange(800, 1000))))
+        np.testing.assert_array_equal(scat_out, np.concatenate((np.arange(300)[::-1],
+                                                                [7] * 200)))
+
+    def test_short(self):
+        in_inds = np.arange(10, dtype=INT_DTYPE)
+        out_inds = np.arange(10, 20, dtype=INT_DTYPE)
+
+        blocks, scat_in, scat_out = _compile_blocks(in_inds, out_inds, 200)
+
+        self.assertEqual(blocks, [])
+        self.assertIs(scat_in, in_inds)
+        self.assertIs(scat_out, out_inds)
+
+
+class TestDefaultTransfer(unittest.TestCase):
+
+    def test_transfer_kinds(self):
+        prob = om.Problem(TransferGroup())
+        prob.setup(mode='fwd')
+        prob.run_model()
+        xfer = prob.model._transfers['nonlinear']['fwd'][None]
+
+        self.assertEqual(len(xfer._blocks), 1)
+        self.assertEqual(xfer._scat_in_inds.size, N + 2)
+        self.assertIsNotNone(xfer._scat_out_uniq)
+
+    def test_fwd(self):
+        prob = om.Problem(TransferGroup())
+        prob.setup(mode='fwd')
+        prob.run_model()
+
+        assert_near_equal(prob['cont.x'], np.arange(N) + 1., 1e-15)
+        assert_near_equal(prob['scat.x'], np.arange(N)[::-1] + 2., 1e-15)
+        assert_near_equal(prob['cont.y'], 3. * (np.arange(N) + 1.), 1e-15)
+        assert_near_equal(prob['dup.y'], 4., 1e-15)
+
+    @parameterized.expand([('fwd', False), ('rev', False), ('fwd', True), ('rev', True)])
+    def test_totals(self, mode, vectorize):
+        prob = om.Problem(TransferGroup(vectorize=vectorize))
+        prob.setup(mode=mode)
+        prob.run_model()
+        J = prob.compute_totals()
+
+        b = np.arange(N) + 2.
+        assert_near_equal(J['cont.y', 'ivc.a'], 3. * np.eye(N), 1e-15)
+        assert_near_equal(J['scat.y', 'ivc.b'], np.diag(4. * b)[::-1], 1e-15)
+
+        # the two connections of b[0] to 'dup' are summed in rev mode
+        expected = np.zeros((1, N))
+        expected[0, 0] = 2. * b[0]
+        assert_near_equal(J['dup.y', 'ivc.b'], expected, 1e-15)
+
+    def test_complex_step(self):
+        prob = om.Problem(TransferGroup())
+        prob.setup(mode='rev', force_alloc_complex=True)
+        prob.run_model()
+
+        data = prob.check_totals(method='cs', out_stream=None)
+        for key, val in data.items():
+            assert_near_equal(val['abs error'][0], 0.0, 1e-10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,10 @@
+import itertools
 import unittest
 
 import numpy as np
 
 import openmdao.api as om
+from openmdao.test_suite.components.sellar import SellarDerivativesGrouped
 from openmdao.utils.array_utils import evenly_distrib_idxs
 from openmdao.utils.assert_utils import assert_near_equal
 from openmdao.utils.mpi import MPI
@@ -12,6 +14,11 @@ try:
 except ImportError:
     PETScVector = None
 
+try:
+    from parameterized import parameterized
+except ImportError:
+    from openmdao.utils.assert_utils import SkipParameterized as parameterized
+
 
 class TestVector(unittest.TestCase):
 
@@ -57,6 +64,172 @@ class TestVector(unittest.TestCase):
         self.assertEqual(p.model._residuals.dot(p.model._outputs), 9.)
 
 
+class TestLazyVector(unittest.TestCase):
+
+    def _run_sellar(self, vec_class):
+        prob = om.Problem(SellarDerivativesGrouped(nl_atol=1e-12, ln_atol=1e-12))
+        prob.model.add_design_var('z', lower=-10, upper=10, ref=2.0)
+        prob.model.add_objective('obj', ref=5.0)
+        prob.setup(local_vector_class=vec_class, force_alloc_complex=True)
+        prob.set_solver_print(level=0)
+        prob.run_model()
+        totals = prob.compute_totals(of=['obj', 'y1', 'y2'], wrt=['x', 'z'])
+
+        return prob, totals
+
+    def test_matches_default_vector(self):
+        prob, totals = self._run_sellar(om.LazyVector)
+        expected_prob, expected = self._run_sellar(om.DefaultVector)
+
+        for name in ('y1', 'y2', 'obj', 'mda.d1.y1', 'mda.d2.y2'):
+            assert_near_equal(prob[name], expected_prob[name], 1e-12)
+
+        for key, val in expected.items():
+            assert_near_equal(totals[key], val, 1e-12)
+
+    def test_views_on_demand(self):
+        prob, _ = self._run_sellar(om.LazyVector)
+        model = prob.model
+
+        # all vectors of the same type share the table built by the root vector
+        table = model._outputs._table
+        self.assertIs(model._residuals._table, table)
+        self.assertIs(model.mda._outputs._table, table)
+        self.assertIs(model.mda.d1._vectors['output']['linear']._table, table)
+
+        # intermediate groups never need views of their variables during a run
+        views = model.mda._outputs._views
+        self.assertEqual(views._cache, {})
+        self.assertIn('mda.d1.y1', views)
+        self.assertNotIn('obj_cmp.obj', views)
+
+        y1 = model.mda._outputs['d1.y1']
+        self.assertIs(views._cache['mda.d1.y1'], y1)
+        self.assertIs(model.mda._outputs['d1.y1'], y1)
+        assert_near_equal(y1, model.mda.d1._outputs['y1'], 1e-15)
+
+        # views of a subsystem are views of the root data
+        y1[:] = 42.0
+        assert_near_equal(model.mda.d1._outputs['y1'], 42.0, 1e-15)
+        assert_near_equal(model._outputs['mda.d1.y1'], 42.0, 1e-15)
+
+        # only the most recently used views are kept
+        views = model._outputs._views
+        views.CACHE_SIZE = 2
+        views._cache.clear()
+        names = list(views)[:3]
+        for name in names:
+            views[name]
+        self.assertEqual(list(views._cache), names[1:])
+        views[names[1]]
+        self.assertEqual(list(views._cache), [names[2], names[1]])
+
+        self.assertEqual(list(model.mda._outputs._abs_iter()), ['mda.d1.y1', 'mda.d2.y2'])
+        self.assertEqual(len(model.mda._outputs), 2)
+        self.assertEqual(model.mda._outputs.get_slice_dict(),
+                         {'mda.d1.y1': slice(0, 1), 'mda.d2.y2': slice(1, 2)})
+
+    def test_complex_step(self):
+        prob, _ = self._run_sellar(om.LazyVector)
+
+        data = prob.check_partials(method='cs', out_stream=None)
+        for comp_data in data.values():
+            for val in comp_data.values():
+                self.assertLess(val['abs error'].forward, 1e-6)
+
+
+class CSSpyComp(om.ExplicitComponent):
+    """Records the state of its vectors whenever it runs under complex step."""
+
+    def setup(self):
+        self.add_input('x', np.ones(3))
+        self.add_output('y', np.ones(3))
+        self.declare_partials('y', 'x', method='cs')
+        self.cs_states = []
+
+    def compute(self, inputs, outputs):
+        if self.under_complex_step:
+            root = self._problem_meta['model_ref']()
+            self.cs_states.append((outputs._data.dtype, root._outputs._cplx_data is None))
+        outputs['y'] = inputs['x'] ** 2
+
+
+class TestLazyComplexStorage(unittest.TestCase):
+
+    def _build(self, vec_class, group_cs=False):
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('ivc', om.IndepVarComp('x', np.array([1.0, 2.0, 3.0])))
+        sub = model.add_subsystem('sub', om.Group())
+        sub.add_subsystem('spy', CSSpyComp())
+        sub.add_subsystem('c2', om.ExecComp('z = 3.0*y', y=np.ones(3), z=np.ones(3)))
+        sub.connect('spy.y', 'c2.y')
+        model.connect('ivc.x', 'sub.spy.x')
+        if group_cs:
+            sub.approx_totals(method='cs')
+
+        prob.setup(local_vector_class=vec_class, force_alloc_complex=True)
+        prob.run_model()
+        return prob
+
+    @parameterized.expand(itertools.product(['DefaultVector', 'LazyVector']),
+                          name_func=lambda f, n, p: '_'.join([f.__name__] + list(p.args)))
+    def test_component_cs(self, vec_class):
+        prob = self._build(getattr(om, vec_class))
+        model = prob.model
+        spy = model.sub.spy
+
+        # complex step is allowed, but nothing is allocated until it is used
+        self.assertTrue(model._outputs._alloc_complex)
+        self.assertIsNone(model._outputs._cplx_data)
+        self.assertIsNone(spy._outputs._cplx_data)
+
+        J = prob.compute_totals(of=['sub.c2.z'], wrt=['ivc.x'], return_format='array')
+        assert_near_equal(J, np.diag([6.0, 12.0, 18.0]), 1e-12)
+
+        # only the component had complex storage while it was complex stepped
+        self.assertEqual(spy.cs_states, [(np.complex, True)] * 3)
+        self.assertIsNone(spy._outputs._cplx_data)
+        self.assertIsNone(model._outputs._cplx_data)
+
+    @parameterized.expand(itertools.product(['DefaultVector', 'LazyVector']),
+                          name_func=lambda f, n, p: '_'.join([f.__name__] + list(p.args)))
+    def test_group_cs(self, vec_class):
+        prob = self._build(getattr(om, vec_class), group_cs=True)
+        model = prob.model
+        sub = model.sub
+
+        shared = []
+        set_mode = sub._set_complex_step_mode
+
+        def spy_set_mode(active):
+            set_mode(active)
+            if active:
+                # subsystem vectors are views of the storage allocated by the group
+                shared.append(np.shares_memory(sub._outputs._data, sub.c2._outputs._data) and
+                              np.shares_memory(sub._inputs._data, sub.spy._inputs._data))
+
+        sub._set_complex_step_mode = spy_set_mode
+
+        J = prob.compute_totals(of=['sub.c2.z'], wrt=['ivc.x'], return_format='array')
+        assert_near_equal(J, np.diag([6.0, 12.0, 18.0]), 1e-12)
+
+        self.assertTrue(shared)
+        self.assertTrue(all(shared))
+        self.assertTrue(sub.spy.cs_states)
+        self.assertTrue(all(state == (np.complex, True) for state in sub.spy.cs_states))
+        for s in (sub, sub.spy, sub.c2):
+            self.assertIsNone(s._outputs._cplx_data)
+            self.assertIsNone(s._inputs._cplx_data)
+
+    def test_petsc_allocates_up_front(self):
+        if PETScVector is None:
+            raise unittest.SkipTest("PETSc is not installed")
+
+        prob = self._build(PETScVector)
+        self.assertIsNotNone(prob.model._outputs._cplx_data)
+
+
 A = np.array([[1.0, 8.0, 0.0], [-1.0, 10.0, 2.0], [3.0, 100.5, 1.0]])
 
 
@@ -79,11 +79,25 @@ class Vector(object):
         When True, self._data is replaced with self._cplx_data.
     _len : int
         Total length of data vector (including shared memory parts).
+    _aliases : dict
+        Inputs whose views are read-only views of their source outputs, mapped to the source.
+    _copy_aliases : bool
+        If True, the user functions of the owning system modify their inputs in place, so they
+        get writable copies of the aliased inputs.
     """
 
     # Listing of relevant citations that should be referenced when
     cite = ""
 
+    # True if complex storage can be allocated on demand rather than during setup
+    LAZY_COMPLEX = False
+
+    # True if inputs can be views of their source outputs
+    ALIAS_INPUTS = False
+
+    # True if the nonlinear root data can be shared with forked worker processes
+    SHARED_MEMORY = False
+
     def __init__(self, name, kind, system, root_vector=None, alloc_complex=False, ncol=1):
         """
         Initialize all attributes.
@@ -122,6 +136,8 @@ class Vector(object):
         self._root_vector = None
         self._data = None
         self._slices = None
+        self._aliases = {}
+        self._copy_aliases = False
 
         # Support for Complex Step
         self._alloc_complex = alloc_complex
@@ -533,6 +549,10 @@ class Vector(object):
             raise ValueError(f"{self._system().msginfo}: Attempt to set value of '{name}' in "
                              f"{self._kind} vector when it is read only.")
 
+        if abs_name in self._aliases:
+            # the input has to get its own storage before it can differ from its source
+            self._system()._unalias_inputs([abs_name])
+
         if self._icol is not None:
             idxs = (idxs, self._icol)
 
@@ -584,6 +604,28 @@ class Vector(object):
         raise NotImplementedError('_in_matvec_context not defined for vector type %s' %
                                   type(self).__name__)
 
+    def _alloc_complex_data(self, subvecs):
+        """
+        Allocate complex storage for this vector if it is allocated on demand.
+
+        Parameters
+        ----------
+        subvecs : list of <Vector>
+            Vectors of the same name and kind owned by the subsystems of our system.
+        """
+        pass
+
+    def _free_complex_data(self, subvecs):
+        """
+        Release complex storage that was allocated on demand by this vector.
+
+        Parameters
+        ----------
+        subvecs : list of <Vector>
+            Vectors of the same name and kind owned by the subsystems of our system.
+        """
+        pass
+
     def set_complex_step_mode(self, active, keep_real=False):
         """
         Turn on or off complex stepping mode.
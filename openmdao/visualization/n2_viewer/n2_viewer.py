@@ -34,6 +34,24 @@ _IND = 4  # HTML indentation (spaces)
 
 _MAX_ARRAY_SIZE_FOR_REPR_VAL = 1000  # If var has more elements than this do not pass to N2
 
+_COMPACT_FORMAT_VERSION = 2
+
+# node kinds of the compact format
+_COMPACT_KINDS = {'root': 0, 'group': 1, 'component': 2, 'input': 3, 'output': 4}
+
+# bits of the 'flags' column of the compact format
+_IMPLICIT_FLAG = 1
+_PARALLEL_FLAG = 2
+_SOLVE_SUBSYSTEMS_FLAG = 4
+
+# tree node entries that are needed to draw the diagram, stored as interned strings
+_COMPACT_STRING_COLUMNS = ('class', 'dtype', 'component_type', 'linear_solver',
+                           'nonlinear_solver')
+
+# tree node entries that are only needed for the node info panel, loaded on demand
+_COMPACT_DETAILS = ('units', 'shape', 'is_discrete', 'distributed', 'value', 'expressions',
+                    'options', 'linear_solver_options', 'nonlinear_solver_options')
+
 
 def _convert_nans_in_nested_list(val_as_list):
     """
@@ -104,6 +122,15 @@ def _get_var_dict(system, typ, name):
         var_dict['implicit'] = isimplicit
 
     var_dict['dtype'] = type(meta['value']).__name__
+    var_dict.update(_get_var_details(meta, is_discrete))
+
+    return var_dict
+
+
+def _get_var_details(meta, is_discrete):
+    """Get the entries of a variable that are only shown in the node info panel."""
+    var_dict = OrderedDict()
+
     if 'units' in meta:
         if meta['units'] is None:
             var_dict['units'] = 'None'
@@ -136,29 +163,10 @@ def _get_var_dict(system, typ, name):
 def _get_tree_dict(system, component_execution_orders, component_execution_index,
                    is_parallel=False):
     """Get a dictionary representation of the system hierarchy."""
-    tree_dict = OrderedDict()
-    tree_dict['name'] = system.name
-    tree_dict['type'] = 'subsystem'
-    tree_dict['class'] = system.__class__.__name__
-    tree_dict['expressions'] = None
+    tree_dict = _get_system_dict(system, is_parallel)
+    is_parallel = tree_dict['is_parallel']
 
     if not isinstance(system, Group):
-        tree_dict['subsystem_type'] = 'component'
-        tree_dict['is_parallel'] = is_parallel
-        if isinstance(system, ImplicitComponent):
-            tree_dict['component_type'] = 'implicit'
-        elif isinstance(system, ExecComp):
-            tree_dict['component_type'] = 'exec'
-            tree_dict['expressions'] = system._exprs
-        elif isinstance(system, (MetaModelStructuredComp, MetaModelUnStructuredComp)):
-            tree_dict['component_type'] = 'metamodel'
-        elif isinstance(system, IndepVarComp):
-            tree_dict['component_type'] = 'indep'
-        elif isinstance(system, ExplicitComponent):
-            tree_dict['component_type'] = 'explicit'
-        else:
-            tree_dict['component_type'] = None
-
         component_execution_orders[system.pathname] = component_execution_index[0]
         component_execution_index[0] += 1
 
@@ -171,12 +179,6 @@ def _get_tree_dict(system, component_execution_orders, component_execution_index
                 children.append(_get_var_dict(system, typ, prom_name))
 
     else:
-        if isinstance(system, ParallelGroup):
-            is_parallel = True
-        tree_dict['component_type'] = None
-        tree_dict['subsystem_type'] = 'group'
-        tree_dict['is_parallel'] = is_parallel
-
         children = []
         for s in system._subsystems_myproc:
             children.append(_get_tree_dict(s, component_execution_orders,
@@ -193,6 +195,46 @@ def _get_tree_dict(system, component_execution_orders, component_execution_index
             for children_list in children_lists:
                 children.extend(children_list)
 
+    # the children come before the options
+    options = tree_dict.pop('options')
+    tree_dict['children'] = children
+    tree_dict['options'] = options
+
+    return tree_dict
+
+
+def _get_system_dict(system, is_parallel=False):
+    """Get a dictionary representation of a system, without its children."""
+    tree_dict = OrderedDict()
+    tree_dict['name'] = system.name
+    tree_dict['type'] = 'subsystem'
+    tree_dict['class'] = system.__class__.__name__
+    tree_dict['expressions'] = None
+
+    if not isinstance(system, Group):
+        tree_dict['subsystem_type'] = 'component'
+        tree_dict['is_parallel'] = is_parallel
+        if isinstance(system, ImplicitComponent):
+            tree_dict['component_type'] = 'implicit'
+        elif isinstance(system, ExecComp):
+            tree_dict['component_type'] = 'exec'
+            tree_dict['expressions'] = system._exprs
+        elif isinstance(system, (MetaModelStructuredComp, MetaModelUnStructuredComp)):
+            tree_dict['component_type'] = 'metamodel'
+        elif isinstance(system, IndepVarComp):
+            tree_dict['component_type'] = 'indep'
+        elif isinstance(system, ExplicitComponent):
+            tree_dict['component_type'] = 'explicit'
+        else:
+            tree_dict['component_type'] = None
+
+    else:
+        if isinstance(system, ParallelGroup):
+            is_parallel = True
+        tree_dict['component_type'] = None
+        tree_dict['subsystem_type'] = 'group'
+        tree_dict['is_parallel'] = is_parallel
+
     if isinstance(system, ImplicitComponent):
         if overrides_method('solve_linear', system, ImplicitComponent):
             tree_dict['linear_solver'] = "solve_linear"
@@ -237,8 +279,6 @@ def _get_tree_dict(system, component_execution_orders, component_execution_index
             tree_dict['nonlinear_solver'] = ""
             tree_dict['nonlinear_solver_options'] = None
 
-    tree_dict['children'] = children
-
     options = {}
     for k in system.options:
         # need to handle solvers separate because they are classes or instances
@@ -293,7 +333,540 @@ def _get_declare_partials(system):
     return declare_partials_list
 
 
-def _get_viewer_data(data_source):
+def _get_connections_list(G, orders):
+    """
+    Get the list of connections, with the arrows of any cycles they are part of.
+
+    Parameters
+    ----------
+    G : nx.DiGraph
+        Graph of the components of the model, with the connections stored on the edges.
+    orders : dict
+        Mapping of component pathname to its execution order.
+
+    Returns
+    -------
+    list of dict
+        The connections, each with a 'src', a 'tgt' and, if in a cycle, 'cycle_arrows'.
+    list of str
+        Pathnames of the systems found in cycles, indexed by the cycle arrows.
+    """
+    connections_list = []
+
+    sys_pathnames_list = []  # list of pathnames of systems found in cycles
+    sys_pathnames_dict = {}  # map of pathnames to index of pathname in list
+
+    scc = nx.strongly_connected_components(G)
+
+    for strong_comp in scc:
+        if len(strong_comp) > 1:
+            # these IDs are only used when back edges are present
+            sys_pathnames_list.extend(strong_comp)
+            for name in strong_comp:
+                sys_pathnames_dict[name] = len(sys_pathnames_dict)
+
+        for src, tgt in G.edges(strong_comp):
+            if src in strong_comp and tgt in strong_comp:
+                if src in orders:
+                    exe_src = orders[src]
+                else:
+                    exe_src = orders[src] = -1
+                if tgt in orders:
+                    exe_tgt = orders[tgt]
+                else:
+                    exe_tgt = orders[tgt] = -1
+
+                if exe_tgt < exe_src:
+                    exe_low = exe_tgt
+                    exe_high = exe_src
+                else:
+                    exe_low = exe_src
+                    exe_high = exe_tgt
+
+                edges_list = [
+                    (sys_pathnames_dict[s], sys_pathnames_dict[t]) for s, t in G.edges(strong_comp)
+                    if s in orders and exe_low <= orders[s] <= exe_high and t in orders and
+                    exe_low <= orders[t] <= exe_high and
+                    not (s == src and t == tgt) and t in sys_pathnames_dict
+                ]
+                for vsrc, vtgtlist in G.get_edge_data(src, tgt)['conns'].items():
+                    for vtgt in vtgtlist:
+                        connections_list.append({'src': vsrc, 'tgt': vtgt,
+                                                 'cycle_arrows': edges_list})
+            else:  # edge is out of the SCC
+                for vsrc, vtgtlist in G.get_edge_data(src, tgt)['conns'].items():
+                    for vtgt in vtgtlist:
+                        connections_list.append({'src': vsrc, 'tgt': vtgt})
+
+    return connections_list, sys_pathnames_list
+
+
+def _get_compact_connections(G):
+    """
+    Get the connections and the cycles they are part of, in time linear in the model size.
+
+    Rather than storing the arrows of its cycle with every connection, the strongly
+    connected components are stored once and the viewer works out the arrows.
+
+    Parameters
+    ----------
+    G : nx.DiGraph
+        Graph of the components of the model, with the connections stored on the edges.
+
+    Returns
+    -------
+    list of tuple
+        The connections as (src, tgt, scc) tuples, where scc is the index of the strongly
+        connected component the connection is part of, or -1.
+    list of tuple
+        The strongly connected components with more than one component, as tuples of the
+        component pathnames and the edges between them.
+    """
+    conns = []
+    sccs = []
+
+    for strong_comp in nx.strongly_connected_components(G):
+        idx = -1
+        if len(strong_comp) > 1:
+            idx = len(sccs)
+            sccs.append((list(strong_comp),
+                         [(s, t) for s, t in G.edges(strong_comp) if t in strong_comp]))
+
+        for src, tgt in G.edges(strong_comp):
+            scc_idx = idx if tgt in strong_comp else -1
+            for vsrc, vtgtlist in G.get_edge_data(src, tgt)['conns'].items():
+                for vtgt in vtgtlist:
+                    conns.append((vsrc, vtgt, scc_idx))
+
+    return conns, sccs
+
+
+class _CompactTreeWriter(object):
+    """
+    Writer of the tree of the compact format, one node at a time in depth first order.
+
+    The nodes down to lazy_depth make up the skeleton of the tree, which the viewer loads up
+    front. Each system at lazy_depth starts a chunk holding the nodes below it, with their own
+    interned strings, and the details of the whole subtree, so the viewer only creates those
+    nodes when the system is expanded.
+
+    Attributes
+    ----------
+    path2id : dict
+        Node id of each absolute path.
+    strings : list of str
+        Interned strings of the skeleton.
+    nodes : dict
+        Columns of the skeleton.
+    details : dict
+        Details of the skeleton nodes that are not in a chunk, keyed by node id.
+    chunks : list of dict
+        Strings, columns and details of each lazily loaded subtree. Chunk numbers start at 1.
+    exec_orders : dict
+        Execution order of each component, keyed by node id.
+    _lazy_depth : int or None
+        Depth of the systems that start a chunk.
+    _abs2prom : dict
+        Promoted name of each variable, keyed by kind and absolute path.
+    _auto_ivc_proms : dict
+        Promoted name of the first input connected to each auto_ivc output.
+    _tables : list of (list, dict)
+        Interned strings and their ids, for the skeleton and then for each chunk.
+    _parents : list of int
+        Parent id of each node.
+    _chunk_of : list of int
+        Chunk of each node, or 0 if it's in the skeleton below no chunk.
+    _chunk_roots : list of int
+        Position in the skeleton columns of the system that starts each chunk.
+    """
+
+    def __init__(self, lazy_depth, abs2prom, auto_ivc_proms):
+        """
+        Initialize all attributes.
+
+        Parameters
+        ----------
+        lazy_depth : int or None
+            Depth of the systems that start a chunk. If None, everything is in the skeleton.
+        abs2prom : dict
+            Promoted name of each variable, keyed by kind and absolute path.
+        auto_ivc_proms : dict
+            Promoted name of the first input connected to each auto_ivc output, which the
+            viewer shows in place of the output's own name.
+        """
+        self.path2id = {}
+        self.strings = []
+        self.nodes = _new_compact_columns(skeleton=True)
+        self.details = {}
+        self.chunks = []
+        self.exec_orders = {}
+        self._lazy_depth = lazy_depth
+        self._abs2prom = abs2prom
+        self._auto_ivc_proms = auto_ivc_proms
+        self._tables = [(self.strings, {})]
+        self._parents = []
+        self._chunk_of = []
+        self._chunk_roots = []
+
+    def _intern(self, s, chunk):
+        """
+        Return the id of the string in the strings of the skeleton or of a chunk.
+
+        Parameters
+        ----------
+        s : str or None
+            The string.
+        chunk : int
+            The chunk, or 0 for the skeleton.
+
+        Returns
+        -------
+        int
+            Index of the string, or -1 if it is None.
+        """
+        if s is None:
+            return -1
+        strings, string_ids = self._tables[chunk]
+        try:
+            return string_ids[s]
+        except KeyError:
+            string_ids[s] = idx = len(strings)
+            strings.append(s)
+            return idx
+
+    def add(self, path, depth, parent, name, kind, flags, str_cols, details):
+        """
+        Add a node after its parent and all previously added nodes of the subtree.
+
+        Parameters
+        ----------
+        path : str
+            Absolute path of the node.
+        depth : int
+            Depth of the node. The root is at depth 0.
+        parent : int
+            Id of the parent node, or -1 for the root.
+        name : str
+            Name of the node.
+        kind : str
+            One of the keys of _COMPACT_KINDS.
+        flags : int
+            Bits of the node's flags.
+        str_cols : dict
+            Values of the entries of _COMPACT_STRING_COLUMNS the node has.
+        details : dict
+            Entries only shown in the node info panel.
+
+        Returns
+        -------
+        int
+            Id of the node.
+        """
+        node_id = len(self._parents)
+        self._parents.append(parent)
+        self.path2id[path] = node_id
+
+        chunk = self._chunk_of[parent] if parent >= 0 else 0
+        in_chunk = chunk > 0
+        if not in_chunk and depth == self._lazy_depth and kind in ('group', 'component'):
+            self.chunks.append({'strings': [], 'nodes': _new_compact_columns(skeleton=False),
+                                'details': {}})
+            self._tables.append((self.chunks[-1]['strings'], {}))
+            self._chunk_roots.append(len(self.nodes['id']))
+            chunk = len(self.chunks)
+        self._chunk_of.append(chunk)
+
+        prom = None
+        if kind in ('input', 'output'):
+            prom = self._auto_ivc_proms.get(path)
+            if prom is None:
+                prom = self._abs2prom[kind].get(path)
+        elif kind == 'component':
+            self.exec_orders[node_id] = len(self.exec_orders)
+
+        table = chunk if in_chunk else 0
+        if in_chunk:
+            cols = self.chunks[chunk - 1]['nodes']
+            if flags & _IMPLICIT_FLAG:
+                # the viewer shows the system of the chunk as implicit before it's loaded
+                self.nodes['flags'][self._chunk_roots[chunk - 1]] |= _IMPLICIT_FLAG
+        else:
+            cols = self.nodes
+            cols['id'].append(node_id)
+            cols['chunk'].append(chunk)
+
+        cols['name'].append(self._intern(name, table))
+        cols['parent'].append(parent)
+        cols['kind'].append(_COMPACT_KINDS[kind])
+        cols['prom'].append(self._intern(prom, table))
+        cols['flags'].append(flags)
+        for col in _COMPACT_STRING_COLUMNS:
+            cols[col].append(self._intern(str_cols.get(col), table))
+
+        if details:
+            if chunk:
+                self.chunks[chunk - 1]['details'][str(node_id)] = details
+            else:
+                self.details[str(node_id)] = details
+
+        return node_id
+
+    def add_dict(self, node, path, depth, parent):
+        """
+        Add a node given as a dict of the tree returned by _get_tree_dict, without its children.
+
+        Parameters
+        ----------
+        node : dict
+            The node.
+        path : str
+            Absolute path of the node.
+        depth : int
+            Depth of the node. The root is at depth 0.
+        parent : int
+            Id of the parent node, or -1 for the root.
+
+        Returns
+        -------
+        int
+            Id of the node.
+        """
+        if node['type'] == 'root':
+            kind = 'root'
+        elif node['type'] == 'subsystem':
+            kind = node['subsystem_type']
+        else:
+            kind = node['type']
+
+        flags = 0
+        if node.get('implicit'):
+            flags |= _IMPLICIT_FLAG
+        if node.get('is_parallel'):
+            flags |= _PARALLEL_FLAG
+        if node.get('solve_subsystems'):
+            flags |= _SOLVE_SUBSYSTEMS_FLAG
+
+        return self.add(path, depth, parent, node['name'], kind, flags, node,
+                        {key: node[key] for key in _COMPACT_DETAILS if key in node})
+
+    def finish(self):
+        """
+        Add the size of the subtree of each node to the skeleton.
+        """
+        parents = self._parents
+        sizes = [1] * len(parents)
+        for node_id in range(len(parents) - 1, 0, -1):
+            sizes[parents[node_id]] += sizes[node_id]
+
+        self.nodes['size'] = [sizes[node_id] for node_id in self.nodes['id']]
+
+
+def _new_compact_columns(skeleton):
+    """
+    Return empty columns of nodes of the compact format.
+
+    Parameters
+    ----------
+    skeleton : bool
+        If True, the columns are for the skeleton, whose ids aren't contiguous, so they have
+        columns for the id, the chunk started by the node and the size of its subtree.
+
+    Returns
+    -------
+    dict
+        Empty list for each column.
+    """
+    names = ('name', 'parent', 'kind', 'prom', 'flags') + _COMPACT_STRING_COLUMNS
+    if skeleton:
+        names = ('id', 'chunk', 'size') + names
+    return {name: [] for name in names}
+
+
+def _write_compact_model(writer, root_group):
+    """
+    Add the systems and variables of a model to the compact tree, without building its dict.
+
+    Parameters
+    ----------
+    writer : _CompactTreeWriter
+        The writer of the compact tree.
+    root_group : <Group>
+        The model. It must not be running under MPI.
+    """
+    # iterative depth first traversal, so ids of a subtree are contiguous
+    stack = [(root_group, -1, 0, False)]
+    while stack:
+        system, parent, depth, is_parallel = stack.pop()
+
+        node = _get_system_dict(system, is_parallel)
+        node_id = writer.add_dict(node, system.pathname, depth, parent)
+
+        if isinstance(system, Group):
+            for s in reversed(system._subsystems_myproc):
+                stack.append((s, node_id, depth + 1, node['is_parallel']))
+            continue
+
+        flags = _IMPLICIT_FLAG if isinstance(system, ImplicitComponent) else 0
+        for typ in ('input', 'output'):
+            var_flags = flags if typ == 'output' else 0
+            for abs_name, meta in system._var_abs2meta[typ].items():
+                writer.add(abs_name, depth + 1, node_id, system._var_abs2prom[typ][abs_name],
+                           typ, var_flags, {'dtype': type(meta['value']).__name__},
+                           _get_var_details(meta, False))
+
+            for name, meta in system._var_discrete[typ].items():
+                writer.add(system.pathname + '.' + name, depth + 1, node_id, name, typ,
+                           var_flags, {'dtype': type(meta['value']).__name__},
+                           _get_var_details(meta, True))
+
+
+def _get_compact_data(data_dict, sccs=None, lazy_depth=None, root_group=None):
+    """
+    Convert viewer data to the compact columnar format.
+
+    All strings in the tree are interned and the tree is stored as columns, with the node ids
+    numbered in depth first order. Connections, cycles and declared partials refer to the
+    nodes by id. The nodes below lazy_depth are stored in chunks, one for each subtree rooted
+    at lazy_depth, together with the entries of the subtree that are only shown in the node
+    info panel, so that the viewer only creates those nodes when they are needed.
+
+    Parameters
+    ----------
+    data_dict : dict
+        Viewer data as returned by _get_viewer_data.
+    sccs : list of tuple or None
+        Strongly connected components referenced by the connections, as returned by
+        _get_compact_connections. If None, the connections are in the format returned by
+        _get_connections_list.
+    lazy_depth : int or None
+        Depth of the subtrees stored in their own chunk. The children of the model are at
+        depth 1. If None, the whole tree is loaded up front.
+    root_group : <Group> or None
+        If given, the tree is read from this model instead of data_dict['tree'].
+
+    Returns
+    -------
+    dict
+        The viewer data in the compact format.
+    """
+    if sccs is None:
+        conns = [(conn['src'], conn['tgt'], -1) for conn in data_dict['connections_list']]
+    else:
+        conns = data_dict['connections_list']
+
+    # auto_ivc outputs are shown with the name of the first input they are connected to
+    abs2prom = data_dict['abs2prom']
+    auto_ivc_proms = {}
+    for src, tgt, _ in conns:
+        if src.startswith('_auto_ivc.') and src not in auto_ivc_proms:
+            auto_ivc_proms[src] = abs2prom['input'].get(tgt)
+
+    writer = _CompactTreeWriter(lazy_depth, abs2prom, auto_ivc_proms)
+    if root_group is not None:
+        _write_compact_model(writer, root_group)
+    else:
+        stack = [(data_dict['tree'], '', -1, 0)]
+        while stack:
+            node, parent_path, parent, depth = stack.pop()
+            if node['type'] == 'root':
+                path = ''
+            elif parent_path:
+                path = parent_path + '.' + node['name']
+            else:
+                path = node['name']
+
+            node_id = writer.add_dict(node, path, depth, parent)
+
+            children = node.get('children')
+            if children:
+                for child in reversed(children):
+                    stack.append((child, path, node_id, depth + 1))
+    writer.finish()
+
+    path2id = writer.path2id
+
+    # connections
+    conn_arrows = []
+    arrow_lists = []
+    arrow_ids = {}
+
+    if sccs is None:
+        # convert the cycle arrows of the full format, storing each distinct list once
+        sys_pathnames = data_dict['sys_pathnames_list']
+        for conn in data_dict['connections_list']:
+            arrows = conn.get('cycle_arrows')
+            if arrows:
+                arrows = tuple(chain(*[(path2id[sys_pathnames[s]], path2id[sys_pathnames[t]])
+                                       for s, t in arrows]))
+                if arrows not in arrow_ids:
+                    arrow_ids[arrows] = len(arrow_lists)
+                    arrow_lists.append(arrows)
+                conn_arrows.append(arrow_ids[arrows])
+            else:
+                conn_arrows.append(-1)
+        sccs = []
+    else:
+        conn_arrows = [-1] * len(conns)
+
+    src_ids = []
+    tgt_ids = []
+    conn_sccs = []
+    src_systems = []
+    tgt_systems = []
+    for src, tgt, scc in conns:
+        src_ids.append(path2id[src])
+        tgt_ids.append(path2id[tgt])
+        conn_sccs.append(scc)
+
+        # the arrows of a connection in a cycle depend on the components it connects, which
+        # the viewer may not have loaded yet
+        if scc >= 0:
+            src_systems.append(path2id[src.rsplit('.', 1)[0]])
+            tgt_systems.append(path2id[tgt.rsplit('.', 1)[0]])
+        else:
+            src_systems.append(-1)
+            tgt_systems.append(-1)
+
+    scc_list = []
+    for systems, edges in sccs:
+        ids = [path2id[s] for s in systems]
+        scc_list.append({'systems': ids,
+                         'orders': [writer.exec_orders[i] for i in ids],
+                         'edges': list(chain(*[(path2id[s], path2id[t]) for s, t in edges]))})
+
+    # declared partials, as pairs of 'of' and 'wrt' ids
+    partials = []
+    for dp in data_dict.get('declare_partials_list', ()):
+        of, wrt = dp.split(' > ')
+        if of in path2id and wrt in path2id:
+            partials.append(path2id[of])
+            partials.append(path2id[wrt])
+
+    return {
+        'format': 'compact',
+        'version': _COMPACT_FORMAT_VERSION,
+        'strings': writer.strings,
+        'nodes': writer.nodes,
+        'details': writer.details,
+        'chunks': writer.chunks,
+        'connections': {
+            'src': src_ids,
+            'tgt': tgt_ids,
+            'scc': conn_sccs,
+            'src_sys': src_systems,
+            'tgt_sys': tgt_systems,
+            'arrows': conn_arrows,
+        },
+        'sccs': scc_list,
+        'arrow_lists': arrow_lists,
+        'declare_partials': partials,
+        'driver': data_dict['driver'],
+        'design_vars': data_dict['design_vars'],
+        'responses': data_dict['responses'],
+    }
+
+
+def _get_viewer_data(data_source, compact=False, lazy_depth=None):
     """
     Get the data needed by the N2 viewer as a dictionary.
 
@@ -301,6 +874,11 @@ def _get_viewer_data(data_source):
     ----------
     data_source : <Problem> or <Group> or str
         A Problem or Group or case recorder file name containing the model or model data.
+    compact : bool
+        If True, return the data in the compact columnar format.
+    lazy_depth : int or None
+        When compact is True, the depth of the subtrees whose nodes and details are stored in
+        their own chunk so they can be loaded on demand. If None, there are no chunks.
 
     Returns
     -------
@@ -344,6 +922,9 @@ def _get_viewer_data(data_source):
         if 'variables' in data_dict:
             del data_dict['variables']
 
+        if compact:
+            return _get_compact_data(data_dict, lazy_depth=lazy_depth)
+
         return data_dict
 
     else:
@@ -351,61 +932,19 @@ def _get_viewer_data(data_source):
                         "The source must be a Problem, model or the filename of a recording.")
 
     data_dict = {}
-    comp_exec_idx = [0]  # list so pass by ref
-    orders = {}
-    data_dict['tree'] = _get_tree_dict(root_group, orders, comp_exec_idx)
-
-    connections_list = []
-
-    sys_pathnames_list = []  # list of pathnames of systems found in cycles
-    sys_pathnames_dict = {}  # map of pathnames to index of pathname in list
+    if not compact or root_group.comm.size > 1:
+        comp_exec_idx = [0]  # list so pass by ref
+        orders = {}
+        data_dict['tree'] = _get_tree_dict(root_group, orders, comp_exec_idx)
 
     G = root_group.compute_sys_graph(comps_only=True)
 
-    scc = nx.strongly_connected_components(G)
-
-    for strong_comp in scc:
-        if len(strong_comp) > 1:
-            # these IDs are only used when back edges are present
-            sys_pathnames_list.extend(strong_comp)
-            for name in strong_comp:
-                sys_pathnames_dict[name] = len(sys_pathnames_dict)
-
-        for src, tgt in G.edges(strong_comp):
-            if src in strong_comp and tgt in strong_comp:
-                if src in orders:
-                    exe_src = orders[src]
-                else:
-                    exe_src = orders[src] = -1
-                if tgt in orders:
-                    exe_tgt = orders[tgt]
-                else:
-                    exe_tgt = orders[tgt] = -1
-
-                if exe_tgt < exe_src:
-                    exe_low = exe_tgt
-                    exe_high = exe_src
-                else:
-                    exe_low = exe_src
-                    exe_high = exe_tgt
-
-                edges_list = [
-                    (sys_pathnames_dict[s], sys_pathnames_dict[t]) for s, t in G.edges(strong_comp)
-                    if s in orders and exe_low <= orders[s] <= exe_high and t in orders and
-                    exe_low <= orders[t] <= exe_high and
-                    not (s == src and t == tgt) and t in sys_pathnames_dict
-                ]
-                for vsrc, vtgtlist in G.get_edge_data(src, tgt)['conns'].items():
-                    for vtgt in vtgtlist:
-                        connections_list.append({'src': vsrc, 'tgt': vtgt,
-                                                 'cycle_arrows': edges_list})
-            else:  # edge is out of the SCC
-                for vsrc, vtgtlist in G.get_edge_data(src, tgt)['conns'].items():
-                    for vtgt in vtgtlist:
-                        connections_list.append({'src': vsrc, 'tgt': vtgt})
+    if compact:
+        data_dict['connections_list'], sccs = _get_compact_connections(G)
+    else:
+        data_dict['connections_list'], data_dict['sys_pathnames_list'] = \
+            _get_connections_list(G, orders)
 
-    data_dict['sys_pathnames_list'] = sys_pathnames_list
-    data_dict['connections_list'] = connections_list
     data_dict['abs2prom'] = root_group._var_abs2prom
 
     data_dict['driver'] = {
@@ -419,11 +958,34 @@ def _get_viewer_data(data_source):
 
     data_dict['declare_partials_list'] = _get_declare_partials(root_group)
 
+    if compact:
+        # without MPI, the compact tree is read straight from the model
+        return _get_compact_data(data_dict, sccs, lazy_depth,
+                                 None if 'tree' in data_dict else root_group)
+
     return data_dict
 
 
+def _compress(data):
+    """
+    Return the JSON encoding of data, compressed and base64 encoded.
+
+    Parameters
+    ----------
+    data : object
+        The data to encode.
+
+    Returns
+    -------
+    str
+        The encoded data.
+    """
+    raw_data = json.dumps(data, default=default_noraise).encode('utf8')
+    return str(base64.b64encode(zlib.compress(raw_data)).decode("ascii"))
+
+
 def n2(data_source, outfile='n2.html', show_browser=True, embeddable=False,
-       title=None, use_declare_partial_info=False):
+       title=None, use_declare_partial_info=False, compact=False, lazy_depth=None):
     """
     Generate an HTML file containing a tree viewer.
 
@@ -452,9 +1014,18 @@ def n2(data_source, outfile='n2.html', show_browser=True, embeddable=False,
         This option is no longer used because it is now always true.
         Still present for backwards compatibility.
 
+    compact : bool, optional
+        If True, embed the model data in a compact columnar format, which is much smaller and
+        faster to generate and load for large models.
+
+    lazy_depth : int or None, optional
+        When compact is True, the depth of the subtrees whose nodes, variable values, options
+        and other details are compressed separately and only loaded by the viewer when the
+        subtree is expanded. If None, the whole model is loaded up front.
+
     """
     # grab the model viewer data
-    model_data = _get_viewer_data(data_source)
+    model_data = _get_viewer_data(data_source, compact=compact, lazy_depth=lazy_depth)
 
     # if MPI is active only display one copy of the viewer
     if MPI and MPI.COMM_WORLD.rank != 0:
@@ -467,9 +1038,13 @@ def n2(data_source, outfile='n2.html', show_browser=True, embeddable=False,
         warn_deprecation("'use_declare_partial_info' is now the"
                          " default and the option is ignored.")
 
-    raw_data = json.dumps(model_data, default=default_noraise).encode('utf8')
-    b64_data = str(base64.b64encode(zlib.compress(raw_data)).decode("ascii"))
-    model_data = 'var compressedModel = "%s";' % b64_data
+    # lazily loaded subtrees are compressed on their own
+    chunks = ['null']
+    if compact:
+        chunks.extend('"%s"' % _compress(chunk) for chunk in model_data.pop('chunks'))
+
+    model_data = ['var compressedModel = "%s";' % _compress(model_data),
+                  'var compressedChunks = [%s];' % ', '.join(chunks)]
 
     import openmdao
     openmdao_dir = os.path.dirname(inspect.getfile(openmdao))
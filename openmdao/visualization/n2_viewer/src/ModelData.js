@@ -1,21 +1,50 @@
+// Node kinds of the compact format generated by n2_viewer.py
+const _COMPACT_KINDS = ['root', 'group', 'component', 'input', 'output'];
+
 /** Process the tree, connections, and other info provided about the model. */
 class ModelData {
 
     /** Do some discovery in the tree and rearrange & enhance where necessary. */
     constructor(modelJSON) {
 
+        // Index the connections so lookups by name don't have to scan them all.
+        this.connectedPaths = new Set();
+        this.autoIvcInputs = new Set();
+        this.autoIvcTargets = {};
+
+        // Compact models only create the nodes below lazy_depth when they're expanded.
+        this.compact = null;
+        this.loadedChunks = [true];
+
+        if (modelJSON.format == 'compact') {
+            startTimer('ModelData._readSkeleton');
+            modelJSON = this._readSkeleton(modelJSON);
+            stopTimer('ModelData._readSkeleton');
+        }
+
         modelJSON.tree.name = 'model'; // Change 'root' to 'model'
         this.conns = modelJSON.connections_list;
         this.abs2prom = modelJSON.abs2prom; // May be undefined.
         this.declarePartialsList = modelJSON.declare_partials_list;
+        this.declarePartialsSet = new Set(this.declarePartialsList);
         this.useDeclarePartialsList = (this.declarePartialsList.length > 0);
         this.sysPathnamesList = modelJSON.sys_pathnames_list;
 
+        for (const conn of this.conns) {
+            this.connectedPaths.add(conn.src);
+            this.connectedPaths.add(conn.tgt);
+            if (conn.src.match(/^_auto_ivc.*$/)) {
+                this.autoIvcInputs.add(conn.tgt);
+                if (!(conn.src in this.autoIvcTargets)) this.autoIvcTargets[conn.src] = conn.tgt;
+            }
+        }
+
         this.maxDepth = 1;
         this.unconnectedInputs = 0;
         this.autoivcSources = 0;
         this.nodePaths = {};
-        this.nodeIds = [];
+        // Nodes of compact models keep their position in the whole tree as id.
+        this.nodeIds = this.compact ? new Array(this.compact.nodes.size[0]) : [];
         this.depthCount = [];
 
         startTimer('ModelData._convertToN2TreeNodes');
@@ -34,15 +63,261 @@ class ModelData {
         stopTimer('ModelData._initSubSystemChildren');
 
         startTimer('ModelData._computeConnections');
-        this._computeConnections();
+        if (this.compact) this._computeCompactConnections();
+        else this._computeConnections();
         stopTimer('ModelData._computeConnections');
 
-        this._updateAutoIvcNames();
+        // The compact format already names auto-ivc outputs after their targets.
+        if (!this.compact) this._updateAutoIvcNames();
 
         debugInfo("New model: ", this);
         // this.errorCheck();
     }
 
+    /**
+     * Build the skeleton of the nested tree from the compact columnar format generated
+     * by n2_viewer.py. Strings are interned, and nodes are referenced by their id, which
+     * is their position in the depth first ordering of the whole tree. The nodes below
+     * each system at lazy_depth are stored in their own chunk, and are only created by
+     * loadDetails() when the system is expanded. Connections are kept as ids, since their
+     * ends may not be loaded yet.
+     * @param {Object} compact The model data in the compact format.
+     * @return {Object} The skeleton in the format produced for smaller models.
+     */
+    _readSkeleton(compact) {
+        const strings = compact.strings;
+        const cols = compact.nodes;
+        const numNodes = cols.id.length;
+        const conns = compact.connections;
+
+        this.compact = compact;
+        this.abs2prom = { 'input': {}, 'output': {} };
+
+        // Systems at lazy_depth, in id order, with the size of their subtree.
+        this.lazyRootIds = [];
+        this.lazyRootSizes = [];
+        let autoIvcId = -1, autoIvcSize = 0;
+        for (let i = 0; i < numNodes; ++i) {
+            if (cols.chunk[i] > 0) {
+                this.lazyRootIds.push(cols.id[i]);
+                this.lazyRootSizes.push(cols.size[i]);
+            }
+            if (cols.parent[i] == 0 && strings[cols.name[i]] == '_auto_ivc') {
+                autoIvcId = cols.id[i];
+                autoIvcSize = cols.size[i];
+            }
+        }
+
+        // Connections of each chunk, where those of the skeleton are in chunk 0.
+        this.connectedIds = new Set();
+        this.autoIvcInputIds = new Set();
+        this.chunkConns = Array.from({ length: this.lazyRootIds.length + 1 }, () => []);
+        for (let i = 0; i < conns.src.length; ++i) {
+            const src = conns.src[i], tgt = conns.tgt[i];
+            this.connectedIds.add(src);
+            this.connectedIds.add(tgt);
+            if (src > autoIvcId && src < autoIvcId + autoIvcSize) this.autoIvcInputIds.add(tgt);
+
+            const srcChunk = this._chunkOfId(src), tgtChunk = this._chunkOfId(tgt);
+            this.chunkConns[srcChunk].push(i);
+            if (tgtChunk != srcChunk) this.chunkConns[tgtChunk].push(i);
+        }
+
+        const nodes = new Map();
+        for (let i = 0; i < numNodes; ++i) {
+            const id = cols.id[i], parent = nodes.get(cols.parent[i]);
+            const node = this._newCompactNode(strings, cols, i, id,
+                parent ? parent.compactPath : null);
+
+            if (cols.chunk[i] > 0) {
+                node.lazyChunk = cols.chunk[i];
+                node.lazyDescendants = cols.size[i] - 1;
+            }
+
+            if (parent) parent.children.push(node);
+            nodes.set(id, node);
+        }
+
+        for (const id in compact.details) {
+            Object.assign(nodes.get(Number(id)), compact.details[id]);
+        }
+
+        // Declared partials are looked up by the ids of their 'of' and 'wrt' variables.
+        const partials = compact.declare_partials;
+        const declarePartialsList = new Array(partials.length / 2);
+        for (let i = 0; i < partials.length; i += 2) {
+            declarePartialsList[i / 2] = partials[i] + ' > ' + partials[i + 1];
+        }
+
+        return {
+            'tree': nodes.get(0),
+            'connections_list': [],
+            'abs2prom': this.abs2prom,
+            'declare_partials_list': declarePartialsList,
+            'driver': compact.driver,
+            'design_vars': compact.design_vars,
+            'responses': compact.responses
+        };
+    }
+
+    /**
+     * Create the JSON object of a node of a compact model from one row of its columns,
+     * indexing its promoted name and connections by its path.
+     * @param {String[]} strings The interned strings of the columns.
+     * @param {Object} cols The columns of the skeleton or of a chunk.
+     * @param {Number} i The row of the node in the columns.
+     * @param {Number} id The id of the node.
+     * @param {String} parentPath The path of the parent, or null for the root.
+     * @return {Object} The node, in the format produced for smaller models.
+     */
+    _newCompactNode(strings, cols, i, id, parentPath) {
+        const kind = _COMPACT_KINDS[cols.kind[i]];
+        const flags = cols.flags[i];
+        const str = idx => (idx < 0) ? null : strings[idx];
+        const name = strings[cols.name[i]];
+        const node = { 'name': name, 'compactId': id };
+
+        if (parentPath === null) node.compactPath = '';
+        else if (parentPath == '') node.compactPath = name;
+        else node.compactPath = parentPath + '.' + name;
+
+        if (kind == 'input' || kind == 'output') {
+            const path = node.compactPath;
+            node.type = kind;
+            node.dtype = str(cols.dtype[i]);
+            if (kind == 'output') node.implicit = Boolean(flags & 1);
+            if (cols.prom[i] >= 0) this.abs2prom[kind][path] = strings[cols.prom[i]];
+            if (this.connectedIds.has(id)) this.connectedPaths.add(path);
+            if (this.autoIvcInputIds.has(id)) this.autoIvcInputs.add(path);
+        }
+        else {
+            node.type = (kind == 'root') ? 'root' : 'subsystem';
+            node.subsystem_type = (kind == 'component') ? 'component' : 'group';
+            node.class = str(cols.class[i]);
+            node.component_type = str(cols.component_type[i]);
+            node.is_parallel = Boolean(flags & 2);
+            node.linear_solver = str(cols.linear_solver[i]);
+            node.nonlinear_solver = str(cols.nonlinear_solver[i]);
+            if (flags & 1) node.implicit = true; // Has implicit outputs not loaded yet
+            if (flags & 4) node.solve_subsystems = true;
+            node.children = [];
+        }
+
+        return node;
+    }
+
+    /**
+     * Find the system at lazy_depth whose subtree holds the node of a compact model.
+     * @param {Number} id The id of the node.
+     * @return {Number} The index of the system in lazyRootIds, or -1 if there is none.
+     */
+    _lazyRootIndex(id) {
+        let low = 0, high = this.lazyRootIds.length - 1, found = -1;
+        while (low <= high) {
+            const mid = (low + high) >> 1;
+            if (this.lazyRootIds[mid] <= id) {
+                found = mid;
+                low = mid + 1;
+            }
+            else high = mid - 1;
+        }
+
+        if (found >= 0 && id < this.lazyRootIds[found] + this.lazyRootSizes[found]) return found;
+        return -1;
+    }
+
+    /**
+     * Find the chunk holding the node of a compact model, which is the chunk of the
+     * system at lazy_depth above it. The system itself is in the skeleton, but its
+     * details are in its chunk.
+     * @param {Number} id The id of the node.
+     * @return {Number} The chunk, or 0 for nodes only in the skeleton.
+     */
+    _chunkOfId(id) {
+        return this._lazyRootIndex(id) + 1;
+    }
+
+    /**
+     * Find the node of a compact model, or the deepest node above it that is loaded.
+     * @param {Number} id The id of the node.
+     * @return {N2TreeNode} The node.
+     */
+    _nodeForId(id) {
+        const node = this.nodeIds[id];
+        if (node) return node;
+
+        return this.nodeIds[this.lazyRootIds[this._lazyRootIndex(id)]];
+    }
+
+    /**
+     * For compact models, uncompress the chunk holding the subtree of a system at
+     * lazy_depth, create its nodes and add their details and connections, if not done
+     * already. The details of the system itself are in its chunk as well.
+     * @param {N2TreeNode} node The node whose details or children are needed.
+     */
+    loadDetails(node) {
+        const chunk = node.lazyChunk;
+        if (chunk === undefined || this.loadedChunks[chunk]) return;
+
+        startTimer('ModelData.loadDetails');
+        const data = ModelData.uncompressModel(compressedChunks[chunk]);
+        const cols = data.nodes;
+        const nodes = new Map([[node.compactId, node]]);
+        const children = [];
+
+        // Ids in a chunk are contiguous, starting just after the system at lazy_depth.
+        for (let i = 0; i < cols.name.length; ++i) {
+            const id = node.compactId + 1 + i, parentId = cols.parent[i];
+            const parent = nodes.get(parentId);
+            const child = this._newCompactNode(data.strings, cols, i, id,
+                (parent === node) ? node.absPathName : parent.compactPath);
+
+            if (parent === node) children.push(child);
+            else parent.children.push(child);
+            nodes.set(id, child);
+        }
+
+        for (let child of children) {
+            child = this._convertToN2TreeNodes(child);
+            node.children.push(child);
+
+            this._setParentsAndDepth(child, node, node.depth + 1);
+            for (let obj = node; !obj.isRoot(); obj = obj.parent) {
+                obj.childNames.add(child.absPathName);
+                for (const childName of child.childNames) obj.childNames.add(childName);
+            }
+        }
+        this._initSubSystemChildren(node);
+
+        for (const id in data.details) {
+            Object.assign(this.nodeIds[id], data.details[id]);
+        }
+
+        for (const i of this.chunkConns[chunk]) {
+            this._addCompactConnection(i, chunk);
+        }
+
+        this.loadedChunks[chunk] = true;
+        compressedChunks[chunk] = null;
+        stopTimer('ModelData.loadDetails');
+    }
+
+    /**
+     * For compact models, load the subtrees of the systems at lazy_depth that are
+     * no longer minimized, such as after expanding them or all of their parents.
+     * @param {N2TreeNode} [node = this.root] The node to start with.
+     */
+    loadExpanded(node = this.root) {
+        if (!this.compact || node.isMinimized) return;
+
+        this.loadDetails(node);
+        if (node.hasChildren()) {
+            for (const child of node.children) {
+                this.loadExpanded(child);
+            }
+        }
+    }
+
     static uncompressModel(b64str) {
         const compressedData = atob(b64str);
         const jsonStr = window.pako.inflate(compressedData, { to: 'string' });
@@ -103,8 +378,8 @@ class ModelData {
     _setParentsAndDepth(node, parent, depth) { // Formerly InitTree()
         node.depth = depth;
         node.parent = parent;
-        node.id = this.nodeIds.length;
-        this.nodeIds.push(node);
+        node.id = (node.compactId === undefined) ? this.nodeIds.length : node.compactId;
+        this.nodeIds[node.id] = node;
 
         // Track # of nodes at each depth
         if (depth > this.depthCount.length) { this.depthCount.push(1); }
@@ -166,6 +441,10 @@ class ModelData {
                 }
             }
         }
+        else if (node.lazyChunk) { // Subtree of a compact model that isn't loaded yet
+            node.numDescendants = node.lazyDescendants;
+            node.isMinimized = true;
+        }
 
         return (node.implicit) ? true : false;
     }
@@ -210,10 +489,7 @@ class ModelData {
      */
     hasAnyConnection(elementPath) {
 
-        for (let conn of this.conns) {
-            if (conn.src == elementPath || conn.tgt == elementPath)
-                return true;
-        }
+        if (this.connectedPaths.has(elementPath)) return true;
 
         debugInfo(elementPath + " has no connections.");
         this.unconnectedInputs++;
@@ -222,12 +498,10 @@ class ModelData {
     }
 
     hasAutoIvcSrc(elementPath) {
-        for (let conn of this.conns) {
-            if (conn.tgt == elementPath && conn.src.match(/^_auto_ivc.*$/)) {
-                debugInfo(elementPath + " source is an auto-ivc output.");
-                this.autoivcSources++;
-                return true;
-            }
+        if (this.autoIvcInputs.has(elementPath)) {
+            debugInfo(elementPath + " source is an auto-ivc output.");
+            this.autoivcSources++;
+            return true;
         }
 
         return false;
@@ -241,10 +515,8 @@ class ModelData {
     getAutoIvcTgt(elementPath) {
         if (!elementPath.match(/^_auto_ivc.*$/)) return undefined;
 
-        for (let conn of this.conns) {
-            if (conn.src == elementPath) {
-                return conn.tgt;
-            }
+        if (elementPath in this.autoIvcTargets) {
+            return this.autoIvcTargets[elementPath];
         }
 
         console.warn(`No target connection found for ${elementPath}.`)
@@ -274,16 +546,17 @@ class ModelData {
     }
 
     /**
-     * Build a string from the absoluate path names of the two elements and
-     * try to find it in the declare partials list.
+     * Build a string from the absoluate path names of the two elements, or their
+     * ids for compact models, and try to find it in the declare partials list.
      * @param {Object} srcObj The source element.
      * @param {Object} tgtObj The target element.
      * @return {Boolean} True if the string was found.
      */
     isDeclaredPartial(srcObj, tgtObj) {
-        let partialsStr = tgtObj.absPathName + " > " + srcObj.absPathName;
+        let partialsStr = this.compact ? tgtObj.compactId + " > " + srcObj.compactId :
+            tgtObj.absPathName + " > " + srcObj.absPathName;
 
-        return this.declarePartialsList.includes(partialsStr);
+        return this.declarePartialsSet.has(partialsStr);
     }
 
     /** 
@@ -324,7 +597,6 @@ class ModelData {
                 continue;
             }
 
-            let srcObjParents = [srcObj];
             if (!srcObj.isOutput()) { // source obj must be output
                 console.warn(throwLbl + "Found a source that is not an output.");
                 continue;
@@ -335,10 +607,6 @@ class ModelData {
                 continue;
             }
 
-            for (let obj = srcObj.parent; obj != null; obj = obj.parent) {
-                srcObjParents.push(obj);
-            }
-
             // Process targets
             let tgtObj = this.nodePaths[conn.tgt];
 
@@ -362,20 +630,7 @@ class ModelData {
                 continue;
             }
 
-            let tgtObjParents = [tgtObj];
-            for (let parentObj = tgtObj.parent; parentObj != null; parentObj = parentObj.parent) {
-                tgtObjParents.push(parentObj);
-            }
-
-            for (let srcParent of srcObjParents) {
-                for (let tgtParent of tgtObjParents) {
-                    if (tgtParent.absPathName != "")
-                        srcParent.targetParentSet.add(tgtParent);
-
-                    if (srcParent.absPathName != "")
-                        tgtParent.sourceParentSet.add(srcParent);
-                }
-            }
+            this._addConnectionParents(srcObj, tgtObj);
 
             /*
              * The cycle_arrows object in each connection is an array of length-2 arrays,
@@ -425,7 +680,130 @@ class ModelData {
     }
 
     /**
-     * 
+     * Store the target object and all of its parents in the source object and all
+     * of its parents, and vice versa.
+     * @param {N2TreeNode} srcObj The source of the connection.
+     * @param {N2TreeNode} tgtObj The target of the connection.
+     */
+    _addConnectionParents(srcObj, tgtObj) {
+        let srcObjParents = [srcObj];
+        for (let obj = srcObj.parent; obj != null; obj = obj.parent) {
+            srcObjParents.push(obj);
+        }
+
+        let tgtObjParents = [tgtObj];
+        for (let parentObj = tgtObj.parent; parentObj != null; parentObj = parentObj.parent) {
+            tgtObjParents.push(parentObj);
+        }
+
+        for (let srcParent of srcObjParents) {
+            for (let tgtParent of tgtObjParents) {
+                if (tgtParent.absPathName != "")
+                    srcParent.targetParentSet.add(tgtParent);
+
+                if (srcParent.absPathName != "")
+                    tgtParent.sourceParentSet.add(srcParent);
+            }
+        }
+    }
+
+    /**
+     * Process the connections of a compact model. Ends that aren't loaded yet are
+     * represented by the system at lazy_depth above them until its chunk is loaded.
+     */
+    _computeCompactConnections() {
+        this.sccArrows = {};
+
+        for (let i = 0; i < this.compact.connections.src.length; ++i) {
+            this._addCompactConnection(i, 0);
+        }
+    }
+
+    /**
+     * Add a connection of a compact model using the nodes loaded so far. Its cycle
+     * arrows are added when the chunk holding its target is loaded.
+     * @param {Number} i The index of the connection.
+     * @param {Number} chunk The chunk just loaded, or 0 for the skeleton.
+     */
+    _addCompactConnection(i, chunk) {
+        const conns = this.compact.connections;
+        const src = conns.src[i], tgt = conns.tgt[i];
+
+        this._addConnectionParents(this._nodeForId(src), this._nodeForId(tgt));
+
+        if (this._chunkOfId(tgt) != chunk) return;
+
+        let arrows = null;
+        if (conns.scc[i] >= 0) {
+            arrows = this._getSccArrows(conns.scc[i], conns.src_sys[i], conns.tgt_sys[i]);
+        }
+        else if (conns.arrows[i] >= 0) {
+            arrows = this.compact.arrow_lists[conns.arrows[i]];
+        }
+        if (!Array.isPopulatedArray(arrows)) return;
+
+        // The ends of the arrows resolve to whichever of their nodes are loaded.
+        const self = this;
+        const cycleArrowsArray = [];
+        for (let j = 0; j < arrows.length; j += 2) {
+            const begin = arrows[j], end = arrows[j + 1];
+            cycleArrowsArray.push({
+                get begin() { return self._nodeForId(begin); },
+                get end() { return self._nodeForId(end); }
+            });
+        }
+
+        const tgtObj = this.nodeIds[tgt];
+        if (!tgtObj.parent.hasOwnProperty("cycleArrows")) {
+            tgtObj.parent.cycleArrows = [];
+        }
+        tgtObj.parent.cycleArrows.push({
+            get src() { return self._nodeForId(src); },
+            "arrows": cycleArrowsArray
+        });
+    }
+
+    /**
+     * For a connection in a strongly connected component of a compact model, find
+     * the edges of the component between the systems executed between the source
+     * and target.
+     * @param {Number} scc The index of the strongly connected component.
+     * @param {Number} srcSys The id of the component of the source.
+     * @param {Number} tgtSys The id of the component of the target.
+     * @return {Number[]} The ids of the begin and end of each arrow, flattened.
+     */
+    _getSccArrows(scc, srcSys, tgtSys) {
+        const key = srcSys + ',' + tgtSys;
+        if (!(key in this.sccArrows)) {
+            const sccInfo = this.compact.sccs[scc];
+            const edges = sccInfo.edges;
+            if (!sccInfo.execOrders) {
+                sccInfo.execOrders = new Map();
+                for (let k = 0; k < sccInfo.systems.length; ++k) {
+                    sccInfo.execOrders.set(sccInfo.systems[k], sccInfo.orders[k]);
+                }
+            }
+            const execOrders = sccInfo.execOrders;
+
+            const low = Math.min(execOrders.get(srcSys), execOrders.get(tgtSys));
+            const high = Math.max(execOrders.get(srcSys), execOrders.get(tgtSys));
+            const arrows = [];
+            for (let i = 0; i < edges.length; i += 2) {
+                const s = edges[i], t = edges[i + 1];
+                const sOrder = execOrders.get(s), tOrder = execOrders.get(t);
+                if (sOrder >= low && sOrder <= high && tOrder >= low && tOrder <= high &&
+                    !(s == srcSys && t == tgtSys)) {
+                    arrows.push(s, t);
+                }
+            }
+            this.sccArrows[key] = arrows;
+        }
+
+        return this.sccArrows[key];
+    }
+
+    /**
+     * For models that aren't compact, name auto-ivc outputs after their targets.
      */
     _updateAutoIvcNames() {
         const aivc = this.nodePaths['_auto_ivc'];
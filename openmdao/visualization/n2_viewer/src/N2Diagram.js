@@ -678,6 +678,7 @@ class N2Diagram {
         this.showWaiter();
         await this.delay(100);
 
+        this.model.loadExpanded();
         this.ui.update();
         this.search.update(this.zoomedElement, this.model.root);
 
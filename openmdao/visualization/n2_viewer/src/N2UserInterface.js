@@ -224,6 +224,7 @@ class N2UserInterface {
             this.rightClickedNode = node;
             this.addBackButtonHistory();
             node.manuallyExpanded = true;
+            this.n2Diag.model.loadDetails(node);
             this._uncollapse(node);
             this.n2Diag.update();
         }
@@ -267,6 +268,7 @@ class N2UserInterface {
         d3.event.preventDefault();
         d3.event.stopPropagation();
 
+        this.n2Diag.model.loadDetails(node);
         if (!node.hasChildren() || node.isInput()) return;
         if (d3.event.button != 0) return;
         this.addBackButtonHistory();
@@ -516,6 +516,7 @@ class NodeInfo {
     update(event, obj, color = '#42926b') {
         if (this.hidden || this.pinned) return;
 
+        this.ui.n2Diag.model.loadDetails(obj);
         this.clear();
         // Put the name in the title
         this.table.select('thead th')
@@ -570,6 +571,7 @@ class NodeInfo {
     update_solver(event, obj, color = '#42926b') {
         if (this.hidden || this.pinned) return;
 
+        this.ui.n2Diag.model.loadDetails(obj);
         this.clear();
         // Put the name in the title
         this.table.select('thead th')
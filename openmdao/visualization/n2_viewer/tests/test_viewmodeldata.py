@@ -30,6 +30,38 @@ DEBUG_BROWSER = False
 DEBUG_FILES = False
 
 
+def _get_compact_nodes(compact_data):
+    """
+    Rebuild the absolute path, parent, kind and promoted name of each node of compact viewer
+    data, indexed by id, from the skeleton and all the chunks.
+    """
+    skeleton = compact_data['nodes']
+    rows = {}
+    for i, node_id in enumerate(skeleton['id']):
+        rows[node_id] = (compact_data['strings'], skeleton, i)
+        if skeleton['chunk'][i]:
+            chunk = compact_data['chunks'][skeleton['chunk'][i] - 1]
+            for j in range(len(chunk['nodes']['name'])):
+                rows[node_id + 1 + j] = (chunk['strings'], chunk['nodes'], j)
+
+    nodes = {'path': [], 'parent': [], 'kind': [], 'prom': []}
+    for node_id in range(len(rows)):
+        strings, cols, i = rows[node_id]
+        parent = cols['parent'][i]
+        name = strings[cols['name'][i]]
+        if parent < 0:
+            nodes['path'].append('')
+        elif nodes['path'][parent]:
+            nodes['path'].append(nodes['path'][parent] + '.' + name)
+        else:
+            nodes['path'].append(name)
+        nodes['parent'].append(parent)
+        nodes['kind'].append(cols['kind'][i])
+        nodes['prom'].append(strings[cols['prom'][i]] if cols['prom'][i] >= 0 else None)
+
+    return nodes
+
+
 class TestViewModelData(unittest.TestCase):
 
     def setUp(self):
@@ -304,6 +336,132 @@ class TestViewModelData(unittest.TestCase):
             expected_responses_names,
         )
 
+    def check_compact_viewer_data(self, compact_data):
+        """
+        Check compact viewer data of the SellarStateConnection model against the expected data.
+        """
+        self.assertEqual(compact_data['format'], 'compact')
+
+        nodes = _get_compact_nodes(compact_data)
+        paths = nodes['path']
+
+        # ids are depth first, so the parent of a node always comes before it
+        for i, parent in enumerate(nodes['parent']):
+            self.assertLess(parent, i)
+
+        abs2prom = {'input': {}, 'output': {}}
+        for path, kind, prom in zip(paths, nodes['kind'], nodes['prom']):
+            if kind == 3:
+                abs2prom['input'][path] = prom
+            elif kind == 4:
+                abs2prom['output'][path] = prom
+
+        # auto_ivc outputs are named after the first input they are connected to
+        expected_abs2prom = {'input': self.expected_abs2prom['input'],
+                             'output': dict(self.expected_abs2prom['output'])}
+        for conn in self.expected_conns:
+            if conn['src'].startswith('_auto_ivc.'):
+                expected_abs2prom['output'][conn['src']] = \
+                    self.expected_abs2prom['input'][conn['tgt']]
+        self.assertEqual(abs2prom, expected_abs2prom)
+
+        conns = compact_data['connections']
+        self.assertEqual(sorted((paths[s], paths[t]) for s, t in zip(conns['src'], conns['tgt'])),
+                         sorted((c['src'], c['tgt']) for c in self.expected_conns))
+
+        # the connection closing the cycle references the strongly connected component
+        sccs = compact_data['sccs']
+        self.assertEqual(len(sccs), 1)
+        self.assertEqual(sorted(paths[i] for i in sccs[0]['systems']), self.expected_pathnames)
+        for src, tgt, scc, src_sys, tgt_sys in zip(conns['src'], conns['tgt'], conns['scc'],
+                                                   conns['src_sys'], conns['tgt_sys']):
+            if scc >= 0:
+                self.assertEqual(src_sys, nodes['parent'][src])
+                self.assertEqual(tgt_sys, nodes['parent'][tgt])
+                self.assertIn(paths[src_sys], self.expected_pathnames)
+                self.assertIn(paths[tgt_sys], self.expected_pathnames)
+            else:
+                self.assertEqual((src_sys, tgt_sys), (-1, -1))
+
+        partials = compact_data['declare_partials']
+        self.assertEqual(sorted('%s > %s' % (paths[partials[i]], paths[partials[i + 1]])
+                                for i in range(0, len(partials), 2)),
+                         sorted(self.expected_declare_partials))
+
+        self.assertEqual(compact_data['driver']['name'], self.expected_driver_name)
+
+        return paths
+
+    def test_compact_viewer_data_from_problem(self):
+        """
+        Verify the compact viewer data, using the SellarStateConnection model.
+        """
+        p = Problem(model=SellarStateConnection())
+        p.setup()
+        p.final_setup()
+
+        compact_data = _get_viewer_data(p, compact=True)
+        paths = self.check_compact_viewer_data(compact_data)
+
+        # without a lazy depth the whole tree is in the skeleton
+        self.assertEqual(compact_data['chunks'], [])
+        self.assertEqual(compact_data['nodes']['id'], list(range(len(paths))))
+        self.assertEqual(compact_data['nodes']['size'][0], len(paths))
+        details = compact_data['details']
+        self.assertEqual(details[str(paths.index('sub.d1.x'))]['units'], 'None')
+        self.assertEqual(details[str(paths.index('sub.d1.z'))]['shape'], '(2,)')
+
+        # with a lazy depth, the nodes below each system at that depth and the details of
+        # the whole subtree are in its own chunk
+        compact_data = _get_viewer_data(p, compact=True, lazy_depth=1)
+        paths = self.check_compact_viewer_data(compact_data)
+
+        skeleton = compact_data['nodes']
+        subtrees = [path for path in paths if path and '.' not in path]
+        self.assertEqual([paths[i] for i in skeleton['id']], [''] + subtrees)
+        self.assertEqual(skeleton['chunk'], list(range(len(subtrees) + 1)))
+        self.assertEqual(list(compact_data['details']), ['0'])
+
+        chunks = compact_data['chunks']
+        self.assertEqual(len(chunks), len(subtrees))
+        for node_id, chunk, size in zip(skeleton['id'][1:], chunks, skeleton['size'][1:]):
+            self.assertEqual(size, len(chunk['nodes']['name']) + 1)
+            self.assertEqual(sorted(chunk['details'], key=int),
+                             [str(i) for i in range(node_id, node_id + size)])
+
+    def test_compact_viewer_data_from_sqlite(self):
+        """
+        Verify the compact viewer data converted from a recording, which stores the arrows of
+        each cycle rather than the strongly connected components.
+        """
+        p = Problem(model=SellarStateConnection())
+
+        r = SqliteRecorder(self.sqlite_db_filename)
+        p.driver.add_recorder(r)
+
+        p.setup()
+        p.final_setup()
+        r.shutdown()
+
+        compact_data = _get_viewer_data(self.sqlite_db_filename, compact=True)
+
+        paths = _get_compact_nodes(compact_data)['path']
+
+        conns = compact_data['connections']
+        self.assertEqual(compact_data['sccs'], [])
+        self.assertEqual(len(compact_data['arrow_lists']), 1)
+
+        for src, tgt, arrows in zip(conns['src'], conns['tgt'], conns['arrows']):
+            expected = [c for c in self.expected_conns
+                        if c['src'] == paths[src] and c['tgt'] == paths[tgt]][0]
+            if arrows < 0:
+                self.assertNotIn('cycle_arrows', expected)
+            else:
+                flat = compact_data['arrow_lists'][arrows]
+                cycle_arrows = sorted('%s %s' % (paths[flat[i]], paths[flat[i + 1]])
+                                      for i in range(0, len(flat), 2))
+                self.assertEqual(cycle_arrows, expected['cycle_arrows'])
+
     def test_viewer_data_from_subgroup(self):
         """
         Test error message when asking for viewer data for a subgroup.
@@ -423,6 +581,37 @@ class TestViewModelData(unittest.TestCase):
         self.assertTrue(sqlite_model_data == compare_model_data,
                         'Model data from sqlite does not match data from Problem.')
 
+    def test_n2_compact(self):
+        """
+        Test that an n2 html file with compact, lazily loaded data is generated from a Problem.
+        """
+        p = Problem()
+        p.model = SellarStateConnection()
+        p.setup()
+        n2(p, outfile=self.problem_html_filename, show_browser=DEBUG_BROWSER, compact=True,
+           lazy_depth=1)
+
+        model_data = self._extract_compressed_model(self.problem_html_filename)
+        self.assertEqual(model_data['format'], 'compact')
+
+        # only the nodes down to the lazy depth are in the model data
+        self.assertNotIn('chunks', model_data)
+        self.assertEqual(list(model_data['details']), ['0'])
+
+        with open(self.problem_html_filename, 'r') as f:
+            for line in f:
+                if re.search('var compressedChunks', line):
+                    chunks = json.loads(line.strip().replace('var compressedChunks = ', '')[:-1])
+                    break
+
+        self.assertIsNone(chunks[0])
+        self.assertEqual(len(chunks), max(model_data['nodes']['chunk']) + 1)
+
+        # _auto_ivc, with its outputs and their details
+        chunk = json.loads(zlib.decompress(base64.b64decode(chunks[1])).decode("utf-8"))
+        self.assertEqual([chunk['strings'][i] for i in chunk['nodes']['name']], ['v0', 'v1'])
+        self.assertEqual(list(chunk['details']), ['1', '2', '3'])
+
     def test_n2_command(self):
         """
         Check that there are no errors when running from the command line with a script.
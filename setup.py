@@ -203,6 +203,7 @@ setup(
             'linearrunoncec=openmdao.solvers.linear.linear_runonce:LinearRunOnce',
             'petsckrylov=openmdao.solvers.linear.petsc_ksp:PETScKrylov',
             'scipykrylov=openmdao.solvers.linear.scipy_iter_solver:ScipyKrylov',
+            'sparseprecon=openmdao.solvers.linear.sparse_precon:SparsePrecon',
             'userdefined=openmdao.solvers.linear.user_defined:LinearUserDefined',
         ],
         'openmdao_nl_solver': [